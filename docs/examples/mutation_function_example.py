@@ -9,6 +9,5 @@ def mutate_value(value):
 
 
 def mutate_gene(gene):
-    """Shuffle a gene -- applied at "gene" level"""
-    random.shuffle(gene)
-    return gene
+    """Shuffle a gene -- applied at "gene" level (returns a new gene rather than shuffling in place)"""
+    return random.sample(gene, len(gene))
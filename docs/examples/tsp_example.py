@@ -1,13 +1,24 @@
-from holland import evolve
+from holland import Evolver
+from holland.library import (
+    get_order_crossover_function,
+    get_inversion_mutation_function,
+    get_reciprocal_weighting_function,
+)
 from math import sqrt
 
 # list of cities and positions
 cities = {"AZ": (1, 2), "CA": (3, 4), "NM": (5, 6), "TX": (7, 8)}
 
 # specify hyper-parameters for genomes
-# in this case there is only a single gene
-genome_parameters = {
-    "path": {"type": "[string]", "possible_values": cities.keys(), "mutation_function": "swap"}
+# in this case there is only a single gene: the order in which to visit the cities
+genome_params = {
+    "path": {
+        "type": "permutation",
+        "values": list(cities.keys()),
+        "crossover_function": get_order_crossover_function(),
+        "mutation_function": get_inversion_mutation_function(),
+        "mutation_rate": 0.2,
+    }
 }
 
 
@@ -20,17 +31,24 @@ def distance(p1, p2):
 # define a fitness function
 # a pythonic way to find the length of a round trip
 def sum_of_distances(individual):
-    cities = [position[city] for city in individual["path"]]
+    positions = [cities[city] for city in individual["path"]]
     return sum(
-        [distance(city_1, city_2) for (city_1, city_2) in zip(cities, cities[1:] + [cities[0]])]
+        distance(city_1, city_2)
+        for (city_1, city_2) in zip(positions, positions[1:] + [positions[0]])
     )
 
 
+# shorter trips are fitter
+selection_strategy = {
+    "pool": {"top": 10},
+    "parents": {"weighting_function": get_reciprocal_weighting_function(), "n_parents": 2},
+}
+
 # evolve!
-my_population = evolve(
-    genome_parameters,
-    fitness_function=my_fitness_function,
-    anneal_mutation_rate=True,
-    show_fitness_plot=True,
-    num_generations=100,
+evolver = Evolver(
+    sum_of_distances, genome_params, selection_strategy, should_maximize_fitness=False
+)
+fitness_results = evolver.evolve(
+    generation_params={"population_size": 50, "n_elite": 1},
+    stop_conditions={"n_generations": 100},
 )
@@ -4,3 +4,9 @@ from .evaluation import *
 from .evolution import *
 from .mutation import *
 from .selection import *
+from .population import *
+from .islands import *
+from .vectors import *
+from .differential import *
+from .strategies import *
+from .restarts import *
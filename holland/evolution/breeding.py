@@ -1,7 +1,24 @@
+import math
+import random
+import itertools
+
 from .selection import Selector
 from .crossover import Crosser
 from .mutation import Mutator
-from ..utils import bound_value, is_numeric_type, is_list_type
+from ..utils import (
+    bound_value,
+    bound_values,
+    is_numeric_type,
+    is_list_type,
+    is_permutation_type,
+    get_permutation_values,
+    create_process_pool,
+    split_into_chunks,
+    hash_genome,
+    derive_genome_hash,
+    get_strategy_gene_name,
+    get_initial_strategy,
+)
 
 
 class PopulationGenerator:
@@ -17,18 +34,55 @@ class PopulationGenerator:
     :param generation_params: a dictionary specifying how to create the next generation; see :ref:`generation-params`
     :type generation_params: dict
 
+    :param should_track_lineage: whether to record the :attr:`lineage` of offspring bred from a single parent by described mutations, for delta evaluation; see :ref:`delta-evaluation`
+    :type should_track_lineage: bool
+
+    :param rng: the source of randomness for selection and for seeding the random stream of each genome (a ``random.Random`` instance); see :ref:`random-streams`. If not specified, the ``random`` module is used and genomes do not get their own streams (except when breeding in parallel)
+    :type rng: random.Random
+
+    :param should_hash_genomes: whether to derive the hash of each bred genome from the hash of its first parent as it is bred, so that :func:`~holland.evolution.PopulationGenerator.get_genome_hash` costs time proportional to the changes made by crossover and mutation rather than to the size of the genome
+    :type should_hash_genomes: bool
 
+
+    :raises ValueError: if a gene with ``self_adaptation`` would store its strategy parameters under the name of another gene (see :func:`~holland.utils.utils.get_strategy_gene_name`)
     :raises ValueError: if ``n_random < 0`` or ``n_elite < 0``
     :raises ValueError: if ``n_random + n_elite > population_size``
+    :raises ValueError: if ``n_breeding_workers < 1`` or ``breeding_chunk_size < 1``
+    :raises ValueError: if ``speciation`` is given without a ``compatibility_function`` or with a ``threshold`` that is not positive
+    :raises ValueError: if ``population_size_schedule`` is given with a ``type`` that is not one of ``"linear"``, ``"exponential"``, ``"adaptive"``, without a ``final_population_size`` of at least ``max(1, n_random + n_elite)``, or (for ``"linear"`` and ``"exponential"``) without ``n_generations`` of at least ``1``
     """
 
-    def __init__(self, genome_params, selection_strategy, generation_params={}):
+    def __init__(
+        self,
+        genome_params,
+        selection_strategy,
+        generation_params={},
+        should_track_lineage=False,
+        rng=None,
+        should_hash_genomes=False,
+    ):
         self.genome_params = genome_params
         self.selection_strategy = selection_strategy
+        self.should_track_lineage = should_track_lineage
+        self.lineage = {}
+        self.rng = rng if rng is not None else random
+        self._should_spawn_streams = rng is not None
+        self.should_hash_genomes = should_hash_genomes
+        self._genome_hashes = {}
+
+        for gene_name, gene_params in genome_params.items():
+            if "self_adaptation" in gene_params and get_strategy_gene_name(gene_name) in genome_params:
+                raise ValueError(
+                    f"Gene '{get_strategy_gene_name(gene_name)}' clashes with the strategy "
+                    f"parameters of self-adaptive gene '{gene_name}'"
+                )
 
         self.n_random = generation_params.get("n_random", 0)
         self.n_elite = generation_params.get("n_elite", 0)
         self.population_size = generation_params.get("population_size", None)
+        self.n_breeding_workers = generation_params.get("n_breeding_workers", 1)
+        self.breeding_chunk_size = generation_params.get("breeding_chunk_size", None)
+        self._breeding_workers = None
 
         if self.n_random < 0 or self.n_elite < 0:
             raise ValueError(
@@ -40,6 +94,48 @@ class PopulationGenerator:
                 "Number of random and elite individuals must be less than or equal to population size"
             )
 
+        if self.n_breeding_workers < 1:
+            raise ValueError("Number of breeding workers must be at least 1")
+        if self.breeding_chunk_size is not None and self.breeding_chunk_size < 1:
+            raise ValueError("Breeding chunk size must be at least 1")
+
+        speciation = generation_params.get("speciation", {})
+        self.compatibility_function = speciation.get("compatibility_function", None)
+        self.compatibility_threshold = speciation.get("threshold", None)
+        self.species_representatives = {}
+        self.species_sizes = {}
+        self._next_species_id = 0
+
+        if speciation and self.compatibility_function is None:
+            raise ValueError("Speciation requires a compatibility function")
+        if speciation and not (self.compatibility_threshold or 0) > 0:
+            raise ValueError("Speciation compatibility threshold must be positive")
+
+        schedule = generation_params.get("population_size_schedule", {})
+        self.population_size_schedule = schedule.get("type", None) if schedule else None
+        self.initial_population_size = self.population_size
+        self.final_population_size = schedule.get("final_population_size", None)
+        self.schedule_n_generations = schedule.get("n_generations", None)
+        self.diversity_function = schedule.get("diversity_function", None)
+        self._n_generations_bred = 0
+        self._initial_diversity = None
+
+        if schedule:
+            if self.population_size_schedule not in ["linear", "exponential", "adaptive"]:
+                raise ValueError(
+                    "Population size schedule must be one of 'linear', 'exponential', 'adaptive'"
+                )
+            # sizes stay between the initial and final sizes, so checking the final size once
+            # covers every generation
+            if (self.final_population_size or 0) < max(1, self.n_random + self.n_elite):
+                raise ValueError(
+                    "Final population size must be at least 1 and at least the number of random "
+                    "and elite individuals"
+                )
+            n_generations = self.schedule_n_generations or 0
+            if self.population_size_schedule != "adaptive" and n_generations < 1:
+                raise ValueError("Population size schedule requires n_generations of at least 1")
+
     def generate_next_generation(self, fitness_results):
         """
         Generates the next generation
@@ -53,16 +149,24 @@ class PopulationGenerator:
         
         .. note:: For the sake of efficiency, this method expects ``fitness_results`` to be sorted in order to properly select genomes on the basis of fitness. :func:`~holland.evolution.Evaluator.evaluate_fitness` returns sorted results.
 
+        .. note:: If ``generation_params["speciation"]`` is given, genomes are bred within their species by :func:`~holland.evolution.PopulationGenerator.breed_species` instead of from the whole population; elite and random genomes are unaffected.
+
         .. todo:: Write an example for usage
 
         :raises ValueError: if ``n_random + n_elite > population_size``
 
+        .. note:: If ``generation_params["population_size_schedule"]`` is given, the size of the next generation is set by :func:`~holland.evolution.PopulationGenerator.get_scheduled_population_size` before breeding; the final size of the schedule is validated once, when the population generator is created, since every scheduled size lies between the initial and final sizes.
+
         Dependencies:
+            * :func:`~holland.evolution.PopulationGenerator.get_scheduled_population_size`
             * :func:`~holland.evolution.PopulationGenerator.breed_next_generation`
+            * :func:`~holland.evolution.PopulationGenerator.breed_species`
             * :func:`~holland.evolution.PopulationGenerator.generate_random_genomes`
         """
         if self.population_size is None:
             self.population_size = len(fitness_results)
+        if self.population_size_schedule is not None:
+            self.population_size = self.get_scheduled_population_size(fitness_results)
 
         if self.n_random + self.n_elite > self.population_size:
             raise ValueError(
@@ -76,11 +180,56 @@ class PopulationGenerator:
         else:
             elite_genomes = []
 
-        bred_genomes = self.breed_next_generation(fitness_results, bred_per_generation)
+        if self.compatibility_function is not None:
+            bred_genomes = self.breed_species(fitness_results, bred_per_generation)
+        else:
+            bred_genomes = self.breed_next_generation(fitness_results, bred_per_generation)
         random_genomes = self.generate_random_genomes(self.n_random)
 
         return elite_genomes + bred_genomes + random_genomes
 
+    def get_scheduled_population_size(self, fitness_results):
+        """
+        Returns the size of the next generation according to ``generation_params["population_size_schedule"]``, counting the generations bred so far
+
+        With ``"linear"`` and ``"exponential"`` schedules the size moves from the initial population size to ``final_population_size`` over ``n_generations`` generations, by a constant difference or a constant factor per generation, and then stays there. With an ``"adaptive"`` schedule the size is ``final_population_size`` plus the difference between the initial and final sizes scaled by the diversity of ``fitness_results`` relative to the diversity of the first generation (at most ``1``), so the population shrinks as it converges.
+
+        :param fitness_results: a sorted list of tuples containing a fitness score in the first position and a genome in the second (returned by :func:`~holland.evolution.Evaluator.evaluate_fitness`)
+        :type fitness_results: list
+
+
+        :returns: the size of the next generation (an ``int``)
+
+        .. note:: The diversity of a population is measured by ``diversity_function(genomes)`` if given (which should return a non-negative number), and otherwise as the fraction of distinct genomes, compared by :func:`~holland.evolution.PopulationGenerator.get_genome_hash`. For continuous genes, whose offspring are rarely exact copies, a ``diversity_function`` such as the mean standard deviation of the values is a better measure.
+
+        Dependencies:
+            * :func:`~holland.evolution.PopulationGenerator.get_genome_hash`
+        """
+        if self.initial_population_size is None:
+            self.initial_population_size = len(fitness_results)
+        initial_size = self.initial_population_size
+        final_size = self.final_population_size
+        self._n_generations_bred += 1
+
+        if self.population_size_schedule == "adaptive":
+            genomes = [genome for _, genome in fitness_results]
+            if self.diversity_function is not None:
+                diversity = self.diversity_function(genomes)
+            else:
+                diversity = len({self.get_genome_hash(genome) for genome in genomes}) / len(genomes)
+            if self._initial_diversity is None:
+                self._initial_diversity = diversity
+            relative_diversity = (
+                min(1, diversity / self._initial_diversity) if self._initial_diversity > 0 else 1
+            )
+            return round(final_size + (initial_size - final_size) * relative_diversity)
+
+        progress = min(self._n_generations_bred, self.schedule_n_generations)
+        progress /= self.schedule_n_generations
+        if self.population_size_schedule == "linear":
+            return round(initial_size + (final_size - initial_size) * progress)
+        return round(initial_size * (final_size / initial_size) ** progress)
+
     def breed_next_generation(self, fitness_results, n_genomes):
         """
         Generates a given number of genomes by breeding, through crossover and mutation, existing genomes
@@ -100,33 +249,381 @@ class PopulationGenerator:
         
         .. note:: For the sake of efficiency, this method expects ``fitness_results`` to be sorted in order to properly select genomes on the basis of fitness. :func:`~holland.evolution.Evaluator.evaluate_fitness` returns sorted results.
 
+        .. note:: If ``generation_params["n_breeding_workers"]`` is greater than ``1``, breeding from the selected pool is handed off to :func:`~holland.evolution.PopulationGenerator.breed_in_parallel`.
+
+        .. note:: If an ``rng`` was given, each offspring is crossed and mutated with the ``random`` module seeded from its own seed drawn from ``rng`` (and the state of the ``random`` module is restored afterwards), so results are the same whether breeding is serial or parallel.
+
+        .. note:: If ``should_hash_genomes`` is ``True``, the hash of each offspring is derived from the hash of its first parent with :func:`~holland.utils.utils.derive_genome_hash` (for offspring of a single parent, the changed positions of list-type genes are taken from the changes described by mutation functions, if any), and hashes of genomes that are not in ``fitness_results`` are forgotten; offspring bred in parallel are hashed in full.
+
+        .. note:: If ``should_track_lineage`` is ``True``, :attr:`lineage` is replaced by a dictionary mapping ``id(offspring)`` to ``(parent_fitness, parent_genome, changes)`` for each offspring whose parents are all the same genome and whose mutations were all described; lineage is not tracked when breeding in parallel.
+
         .. todo:: Write an example for usage
 
 
         Dependencies:
             * :func:`~holland.evolution.Selector.select_breeding_pool`
-            * :func:`~holland.evolution.Selector.select_parents`
+            * :func:`~holland.evolution.PopulationGenerator.breed_in_parallel`
+            * :func:`~holland.evolution.Selector.select_parent_groups`
             * :func:`~holland.evolution.Crosser.cross_genomes`
             * :func:`~holland.evolution.Mutator.mutate_genome`
+            * :func:`~holland.evolution.Mutator.mutate_genome_with_changes`
+            * :func:`~holland.evolution.PopulationGenerator.get_genome_hash`
+            * :func:`~holland.utils.utils.derive_genome_hash`
+        """
+        if n_genomes < 0:
+            raise ValueError("Number of bred genomes per generation cannot be negative")
+
+        selector = Selector(self.selection_strategy, rng=self.rng, genome_params=self.genome_params)
+        breeding_pool = selector.select_breeding_pool(fitness_results)
+        self._reset_breeding_records(fitness_results)
+
+        return self._breed_from_pool(selector, breeding_pool, n_genomes)
+
+    def assign_species(self, fitness_results):
+        """
+        Assigns each genome to a species: the first species (in order of creation) whose representative is closer than the compatibility ``threshold`` by the ``compatibility_function``, or a new species represented by the genome if there is none
+
+        Representatives are kept between generations, so each genome is only compared with the representative of each species rather than with the whole population. Once every genome is assigned, the most fit member of each species becomes its representative for the next generation and species without members are dropped.
+
+        :param fitness_results: a sorted list of tuples containing a fitness score in the first position and a genome in the second (returned by :func:`~holland.evolution.Evaluator.evaluate_fitness`)
+        :type fitness_results: list
+
+
+        :returns: a dictionary mapping the id (an ``int``) of each species to the sorted fitness results of its members; :attr:`species_sizes` is replaced by a dictionary mapping the id of each species to its number of members
+        """
+        representatives = list(self.species_representatives.items())
+        get_distance = self.compatibility_function
+        members = {species_id: [] for species_id, representative in representatives}
+        for fitness_result in fitness_results:
+            genome = fitness_result[1]
+            for species_id, representative in representatives:
+                if get_distance(genome, representative) < self.compatibility_threshold:
+                    members[species_id].append(fitness_result)
+                    break
+            else:
+                species_id = self._next_species_id
+                self._next_species_id += 1
+                representatives.append((species_id, genome))
+                members[species_id] = [fitness_result]
+
+        species = {species_id: results for species_id, results in members.items() if results}
+        self.species_representatives = {
+            species_id: results[-1][1] for species_id, results in species.items()
+        }
+        self.species_sizes = {species_id: len(results) for species_id, results in species.items()}
+        return species
+
+    def breed_species(self, fitness_results, n_genomes):
+        """
+        Generates a given number of genomes by breeding genomes within their species
+
+        Genomes are assigned to species by :func:`~holland.evolution.PopulationGenerator.assign_species`, and each species breeds a number of offspring proportional to the mean selection probability of its members (explicit fitness sharing), so that large species do not take over the population. Within a species, the breeding pool is selected with the counts of the ``"pool"`` selection strategy scaled to the size of the species, and parents are selected from it as usual.
+
+        :param fitness_results: a sorted list of tuples containing a fitness score in the first position and a genome in the second (returned by :func:`~holland.evolution.Evaluator.evaluate_fitness`)
+        :type fitness_results: list
+
+        :param n_genomes: the number of genomes to produce
+        :type n_genomes: int
+
+
+        :returns: a list of bred genomes
+
+
+        :raises ValueError: if ``n_genomes < 0``
+
+        .. note:: A species whose breeding pool is smaller than the number of parents breeds from copies of its members, and a species of one genome skips selection and reproduces by mutation alone.
+
+        Dependencies:
+            * :func:`~holland.evolution.PopulationGenerator.assign_species`
+            * :func:`~holland.evolution.Selector.compute_selection_probabilities`
+            * :func:`~holland.evolution.Selector.select_breeding_pool`
         """
         if n_genomes < 0:
             raise ValueError("Number of bred genomes per generation cannot be negative")
 
-        selector = Selector(self.selection_strategy)
+        species = self.assign_species(fitness_results)
+        self._reset_breeding_records(fitness_results)
+
+        selector = Selector(self.selection_strategy, rng=self.rng, genome_params=self.genome_params)
+        probabilities = selector.compute_selection_probabilities(
+            [fitness for fitness, genome in fitness_results]
+        )
+        genome_probabilities = {
+            id(genome): probability
+            for (fitness, genome), probability in zip(fitness_results, probabilities)
+        }
+        shares = [
+            sum(genome_probabilities[id(genome)] for fitness, genome in results) / len(results)
+            for results in species.values()
+        ]
+
+        bred_genomes = []
+        for results, n_offspring in zip(species.values(), _allocate(n_genomes, shares)):
+            if n_offspring == 0:
+                continue
+            if len(results) == 1:
+                parent_groups = [[results[0][1]] * selector.n_parents for _ in range(n_offspring)]
+                bred_genomes += self._breed_parent_groups(parent_groups, results)
+                continue
+            scale = len(results) / len(fitness_results)
+            pool_strategy = {
+                key: min(math.ceil(value * scale), len(results))
+                for key, value in self.selection_strategy.get("pool", {}).items()
+            }
+            if sum(pool_strategy.values()) > len(results):
+                pool_strategy = {"top": len(results)}
+            species_selector = Selector(
+                {**self.selection_strategy, "pool": pool_strategy},
+                rng=self.rng,
+                genome_params=self.genome_params,
+            )
+            breeding_pool = species_selector.select_breeding_pool(results)
+            if 0 < len(breeding_pool) < species_selector.n_parents:
+                breeding_pool = breeding_pool * math.ceil(
+                    species_selector.n_parents / len(breeding_pool)
+                )
+            bred_genomes += self._breed_from_pool(species_selector, breeding_pool, n_offspring)
+        return bred_genomes
+
+    def breed_cells(self, fitness_results, neighborhoods, n_columns):
+        """
+        Generates one offspring for each cell of a cellular population, bred from parents selected in the cell's neighborhood
+
+        :param fitness_results: a list of tuples containing a fitness score in the first position and a genome in the second, one for each cell of the grid in row-major order (not sorted)
+        :type fitness_results: list
+
+        :param neighborhoods: for each cell, the indices of the cells in its neighborhood (returned by :func:`~holland.utils.grids.get_grid_neighborhoods`)
+        :type neighborhoods: list
+
+        :param n_columns: the number of columns of the grid
+        :type n_columns: int
+
+
+        :returns: a list with the offspring of each cell, in the order of ``fitness_results``
+
+
+        .. note:: If ``generation_params["n_breeding_workers"]`` is greater than ``1``, the grid is partitioned into blocks of whole rows (of about four blocks per worker, or of at least ``breeding_chunk_size`` cells) and each block is crossed and mutated in a worker, as in :func:`~holland.evolution.PopulationGenerator.breed_in_parallel`; parents are selected in the calling process, so results do not depend on the partition.
+
+        Dependencies:
+            * :func:`~holland.evolution.Selector.select_local_parent_groups`
+            * :func:`~holland.evolution.Crosser.cross_genomes`
+            * :func:`~holland.evolution.Mutator.mutate_genome`
+        """
+        selector = Selector(self.selection_strategy, rng=self.rng, genome_params=self.genome_params)
+        parent_groups = selector.select_local_parent_groups(fitness_results, neighborhoods)
+        self._reset_breeding_records(fitness_results)
+
+        if self.n_breeding_workers > 1 and parent_groups:
+            n_rows = math.ceil(len(parent_groups) / n_columns)
+            if self.breeding_chunk_size is None:
+                n_rows_per_chunk = math.ceil(n_rows / (4 * self.n_breeding_workers))
+            else:
+                n_rows_per_chunk = math.ceil(self.breeding_chunk_size / n_columns)
+            return self._breed_parent_groups_in_parallel(
+                parent_groups, n_rows_per_chunk * n_columns
+            )
+        return self._breed_parent_groups(parent_groups, fitness_results)
+
+    def breed_by_crowded_tournament(self, fitness_results, ranks, crowding_distances, n_genomes):
+        """
+        Generates a given number of genomes by breeding genomes selected by crowded binary tournaments (NSGA-II)
+
+        :param fitness_results: a list of tuples containing a tuple of objective values in the first position and a genome in the second
+        :type fitness_results: list
+
+        :param ranks: the index of the non-dominated front of each genome
+        :type ranks: list
+
+        :param crowding_distances: the crowding distance of each genome within its front
+        :type crowding_distances: list
+
+        :param n_genomes: the number of genomes to produce
+        :type n_genomes: int
+
+
+        :returns: a list of bred genomes
+
+
+        .. note:: If ``generation_params["n_breeding_workers"]`` is greater than ``1``, the selected parent groups are crossed and mutated in worker processes as in :func:`~holland.evolution.PopulationGenerator.breed_in_parallel`.
+
+        Dependencies:
+            * :func:`~holland.evolution.Selector.select_crowded_tournament_parent_groups`
+            * :func:`~holland.evolution.Crosser.cross_genomes`
+            * :func:`~holland.evolution.Mutator.mutate_genome`
+        """
+        selector = Selector(self.selection_strategy, rng=self.rng, genome_params=self.genome_params)
+        parent_groups = selector.select_crowded_tournament_parent_groups(
+            fitness_results, ranks, crowding_distances, n_genomes
+        )
+        self._reset_breeding_records(fitness_results)
+
+        if self.n_breeding_workers > 1 and parent_groups:
+            chunk_size = self.breeding_chunk_size
+            if chunk_size is None:
+                chunk_size = math.ceil(n_genomes / (4 * self.n_breeding_workers))
+            return self._breed_parent_groups_in_parallel(parent_groups, chunk_size)
+        return self._breed_parent_groups(parent_groups, fitness_results)
+
+    def _reset_breeding_records(self, fitness_results):
+        self.lineage = {}
+        if self._genome_hashes:
+            self._genome_hashes = {
+                id(genome): self._genome_hashes[id(genome)]
+                for fitness, genome in fitness_results
+                if self._genome_hashes.get(id(genome), (None,))[0] is genome
+            }
+
+    def _breed_from_pool(self, selector, breeding_pool, n_genomes):
+        if self.n_breeding_workers > 1 and n_genomes > 0:
+            return self.breed_in_parallel(breeding_pool, n_genomes)
+
+        parent_groups = selector.select_parent_groups(breeding_pool, n_genomes)
+        return self._breed_parent_groups(parent_groups, breeding_pool)
+
+    def _breed_parent_groups(self, parent_groups, parent_results):
+        n_genomes = len(parent_groups)
         crosser = Crosser(self.genome_params)
         mutator = Mutator(self.genome_params)
-
         next_generation = [None] * n_genomes
-        breeding_pool = selector.select_breeding_pool(fitness_results)
 
-        for i in range(n_genomes):
-            parents = selector.select_parents(breeding_pool)
+        seeds = self._spawn_seeds(n_genomes)
+        if self.should_track_lineage:
+            parent_fitnesses = {id(genome): fitness for fitness, genome in parent_results}
+        # the changes described for these genes map the indices of their mutated values
+        value_mutated_gene_names = {
+            gene_name
+            for gene_name, gene_params in self.genome_params.items()
+            if is_list_type(gene_params) and gene_params.get("mutation_level") != "gene"
+        }
+        if self._should_spawn_streams:
+            random_state = random.getstate()
+
+        for i, parents in enumerate(parent_groups):
+            if self._should_spawn_streams:
+                random.seed(seeds[i])
             offspring = crosser.cross_genomes(parents)
-            mutated_offspring = mutator.mutate_genome(offspring)
+            parent = parents[0]
+            changes = None
+            if (self.should_track_lineage or self.should_hash_genomes) and all(
+                other is parent for other in parents[1:]
+            ):
+                mutated_offspring, changes = mutator.mutate_genome_with_changes(offspring)
+                if self.should_track_lineage and changes is not None:
+                    self.lineage[id(mutated_offspring)] = (
+                        parent_fitnesses[id(parent)], parent, changes
+                    )
+            else:
+                mutated_offspring = mutator.mutate_genome(offspring)
+            if self.should_hash_genomes and mutated_offspring is not parent:
+                changed_positions = {}
+                if changes is not None:
+                    changed_positions = {
+                        gene_name: list(change)
+                        for gene_name, change in changes.items()
+                        if gene_name in value_mutated_gene_names
+                    }
+                genome_hash = derive_genome_hash(
+                    mutated_offspring,
+                    parent,
+                    self.get_genome_hash(parent),
+                    changed_positions=changed_positions,
+                )
+                self._genome_hashes[id(mutated_offspring)] = (mutated_offspring, genome_hash)
             next_generation[i] = mutated_offspring
 
+        if self._should_spawn_streams:
+            # leave the stream of the calling process as if breeding had been done in parallel
+            random.setstate(random_state)
         return next_generation
 
+    def breed_in_parallel(self, breeding_pool, n_genomes):
+        """
+        Generates a given number of genomes by breeding genomes from a breeding pool across a pool of worker processes
+
+        Parent groups are selected in the calling process and each offspring is given its own random stream seed; the offspring are then split into chunks of ``generation_params["breeding_chunk_size"]`` (by default about four chunks per worker) and each chunk runs the cross and mutate loop in a worker, seeding the ``random`` module of the worker with each offspring's seed in turn. Offspring are returned in order, so results do not depend on how chunks are scheduled across workers, nor on the number of workers or the chunk size; with an ``rng`` they are the same as the results of serial breeding.
+
+        :param breeding_pool: a list of tuples containing a fitness score in the first position and a genome in the second (returned by :func:`~holland.evolution.Selector.select_breeding_pool`)
+        :type breeding_pool: list
+
+        :param n_genomes: the number of genomes to produce
+        :type n_genomes: int
+
+
+        :returns: a list of bred genomes
+
+
+        .. note:: Worker processes are started on the first call and reused until :func:`~holland.evolution.PopulationGenerator.close` is called. Where the ``"fork"`` start method is unavailable, ``genome_params`` must be picklable.
+
+        Dependencies:
+            * :func:`~holland.evolution.Selector.select_parent_groups`
+            * :func:`~holland.utils.parallel.create_process_pool`
+            * :func:`~holland.utils.parallel.split_into_chunks`
+        """
+        chunk_size = self.breeding_chunk_size
+        if chunk_size is None:
+            chunk_size = math.ceil(n_genomes / (4 * self.n_breeding_workers))
+
+        selector = Selector(self.selection_strategy, rng=self.rng, genome_params=self.genome_params)
+        parent_groups = selector.select_parent_groups(breeding_pool, n_genomes)
+
+        return self._breed_parent_groups_in_parallel(parent_groups, chunk_size)
+
+    def _breed_parent_groups_in_parallel(self, parent_groups, chunk_size):
+        if self._breeding_workers is None:
+            self._breeding_workers = create_process_pool(
+                self.n_breeding_workers,
+                initializer=_initialize_breeding_worker,
+                initargs=(self.genome_params,),
+            )
+
+        n_genomes = len(parent_groups)
+        seeds = [self.rng.getrandbits(64) for _ in range(n_genomes)]
+
+        chunk_sizes = split_into_chunks(n_genomes, chunk_size)
+        chunk_ends = list(itertools.accumulate(chunk_sizes))
+        chunks = [
+            (parent_groups[end - size : end], seeds[end - size : end])
+            for size, end in zip(chunk_sizes, chunk_ends)
+        ]
+        bred_chunks = self._breeding_workers.starmap(_breed_chunk, chunks)
+
+        return [genome for bred_chunk in bred_chunks for genome in bred_chunk]
+
+    def get_genome_hash(self, genome, should_remember=True):
+        """
+        Returns the hash of a genome (see :func:`~holland.utils.utils.hash_genome`), using the hash derived while breeding it if ``should_hash_genomes`` is ``True`` and otherwise computing it in full (and, if ``should_remember`` is ``True``, remembering it until the genome leaves the population)
+
+        :param genome: the genome to hash
+        :type genome: dict
+
+        :param should_remember: whether to remember a hash computed in full; remembered hashes are only forgotten when the next generation is bred, so callers hashing genomes that may never be bred from (such as the hall of fame) should not remember them
+        :type should_remember: bool
+
+
+        :returns: an ``int`` equal to ``hash_genome(genome)``
+
+        Dependencies:
+            * :func:`~holland.utils.utils.hash_genome`
+        """
+        hashed_genome, genome_hash = self._genome_hashes.get(id(genome), (None, None))
+        if hashed_genome is not genome:
+            genome_hash = hash_genome(genome)
+            if should_remember:
+                self._genome_hashes[id(genome)] = (genome, genome_hash)
+        return genome_hash
+
+    def close(self):
+        """
+        Shuts down the worker processes used for parallel breeding, if any were started
+
+
+        :returns: ``None``
+        """
+        if self._breeding_workers is not None:
+            self._breeding_workers.close()
+            self._breeding_workers.join()
+            self._breeding_workers = None
+
     def generate_random_genomes(self, n_genomes):
         """
         Generates a given number of genomes based on genome parameters
@@ -140,19 +637,60 @@ class PopulationGenerator:
 
         :raises ValueError: if ``n_genomes < 0``
 
+        .. note:: ``"permutation"`` genes without an ``initial_distribution`` are initialized to a uniformly random ordering of their values.
+
+        .. note:: Genes with a ``batch_initial_distribution`` are generated for all ``n_genomes`` genomes with a single call to it and bounded with a single call to :func:`~holland.utils.utils.bound_values`, which is much faster than generating and bounding each value separately for large populations.
+
+        .. note:: If an ``rng`` was given, each genome is generated with the ``random`` module seeded from its own seed drawn from ``rng`` (genes with a ``batch_initial_distribution`` share one seed drawn from ``rng``), and the state of the ``random`` module is restored afterwards.
+
+        .. note:: Genomes also get the initial strategy parameters of each self-adaptive gene (see :ref:`self-adaptation`); since genes are never modified in place, all genomes share the same initial strategy objects.
+
         .. todo:: Write an example for usage
 
         Dependencies:
             * :func:`~holland.utils.utils.bound_value`
+            * :func:`~holland.utils.utils.get_permutation_values`
+            * :func:`~holland.utils.utils.get_initial_strategy`
+            * :func:`~holland.evolution.PopulationGenerator.generate_gene_batch`
         """
         if n_genomes < 0:
             raise ValueError("Number of random genomes per generation cannot be negative")
 
         genomes = []
-
-        for _ in range(n_genomes):
+        permutation_values = {
+            gene_name: get_permutation_values(gene_params)
+            for gene_name, gene_params in self.genome_params.items()
+            if is_permutation_type(gene_params) and "initial_distribution" not in gene_params
+        }
+
+        seeds = self._spawn_seeds(n_genomes)
+        if self._should_spawn_streams:
+            random_state = random.getstate()
+            random.seed(self.rng.getrandbits(64))
+
+        gene_batches = {
+            gene_name: self.generate_gene_batch(gene_params, n_genomes)
+            for gene_name, gene_params in self.genome_params.items()
+            if "batch_initial_distribution" in gene_params
+        }
+        initial_strategies = {
+            get_strategy_gene_name(gene_name): get_initial_strategy(gene_params)
+            for gene_name, gene_params in self.genome_params.items()
+            if "self_adaptation" in gene_params
+        }
+
+        for i, seed in enumerate(seeds):
+            if self._should_spawn_streams:
+                random.seed(seed)
             genome = {}
             for gene_name, gene_params in self.genome_params.items():
+                if gene_name in gene_batches:
+                    genome[gene_name] = gene_batches[gene_name][i]
+                    continue
+                if gene_name in permutation_values:
+                    values = permutation_values[gene_name]
+                    genome[gene_name] = random.sample(values, len(values))
+                    continue
                 initial_distribution = gene_params["initial_distribution"]
                 if is_list_type(gene_params):
                     if is_numeric_type(gene_params):
@@ -179,6 +717,85 @@ class PopulationGenerator:
                         )
                     else:
                         genome[gene_name] = initial_distribution()
+            genome.update(initial_strategies)
             genomes.append(genome)
 
+        if self._should_spawn_streams:
+            random.setstate(random_state)
         return genomes
+
+    def generate_gene_batch(self, gene_params, n_genomes):
+        """
+        Generates a single gene for each of a given number of genomes with one call to the gene's ``batch_initial_distribution``
+
+        :param gene_params: parameters for a single gene, including ``batch_initial_distribution``; see :ref:`genome-params`
+        :type gene_params: dict
+
+        :param n_genomes: the number of genes to produce
+        :type n_genomes: int
+
+
+        :returns: a list of ``n_genomes`` genes
+
+
+        :raises ValueError: if ``batch_initial_distribution`` does not return ``n_genomes`` values (``n_genomes * size`` values for list-type genes)
+
+        Dependencies:
+            * :func:`~holland.utils.utils.bound_values`
+        """
+        size = gene_params["size"] if is_list_type(gene_params) else 1
+        values = list(gene_params["batch_initial_distribution"](n_genomes * size))
+
+        if len(values) != n_genomes * size:
+            raise ValueError("Batch initial distribution must return one value per value requested")
+
+        if is_numeric_type(gene_params):
+            values = bound_values(
+                values,
+                minimum=gene_params.get("min"),
+                maximum=gene_params.get("max"),
+                to_int=gene_params.get("type") in ["int", "[int]"],
+            )
+
+        if is_list_type(gene_params):
+            return [values[i * size : (i + 1) * size] for i in range(n_genomes)]
+        return values
+
+    def _spawn_seeds(self, n_genomes):
+        if not self._should_spawn_streams:
+            return [None] * n_genomes
+        return [self.rng.getrandbits(64) for _ in range(n_genomes)]
+
+
+def _allocate(n_items, weights):
+    # largest remainder allocation of n_items in proportion to weights
+    total = sum(weights)
+    if total <= 0:
+        weights, total = [1] * len(weights), len(weights)
+    quotas = [n_items * weight / total for weight in weights]
+    allocation = [math.floor(quota) for quota in quotas]
+    by_remainder = sorted(
+        range(len(quotas)), key=lambda i: quotas[i] - allocation[i], reverse=True
+    )
+    for i in by_remainder[: n_items - sum(allocation)]:
+        allocation[i] += 1
+    return allocation
+
+
+_breeding_worker_state = {}
+
+
+def _initialize_breeding_worker(genome_params):
+    _breeding_worker_state["crosser"] = Crosser(genome_params)
+    _breeding_worker_state["mutator"] = Mutator(genome_params)
+
+
+def _breed_chunk(parent_groups, seeds):
+    crosser = _breeding_worker_state["crosser"]
+    mutator = _breeding_worker_state["mutator"]
+
+    bred_genomes = []
+    for parents, seed in zip(parent_groups, seeds):
+        random.seed(seed)
+        bred_genomes.append(mutator.mutate_genome(crosser.cross_genomes(parents)))
+    return bred_genomes
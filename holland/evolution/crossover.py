@@ -1,3 +1,6 @@
+from ..utils import get_strategy_gene_name
+
+
 class Crosser:
     """
     Handles genetic crossover
@@ -8,6 +11,11 @@ class Crosser:
 
     def __init__(self, genome_params):
         self.genome_params = genome_params
+        self._strategy_gene_names = {
+            get_strategy_gene_name(gene_name)
+            for gene_name, gene_params in genome_params.items()
+            if "self_adaptation" in gene_params
+        }
 
     def cross_genomes(self, parent_genomes):
         """
@@ -18,11 +26,32 @@ class Crosser:
 
 
         :returns: a single genome
+
+
+        .. note:: If every parent shares the same gene object (e.g. the same genome was selected as more than one parent, or the gene was passed down unchanged), the crossover function is skipped and the gene is shared with the offspring rather than copied.
+
+        .. note:: The strategy parameters of self-adaptive genes (see :ref:`self-adaptation`) are recombined by averaging those of the parents (intermediate recombination) rather than by a crossover function.
         """
         offspring = {}
         for gene_name in parent_genomes[0].keys():
-            parent_genes = [pg[gene_name] for pg in parent_genomes]
+            is_strategy = gene_name in self._strategy_gene_names
+            # parents from an initial population may not have strategy parameters yet
+            parent_genes = [
+                pg[gene_name] for pg in parent_genomes if not is_strategy or gene_name in pg
+            ]
+            if all(parent_gene is parent_genes[0] for parent_gene in parent_genes[1:]):
+                offspring[gene_name] = parent_genes[0]
+                continue
+            if is_strategy:
+                offspring[gene_name] = _average(parent_genes)
+                continue
             crossover_function = self.genome_params[gene_name]["crossover_function"]
             offspring[gene_name] = crossover_function(parent_genes)
 
         return offspring
+
+
+def _average(strategies):
+    if isinstance(strategies[0], list):
+        return [sum(values) / len(values) for values in zip(*strategies)]
+    return sum(strategies) / len(strategies)
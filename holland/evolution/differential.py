@@ -0,0 +1,98 @@
+import random
+import operator
+import itertools
+
+from .vectors import GenomeVectorizer
+
+
+class DifferentialBreeder(GenomeVectorizer):
+    """
+    Handles breeding trial genomes by differential evolution, for genomes whose genes are all of type ``"float"`` or ``"[float]"``
+
+    Genomes are bred as flat vectors of their values (see :class:`~holland.evolution.GenomeVectorizer`), so that each step of breeding is a single pass over whole vectors.
+
+    :param genome_params: a dictionary specifying genome parameters; see :ref:`genome-params`; only the ``type``, ``size``, ``min``, and ``max`` of each gene are used
+    :type genome_params: dict
+
+    :param differential_evolution_params: a dictionary specifying the strategy, differential weight, and crossover rate; see :ref:`differential-evolution`
+    :type differential_evolution_params: dict
+
+    :param rng: the source of randomness (a ``random.Random`` instance); the ``random`` module is used if not specified
+    :type rng: random.Random
+
+
+    :raises ValueError: if any gene is not of type ``"float"`` or ``"[float]"``
+    :raises ValueError: if ``strategy`` is not one of ``"rand/1/bin"``, ``"best/1/bin"``, ``"current-to-best/1/bin"``
+    :raises ValueError: if ``differential_weight`` is not positive or ``crossover_rate`` is not between 0 and 1
+    """
+
+    def __init__(self, genome_params, differential_evolution_params={}, rng=None):
+        super().__init__(genome_params)
+        self.rng = rng if rng is not None else random
+        self.strategy = differential_evolution_params.get("strategy", "rand/1/bin")
+        self.differential_weight = differential_evolution_params.get("differential_weight", 0.5)
+        self.crossover_rate = differential_evolution_params.get("crossover_rate", 0.9)
+
+        if self.strategy not in ["rand/1/bin", "best/1/bin", "current-to-best/1/bin"]:
+            raise ValueError(
+                "Differential evolution strategy must be one of "
+                "'rand/1/bin', 'best/1/bin', 'current-to-best/1/bin'"
+            )
+        if self.differential_weight <= 0:
+            raise ValueError("Differential weight must be positive")
+        if not 0 <= self.crossover_rate <= 1:
+            raise ValueError("Crossover rate must be between 0 and 1")
+
+    def breed_trial_vectors(self, vectors, best_index):
+        """
+        Breeds a trial vector for each target vector of the population
+
+        Each trial vector starts as a mutant vector: ``x_r1 + F * (x_r2 - x_r3)`` for ``"rand/1/bin"``, ``x_best + F * (x_r1 - x_r2)`` for ``"best/1/bin"``, and ``x_i + F * (x_best - x_i) + F * (x_r1 - x_r2)`` for ``"current-to-best/1/bin"``, where ``x_i`` is the target vector, ``F`` is the ``differential_weight``, and ``r1``, ``r2``, ``r3`` are distinct random indices other than ``i``. Each value of the mutant is then kept with probability ``crossover_rate`` and otherwise replaced by the value of the target vector (binomial crossover), keeping at least one value of the mutant, and the values are bounded to the ``min`` and ``max`` of their genes.
+
+        :param vectors: the vectors of the population (returned by :func:`~holland.evolution.GenomeVectorizer.to_vectors`)
+        :type vectors: list
+
+        :param best_index: the index of the most fit vector
+        :type best_index: int
+
+
+        :returns: a list with a trial vector for each vector of ``vectors``, in the same order
+
+
+        :raises ValueError: if the population is too small for the strategy (four vectors for ``"rand/1/bin"``, three otherwise)
+        """
+        n_vectors = len(vectors)
+        n_random_indices = 3 if self.strategy == "rand/1/bin" else 2
+        if n_vectors < n_random_indices + 1:
+            raise ValueError(
+                f"Population size must be at least {n_random_indices + 1} for '{self.strategy}'"
+            )
+
+        add, sub, mul = operator.add, operator.sub, operator.mul
+        rng = self.rng
+        weights = itertools.repeat(self.differential_weight)
+        best = vectors[best_index]
+        n_values = len(self.lower_bounds)
+
+        trial_vectors = []
+        for i, target in enumerate(vectors):
+            # sample from the other indices by skipping over i
+            indices = [j + (j >= i) for j in rng.sample(range(n_vectors - 1), n_random_indices)]
+            if self.strategy == "rand/1/bin":
+                base = vectors[indices[0]]
+                difference = map(sub, vectors[indices[1]], vectors[indices[2]])
+            elif self.strategy == "best/1/bin":
+                base = best
+                difference = map(sub, vectors[indices[0]], vectors[indices[1]])
+            else:
+                base = list(map(add, target, map(mul, weights, map(sub, best, target))))
+                difference = map(sub, vectors[indices[0]], vectors[indices[1]])
+            mutant = map(add, base, map(mul, weights, difference))
+
+            forced_index = int(rng.random() * n_values)
+            trial = [
+                value if k == forced_index or rng.random() < self.crossover_rate else target_value
+                for k, (value, target_value) in enumerate(zip(mutant, target))
+            ]
+            trial_vectors.append(self.bound_vector(trial))
+        return trial_vectors
@@ -1,3 +1,7 @@
+import random
+import operator
+
+
 class Evaluator:
     """
     Handles evaluation of genomes
@@ -7,27 +11,171 @@ class Evaluator:
 
     :param ascending: whether or not to sort results in ascending order of fitness
     :type ascending: bool
+
+    :param delta_fitness_function: a function ``delta_fitness_function(parent_fitness, parent_genome, changes)`` that computes the fitness of an offspring bred from a single parent by described mutations; see :ref:`delta-evaluation`
+    :type delta_fitness_function: func
+
+    :param local_search_params: a dictionary specifying a local search applied to some genomes after they are evaluated; see :ref:`local-search`
+    :type local_search_params: dict
+
+    :param is_multi_objective: whether the fitness function returns a tuple/list of objective values rather than a single score; see :ref:`multi-objective`
+    :type is_multi_objective: bool
+
+
+    :raises ValueError: if the local search ``rate`` is not between 0 and 1
+    :raises ValueError: if the local search ``max_evaluations < 1``
+    :raises ValueError: if a local search ``function`` is given and ``is_multi_objective`` is ``True``
     """
 
-    def __init__(self, fitness_function, ascending=True):
+    def __init__(
+        self,
+        fitness_function,
+        ascending=True,
+        delta_fitness_function=None,
+        local_search_params={},
+        is_multi_objective=False,
+    ):
         self.fitness_function = fitness_function
         self.ascending = ascending
+        self.delta_fitness_function = delta_fitness_function
+        self.is_multi_objective = is_multi_objective
+
+        self.local_search_function = local_search_params.get("function", None)
+        self.local_search_rate = local_search_params.get("rate", 0.1)
+        self.local_search_max_evaluations = local_search_params.get("max_evaluations", 100)
+        self.is_local_search_lamarckian = local_search_params.get("is_lamarckian", True)
+
+        if not 0 <= self.local_search_rate <= 1:
+            raise ValueError("Local search rate must be between 0 and 1")
+        if self.local_search_max_evaluations < 1:
+            raise ValueError("Local search evaluation budget must be at least 1")
+        if self.local_search_function is not None and is_multi_objective:
+            raise ValueError("Local search requires a single fitness score")
 
-    def evaluate_fitness(self, gene_pool):
+    def evaluate_fitness(self, gene_pool, lineage=None, should_sort=True):
         """
         Evaluates the fitness of a population by applying a fitness function to each genome in the population
 
         :param gene_pool: a population of genomes to evaluate
         :type gene_pool: list
 
+        :param lineage: a dictionary mapping ``id(genome)`` to a tuple ``(parent_fitness, parent_genome, changes)`` for genomes bred from a single parent by described mutations (:attr:`~holland.evolution.PopulationGenerator.lineage`); the fitness of these genomes is computed with the ``delta_fitness_function`` instead of the fitness function
+        :type lineage: dict
+
+        :param should_sort: whether to sort the results by fitness; if ``False``, results are in the order of ``gene_pool``
+        :type should_sort: bool
+
 
         :returns: a sorted list of tuples of the form ``(score, genome)``.
+
+
+        Dependencies:
+            * :func:`~holland.evolution.Evaluator.evaluate_genome`
+            * :func:`~holland.evolution.Evaluator.evaluate_genome_by_delta`
+        """
+        if self.delta_fitness_function is None or not lineage:
+            results = [self.evaluate_genome(genome) for genome in gene_pool]
+        else:
+            results = [
+                self.evaluate_genome_by_delta(genome, *lineage[id(genome)])
+                if id(genome) in lineage
+                else self.evaluate_genome(genome)
+                for genome in gene_pool
+            ]
+        if should_sort:
+            results.sort(key=lambda x: x[0], reverse=(not self.ascending))
+        return results
+
+    def evaluate_genome(self, genome):
+        """
+        Evaluates the fitness of a single genome by applying the fitness function to it
+
+        :param genome: the genome to evaluate
+        :type genome: dict
+
+
+        :returns: a tuple of the form ``(score, genome)``; if the fitness function returns a tuple/list (Lamarckian evolution) it is returned as is; if ``is_multi_objective`` is ``True``, the score is a tuple of objective values, and the fitness function is Lamarckian if it returns a tuple/list whose first element is itself a tuple/list
+
+
+        .. note:: If a local search ``function`` is given, the result of a ``rate`` fraction of genomes is replaced by the result of :func:`~holland.evolution.Evaluator.search_locally`. Since this method is also what the worker processes of ``"asynchronous"`` mode call, the local search runs in the workers, next to the evaluation it refines.
+
+        Dependencies:
+            * :func:`~holland.evolution.Evaluator.search_locally`
+        """
+        result = self.fitness_function(genome)
+        if self.is_multi_objective:
+            if type(result[0]) in [list, tuple]:
+                return (tuple(result[0]), result[1])
+            return (tuple(result), genome)
+        if type(result) not in [list, tuple]:
+            result = (result, genome)
+        if self.local_search_function is not None and random.random() < self.local_search_rate:
+            return self.search_locally(*result)
+        return result
+
+    def evaluate_genome_by_delta(self, genome, parent_fitness, parent_genome, changes):
         """
-        results = []
-        for genome in gene_pool:
-            result = self.fitness_function(genome)
-            if type(result) in [list, tuple]:
-                results.append(result)
-            else:
-                results.append((result, genome))
-        return sorted(results, key=lambda x: x[0], reverse=(not self.ascending))
+        Evaluates the fitness of a genome bred from a single parent by described mutations, by applying the ``delta_fitness_function`` to the parent's fitness and the changes rather than applying the fitness function to the whole genome
+
+        :param genome: the genome to evaluate
+        :type genome: dict
+
+        :param parent_fitness: the fitness score of the parent
+        :type parent_fitness: int/float
+
+        :param parent_genome: the genome of the parent
+        :type parent_genome: dict
+
+        :param changes: a dictionary mapping the name of each mutated gene to the description of its change (returned by :func:`~holland.evolution.Mutator.mutate_genome_with_changes`)
+        :type changes: dict
+
+
+        :returns: a tuple of the form ``(score, genome)``; the parent's fitness is reused without calling the ``delta_fitness_function`` if ``changes`` is empty
+        """
+        if not changes:
+            return (parent_fitness, genome)
+        return (self.delta_fitness_function(parent_fitness, parent_genome, changes), genome)
+
+    def search_locally(self, fitness, genome):
+        """
+        Refines an evaluated genome by applying the local search ``function`` to it, with a budget of ``max_evaluations`` calls of the fitness function
+
+        The local search function is called as ``function(genome, fitness, evaluate, is_better)``, where ``evaluate(candidate)`` returns the fitness of a candidate genome (or ``None`` once the budget is used, without evaluating it) and ``is_better(fitness_a, fitness_b)`` tells whether ``fitness_a`` is more fit than ``fitness_b``; it must return a tuple ``(fitness, genome)`` of the most fit genome found.
+
+        :param fitness: the fitness score of the genome
+        :type fitness: int/float
+
+        :param genome: the genome to refine
+        :type genome: dict
+
+
+        :returns: a tuple of the form ``(score, genome)``; the genome found by the local search if ``is_lamarckian`` is ``True``, and the given genome (with the fitness found by the local search) otherwise
+        """
+        n_evaluations = 0
+
+        def evaluate(candidate):
+            nonlocal n_evaluations
+            if n_evaluations >= self.local_search_max_evaluations:
+                return None
+            n_evaluations += 1
+            result = self.fitness_function(candidate)
+            return result[0] if type(result) in [list, tuple] else result
+
+        is_better = operator.gt if self.ascending else operator.lt
+        searched_fitness, searched_genome = self.local_search_function(
+            genome, fitness, evaluate, is_better
+        )
+        if self.is_local_search_lamarckian:
+            return (searched_fitness, searched_genome)
+        return (searched_fitness, genome)
+
+
+_evaluation_worker_state = {}
+
+
+def _initialize_evaluation_worker(evaluator):
+    _evaluation_worker_state["evaluator"] = evaluator
+
+
+def _evaluate_genome_in_worker(genome):
+    return _evaluation_worker_state["evaluator"].evaluate_genome(genome)
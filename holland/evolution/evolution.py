@@ -1,9 +1,23 @@
+import os
 import math
+import queue
+import random
 import logging
+import functools
 
-from .evaluation import Evaluator
+from .evaluation import Evaluator, _initialize_evaluation_worker, _evaluate_genome_in_worker
 from .breeding import PopulationGenerator
+from .population import SortedPopulation
+from .differential import DifferentialBreeder
+from .strategies import EvolutionStrategy
+from .restarts import RestartStrategy
 from ..storage import StorageManager
+from ..utils import (
+    create_process_pool,
+    get_grid_shape,
+    get_grid_neighborhoods,
+    select_non_dominated,
+)
 
 
 class Evolver:
@@ -21,15 +35,24 @@ class Evolver:
 
     :param should_maximize_fitness: whether fitness should be maximized or minimized
     :type should_maximize_fitness: bool
+
+    :param delta_fitness_function: a function ``delta_fitness_function(parent_fitness, parent_genome, changes)`` used instead of ``fitness_function`` to evaluate offspring bred from a single parent by mutations that describe their changes; see :ref:`delta-evaluation`
+    :type delta_fitness_function: function
     """
 
     def __init__(
-        self, fitness_function, genome_params, selection_strategy, should_maximize_fitness=True
+        self,
+        fitness_function,
+        genome_params,
+        selection_strategy,
+        should_maximize_fitness=True,
+        delta_fitness_function=None,
     ):
         self.fitness_function = fitness_function
         self.genome_params = genome_params
         self.selection_strategy = selection_strategy
         self.should_maximize_fitness = should_maximize_fitness
+        self.delta_fitness_function = delta_fitness_function
 
     def evolve(
         self,
@@ -38,6 +61,7 @@ class Evolver:
         stop_conditions={"n_generations": 100, "target_fitness": math.inf},
         storage_options={},
         logging_options={"level": logging.INFO, "format": "%(message)s"},
+        seed=None,
     ):
         """
         The heart of Holland.
@@ -51,12 +75,15 @@ class Evolver:
         :param stop_conditions: conditions for stopping execution; will stop if *any* of the conditions is met; see Stop Conditions below
         :type stop_conditions: dict
     
-        :param storage_options: configuration options for storing fitness and genomes (should contain keys ``"fitness"`` and ``"genomes"``); see :ref:`fitness-storage-options` and :ref:`genome-storage-options`
+        :param storage_options: configuration options for storing fitness and genomes (should contain keys ``"fitness"`` and ``"genomes"``, and may contain ``"hall_of_fame"``); see :ref:`fitness-storage-options`, :ref:`genome-storage-options`, and :ref:`hall-of-fame-options`
         :type storage_options: dict
 
         :param logging_options: options for logging passed to `logging.basicConfig <https://docs.python.org/3/library/logging.html#logging.basicConfig>`_ as ``kwargs``
         :type logging_options: dict
 
+        :param seed: a seed (or a ``random.Random`` instance) from which to draw all random streams of the run, making it reproducible; see :ref:`random-streams`
+        :type seed: int/random.Random
+
         :Stop Conditions:
             * **n_generations** (*int*) -- the number of generations to run evolution over
             * **target_fitness** (*int*) -- the target fitness score, will stop once the fittest individual reaches this score
@@ -65,22 +92,47 @@ class Evolver:
         :returns:
             * a list of fitness scores and genomes ``[(fitness, genome), ...]`` (fitness results); or
             * a tuple of fitness results (previous bullet) and list of historical fitness statistics ``(fitness_results, fitness_history)``,  if ``storage_options["fitness"]`` has ``'should_record_fitness': True`` and ``'format': 'memory'``
+            * with the fitness results of the hall of fame (the most fit unique genomes of all generations, sorted) appended, ``(fitness_results, hall_of_fame)`` or ``(fitness_results, fitness_history, hall_of_fame)``, if ``storage_options["hall_of_fame"]`` has a ``size``
 
 
         :raises ValueError: if ``generation_params["n_random"] < 0`` or ``generation_params["n_elite"] < 0``
         :raises ValueError: if ``population_size < 1``
         :raises ValueError: if ``n_generations < 1``
+        :raises ValueError: if ``generation_params["mode"]`` is not one of ``"generational"``, ``"steady_state"``, ``"asynchronous"``, ``"cellular"``, ``"differential_evolution"``, ``"evolution_strategy"``, ``"nsga2"``
+        :raises ValueError: if ``generation_params["n_offspring_per_step"] < 1``
+        :raises ValueError: if ``generation_params["replacement"]`` is not one of ``"worst"``, ``"random"``
+        :raises ValueError: if ``mode`` is ``"asynchronous"`` and ``generation_params["n_evaluation_workers"] < 1``
+        :raises ValueError: if ``generation_params["cell_replacement"]`` is not one of ``"if_better"``, ``"always"``
+        :raises ValueError: if ``generation_params["grid_shape"]`` does not have one cell per individual, or the ``neighborhood`` is invalid (see :func:`~holland.utils.grids.get_grid_neighborhoods`)
+        :raises ValueError: if ``generation_params["speciation"]`` is given and ``mode`` is not ``"generational"``
+        :raises ValueError: if ``mode`` is ``"differential_evolution"`` and the genes or ``generation_params["differential_evolution"]`` are invalid (see :class:`~holland.evolution.DifferentialBreeder`)
+        :raises ValueError: if ``mode`` is ``"evolution_strategy"`` and the genes or ``generation_params["evolution_strategy"]`` are invalid (see :class:`~holland.evolution.EvolutionStrategy`)
+        :raises ValueError: if ``mode`` is ``"nsga2"`` and a local search is given
+        :raises ValueError: if ``mode`` is ``"nsga2"`` and a hall of fame is given, or the hall of fame ``size < 1``
+        :raises ValueError: if ``generation_params["restart"]`` is given and ``mode`` is ``"asynchronous"`` or ``"nsga2"``, or it is invalid (see :class:`~holland.evolution.RestartStrategy`)
+        :raises ValueError: if the restart ``policy`` is ``"ipop"`` and ``generation_params["grid_shape"]`` is given
+        :raises ValueError: if ``generation_params["population_size_schedule"]`` is given and ``mode`` is not ``"generational"`` or a restart is given, or it is invalid (see :class:`~holland.evolution.PopulationGenerator`)
 
 
         .. todo:: If an initial population is given but does not match the given genome parameters, some kind of error should be raised
         .. todo:: If an initial population is given and some genomes are missing parameters, a warning is given unless a flag is set to fill those values randomly
 
+        .. note:: By default evolution is generational: each generation is evaluated in full and replaced by the next. With ``generation_params["mode"]`` set to ``"steady_state"`` a few offspring at a time are bred, evaluated, and inserted into the sorted population instead, and with ``"asynchronous"`` genomes are evaluated by a pool of worker processes and a new offspring is bred and dispatched as soon as any worker returns a result, with ``"cellular"`` individuals live on a toroidal grid and breed only with their neighbors, with ``"differential_evolution"`` each genome competes with a trial genome built from the differences between other genomes, with ``"evolution_strategy"`` the offspring of each generation are Gaussian perturbations of the fittest genomes with an adaptive step size, and with ``"nsga2"`` the fitness function returns several objectives and genomes are ranked by Pareto dominance; see :ref:`generation-params`.
+
+        .. note:: If ``generation_params["restart"]`` is given, a run whose best fitness stops improving is restarted from a new population built by :func:`~holland.evolution.RestartStrategy.restart`, with generations numbered on from the last generation before the restart; the evaluator, population generator (with its breeding workers and genome hashes), and storage manager (with its hall of fame) are kept across restarts; see :ref:`restarts`.
+
         Dependencies:
             * :func:`~holland.evolution.PopulationGenerator.generate_random_genomes`
-            * :func:`~holland.evolution.Evaluator.evaluate_fitness`
-            * :func:`~holland.evolution.PopulationGenerator.generate_next_generation`
-            * :func:`~holland.storage.StorageManager.update_storage`
-            * :func:`~holland.storage.StorageManager.react_to_interruption`
+            * :func:`~holland.evolution.Evolver._run_generational`
+            * :func:`~holland.evolution.Evolver._run_steady_state`
+            * :func:`~holland.evolution.Evolver._run_asynchronous`
+            * :func:`~holland.evolution.Evolver._run_cellular`
+            * :func:`~holland.evolution.Evolver._run_differential_evolution`
+            * :func:`~holland.evolution.Evolver._run_evolution_strategy`
+            * :func:`~holland.evolution.Evolver._run_nsga2`
+            * :func:`~holland.evolution.RestartStrategy.update`
+            * :func:`~holland.evolution.RestartStrategy.restart`
+            * :func:`~holland.evolution.PopulationGenerator.close`
 
 
         Example:
@@ -91,10 +143,16 @@ class Evolver:
         n_random_per_generation = generation_params.get("n_random", 0)
         n_elite_per_generation = generation_params.get("n_elite", 0)
         population_size = generation_params.get("population_size", 1000)
+        mode = generation_params.get("mode", "generational")
+        n_offspring_per_step = generation_params.get("n_offspring_per_step", 1)
+        replacement = generation_params.get("replacement", "worst")
+        n_evaluation_workers = generation_params.get("n_evaluation_workers", os.cpu_count() or 1)
+        cell_replacement = generation_params.get("cell_replacement", "if_better")
         n_generations = stop_conditions.get("n_generations", math.inf)
         target_fitness = stop_conditions.get("target_fitness", math.inf)
+        has_reached_target = lambda max_fit: max_fit == target_fitness
         should_stop = (
-            lambda gen_num, max_fit: gen_num == n_generations - 1 or max_fit == target_fitness
+            lambda gen_num, max_fit: gen_num == n_generations - 1 or has_reached_target(max_fit)
         )
 
         if n_random_per_generation < 0 or n_elite_per_generation < 0:
@@ -103,27 +161,190 @@ class Evolver:
             raise ValueError("Population size must be at least 1")
         if n_generations < 1:
             raise ValueError("Number of generations must be at least 1")
+        if mode not in [
+            "generational",
+            "steady_state",
+            "asynchronous",
+            "cellular",
+            "differential_evolution",
+            "evolution_strategy",
+            "nsga2",
+        ]:
+            raise ValueError(
+                "Mode must be one of 'generational', 'steady_state', 'asynchronous', 'cellular', "
+                "'differential_evolution', 'evolution_strategy', 'nsga2'"
+            )
+        if n_offspring_per_step < 1:
+            raise ValueError("Number of offspring per step must be at least 1")
+        if replacement not in ["worst", "random"]:
+            raise ValueError("Replacement policy must be either 'worst' or 'random'")
+        if mode == "asynchronous" and n_evaluation_workers < 1:
+            raise ValueError("Number of evaluation workers must be at least 1")
+        if cell_replacement not in ["if_better", "always"]:
+            raise ValueError("Cell replacement policy must be either 'if_better' or 'always'")
+        if "speciation" in generation_params and mode != "generational":
+            raise ValueError("Speciation is only supported in 'generational' mode")
+        if "hall_of_fame" in storage_options and mode == "nsga2":
+            raise ValueError("A hall of fame is not supported in 'nsga2' mode")
+        if "restart" in generation_params and mode in ["asynchronous", "nsga2"]:
+            raise ValueError("Restarts are not supported in 'asynchronous' or 'nsga2' mode")
+        if "population_size_schedule" in generation_params and mode != "generational":
+            raise ValueError("Population size schedules are only supported in 'generational' mode")
+        if "population_size_schedule" in generation_params and "restart" in generation_params:
+            raise ValueError("A population size schedule cannot be given with restarts")
+        if (
+            generation_params.get("restart", {}).get("policy") == "ipop"
+            and generation_params.get("grid_shape") is not None
+        ):
+            raise ValueError("A grid shape cannot be given with 'ipop' restarts")
+
+        schedule = generation_params.get("population_size_schedule", {})
+        should_hash_genomes = generation_params.get(
+            "should_hash_genomes",
+            "size" in storage_options.get("hall_of_fame", {})
+            or (schedule.get("type") == "adaptive" and "diversity_function" not in schedule),
+        )
+
+        restart_strategy = None
+        if "restart" in generation_params:
+            restart_strategy = RestartStrategy(
+                generation_params["restart"], ascending=self.should_maximize_fitness
+            )
+
+            def should_stop_or_restart(generation_num, best_fitness):
+                return should_stop(generation_num, best_fitness) or restart_strategy.update(
+                    generation_num, best_fitness
+                )
 
         logging.basicConfig(**logging_options)
         logger = logging.getLogger(__name__)
 
-        evaluator = Evaluator(self.fitness_function, ascending=self.should_maximize_fitness)
+        rng = None
+        if seed is not None:
+            rng = seed if isinstance(seed, random.Random) else random.Random(seed)
+
+        evaluator = Evaluator(
+            self.fitness_function,
+            ascending=self.should_maximize_fitness,
+            delta_fitness_function=self.delta_fitness_function,
+            local_search_params=generation_params.get("local_search", {}),
+            is_multi_objective=mode == "nsga2",
+        )
+        population_generator = PopulationGenerator(
+            self.genome_params,
+            self.selection_strategy,
+            generation_params=generation_params,
+            should_track_lineage=self.delta_fitness_function is not None,
+            rng=rng,
+            should_hash_genomes=should_hash_genomes,
+        )
         storage_manager = StorageManager(
             fitness_storage_options=storage_options.get("fitness", {}),
             genome_storage_options=storage_options.get("genomes", {}),
+            hall_of_fame_options=storage_options.get("hall_of_fame", {}),
+            ascending=self.should_maximize_fitness,
+            hash_function=functools.partial(
+                population_generator.get_genome_hash, should_remember=False
+            ),
         )
-        population_generator = PopulationGenerator(
-            self.genome_params, self.selection_strategy, generation_params=generation_params
-        )
 
-        population = initial_population
-        if population is None:
-            population = population_generator.generate_random_genomes(population_size)
+        if mode == "steady_state":
+            run = self._run_steady_state
+        elif mode == "asynchronous":
+            run = self._run_asynchronous
+        elif mode == "cellular":
+            run = self._run_cellular
+        elif mode == "differential_evolution":
+            run = self._run_differential_evolution
+        elif mode == "evolution_strategy":
+            run = self._run_evolution_strategy
+        elif mode == "nsga2":
+            run = self._run_nsga2
+        else:
+            run = self._run_generational
+
+        if seed is not None:
+            # the random module is reseeded for each genome, so restore it once evolution ends
+            random_state = random.getstate()
+        try:
+            if seed is not None:
+                random.seed(rng.getrandbits(64))
+            population = initial_population
+            if population is None:
+                population = population_generator.generate_random_genomes(population_size)
+
+            first_generation_num = 0
+            while True:
+                fitness_results = run(
+                    population,
+                    evaluator,
+                    population_generator,
+                    storage_manager,
+                    logger,
+                    should_stop if restart_strategy is None else should_stop_or_restart,
+                    has_reached_target,
+                    generation_params,
+                    first_generation_num=first_generation_num,
+                )
+                if restart_strategy is None or not restart_strategy.is_stagnant:
+                    break
+
+                hall_of_fame = storage_manager.hall_of_fame
+                population = restart_strategy.restart(
+                    fitness_results,
+                    population_generator,
+                    hall_of_fame=hall_of_fame.fitness_results if hall_of_fame is not None else None,
+                )
+                first_generation_num = restart_strategy.last_generation_num + 1
+                logger.info(
+                    f"Generation: {first_generation_num}; Restart: {restart_strategy.n_restarts}; "
+                    f"Population Size: {len(population)}"
+                )
+        finally:
+            population_generator.close()
+            if seed is not None:
+                random.setstate(random_state)
+        storage_manager.record_hall_of_fame()
+
+        outputs = [fitness_results]
+        if (
+            storage_options.get("fitness", {}).get("should_record_fitness", False)
+            and storage_options.get("fitness", {}).get("format") == "memory"
+        ):
+            outputs.append(storage_manager.fitness_history)
+        if "size" in storage_options.get("hall_of_fame", {}):
+            outputs.append(storage_manager.hall_of_fame.fitness_results)
+        return outputs[0] if len(outputs) == 1 else tuple(outputs)
+
+    def _run_generational(
+        self,
+        population,
+        evaluator,
+        population_generator,
+        storage_manager,
+        logger,
+        should_stop,
+        has_reached_target,
+        generation_params,
+        first_generation_num=0,
+    ):
+        """
+        Runs generational evolution: each generation is evaluated in full, then replaced by the next generation
 
-        generation_num = 0
+        :returns: the fitness results of the last generation
+
+        Dependencies:
+            * :func:`~holland.evolution.Evaluator.evaluate_fitness`
+            * :func:`~holland.evolution.PopulationGenerator.generate_next_generation`
+            * :func:`~holland.storage.StorageManager.update_storage`
+            * :func:`~holland.storage.StorageManager.react_to_interruption`
+        """
+        generation_num = first_generation_num
         while True:
             try:
-                fitness_results = evaluator.evaluate_fitness(population)
+                fitness_results = evaluator.evaluate_fitness(
+                    population, lineage=population_generator.lineage
+                )
 
                 best_fitness = fitness_results[-1][0]
                 logger.info(f"Generation: {generation_num}; Top Score: {best_fitness}")
@@ -134,15 +355,509 @@ class Evolver:
                     break
 
                 population = population_generator.generate_next_generation(fitness_results)
+                if population_generator.compatibility_function is not None:
+                    logger.info(
+                        f"Generation: {generation_num}; Species Sizes: {population_generator.species_sizes}"
+                    )
+                if population_generator.population_size_schedule is not None:
+                    logger.info(
+                        f"Generation: {generation_num}; Next Population Size: {len(population)}"
+                    )
+
+                generation_num += 1
+            except:
+                storage_manager.react_to_interruption(generation_num, fitness_results)
+                raise
+
+        return fitness_results
+
+    def _run_steady_state(
+        self,
+        population,
+        evaluator,
+        population_generator,
+        storage_manager,
+        logger,
+        should_stop,
+        has_reached_target,
+        generation_params,
+        first_generation_num=0,
+    ):
+        """
+        Runs steady-state evolution: in each step ``n_offspring_per_step`` offspring are bred from the current population, evaluated, and inserted into it according to the ``replacement`` policy; a generation (for logging, storage, and stop conditions) is the number of steps needed to breed as many offspring as there are individuals in the population
+
+        :returns: the fitness results of the final population
+
+        Dependencies:
+            * :func:`~holland.evolution.Evaluator.evaluate_fitness`
+            * :func:`~holland.evolution.PopulationGenerator.breed_next_generation`
+            * :func:`~holland.evolution.SortedPopulation.replace`
+            * :func:`~holland.storage.StorageManager.update_storage`
+            * :func:`~holland.storage.StorageManager.update_hall_of_fame`
+            * :func:`~holland.storage.StorageManager.react_to_interruption`
+        """
+        n_offspring_per_step = generation_params.get("n_offspring_per_step", 1)
+        replacement = generation_params.get("replacement", "worst")
+        n_elite = generation_params.get("n_elite", 0)
+
+        sorted_population = SortedPopulation(
+            evaluator.evaluate_fitness(population),
+            ascending=evaluator.ascending,
+            rng=population_generator.rng,
+        )
+        steps_per_generation = math.ceil(len(sorted_population) / n_offspring_per_step)
+
+        generation_num = first_generation_num
+        while True:
+            try:
+                fitness_results = sorted_population.fitness_results
+
+                best_fitness = fitness_results[-1][0]
+                logger.info(f"Generation: {generation_num}; Top Score: {best_fitness}")
+
+                storage_manager.update_storage(generation_num, fitness_results)
+
+                if should_stop(generation_num, best_fitness):
+                    break
+
+                for _ in range(steps_per_generation):
+                    offspring = population_generator.breed_next_generation(
+                        sorted_population.fitness_results, n_offspring_per_step
+                    )
+                    offspring_results = evaluator.evaluate_fitness(
+                        offspring, lineage=population_generator.lineage
+                    )
+                    storage_manager.update_hall_of_fame(offspring_results)
+                    for fitness, genome in offspring_results:
+                        sorted_population.replace(
+                            fitness, genome, policy=replacement, n_protected=n_elite
+                        )
+                    if has_reached_target(sorted_population.fitness_results[-1][0]):
+                        break
+
+                generation_num += 1
+            except:
+                storage_manager.react_to_interruption(
+                    generation_num, sorted_population.fitness_results
+                )
+                raise
+
+        return sorted_population.fitness_results
+
+    def _run_asynchronous(
+        self,
+        population,
+        evaluator,
+        population_generator,
+        storage_manager,
+        logger,
+        should_stop,
+        has_reached_target,
+        generation_params,
+        first_generation_num=0,
+    ):
+        """
+        Runs asynchronous evolution: genomes are evaluated by a pool of ``n_evaluation_workers`` processes and, each time a worker returns a fitness score, the result is inserted into the sorted population (according to the ``replacement`` policy once the population is full) and a new genome, bred from the population, is dispatched so that every worker stays busy; no genome is bred until the whole initial population has been evaluated, so at most ``population_size`` evaluations are in flight before then; a generation (for logging, storage, and stop conditions) is as many evaluations as there are individuals in the initial population
+
+        :returns: the fitness results of the final population
+
+        .. note:: Results depend on the order in which evaluations finish, so asynchronous runs are not reproducible, even with a ``seed``.
+
+        .. note:: Every genome is evaluated in full by the workers; a ``delta_fitness_function`` is not used in this mode.
+
+        Dependencies:
+            * :func:`~holland.utils.parallel.create_process_pool`
+            * :func:`~holland.evolution.Evaluator.evaluate_genome`
+            * :func:`~holland.evolution.PopulationGenerator.breed_next_generation`
+            * :func:`~holland.evolution.SortedPopulation.insert`
+            * :func:`~holland.evolution.SortedPopulation.replace`
+            * :func:`~holland.storage.StorageManager.update_storage`
+            * :func:`~holland.storage.StorageManager.update_hall_of_fame`
+            * :func:`~holland.storage.StorageManager.react_to_interruption`
+        """
+        n_evaluation_workers = generation_params.get("n_evaluation_workers", os.cpu_count() or 1)
+        replacement = generation_params.get("replacement", "worst")
+        n_elite = generation_params.get("n_elite", 0)
+        population_size = len(population)
+
+        sorted_population = SortedPopulation(
+            [], ascending=evaluator.ascending, rng=population_generator.rng
+        )
+        completed = queue.Queue()
+        workers = create_process_pool(
+            n_evaluation_workers,
+            initializer=_initialize_evaluation_worker,
+            initargs=(evaluator,),
+        )
+
+        def dispatch(genome):
+            workers.apply_async(
+                _evaluate_genome_in_worker,
+                (genome,),
+                callback=completed.put,
+                error_callback=completed.put,
+            )
+
+        generation_num = first_generation_num
+        try:
+            for genome in population:
+                dispatch(genome)
+            n_pending = len(population)
+            n_evaluated = 0
+
+            while True:
+                result = completed.get()
+                n_pending -= 1
+                if isinstance(result, BaseException):
+                    raise result
+
+                fitness, genome = result
+                storage_manager.update_hall_of_fame([result])
+                if len(sorted_population) < population_size:
+                    sorted_population.insert(fitness, genome)
+                else:
+                    sorted_population.replace(
+                        fitness, genome, policy=replacement, n_protected=n_elite
+                    )
+                n_evaluated += 1
+
+                best_fitness = sorted_population.fitness_results[-1][0]
+                is_end_of_generation = n_evaluated % population_size == 0
+                if is_end_of_generation or has_reached_target(best_fitness):
+                    logger.info(f"Generation: {generation_num}; Top Score: {best_fitness}")
+                    storage_manager.update_storage(
+                        generation_num, sorted_population.fitness_results
+                    )
+
+                    if should_stop(generation_num, best_fitness):
+                        break
+                    generation_num += 1
+
+                # the initial genomes still pending complete the population, so none is added
+                # before they are all evaluated
+                while (
+                    n_pending < n_evaluation_workers and len(sorted_population) == population_size
+                ):
+                    new_genome = population_generator.breed_next_generation(
+                        sorted_population.fitness_results, 1
+                    )[0]
+                    dispatch(new_genome)
+                    n_pending += 1
+        except:
+            storage_manager.react_to_interruption(generation_num, sorted_population.fitness_results)
+            raise
+        finally:
+            workers.terminate()
+            workers.join()
+
+        return sorted_population.fitness_results
+
+    def _run_cellular(
+        self,
+        population,
+        evaluator,
+        population_generator,
+        storage_manager,
+        logger,
+        should_stop,
+        has_reached_target,
+        generation_params,
+        first_generation_num=0,
+    ):
+        """
+        Runs cellular evolution: each individual occupies a cell of a toroidal grid and, in each generation, every cell breeds an offspring from parents selected in its neighborhood, which replaces the individual of the cell according to the ``cell_replacement`` policy; all cells are updated at once from the previous generation
+
+        The fitness scores and genomes of the grid are kept in two flat lists in row-major order and the neighborhood of each cell is computed once, so that a generation only indexes into these lists and the grid can be split into blocks of rows for parallel breeding.
+
+        :returns: the fitness results of the final population (sorted)
+
+        :raises ValueError: if ``grid_shape`` does not have one cell per individual
+
+        Dependencies:
+            * :func:`~holland.utils.grids.get_grid_shape`
+            * :func:`~holland.utils.grids.get_grid_neighborhoods`
+            * :func:`~holland.evolution.Evaluator.evaluate_fitness`
+            * :func:`~holland.evolution.PopulationGenerator.breed_cells`
+            * :func:`~holland.storage.StorageManager.update_storage`
+            * :func:`~holland.storage.StorageManager.react_to_interruption`
+        """
+        grid_shape = generation_params.get("grid_shape", None) or get_grid_shape(len(population))
+        n_rows, n_columns = grid_shape
+        if n_rows * n_columns != len(population):
+            raise ValueError("Grid shape must have one cell per individual")
+        neighborhoods = get_grid_neighborhoods(
+            grid_shape,
+            neighborhood=generation_params.get("neighborhood", "von_neumann"),
+            radius=generation_params.get("neighborhood_radius", 1),
+        )
+        should_always_replace = generation_params.get("cell_replacement", "if_better") == "always"
+        is_better = (lambda a, b: a > b) if evaluator.ascending else (lambda a, b: a < b)
+
+        initial_results = evaluator.evaluate_fitness(population, should_sort=False)
+        fitnesses, genomes = (list(values) for values in zip(*initial_results))
+        sort_key = lambda fitness_result: fitness_result[0]
+
+        generation_num = first_generation_num
+        fitness_results = []
+        while True:
+            try:
+                fitness_results = sorted(
+                    zip(fitnesses, genomes), key=sort_key, reverse=not evaluator.ascending
+                )
+
+                best_fitness = fitness_results[-1][0]
+                logger.info(f"Generation: {generation_num}; Top Score: {best_fitness}")
+
+                storage_manager.update_storage(generation_num, fitness_results)
+
+                if should_stop(generation_num, best_fitness):
+                    break
+
+                offspring = population_generator.breed_cells(
+                    list(zip(fitnesses, genomes)), neighborhoods, n_columns
+                )
+                offspring_results = evaluator.evaluate_fitness(
+                    offspring, lineage=population_generator.lineage, should_sort=False
+                )
+                for i, (fitness, genome) in enumerate(offspring_results):
+                    if should_always_replace or is_better(fitness, fitnesses[i]):
+                        fitnesses[i] = fitness
+                        genomes[i] = genome
+
+                generation_num += 1
+            except:
+                storage_manager.react_to_interruption(generation_num, fitness_results)
+                raise
+
+        return fitness_results
+
+    def _run_differential_evolution(
+        self,
+        population,
+        evaluator,
+        population_generator,
+        storage_manager,
+        logger,
+        should_stop,
+        has_reached_target,
+        generation_params,
+        first_generation_num=0,
+    ):
+        """
+        Runs differential evolution: in each generation a trial genome is bred for every genome of the population by :func:`~holland.evolution.DifferentialBreeder.breed_trial_vectors`, and each trial replaces its target genome if it is at least as fit
+
+        The population is kept as a list of vectors of gene values (with a parallel list of fitness scores), so genomes are only built to evaluate trials.
+
+        :returns: the fitness results of the final population (sorted)
+
+        Dependencies:
+            * :func:`~holland.evolution.GenomeVectorizer.to_vectors`
+            * :func:`~holland.evolution.DifferentialBreeder.breed_trial_vectors`
+            * :func:`~holland.evolution.GenomeVectorizer.to_genomes`
+            * :func:`~holland.evolution.Evaluator.evaluate_fitness`
+            * :func:`~holland.storage.StorageManager.update_storage`
+            * :func:`~holland.storage.StorageManager.react_to_interruption`
+        """
+        breeder = DifferentialBreeder(
+            self.genome_params,
+            generation_params.get("differential_evolution", {}),
+            rng=population_generator.rng,
+        )
+        is_worse = (lambda a, b: a < b) if evaluator.ascending else (lambda a, b: a > b)
+
+        initial_results = evaluator.evaluate_fitness(population, should_sort=False)
+        fitnesses, genomes = (list(values) for values in zip(*initial_results))
+        vectors = breeder.to_vectors(genomes)
+        sort_key = lambda fitness_result: fitness_result[0]
+
+        generation_num = first_generation_num
+        fitness_results = []
+        while True:
+            try:
+                fitness_results = sorted(
+                    zip(fitnesses, genomes), key=sort_key, reverse=not evaluator.ascending
+                )
+
+                best_fitness = fitness_results[-1][0]
+                logger.info(f"Generation: {generation_num}; Top Score: {best_fitness}")
+
+                storage_manager.update_storage(generation_num, fitness_results)
+
+                if should_stop(generation_num, best_fitness):
+                    break
+
+                best_index = fitnesses.index(best_fitness)
+                trial_vectors = breeder.breed_trial_vectors(vectors, best_index)
+                trial_genomes = breeder.to_genomes(trial_vectors)
+                trial_results = evaluator.evaluate_fitness(trial_genomes, should_sort=False)
+                for i, (fitness, genome) in enumerate(trial_results):
+                    if is_worse(fitness, fitnesses[i]):
+                        continue
+                    fitnesses[i] = fitness
+                    genomes[i] = genome
+                    # a Lamarckian fitness function may return a different genome
+                    is_trial = genome is trial_genomes[i]
+                    vectors[i] = trial_vectors[i] if is_trial else breeder.to_vectors([genome])[0]
+
+                generation_num += 1
+            except:
+                storage_manager.react_to_interruption(generation_num, fitness_results)
+                raise
+
+        return fitness_results
+
+    def _run_evolution_strategy(
+        self,
+        population,
+        evaluator,
+        population_generator,
+        storage_manager,
+        logger,
+        should_stop,
+        has_reached_target,
+        generation_params,
+        first_generation_num=0,
+    ):
+        """
+        Runs a (μ, λ) or (μ + λ) evolution strategy: in each generation λ offspring (as many as the initial population) are bred from the μ fittest genomes by :func:`~holland.evolution.EvolutionStrategy.breed_offspring_vectors`, and the step size is adapted by :func:`~holland.evolution.EvolutionStrategy.adapt_step_size`
+
+        The parents of the next generation are the μ fittest offspring with ``"comma"`` selection, or the μ fittest of the parents and offspring with ``"plus"`` selection; each generation reports and stores the genomes parents were selected from.
+
+        :returns: the fitness results of the final generation (sorted)
+
+        Dependencies:
+            * :func:`~holland.evolution.Evaluator.evaluate_fitness`
+            * :func:`~holland.evolution.GenomeVectorizer.to_vectors`
+            * :func:`~holland.evolution.EvolutionStrategy.breed_offspring_vectors`
+            * :func:`~holland.evolution.GenomeVectorizer.to_genomes`
+            * :func:`~holland.evolution.EvolutionStrategy.adapt_step_size`
+            * :func:`~holland.storage.StorageManager.update_storage`
+            * :func:`~holland.storage.StorageManager.react_to_interruption`
+        """
+        strategy = EvolutionStrategy(
+            self.genome_params,
+            len(population),
+            generation_params.get("evolution_strategy", {}),
+            rng=population_generator.rng,
+        )
+        is_better = (lambda a, b: a > b) if evaluator.ascending else (lambda a, b: a < b)
+        sort_key = lambda fitness_result: fitness_result[0]
+
+        pool_results = evaluator.evaluate_fitness(population)
+
+        generation_num = first_generation_num
+        fitness_results = []
+        while True:
+            try:
+                fitness_results = pool_results
+
+                best_fitness = fitness_results[-1][0]
+                logger.info(f"Generation: {generation_num}; Top Score: {best_fitness}")
+
+                storage_manager.update_storage(generation_num, fitness_results)
+
+                if should_stop(generation_num, best_fitness):
+                    break
+
+                parent_results = fitness_results[-strategy.n_parents :]
+                parent_vectors = strategy.to_vectors([genome for _, genome in parent_results])
+                offspring_vectors = strategy.breed_offspring_vectors(parent_vectors)
+                offspring_results = evaluator.evaluate_fitness(
+                    strategy.to_genomes(offspring_vectors)
+                )
+
+                best_parent_fitness = parent_results[-1][0]
+                n_successes = sum(
+                    is_better(fitness, best_parent_fitness) for fitness, _ in offspring_results
+                )
+                if strategy.selection == "comma":
+                    pool_results = offspring_results
+                else:
+                    # parents come first so that offspring are preferred among equally fit genomes
+                    pool_results = sorted(
+                        parent_results + offspring_results,
+                        key=sort_key,
+                        reverse=not evaluator.ascending,
+                    )
+                # a Lamarckian fitness function may return different genomes than were bred
+                next_parent_vectors = strategy.to_vectors(
+                    [genome for _, genome in pool_results[-strategy.n_parents :]]
+                )
+                strategy.adapt_step_size(
+                    parent_vectors, next_parent_vectors, n_successes / len(offspring_results)
+                )
+
+                generation_num += 1
+            except:
+                storage_manager.react_to_interruption(generation_num, fitness_results)
+                raise
+
+        return fitness_results
+
+    def _run_nsga2(
+        self,
+        population,
+        evaluator,
+        population_generator,
+        storage_manager,
+        logger,
+        should_stop,
+        has_reached_target,
+        generation_params,
+        first_generation_num=0,
+    ):
+        """
+        Runs NSGA-II: in each generation as many offspring as there are genomes are bred from parents selected by crowded tournaments (:func:`~holland.evolution.PopulationGenerator.breed_by_crowded_tournament`), and the genomes of the next generation are selected from the parents and offspring by non-dominated rank and crowding distance (:func:`~holland.utils.pareto.select_non_dominated`)
+
+        Fitness scores are tuples of objective values, all maximized or all minimized according to ``should_maximize_fitness``. Each generation is reported and returned ordered from the worst to the best genome (the last front first and, within a front, by increasing crowding distance), so that the last genomes are the first front, as with sorted fitness results; the number of genomes in the first front is logged in place of the top score.
+
+        :returns: the fitness results of the final population (ordered as above)
+
+        .. note:: ``target_fitness`` is not used, since there is no single best fitness score to compare it to.
+
+        Dependencies:
+            * :func:`~holland.evolution.Evaluator.evaluate_fitness`
+            * :func:`~holland.utils.pareto.select_non_dominated`
+            * :func:`~holland.evolution.PopulationGenerator.breed_by_crowded_tournament`
+            * :func:`~holland.storage.StorageManager.update_storage`
+            * :func:`~holland.storage.StorageManager.react_to_interruption`
+        """
+        population_size = len(population)
+        should_maximize = evaluator.ascending
+
+        pool_results = evaluator.evaluate_fitness(population, should_sort=False)
+
+        generation_num = first_generation_num
+        fitness_results = []
+        while True:
+            try:
+                indices, ranks, crowding_distances = select_non_dominated(
+                    [fitness for fitness, genome in pool_results], population_size, should_maximize
+                )
+                parent_results = [pool_results[i] for i in indices]
+
+                order = sorted(
+                    range(len(parent_results)),
+                    key=lambda k: (-ranks[k], crowding_distances[k]),
+                )
+                fitness_results = [parent_results[k] for k in order]
+                n_first_front = ranks.count(0)
+                logger.info(f"Generation: {generation_num}; First Front Size: {n_first_front}")
+
+                storage_manager.update_storage(generation_num, fitness_results)
+
+                if should_stop(generation_num, None):
+                    break
+
+                offspring = population_generator.breed_by_crowded_tournament(
+                    parent_results, ranks, crowding_distances, population_size
+                )
+                offspring_results = evaluator.evaluate_fitness(offspring, should_sort=False)
+                pool_results = parent_results + offspring_results
 
                 generation_num += 1
             except:
                 storage_manager.react_to_interruption(generation_num, fitness_results)
                 raise
 
-        if (
-            storage_options.get("fitness", {}).get("should_record_fitness", False)
-            and storage_options.get("fitness", {}).get("format") == "memory"
-        ):
-            return fitness_results, storage_manager.fitness_history
         return fitness_results
@@ -0,0 +1,323 @@
+import math
+import random
+import logging
+
+from .evaluation import Evaluator
+from .breeding import PopulationGenerator
+from ..storage import format_fitness_statistics
+from ..utils import get_process_context, get_grid_shape
+
+
+class IslandModel:
+    """
+    Handles evolution for several populations ("islands") of an :class:`~holland.evolution.Evolver`, each evolving in its own process, with the most fit individuals migrating between islands
+
+    :param evolver: the evolver whose fitness function, genome parameters, selection strategy, and other settings each island uses
+    :type evolver: :class:`~holland.evolution.Evolver`
+
+    :param n_islands: the number of islands (and processes)
+    :type n_islands: int
+
+    :param migration_params: a dictionary specifying how individuals migrate between islands; see :ref:`migration-params`
+    :type migration_params: dict
+
+
+    :raises ValueError: if ``n_islands < 1``
+    :raises ValueError: if ``topology`` is not one of ``"ring"``, ``"grid"``, ``"fully_connected"``
+    :raises ValueError: if ``interval < 1`` or ``n_migrants < 0``
+    :raises ValueError: if ``grid_shape`` does not have ``n_islands`` cells
+    """
+
+    def __init__(self, evolver, n_islands=4, migration_params={}):
+        self.evolver = evolver
+        self.n_islands = n_islands
+        self.topology = migration_params.get("topology", "ring")
+        self.interval = migration_params.get("interval", 10)
+        self.n_migrants = migration_params.get("n_migrants", 1)
+        self.grid_shape = migration_params.get("grid_shape", None)
+
+        if self.n_islands < 1:
+            raise ValueError("Number of islands must be at least 1")
+        if self.interval < 1:
+            raise ValueError("Migration interval must be at least 1")
+        if self.n_migrants < 0:
+            raise ValueError("Number of migrants cannot be negative")
+
+        self.destinations = get_migration_topology(self.n_islands, self.topology, self.grid_shape)
+
+    def evolve(
+        self,
+        generation_params={},
+        stop_conditions={"n_generations": 100, "target_fitness": math.inf},
+        logging_options={"level": logging.INFO, "format": "%(message)s"},
+        seed=None,
+    ):
+        """
+        Evolves each island in its own process, migrating individuals between islands every ``interval`` generations
+
+        At each migration the ``n_migrants`` most fit individuals of each island are sent (with their fitness scores, so they are not evaluated again) to each of its destinations in the topology, where they replace the least fit individuals. Migrants are routed through the calling process over one pipe per island, which also decides for all islands when to stop. Islands evolve independently between migrations, but each migration is a barrier: every island waits until the calling process has received the emigrants of all islands, so the slowest island sets the pace.
+
+        :param generation_params: a dictionary specifying how to create each generation of each island; see :ref:`generation-params`; ``population_size`` is the size of each island
+        :type generation_params: dict
+
+        :param stop_conditions: conditions for stopping execution, as for :func:`~holland.evolution.Evolver.evolve`; ``target_fitness`` is checked at each migration
+        :type stop_conditions: dict
+
+        :param logging_options: options for logging passed to `logging.basicConfig <https://docs.python.org/3/library/logging.html#logging.basicConfig>`_ as ``kwargs``
+        :type logging_options: dict
+
+        :param seed: a seed (or a ``random.Random`` instance) from which the seed of each island is drawn, making the run reproducible; see :ref:`random-streams`
+        :type seed: int/random.Random
+
+
+        :returns: a tuple ``(fitness_results, island_statistics)`` where ``fitness_results`` are the fitness results of the last generation of all islands, sorted together (so the most fit individual of all islands is last), and ``island_statistics`` is a list with, for each island, a list of fitness statistics for each generation (as returned by :func:`~holland.storage.fitness.format_fitness_statistics`)
+
+
+        :raises ValueError: if ``population_size < 2`` or ``n_generations < 1``
+        :raises ValueError: if ``generation_params["mode"]`` is given and is not ``"generational"``
+        :raises ValueError: if ``generation_params["restart"]`` or ``generation_params["population_size_schedule"]`` is given
+        :raises ValueError: if an island could receive as many migrants as its ``population_size``
+
+
+        .. note:: Each island runs its own generational loop, which does not store fitness or genomes, keep a hall of fame, restart, or change its population size.
+
+        .. note:: Islands are started with the ``"fork"`` start method where it is available; elsewhere the evolver must be picklable.
+
+        Dependencies:
+            * :func:`~holland.utils.parallel.get_process_context`
+            * :func:`~holland.evolution.IslandModel.route_migrants`
+        """
+        population_size = generation_params.get("population_size", 1000)
+        n_generations = stop_conditions.get("n_generations", math.inf)
+        target_fitness = stop_conditions.get("target_fitness", math.inf)
+        n_sources = [0] * self.n_islands
+        for destinations in self.destinations:
+            for destination in destinations:
+                n_sources[destination] += 1
+        max_n_immigrants = self.n_migrants * max(n_sources)
+
+        if population_size < 2:
+            raise ValueError("Population size of each island must be at least 2")
+        if n_generations < 1:
+            raise ValueError("Number of generations must be at least 1")
+        if generation_params.get("mode", "generational") != "generational":
+            raise ValueError("Islands only support 'generational' mode")
+        if "restart" in generation_params:
+            raise ValueError("Restarts are not supported on islands")
+        if "population_size_schedule" in generation_params:
+            # immigrants are checked against the population size, which a schedule would change
+            raise ValueError("Population size schedules are not supported on islands")
+        if max_n_immigrants >= population_size:
+            raise ValueError("Islands must receive fewer migrants than their population size")
+
+        logging.basicConfig(**logging_options)
+
+        rng = None
+        if seed is not None:
+            rng = seed if isinstance(seed, random.Random) else random.Random(seed)
+        island_seeds = [rng.getrandbits(64) if rng is not None else None for _ in self.destinations]
+
+        context = get_process_context()
+        connections = []
+        processes = []
+        is_finished = False
+        try:
+            for island_index, island_seed in enumerate(island_seeds):
+                connection, island_connection = context.Pipe()
+                process = context.Process(
+                    target=_run_island,
+                    args=(
+                        self,
+                        island_index,
+                        island_connection,
+                        generation_params,
+                        n_generations,
+                        island_seed,
+                    ),
+                )
+                process.start()
+                island_connection.close()
+                connections.append(connection)
+                processes.append(process)
+
+            while True:
+                messages = [_receive(connection) for connection in connections]
+                best_fitnesses, emigrants, are_last = zip(*messages)
+                should_stop = any(are_last) or target_fitness in best_fitnesses
+                immigrants = self.route_migrants(emigrants)
+                for connection, island_immigrants in zip(connections, immigrants):
+                    connection.send((island_immigrants, should_stop))
+                if should_stop:
+                    break
+
+            island_results = [_receive(connection) for connection in connections]
+            is_finished = True
+        finally:
+            for connection in connections:
+                connection.close()
+            for process in processes:
+                if not is_finished:
+                    process.terminate()
+                process.join()
+
+        fitness_results = sorted(
+            (
+                fitness_result
+                for results, statistics in island_results
+                for fitness_result in results
+            ),
+            key=lambda fitness_result: fitness_result[0],
+            reverse=not self.evolver.should_maximize_fitness,
+        )
+        island_statistics = [statistics for results, statistics in island_results]
+        return fitness_results, island_statistics
+
+    def route_migrants(self, emigrants):
+        """
+        Determines the immigrants of each island from the emigrants of each island and the migration topology
+
+        :param emigrants: for each island, a list of the fitness results of its emigrants
+        :type emigrants: list
+
+
+        :returns: for each island, a list of the fitness results of the individuals migrating to it
+        """
+        immigrants = [[] for _ in self.destinations]
+        for island_emigrants, destinations in zip(emigrants, self.destinations):
+            for destination in destinations:
+                immigrants[destination] += island_emigrants
+        return immigrants
+
+
+def get_migration_topology(n_islands, topology="ring", grid_shape=None):
+    """
+    Determines the islands to which each island sends migrants
+
+    :param n_islands: the number of islands
+    :type n_islands: int
+
+    :param topology: how islands are connected (options: ``"ring"``, ``"grid"``, ``"fully_connected"``); in a ``"ring"`` each island sends migrants to the next, on a ``"grid"`` (a torus) to the islands above, below, left, and right of it, and if ``"fully_connected"`` to every other island
+    :type topology: str
+
+    :param grid_shape: the number of rows and columns of a ``"grid"``; by default the grid is as close to square as ``n_islands`` allows
+    :type grid_shape: tuple
+
+
+    :returns: a list with, for each island, a list of the indices of the islands it sends migrants to
+
+
+    :raises ValueError: if ``topology`` is not one of ``"ring"``, ``"grid"``, ``"fully_connected"``
+    :raises ValueError: if ``grid_shape`` does not have ``n_islands`` cells
+
+    Dependencies:
+        * :func:`~holland.utils.grids.get_grid_shape`
+    """
+    if topology == "ring":
+        return [[(i + 1) % n_islands] if n_islands > 1 else [] for i in range(n_islands)]
+    if topology == "fully_connected":
+        return [[j for j in range(n_islands) if j != i] for i in range(n_islands)]
+    if topology != "grid":
+        raise ValueError("Topology must be one of 'ring', 'grid', 'fully_connected'")
+
+    if grid_shape is None:
+        grid_shape = get_grid_shape(n_islands)
+    n_rows, n_columns = grid_shape
+    if n_rows * n_columns != n_islands:
+        raise ValueError("Grid shape must have one cell per island")
+
+    destinations = []
+    for i in range(n_islands):
+        row, column = divmod(i, n_columns)
+        neighbors = [
+            ((row - 1) % n_rows) * n_columns + column,
+            ((row + 1) % n_rows) * n_columns + column,
+            row * n_columns + (column - 1) % n_columns,
+            row * n_columns + (column + 1) % n_columns,
+        ]
+        destinations.append(sorted(set(neighbors) - {i}))
+    return destinations
+
+
+def _receive(connection):
+    message = connection.recv()
+    if isinstance(message, BaseException):
+        raise message
+    return message
+
+
+def _run_island(
+    island_model, island_index, connection, generation_params, n_generations, island_seed
+):
+    try:
+        evolver = island_model.evolver
+        logger = logging.getLogger(__name__)
+
+        if island_seed is None:
+            # forked islands inherit the state of the random module, so each needs fresh entropy
+            random.seed()
+            rng = None
+        else:
+            rng = random.Random(island_seed)
+            random.seed(rng.getrandbits(64))
+
+        evaluator = Evaluator(
+            evolver.fitness_function,
+            ascending=evolver.should_maximize_fitness,
+            delta_fitness_function=evolver.delta_fitness_function,
+            local_search_params=generation_params.get("local_search", {}),
+        )
+        population_generator = PopulationGenerator(
+            evolver.genome_params,
+            evolver.selection_strategy,
+            generation_params=generation_params,
+            should_track_lineage=evolver.delta_fitness_function is not None,
+            rng=rng,
+            should_hash_genomes=generation_params.get("should_hash_genomes", False),
+        )
+        population = population_generator.generate_random_genomes(
+            generation_params.get("population_size", 1000)
+        )
+
+        statistics = []
+        generation_num = 0
+        while True:
+            fitness_results = evaluator.evaluate_fitness(
+                population, lineage=population_generator.lineage
+            )
+            best_fitness = fitness_results[-1][0]
+            logger.info(
+                f"Island: {island_index}; Generation: {generation_num}; Top Score: {best_fitness}"
+            )
+            statistics.append(
+                format_fitness_statistics(
+                    generation_num, [fitness for fitness, genome in fitness_results]
+                )
+            )
+
+            is_last = generation_num == n_generations - 1
+            if is_last or (generation_num + 1) % island_model.interval == 0:
+                emigrants = fitness_results[len(fitness_results) - island_model.n_migrants :]
+                connection.send((best_fitness, emigrants, is_last))
+                immigrants, should_stop = _receive(connection)
+                if should_stop:
+                    break
+                # immigrants replace the least fit individuals
+                fitness_results = sorted(
+                    fitness_results[len(immigrants) :] + immigrants,
+                    key=lambda fitness_result: fitness_result[0],
+                    reverse=not evaluator.ascending,
+                )
+
+            population = population_generator.generate_next_generation(fitness_results)
+            generation_num += 1
+
+        population_generator.close()
+        connection.send((fitness_results, statistics))
+    except Exception as e:
+        try:
+            connection.send(e)
+        except (OSError, TypeError, AttributeError):
+            # the calling process has stopped listening, or the error cannot be pickled
+            pass
+    finally:
+        connection.close()
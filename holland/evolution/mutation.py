@@ -1,6 +1,14 @@
+import math
 import random
 
-from ..utils import bound_value, is_numeric_type, is_list_type
+from ..utils import (
+    bound_value,
+    is_numeric_type,
+    is_list_type,
+    get_strategy_gene_name,
+    get_initial_strategy,
+    DescribedMutation,
+)
 
 
 class Mutator:
@@ -22,16 +30,60 @@ class Mutator:
         :type genome: dict
 
 
-        :returns: a mutated genome
+        :returns: a mutated genome; genes that are not mutated are shared with ``genome`` rather than copied, and ``genome`` itself is returned if no gene is mutated
 
 
+        Dependencies:
+            * :func:`~holland.evolution.Mutator.mutate_genome_with_changes`
+        """
+        return self.mutate_genome_with_changes(genome)[0]
+
+    def mutate_genome_with_changes(self, genome):
+        """
+        Mutates a genome and collects the descriptions of the changes made to it by mutation functions that return a :class:`~holland.utils.utils.DescribedMutation`; see :ref:`delta-evaluation`
+
+        :param genome: the genome to mutate
+        :type genome: dict
+
+
+        :returns: a tuple ``(mutated_genome, changes)`` where ``mutated_genome`` is as returned by :func:`~holland.evolution.Mutator.mutate_genome` and ``changes`` is a dictionary mapping the name of each mutated gene to the description of its change (for list-type genes mutated by value, a dictionary mapping the index of each mutated value to the description of its change), or ``None`` if any gene was mutated without a description
+
+
+        .. note:: Self-adaptive genes (see :ref:`self-adaptation`) are mutated by :func:`~holland.evolution.Mutator.mutate_self_adaptive_gene`, which also replaces their strategy parameters, so ``changes`` is ``None`` for genomes with self-adaptive genes.
+
         Dependencies:
             * :func:`~holland.evolution.Mutator.mutate_gene`
+            * :func:`~holland.evolution.Mutator.mutate_self_adaptive_gene`
         """
-        return {
-            gene_name: self.mutate_gene(genome[gene_name], self.genome_params[gene_name])
-            for gene_name in self.genome_params.keys()
-        }
+        mutated_genome = genome
+        changes = {}
+        for gene_name, gene_params in self.genome_params.items():
+            gene = genome[gene_name]
+            if "self_adaptation" in gene_params:
+                strategy_gene_name = get_strategy_gene_name(gene_name)
+                strategy = genome.get(strategy_gene_name)
+                if strategy is None:
+                    strategy = get_initial_strategy(gene_params)
+                if mutated_genome is genome:
+                    mutated_genome = dict(genome)
+                mutated_genome[gene_name], mutated_genome[strategy_gene_name] = (
+                    self.mutate_self_adaptive_gene(gene, strategy, gene_params)
+                )
+                changes = None
+                continue
+            mutated_gene = self.mutate_gene(gene, gene_params)
+            change = None
+            if isinstance(mutated_gene, DescribedMutation):
+                mutated_gene, change = mutated_gene
+            if mutated_gene is not gene:
+                if mutated_genome is genome:
+                    mutated_genome = dict(genome)
+                mutated_genome[gene_name] = mutated_gene
+                if change is None:
+                    changes = None
+                elif changes is not None:
+                    changes[gene_name] = change
+        return mutated_genome, changes
 
     def mutate_gene(self, gene, gene_params):
         """
@@ -44,7 +96,7 @@ class Mutator:
         :type gene_params: dict
 
         
-        :returns: a mutated gene
+        :returns: a mutated gene; for list-type genes mutated by value, a new list is only built once a value is actually mutated, otherwise ``gene`` itself is returned; if every mutation made to the gene was described, the gene is wrapped in a :class:`~holland.utils.utils.DescribedMutation` (for list-type genes mutated by value, with a dictionary mapping the index of each mutated value to the description of its change)
 
 
         Dependencies:
@@ -53,10 +105,93 @@ class Mutator:
         mutation_level = "value" if gene_params.get("mutation_level") != "gene" else "gene"
 
         if is_list_type(gene_params) and mutation_level == "value":
-            return [self.probabilistically_apply_mutation(value, gene_params) for value in gene]
+            mutated_gene = gene
+            changes = {}
+            for i, value in enumerate(gene):
+                mutated_value = self.probabilistically_apply_mutation(value, gene_params)
+                change = None
+                if isinstance(mutated_value, DescribedMutation):
+                    mutated_value, change = mutated_value
+                if mutated_value is not value:
+                    if mutated_gene is gene:
+                        mutated_gene = list(gene)
+                    mutated_gene[i] = mutated_value
+                    if change is None:
+                        changes = None
+                    elif changes is not None:
+                        changes[i] = change
+            if changes and mutated_gene is not gene:
+                return DescribedMutation(mutated_gene, changes)
+            return mutated_gene
 
         return self.probabilistically_apply_mutation(gene, gene_params)
 
+    def mutate_self_adaptive_gene(self, gene, strategy, gene_params):
+        """
+        Mutates the strategy parameters of a self-adaptive gene and then mutates the gene with them; see :ref:`self-adaptation`
+
+        For numeric genes, the strategy parameters are a step size for each value, which are mutated by the log-normal rule ``step_size * exp(global_learning_rate * N(0, 1) + learning_rate * N_i(0, 1))`` (where the first normal sample is shared by all values of the gene) and bounded below by ``min_step_size``; each value is then replaced by a sample from a gaussian distribution centered on the value with its new step size, and bounded. For other genes, the strategy parameter is a mutation rate, which is mutated by the logistic-normal rule ``1 / (1 + (1 - rate) / rate * exp(-learning_rate * N(0, 1)))`` and bounded below by ``min_mutation_rate``; the gene is then mutated with its ``mutation_function`` at that rate by :func:`~holland.evolution.Mutator.mutate_gene`.
+
+        :param gene: the gene to mutate
+        :type gene: a valid gene type
+
+        :param strategy: the strategy parameters of the gene (step sizes or mutation rate)
+        :type strategy: list/float
+
+        :param gene_params: parameters for a single gene, including ``self_adaptation``; see :ref:`genome-params`
+        :type gene_params: dict
+
+
+        :returns: a tuple ``(mutated_gene, mutated_strategy)``
+
+
+        Dependencies:
+            * :func:`~holland.utils.utils.bound_value`
+            * :func:`~holland.evolution.Mutator.mutate_gene`
+        """
+        self_adaptation = gene_params["self_adaptation"]
+
+        if not is_numeric_type(gene_params):
+            learning_rate = self_adaptation.get("learning_rate", 0.22)
+            min_mutation_rate = self_adaptation.get("min_mutation_rate", 0.001)
+            odds = (1 - strategy) / strategy if strategy > 0 else math.inf
+            mutation_rate = 1 / (1 + odds * math.exp(-learning_rate * random.gauss(0, 1)))
+            mutation_rate = min(max(mutation_rate, min_mutation_rate), 1)
+            mutated_gene = self.mutate_gene(gene, {**gene_params, "mutation_rate": mutation_rate})
+            if isinstance(mutated_gene, DescribedMutation):
+                mutated_gene = mutated_gene.value
+            return mutated_gene, mutation_rate
+
+        is_list = is_list_type(gene_params)
+        values = gene if is_list else [gene]
+        step_sizes = strategy if is_list else [strategy]
+        n_values = len(values)
+        global_learning_rate = self_adaptation.get(
+            "global_learning_rate", 1 / math.sqrt(2 * n_values)
+        )
+        learning_rate = self_adaptation.get("learning_rate", 1 / math.sqrt(2 * math.sqrt(n_values)))
+        min_step_size = self_adaptation.get("min_step_size", 1e-8)
+        minimum = gene_params.get("min")
+        maximum = gene_params.get("max")
+        to_int = gene_params.get("type") in ["int", "[int]"]
+
+        global_factor = math.exp(global_learning_rate * random.gauss(0, 1))
+        gauss = random.gauss
+        mutated_step_sizes = [
+            max(step_size * global_factor * math.exp(learning_rate * gauss(0, 1)), min_step_size)
+            for step_size in step_sizes
+        ]
+        mutated_values = [
+            bound_value(
+                value + step_size * gauss(0, 1), minimum=minimum, maximum=maximum, to_int=to_int
+            )
+            for value, step_size in zip(values, mutated_step_sizes)
+        ]
+
+        if is_list:
+            return mutated_values, mutated_step_sizes
+        return mutated_values[0], mutated_step_sizes[0]
+
     def probabilistically_apply_mutation(self, target, gene_params):
         """
         Either applies a mutation function to a target (gene or value of a gene) or does not, probabilistically according to the ``mutation_rate``
@@ -68,7 +203,7 @@ class Mutator:
         :type gene_params: dict
 
 
-        :returns: either the mutated target or the original target
+        :returns: either the mutated target or the original target; if the mutation function returns a :class:`~holland.utils.utils.DescribedMutation`, its value is bounded and it is returned as a :class:`~holland.utils.utils.DescribedMutation` unless bounding changed the value
 
 
         Dependencies:
@@ -83,6 +218,10 @@ class Mutator:
 
         if random.random() < mutation_rate:
             mutated_target = mutation_function(target)
+            change = None
+            if isinstance(mutated_target, DescribedMutation):
+                mutated_target, change = mutated_target
+            unbounded_target = mutated_target
             if should_bound:
                 if isinstance(target, list):
                     mutated_target = [
@@ -93,5 +232,8 @@ class Mutator:
                     mutated_target = bound_value(
                         mutated_target, minimum=minimum, maximum=maximum, to_int=to_int
                     )
+            # a description of the unbounded value does not hold once bounding changes it
+            if change is not None and mutated_target == unbounded_target:
+                return DescribedMutation(mutated_target, change)
             return mutated_target
         return target
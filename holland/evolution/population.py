@@ -0,0 +1,100 @@
+import bisect
+import random
+
+
+class SortedPopulation:
+    """
+    Holds a population of evaluated genomes in sorted order so individuals can be inserted and replaced without re-sorting the whole population
+
+    :param fitness_results: a sorted list of tuples containing a fitness score in the first position and a genome in the second (returned by :func:`~holland.evolution.Evaluator.evaluate_fitness`)
+    :type fitness_results: list
+
+    :param ascending: whether ``fitness_results`` is sorted in ascending order of fitness (should match the ``ascending`` of the :class:`~holland.evolution.Evaluator` that produced it)
+    :type ascending: bool
+
+    :param rng: the source of randomness for the ``"random"`` replacement policy (a ``random.Random`` instance); the ``random`` module is used if not specified
+    :type rng: random.Random
+
+
+    .. note:: Like the results of :func:`~holland.evolution.Evaluator.evaluate_fitness`, the most fit individual is always last.
+    """
+
+    def __init__(self, fitness_results, ascending=True, rng=None):
+        self.ascending = ascending
+        self.rng = rng if rng is not None else random
+        self.fitness_results = list(fitness_results)
+        self._keys = [self._get_key(fitness) for fitness, genome in self.fitness_results]
+
+    def __len__(self):
+        return len(self.fitness_results)
+
+    def _get_key(self, fitness):
+        return fitness if self.ascending else -fitness
+
+    def insert(self, fitness, genome):
+        """
+        Inserts an individual into the population at the position given by its fitness
+
+        :param fitness: the fitness score of the individual
+        :type fitness: int/float
+
+        :param genome: the genome of the individual
+        :type genome: dict
+
+
+        :returns: the index at which the individual was inserted
+        """
+        key = self._get_key(fitness)
+        index = bisect.bisect_right(self._keys, key)
+        self._keys.insert(index, key)
+        self.fitness_results.insert(index, (fitness, genome))
+        return index
+
+    def remove(self, index):
+        """
+        Removes the individual at ``index`` from the population
+
+        :param index: the position of the individual to remove (``0`` is the least fit)
+        :type index: int
+
+
+        :returns: the removed ``(fitness, genome)`` tuple
+        """
+        del self._keys[index]
+        return self.fitness_results.pop(index)
+
+    def replace(self, fitness, genome, policy="worst", n_protected=0):
+        """
+        Adds an individual to the population and removes another so that the size of the population is unchanged
+
+        :param fitness: the fitness score of the individual to add
+        :type fitness: int/float
+
+        :param genome: the genome of the individual to add
+        :type genome: dict
+
+        :param policy: how to choose the individual to remove (options: ``"worst"``, ``"random"``); ``"worst"`` removes the least fit individual after inserting the new one (so an offspring worse than the whole population is discarded), while ``"random"`` removes a random individual before inserting the new one
+        :type policy: str
+
+        :param n_protected: number of the most fit individuals that cannot be removed by the ``"random"`` policy
+        :type n_protected: int
+
+
+        :returns: the removed ``(fitness, genome)`` tuple
+
+
+        :raises ValueError: if ``policy`` is not one of ``"worst"``, ``"random"``
+
+        Dependencies:
+            * :func:`~holland.evolution.SortedPopulation.insert`
+            * :func:`~holland.evolution.SortedPopulation.remove`
+        """
+        if policy == "worst":
+            self.insert(fitness, genome)
+            return self.remove(0)
+        if policy == "random":
+            n_replaceable = max(len(self) - n_protected, 1)
+            removed = self.remove(int(self.rng.random() * n_replaceable))
+            self.insert(fitness, genome)
+            return removed
+        raise ValueError("Replacement policy must be either 'worst' or 'random'")
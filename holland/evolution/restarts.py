@@ -0,0 +1,121 @@
+import math
+
+
+class RestartStrategy:
+    """
+    Handles detecting that the best fitness of a run has stagnated and building the population a run restarts from
+
+    :param restart_params: a dictionary specifying the restart policy and when to restart; see :ref:`restarts`
+    :type restart_params: dict
+
+    :param ascending: whether more fit genomes have higher fitness scores (as for :class:`~holland.evolution.Evaluator`)
+    :type ascending: bool
+
+
+    :raises ValueError: if ``policy`` is not one of ``"reinitialize"``, ``"ipop"``, ``"immigrants"``
+    :raises ValueError: if ``stagnation_window < 1`` or ``min_improvement < 0``
+    :raises ValueError: if ``population_size_factor`` is not greater than 1
+    :raises ValueError: if ``immigrant_fraction`` is not greater than 0 and at most 1
+    """
+
+    def __init__(self, restart_params={}, ascending=True):
+        self.policy = restart_params.get("policy", "reinitialize")
+        self.stagnation_window = restart_params.get("stagnation_window", 20)
+        self.min_improvement = restart_params.get("min_improvement", 0)
+        self.population_size_factor = restart_params.get("population_size_factor", 2)
+        self.immigrant_fraction = restart_params.get("immigrant_fraction", 0.5)
+        self.max_restarts = restart_params.get("max_restarts", math.inf)
+        self.ascending = ascending
+
+        if self.policy not in ["reinitialize", "ipop", "immigrants"]:
+            raise ValueError("Restart policy must be one of 'reinitialize', 'ipop', 'immigrants'")
+        if self.stagnation_window < 1:
+            raise ValueError("Stagnation window must be at least 1")
+        if self.min_improvement < 0:
+            raise ValueError("Minimum improvement cannot be negative")
+        if self.population_size_factor <= 1:
+            raise ValueError("Population size factor must be greater than 1")
+        if not 0 < self.immigrant_fraction <= 1:
+            raise ValueError("Immigrant fraction must be greater than 0 and at most 1")
+
+        self.n_restarts = 0
+        self.last_generation_num = None
+        self.is_stagnant = False
+        self._best_fitness = None
+        self._n_stagnant_generations = 0
+
+    def update(self, generation_num, best_fitness):
+        """
+        Records the best fitness of a generation and determines whether the run has stagnated: the best fitness has not improved by more than ``min_improvement`` on the best fitness of the run for ``stagnation_window`` generations, and fewer than ``max_restarts`` restarts have been made
+
+        :param generation_num: the number of the generation
+        :type generation_num: int
+
+        :param best_fitness: the fitness score of the most fit genome of the generation
+        :type best_fitness: int/float
+
+
+        :returns: ``True`` if the run should restart, ``False`` otherwise (also stored as ``is_stagnant``)
+        """
+        self.last_generation_num = generation_num
+        improvement = None
+        if self._best_fitness is not None:
+            improvement = best_fitness - self._best_fitness
+            if not self.ascending:
+                improvement = -improvement
+
+        if improvement is None or improvement > self.min_improvement:
+            self._best_fitness = best_fitness
+            self._n_stagnant_generations = 0
+        else:
+            self._n_stagnant_generations += 1
+
+        self.is_stagnant = (
+            self._n_stagnant_generations >= self.stagnation_window
+            and self.n_restarts < self.max_restarts
+        )
+        return self.is_stagnant
+
+    def restart(self, fitness_results, population_generator, hall_of_fame=None):
+        """
+        Builds the initial population of the next run and resets stagnation tracking
+
+        With ``"reinitialize"``, the genomes of the hall of fame (or, if there is none, the most fit genome of the run) are kept and the rest of the population is generated randomly; ``"ipop"`` does the same but multiplies the population size by ``population_size_factor``; with ``"immigrants"``, the ``immigrant_fraction`` least fit genomes are replaced by random genomes.
+
+        :param fitness_results: the sorted fitness results of the last generation of the run (returned by :func:`~holland.evolution.Evaluator.evaluate_fitness`)
+        :type fitness_results: list
+
+        :param population_generator: the population generator of the run, used to generate random genomes; its ``population_size`` is set to the size of the new population
+        :type population_generator: :class:`~holland.evolution.PopulationGenerator`
+
+        :param hall_of_fame: the fitness results of the hall of fame (sorted, most fit last), if one is kept
+        :type hall_of_fame: list
+
+
+        :returns: the initial population of the next run (a list of genomes)
+
+
+        Dependencies:
+            * :func:`~holland.evolution.PopulationGenerator.generate_random_genomes`
+        """
+        population_size = len(fitness_results)
+        if self.policy == "ipop":
+            population_size = math.ceil(population_size * self.population_size_factor)
+
+        if self.policy == "immigrants":
+            n_immigrants = max(1, int(self.immigrant_fraction * population_size))
+            kept_genomes = [genome for _, genome in fitness_results[n_immigrants:]]
+        elif hall_of_fame:
+            kept_genomes = [genome for _, genome in hall_of_fame[-population_size:]]
+        else:
+            kept_genomes = [fitness_results[-1][1]]
+
+        n_random = population_size - len(kept_genomes)
+        population = kept_genomes + population_generator.generate_random_genomes(n_random)
+        population_generator.population_size = population_size
+
+        self.n_restarts += 1
+        self.is_stagnant = False
+        self._best_fitness = None
+        self._n_stagnant_generations = 0
+        return population
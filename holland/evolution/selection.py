@@ -1,6 +1,16 @@
 import math
+import random
+import itertools
 
-from ..utils import select_from, select_random
+from ..utils import (
+    select_from,
+    select_random,
+    select_random_indices,
+    select_stochastic_universal,
+    compute_niche_counts,
+    pack_bits,
+    is_numeric_type,
+)
 
 
 class Selector:
@@ -9,11 +19,23 @@ class Selector:
 
     :param selection_strategy: parameters for selecting a breeding pool and sets of parents; see :ref:`selection-strategy`
 
+    :param rng: the source of randomness for selection (a ``random.Random`` instance); the ``random`` module is used if not specified
+    :type rng: random.Random
+
+    :param genome_params: a dictionary specifying genome parameters, used to choose the genes that niching distances are computed over; see :ref:`genome-params`
+    :type genome_params: dict
+
     :raises ValueError: if any of ``top``, ``mid``, ``bottom``, or ``random`` is negative
     :raises ValueError: if ``n_parents < 1``
+    :raises ValueError: if ``sampling`` is not one of ``"independent"`` or ``"stochastic_universal"``
+    :raises ValueError: if the niching ``radius`` is not positive
+    :raises ValueError: if the niching ``metric`` is not one of ``"euclidean"`` or ``"hamming"``
+    :raises ValueError: if ``genome_params`` is given and a niching gene is not of a type suited to the niching ``metric`` (numeric types for ``"euclidean"``; ``"bool"``, ``"[bool]"``, or ``"bitset"`` for ``"hamming"``), or no gene is if ``genes`` is not given
     """
 
-    def __init__(self, selection_strategy={}):
+    def __init__(self, selection_strategy={}, rng=None, genome_params=None):
+        self.rng = rng if rng is not None else random
+
         pool_strategy = selection_strategy.get("pool", {})
         self.top = pool_strategy.get("top", 0)
         self.mid = pool_strategy.get("mid", 0)
@@ -27,8 +49,39 @@ class Selector:
         self.weighting_function = parents_strategy.get("weighting_function", lambda x: 1)
         self.n_parents = parents_strategy.get("n_parents", 2)
 
+        self.sampling = parents_strategy.get("sampling", "independent")
+
         if self.n_parents < 1:
             raise ValueError("Number of parents must be at least 1")
+        if self.sampling not in ["independent", "stochastic_universal"]:
+            raise ValueError(
+                "Parent sampling strategy must be 'independent' or 'stochastic_universal'"
+            )
+
+        niching_strategy = selection_strategy.get("niching", {})
+        self.niching_radius = niching_strategy.get("radius", None)
+        self.niching_alpha = niching_strategy.get("alpha", 1)
+        self.niching_metric = niching_strategy.get("metric", "euclidean")
+        self.niching_genes = niching_strategy.get("genes", None)
+
+        if self.niching_radius is not None and self.niching_radius <= 0:
+            raise ValueError("Niching radius must be positive")
+        if self.niching_metric not in ["euclidean", "hamming"]:
+            raise ValueError("Niching metric must be either 'euclidean' or 'hamming'")
+
+        if self.niching_radius is not None and genome_params is not None:
+            suited_gene_names = [
+                gene_name
+                for gene_name, gene_params in genome_params.items()
+                if _is_niching_type(gene_params, self.niching_metric)
+            ]
+            if self.niching_genes is None:
+                self.niching_genes = sorted(suited_gene_names)
+            if not self.niching_genes or not set(self.niching_genes) <= set(suited_gene_names):
+                raise ValueError(
+                    "Niching genes must be numeric for the 'euclidean' metric and bool, [bool], "
+                    "or bitset for the 'hamming' metric"
+                )
 
     def select_breeding_pool(self, fitness_results):
         """
@@ -52,7 +105,12 @@ class Selector:
             raise ValueError("Select Breeding Pool strategy numbers cannot exceed population size")
 
         selection_pool = select_from(
-            fitness_results, top=self.top, mid=self.mid, bottom=self.bottom, random=self.random
+            fitness_results,
+            top=self.top,
+            mid=self.mid,
+            bottom=self.bottom,
+            random=self.random,
+            rng=self.rng,
         )
 
         return selection_pool
@@ -68,11 +126,171 @@ class Selector:
         :returns: a list of genomes (of length ``self.n_parents``)
 
 
+        .. note:: If a niching ``radius`` is given, the selection probability of each genome is divided by its niche count (see :func:`~holland.evolution.Selector.compute_niche_counts`), so that genomes in crowded regions of the search space are selected less often.
+
         Dependencies:
+            * :func:`~holland.evolution.Selector.compute_selection_probabilities`
+            * :func:`~holland.evolution.Selector.compute_niche_counts`
             * :func:`~holland.utils.utils.select_random`
         """
+        genomes, selection_probabilities = self._prepare_pool(fitness_results)
+        return self._select_parents_from(genomes, selection_probabilities)
+
+    def select_parent_groups(self, fitness_results, n_groups):
+        """
+        Selects ``n_groups`` sets of parents from the given ``fitness_results``, one set for each genome to breed
+
+        If ``sampling`` is ``"stochastic_universal"``, all ``n_groups * n_parents`` parents are drawn in a single pass by stochastic universal sampling and then shuffled into groups; otherwise each group is drawn independently as by :func:`~holland.evolution.Selector.select_parents`, with the selection probabilities computed once for all groups
+
+        :param fitness_results: a (not necessarily sorted) list of tuples containing a fitness score in the first position and a genome in the second (returned by :func:`~holland.evolution.Evaluator.evaluate_fitness`)
+        :type fitness_results: list
+
+        :param n_groups: the number of parent groups to select
+        :type n_groups: int
+
+
+        :returns: a list of ``n_groups`` lists of genomes (each of length ``self.n_parents``)
+
+
+        Dependencies:
+            * :func:`~holland.evolution.Selector.compute_selection_probabilities`
+            * :func:`~holland.evolution.Selector.compute_niche_counts`
+            * :func:`~holland.utils.utils.select_random`
+            * :func:`~holland.utils.utils.select_stochastic_universal`
+        """
+        if n_groups == 0:
+            return []
+
+        # the genomes and probabilities are prepared once rather than once per group
+        genomes, selection_probabilities = self._prepare_pool(fitness_results)
+        if self.sampling != "stochastic_universal":
+            return [
+                self._select_parents_from(genomes, selection_probabilities)
+                for _ in range(n_groups)
+            ]
+
+        parents = select_stochastic_universal(
+            genomes,
+            probabilities=selection_probabilities,
+            n=n_groups * self.n_parents,
+            rng=self.rng,
+        )
+        self.rng.shuffle(parents)
+
+        return [parents[i * self.n_parents : (i + 1) * self.n_parents] for i in range(n_groups)]
+
+    def select_local_parent_groups(self, fitness_results, neighborhoods):
+        """
+        Selects a set of parents for each cell of a cellular population from the genomes in the cell's neighborhood, rather than from a breeding pool of the whole population
+
+        Selection probabilities are computed once for the whole population (as by :func:`~holland.evolution.Selector.select_parents`, including niching) and renormalized within each neighborhood; parents are drawn independently with replacement, so a neighborhood smaller than ``n_parents`` still yields a full set of parents
+
+        :param fitness_results: a list of tuples containing a fitness score in the first position and a genome in the second, one for each cell (in the order of the cells, not sorted)
+        :type fitness_results: list
+
+        :param neighborhoods: for each cell, a sequence of the indices (into ``fitness_results``) of the cells in its neighborhood (returned by :func:`~holland.utils.grids.get_grid_neighborhoods`)
+        :type neighborhoods: list
+
+
+        :returns: a list with a list of genomes (of length ``self.n_parents``) for each neighborhood
+
+
+        Dependencies:
+            * :func:`~holland.evolution.Selector.compute_selection_probabilities`
+            * :func:`~holland.evolution.Selector.compute_niche_counts`
+            * :func:`~holland.utils.utils.select_random_indices`
+        """
+        if not neighborhoods:
+            return []
+        genomes, selection_probabilities = self._prepare_pool(fitness_results)
+
+        parent_groups = []
+        for neighborhood in neighborhoods:
+            local_probabilities = [selection_probabilities[i] for i in neighborhood]
+            local_total = sum(local_probabilities)
+            if local_total > 0:
+                local_probabilities = [p / local_total for p in local_probabilities]
+            else:
+                local_probabilities = None
+            indices = select_random_indices(
+                len(neighborhood),
+                probabilities=local_probabilities,
+                n=self.n_parents,
+                should_replace=True,
+                rng=self.rng,
+            )
+            parent_groups.append([genomes[neighborhood[i]] for i in indices])
+        return parent_groups
+
+    def select_crowded_tournament_parent_groups(
+        self, fitness_results, ranks, crowding_distances, n_groups
+    ):
+        """
+        Selects ``n_groups`` sets of parents by binary tournaments with the crowded comparison of NSGA-II: of two genomes drawn at random, the one in the better non-dominated front wins, and within the same front the one with the larger crowding distance
+
+        :param fitness_results: a list of tuples containing a tuple of objective values in the first position and a genome in the second
+        :type fitness_results: list
+
+        :param ranks: the index of the non-dominated front of each genome (returned by :func:`~holland.utils.pareto.select_non_dominated`)
+        :type ranks: list
+
+        :param crowding_distances: the crowding distance of each genome within its front (returned by :func:`~holland.utils.pareto.select_non_dominated`)
+        :type crowding_distances: list
+
+        :param n_groups: the number of parent groups to select
+        :type n_groups: int
+
+
+        :returns: a list of ``n_groups`` lists of genomes (each of length ``self.n_parents``)
+
+
+        .. note:: The ``"pool"``, ``weighting_function``, ``sampling``, and ``"niching"`` strategies are not used; the crowding distance takes the place of niching.
+        """
+        n_genomes = len(fitness_results)
+        random_ = self.rng.random
+
+        def select_winner():
+            i = int(random_() * n_genomes)
+            j = int(random_() * n_genomes)
+            if ranks[j] < ranks[i] or (
+                ranks[j] == ranks[i] and crowding_distances[j] > crowding_distances[i]
+            ):
+                i = j
+            return fitness_results[i][1]
+
+        return [[select_winner() for _ in range(self.n_parents)] for _ in range(n_groups)]
+
+    def _prepare_pool(self, fitness_results):
         fitness_scores, genomes = zip(*fitness_results)
+        selection_probabilities = self.compute_selection_probabilities(fitness_scores)
+        if self.niching_radius is not None:
+            niche_counts = self.compute_niche_counts(genomes)
+            shared_probabilities = [
+                probability / niche_count
+                for probability, niche_count in zip(selection_probabilities, niche_counts)
+            ]
+            shared_total = sum(shared_probabilities)
+            if shared_total > 0:
+                selection_probabilities = [
+                    probability / shared_total for probability in shared_probabilities
+                ]
+        return genomes, selection_probabilities
+
+    def _select_parents_from(self, genomes, selection_probabilities):
+        return select_random(
+            genomes, probabilities=selection_probabilities, n=self.n_parents, rng=self.rng
+        )
+
+    def compute_selection_probabilities(self, fitness_scores):
+        """
+        Converts fitness scores into selection probabilities by applying the ``weighting_function``; weighted scores are shifted to be positive if any of them is negative
+
+        :param fitness_scores: the fitness scores to convert
+        :type fitness_scores: list
 
+
+        :returns: a list of probabilities (summing to 1) in the same order as ``fitness_scores``; if the weighted scores sum to zero (e.g. every shifted score is zero because all weighted scores are equal and negative), every genome is equally likely
+        """
         weighted_scores = [self.weighting_function(fitness) for fitness in fitness_scores]
         min_weighted_score = min(weighted_scores)
         if min_weighted_score < 0:
@@ -82,8 +300,76 @@ class Selector:
             weighted_scores = [ws + shift for ws in weighted_scores]
 
         weighted_total = sum(weighted_scores)
-        selection_probabilities = [
-            weighted_score / weighted_total for weighted_score in weighted_scores
-        ]
+        if weighted_total == 0:
+            return [1 / len(weighted_scores)] * len(weighted_scores)
+        return [weighted_score / weighted_total for weighted_score in weighted_scores]
+
+    def compute_niche_counts(self, genomes):
+        """
+        Computes the niche count of each genome for fitness sharing, from the distances between genomes in the ``genes`` of the ``"niching"`` strategy
+
+        For the ``"euclidean"`` metric, the values of the numeric genes (and list-type genes) of a genome are its coordinates; for the ``"hamming"`` metric, the bits of its ``bool`` genes, ``[bool]`` genes, and ``"bitset"`` genes are concatenated. If no ``genes`` were given, they are the genes of the ``genome_params`` suited to the metric, or without ``genome_params``, the genes of the first genome whose values are suited to it
+
+        :param genomes: the genomes
+        :type genomes: list
+
+
+        :returns: a list of niche counts in the same order as ``genomes``
+
+        Dependencies:
+            * :func:`~holland.utils.niching.compute_niche_counts`
+            * :func:`~holland.utils.bitsets.pack_bits`
+        """
+        if not genomes:
+            return []
+        gene_names = self.niching_genes
+        if gene_names is None:
+            gene_names = sorted(
+                gene_name
+                for gene_name, gene in genomes[0].items()
+                if _is_niching_value(gene, self.niching_metric)
+            )
+
+        if self.niching_metric == "euclidean":
+            points = [
+                tuple(
+                    itertools.chain.from_iterable(
+                        _as_coordinates(genome[gene_name]) for gene_name in gene_names
+                    )
+                )
+                for genome in genomes
+            ]
+        else:
+            points = [0] * len(genomes)
+            for gene_name in gene_names:
+                genes = [genome[gene_name] for genome in genomes]
+                if isinstance(genes[0], list):
+                    width = max(len(gene) for gene in genes)
+                    genes = [pack_bits(gene) for gene in genes]
+                elif isinstance(genes[0], bool):
+                    width = 1
+                    genes = [int(gene) for gene in genes]
+                else:
+                    width = max(gene.bit_length() for gene in genes)
+                points = [(point << width) | gene for point, gene in zip(points, genes)]
+
+        return compute_niche_counts(
+            points, self.niching_radius, alpha=self.niching_alpha, metric=self.niching_metric
+        )
+
+
+def _as_coordinates(gene):
+    return gene if isinstance(gene, list) else (gene,)
+
+
+def _is_niching_type(gene_params, metric):
+    if metric == "euclidean":
+        return is_numeric_type(gene_params)
+    return gene_params["type"] in ["bool", "[bool]", "bitset"]
+
 
-        return select_random(genomes, probabilities=selection_probabilities, n=self.n_parents)
+def _is_niching_value(gene, metric):
+    value = gene[0] if isinstance(gene, list) and gene else gene
+    if metric == "euclidean":
+        return isinstance(value, (int, float)) and not isinstance(value, bool)
+    return isinstance(value, int)
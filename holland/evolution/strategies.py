@@ -0,0 +1,142 @@
+import math
+import random
+import operator
+import itertools
+
+from .vectors import GenomeVectorizer
+
+
+class EvolutionStrategy(GenomeVectorizer):
+    """
+    Handles breeding offspring genomes by Gaussian perturbation with an adaptive step size (a (μ, λ) or (μ + λ) evolution strategy), for genomes whose genes are all of type ``"float"`` or ``"[float]"``
+
+    Genomes are bred as flat vectors of their values (see :class:`~holland.evolution.GenomeVectorizer`), and a single step size is shared by all values and adapted after each generation.
+
+    :param genome_params: a dictionary specifying genome parameters; see :ref:`genome-params`; only the ``type``, ``size``, ``min``, and ``max`` of each gene are used
+    :type genome_params: dict
+
+    :param n_offspring: the number of offspring bred in each generation (λ)
+    :type n_offspring: int
+
+    :param evolution_strategy_params: a dictionary specifying the number of parents, selection, recombination, and step size adaptation; see :ref:`evolution-strategies`
+    :type evolution_strategy_params: dict
+
+    :param rng: the source of randomness (a ``random.Random`` instance); the ``random`` module is used if not specified
+    :type rng: random.Random
+
+
+    :raises ValueError: if any gene is not of type ``"float"`` or ``"[float]"``
+    :raises ValueError: if ``n_parents`` is less than 1 or greater than ``n_offspring``
+    :raises ValueError: if ``selection`` is not one of ``"comma"``, ``"plus"``
+    :raises ValueError: if ``recombination`` is not one of ``"intermediate"``, ``"none"``
+    :raises ValueError: if ``step_size_adaptation`` is not one of ``"csa"``, ``"one_fifth"``
+    :raises ValueError: if ``initial_step_size`` is not positive
+    """
+
+    def __init__(self, genome_params, n_offspring, evolution_strategy_params={}, rng=None):
+        super().__init__(genome_params)
+        self.rng = rng if rng is not None else random
+        self.n_offspring = n_offspring
+        self.n_parents = evolution_strategy_params.get("n_parents", max(1, n_offspring // 4))
+        self.selection = evolution_strategy_params.get("selection", "comma")
+        self.recombination = evolution_strategy_params.get("recombination", "intermediate")
+        self.step_size_adaptation = evolution_strategy_params.get("step_size_adaptation", "csa")
+        self.step_size = evolution_strategy_params.get("initial_step_size", 1)
+        self.min_step_size = evolution_strategy_params.get("min_step_size", 1e-8)
+
+        if not 1 <= self.n_parents <= n_offspring:
+            raise ValueError("Number of parents must be between 1 and the number of offspring")
+        if self.selection not in ["comma", "plus"]:
+            raise ValueError("Evolution strategy selection must be either 'comma' or 'plus'")
+        if self.recombination not in ["intermediate", "none"]:
+            raise ValueError(
+                "Evolution strategy recombination must be either 'intermediate' or 'none'"
+            )
+        if self.step_size_adaptation not in ["csa", "one_fifth"]:
+            raise ValueError("Step size adaptation must be either 'csa' or 'one_fifth'")
+        if self.step_size <= 0:
+            raise ValueError("Initial step size must be positive")
+
+        n_values = len(self.lower_bounds)
+        mu = self.n_parents
+        # constants of cumulative step size adaptation (Hansen, 2016) with equal weights
+        self._path = [0.0] * n_values
+        self._path_rate = (mu + 2) / (n_values + mu + 5)
+        self._path_damping = (
+            1 + 2 * max(0, math.sqrt((mu - 1) / (n_values + 1)) - 1) + self._path_rate
+        )
+        self._expected_norm = math.sqrt(n_values) * (
+            1 - 1 / (4 * n_values) + 1 / (21 * n_values**2)
+        )
+        # damping of the one-fifth success rule of the (1 + λ)-ES (Igel et al., 2007)
+        self._success_damping = 1 + n_values / (2 * n_offspring)
+
+    def breed_offspring_vectors(self, parent_vectors):
+        """
+        Breeds ``n_offspring`` offspring vectors by adding ``step_size`` times a standard normal vector to a base vector, and bounds the values to the ``min`` and ``max`` of their genes
+
+        With ``"intermediate"`` recombination the base vector of every offspring is the mean of the parent vectors; with ``"none"`` it is a parent vector drawn uniformly at random for each offspring.
+
+        :param parent_vectors: the vectors of the parents (returned by :func:`~holland.evolution.GenomeVectorizer.to_vectors`)
+        :type parent_vectors: list
+
+
+        :returns: a list of ``n_offspring`` offspring vectors
+        """
+        add, mul = operator.add, operator.mul
+        gauss = self.rng.gauss
+        step_sizes = itertools.repeat(self.step_size)
+        n_values = len(self.lower_bounds)
+        if self.recombination == "intermediate":
+            centroid = _mean(parent_vectors)
+
+        offspring_vectors = []
+        for _ in range(self.n_offspring):
+            if self.recombination == "intermediate":
+                base = centroid
+            else:
+                base = parent_vectors[int(self.rng.random() * len(parent_vectors))]
+            perturbation = map(mul, step_sizes, [gauss(0, 1) for _ in range(n_values)])
+            offspring_vectors.append(self.bound_vector(map(add, base, perturbation)))
+        return offspring_vectors
+
+    def adapt_step_size(self, parent_vectors, next_parent_vectors, success_rate):
+        """
+        Adapts the step size after a generation, by cumulative step size adaptation (``"csa"``) or the one-fifth success rule (``"one_fifth"``)
+
+        With ``"csa"``, an evolution path accumulates the shifts of the mean parent vector (in units of the step size), and the step size grows if the path is longer than expected under random selection and shrinks if it is shorter. With ``"one_fifth"``, the step size grows if more than a fifth of the offspring were successful and shrinks if fewer were.
+
+        .. note:: Cumulative step size adaptation assumes that the offspring of a generation share the mean parent vector as their base, so it is best paired with ``"intermediate"`` recombination.
+
+        :param parent_vectors: the vectors of the parents the offspring were bred from
+        :type parent_vectors: list
+
+        :param next_parent_vectors: the vectors of the parents selected for the next generation
+        :type next_parent_vectors: list
+
+        :param success_rate: the fraction of offspring more fit than the fittest parent
+        :type success_rate: float
+
+
+        :returns: the new step size (also stored as ``step_size``)
+        """
+        if self.step_size_adaptation == "csa":
+            rate = self._path_rate
+            shift_scale = math.sqrt(rate * (2 - rate) * self.n_parents) / self.step_size
+            shift = map(operator.sub, _mean(next_parent_vectors), _mean(parent_vectors))
+            self._path = [
+                (1 - rate) * path_value + shift_scale * shift_value
+                for path_value, shift_value in zip(self._path, shift)
+            ]
+            path_norm = math.sqrt(sum(value * value for value in self._path))
+            exponent = (rate / self._path_damping) * (path_norm / self._expected_norm - 1)
+        else:
+            exponent = (success_rate - 0.2) / (0.8 * self._success_damping)
+
+        self.step_size = max(self.step_size * math.exp(exponent), self.min_step_size)
+        return self.step_size
+
+
+def _mean(vectors):
+    n_vectors = len(vectors)
+    return [sum(values) / n_vectors for values in zip(*vectors)]
@@ -0,0 +1,83 @@
+import math
+
+
+class GenomeVectorizer:
+    """
+    Handles converting genomes whose genes are all of type ``"float"`` or ``"[float]"`` to and from flat vectors of their values (genes in the order of ``genome_params``), so that breeding can be a single pass over whole vectors with ``map`` and ``operator`` rather than a loop over genes and values
+
+    :param genome_params: a dictionary specifying genome parameters; see :ref:`genome-params`; only the ``type``, ``size``, ``min``, and ``max`` of each gene are used
+    :type genome_params: dict
+
+
+    :raises ValueError: if any gene is not of type ``"float"`` or ``"[float]"``
+    """
+
+    def __init__(self, genome_params):
+        self.genome_params = genome_params
+
+        gene_types = [gene_params["type"] for gene_params in genome_params.values()]
+        if any(gene_type not in ["float", "[float]"] for gene_type in gene_types):
+            raise ValueError("Vectorized genomes require all genes to be 'float' or '[float]'")
+
+        self._layout = []
+        self.lower_bounds = []
+        self.upper_bounds = []
+        for gene_name, gene_params in genome_params.items():
+            size = gene_params["size"] if gene_params["type"] == "[float]" else None
+            self._layout.append((gene_name, len(self.lower_bounds), size))
+            n_values = size if size is not None else 1
+            minimum = gene_params.get("min")
+            maximum = gene_params.get("max")
+            self.lower_bounds += [-math.inf if minimum is None else minimum] * n_values
+            self.upper_bounds += [math.inf if maximum is None else maximum] * n_values
+
+    def to_vectors(self, genomes):
+        """
+        Flattens genomes into vectors of their values
+
+        :param genomes: the genomes to flatten
+        :type genomes: list
+
+
+        :returns: a list with a list of floats for each genome
+        """
+        vectors = []
+        for genome in genomes:
+            vector = []
+            for gene_name, start, size in self._layout:
+                if size is None:
+                    vector.append(genome[gene_name])
+                else:
+                    vector += genome[gene_name]
+            vectors.append(vector)
+        return vectors
+
+    def to_genomes(self, vectors):
+        """
+        Builds genomes from vectors of their values (the inverse of :func:`~holland.evolution.GenomeVectorizer.to_vectors`)
+
+        :param vectors: the vectors to convert
+        :type vectors: list
+
+
+        :returns: a list of genomes
+        """
+        return [
+            {
+                gene_name: vector[start] if size is None else vector[start : start + size]
+                for gene_name, start, size in self._layout
+            }
+            for vector in vectors
+        ]
+
+    def bound_vector(self, vector):
+        """
+        Bounds each value of a vector to the ``min`` and ``max`` of its gene
+
+        :param vector: the vector to bound
+        :type vector: list
+
+
+        :returns: a new list of bounded values
+        """
+        return list(map(min, self.upper_bounds, map(max, self.lower_bounds, vector)))
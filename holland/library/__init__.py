@@ -1,3 +1,4 @@
 from .crossover_functions import *
 from .mutation_functions import *
 from .fitness_weighting_functions import *
+from .local_search_functions import *
@@ -1,6 +1,9 @@
 import random
+import operator
+import functools
 
 from ..utils.utils import select_random
+from ..utils.bitsets import get_bit_mask, get_random_bit_mask
 
 
 def get_uniform_crossover_function():
@@ -66,7 +69,7 @@ def get_and_crossover_function():
     Returns a function that reduces the values of the parent_genes by the logical 'and' operation; see :ref:`crossover-functions`
     
     :Valid For:
-        ``"bool"`` and ``"[bool]"`` gene types
+        ``"bool"``, ``"[bool]"``, and ``"bitset"`` gene types
 
 
     :returns: a function that accepts a list of parent genes and applies 'and' crossover
@@ -76,6 +79,8 @@ def get_and_crossover_function():
         if isinstance(parent_genes[0], list):
             size = len(parent_genes[0])
             return [all(pg[i] for pg in parent_genes) for i in range(size)]
+        if _is_bitset(parent_genes[0]):
+            return functools.reduce(operator.and_, parent_genes)
         return all(parent_genes)
 
     return and_crossover
@@ -86,7 +91,7 @@ def get_or_crossover_function():
     Returns a function that reduces the values of the parent_genes by the logical 'or' operation; see :ref:`crossover-functions`
 
     :Valid For:
-        ``"bool"`` and ``"[bool]"`` gene types
+        ``"bool"``, ``"[bool]"``, and ``"bitset"`` gene types
 
 
     :returns: a function that accepts a list of parent genes and applies 'or' crossover
@@ -96,6 +101,190 @@ def get_or_crossover_function():
         if isinstance(parent_genes[0], list):
             size = len(parent_genes[0])
             return [any(pg[i] for pg in parent_genes) for i in range(size)]
+        if _is_bitset(parent_genes[0]):
+            return functools.reduce(operator.or_, parent_genes)
         return any(parent_genes)
 
     return or_crossover
+
+
+def get_bitset_uniform_crossover_function(size):
+    """
+    Returns a function that applies uniform crossover to bitsets (each bit is chosen at random from the parent genes) using bitwise operations; see :ref:`crossover-functions`
+
+    :Valid For:
+        ``"bitset"`` gene type
+
+    :param size: the number of bits in the gene
+    :type size: int
+
+
+    :returns: a function that accepts a list of parent bitsets and applies uniform crossover to them and returns a new bitset
+
+
+    Dependencies:
+        * :func:`~holland.utils.bitsets.get_random_bit_mask`
+    """
+
+    def bitset_uniform_crossover(parent_genes):
+        offspring = parent_genes[0]
+        for i, parent_gene in enumerate(parent_genes[1:], start=2):
+            # taking each bit from the i-th parent with probability 1/i leaves every parent equally likely
+            mask = get_random_bit_mask(size, probability=1 / i)
+            offspring = (offspring & ~mask) | (parent_gene & mask)
+        return offspring
+
+    return bitset_uniform_crossover
+
+
+def get_bitset_point_crossover_function(size, n_crossover_points=1):
+    """
+    Returns a function that applies point crossover to bitsets (take bits from one parent gene at a time until reaching a crossover point, then switch parent genes) using bitwise operations; see :ref:`crossover-functions`
+
+    :Valid For:
+        ``"bitset"`` gene type
+
+    :param size: the number of bits in the gene
+    :type size: int
+
+    :param n_crossover_points: number of points at which to switch to the next parent gene (should be at least ``len(parent_genes) - 1``)
+    :type n_crossover_points: int
+
+
+    :returns: a function that accepts a list of parent bitsets and applies point crossover
+
+
+    :raises ValueError: if ``n_crossover_points`` is negative
+
+    Dependencies:
+        * :func:`~holland.utils.utils.select_random`
+        * :func:`~holland.utils.bitsets.get_bit_mask`
+    """
+    if n_crossover_points < 0:
+        raise ValueError("Number of crossover points cannot be negative")
+
+    def bitset_point_crossover(parent_genes):
+        crossover_points = sorted(select_random(range(1, size), n=n_crossover_points))
+        crossover_points.insert(0, 0)
+        crossover_points.append(size)
+
+        offspring = 0
+        current_parent_index = 0
+        for start, end in zip(crossover_points, crossover_points[1:]):
+            offspring |= parent_genes[current_parent_index] & get_bit_mask(start, end)
+            current_parent_index = (current_parent_index + 1) % len(parent_genes)
+        return offspring
+
+    return bitset_point_crossover
+
+
+def get_order_crossover_function():
+    """
+    Returns a function that applies order crossover (OX) to permutations: a random slice is copied from the first parent and the remaining positions are filled, starting after the slice, with the missing values in the order they appear in the second parent; see :ref:`crossover-functions`
+
+    :Valid For:
+        ``"permutation"`` gene type
+
+
+    :returns: a function that accepts a list of parent genes and applies order crossover to the first two in linear time
+    """
+
+    def order_crossover(parent_genes):
+        if len(parent_genes) < 2:
+            return list(parent_genes[0])
+        first, second = parent_genes[0], parent_genes[1]
+        size = len(first)
+        start, end = _select_slice(size)
+
+        offspring = [None] * size
+        offspring[start:end] = first[start:end]
+        copied = set(first[start:end])
+
+        position = end % size
+        for k in range(size):
+            value = second[(end + k) % size]
+            if value not in copied:
+                offspring[position] = value
+                position = (position + 1) % size
+        return offspring
+
+    return order_crossover
+
+
+def get_partially_mapped_crossover_function():
+    """
+    Returns a function that applies partially mapped crossover (PMX) to permutations: a random slice is copied from the first parent, the other positions are taken from the second parent, and values displaced by the slice are placed by following the mapping between the parents' slices; see :ref:`crossover-functions`
+
+    :Valid For:
+        ``"permutation"`` gene type
+
+
+    :returns: a function that accepts a list of parent genes and applies partially mapped crossover to the first two in linear time
+    """
+
+    def partially_mapped_crossover(parent_genes):
+        if len(parent_genes) < 2:
+            return list(parent_genes[0])
+        first, second = parent_genes[0], parent_genes[1]
+        start, end = _select_slice(len(first))
+
+        offspring = list(second)
+        offspring[start:end] = first[start:end]
+        copied = set(first[start:end])
+        second_positions = {value: i for i, value in enumerate(second)}
+
+        for i in range(start, end):
+            value = second[i]
+            if value in copied:
+                continue
+            position = i
+            while start <= position < end:
+                position = second_positions[first[position]]
+            offspring[position] = value
+        return offspring
+
+    return partially_mapped_crossover
+
+
+def get_cycle_crossover_function():
+    """
+    Returns a function that applies cycle crossover (CX) to permutations: the positions are divided into cycles between the parents and alternate cycles take their values from alternate parents, so every value keeps the position it has in one of the parents; see :ref:`crossover-functions`
+
+    :Valid For:
+        ``"permutation"`` gene type
+
+
+    :returns: a function that accepts a list of parent genes and applies cycle crossover to the first two in linear time
+    """
+
+    def cycle_crossover(parent_genes):
+        if len(parent_genes) < 2:
+            return list(parent_genes[0])
+        first, second = parent_genes[0], parent_genes[1]
+        size = len(first)
+        first_positions = {value: i for i, value in enumerate(first)}
+
+        offspring = [None] * size
+        is_assigned = [False] * size
+        source = first
+        for i in range(size):
+            if is_assigned[i]:
+                continue
+            position = i
+            while not is_assigned[position]:
+                offspring[position] = source[position]
+                is_assigned[position] = True
+                position = first_positions[second[position]]
+            source = second if source is first else first
+        return offspring
+
+    return cycle_crossover
+
+
+def _select_slice(size):
+    start, end = sorted(random.sample(range(size + 1), 2))
+    return start, end
+
+
+def _is_bitset(gene):
+    return isinstance(gene, int) and not isinstance(gene, bool)
@@ -0,0 +1,134 @@
+def get_hill_climbing_local_search(gene_name, mutation_function, max_failures=None):
+    """
+    Returns a function that repeatedly mutates a gene of a genome and keeps each mutation that improves fitness (stochastic first-improvement hill climbing); see :ref:`local-search`
+
+    :Valid For:
+        any gene type, given a suitable mutation function
+
+    :param gene_name: the name of the gene to mutate
+    :type gene_name: str
+
+    :param mutation_function: a function that returns a mutated copy of the value of the gene, e.g. from :func:`~holland.library.mutation_functions.get_gaussian_mutation_function`; it should never modify its input in place
+    :type mutation_function: func
+
+    :param max_failures: the number of consecutive mutations that do not improve fitness after which the search stops (by default the search stops only once the evaluation budget is used)
+    :type max_failures: int
+
+
+    :returns: a local search function that returns the most fit genome found and its fitness
+    """
+
+    def hill_climbing_local_search(genome, fitness, evaluate, is_better):
+        n_failures = 0
+        while max_failures is None or n_failures < max_failures:
+            candidate = {**genome, gene_name: mutation_function(genome[gene_name])}
+            candidate_fitness = evaluate(candidate)
+            if candidate_fitness is None:
+                break
+            if is_better(candidate_fitness, fitness):
+                genome, fitness = candidate, candidate_fitness
+                n_failures = 0
+            else:
+                n_failures += 1
+        return fitness, genome
+
+    return hill_climbing_local_search
+
+
+def get_coordinate_descent_local_search(
+    gene_name, step_size, min_step_size=1e-6, minimum=None, maximum=None
+):
+    """
+    Returns a function that moves each value of a numeric gene up or down by a step size in turn, keeping each move that improves fitness, and halves the step size whenever no move improves fitness (compass search); see :ref:`local-search`
+
+    :Valid For:
+        ``"int"``, ``"[int]"``, ``"float"``, and ``"[float]"`` gene types (for ``int`` genes, ``step_size`` and ``min_step_size`` should be integers of at least ``1``)
+
+    :param gene_name: the name of the gene to search
+    :type gene_name: str
+
+    :param step_size: the initial distance each value is moved by
+    :type step_size: int/float
+
+    :param min_step_size: the step size below which the search stops
+    :type min_step_size: int/float
+
+    :param minimum: the minimum allowed value (moved values are bounded to it)
+    :type minimum: int/float
+
+    :param maximum: the maximum allowed value (moved values are bounded to it)
+    :type maximum: int/float
+
+
+    :returns: a local search function that returns the most fit genome found and its fitness
+    """
+
+    def bound(value):
+        if minimum is not None and value < minimum:
+            return minimum
+        if maximum is not None and value > maximum:
+            return maximum
+        return value
+
+    def coordinate_descent_local_search(genome, fitness, evaluate, is_better):
+        is_list = isinstance(genome[gene_name], list)
+        values = list(genome[gene_name]) if is_list else [genome[gene_name]]
+        step = step_size
+        while step >= min_step_size:
+            has_improved = False
+            for i in range(len(values)):
+                for direction in (1, -1):
+                    moved_values = list(values)
+                    moved_values[i] = bound(values[i] + direction * step)
+                    if moved_values[i] == values[i]:
+                        continue
+                    candidate = {**genome, gene_name: moved_values if is_list else moved_values[0]}
+                    candidate_fitness = evaluate(candidate)
+                    if candidate_fitness is None:
+                        return fitness, genome
+                    if is_better(candidate_fitness, fitness):
+                        genome, fitness, values = candidate, candidate_fitness, moved_values
+                        has_improved = True
+                        break
+            if not has_improved:
+                step = step / 2 if isinstance(step, float) else step // 2
+        return fitness, genome
+
+    return coordinate_descent_local_search
+
+
+def get_two_opt_local_search(gene_name):
+    """
+    Returns a function that reverses slices of a permutation gene (2-opt moves for a tour), keeping each reversal that improves fitness, until no reversal improves fitness; see :ref:`local-search`
+
+    :Valid For:
+        ``"permutation"`` gene type and list-type genes
+
+    :param gene_name: the name of the gene to search
+    :type gene_name: str
+
+
+    :returns: a local search function that returns the most fit genome found and its fitness
+
+    .. note:: Each move is evaluated with the full fitness function; for long tours a small evaluation budget keeps the search affordable.
+    """
+
+    def two_opt_local_search(genome, fitness, evaluate, is_better):
+        size = len(genome[gene_name])
+        has_improved = True
+        while has_improved:
+            has_improved = False
+            for start in range(size - 1):
+                for end in range(start + 2, size + 1):
+                    tour = genome[gene_name]
+                    reversed_tour = tour[:start] + tour[start:end][::-1] + tour[end:]
+                    candidate = {**genome, gene_name: reversed_tour}
+                    candidate_fitness = evaluate(candidate)
+                    if candidate_fitness is None:
+                        return fitness, genome
+                    if is_better(candidate_fitness, fitness):
+                        genome, fitness = candidate, candidate_fitness
+                        has_improved = True
+        return fitness, genome
+
+    return two_opt_local_search
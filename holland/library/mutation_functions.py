@@ -1,5 +1,8 @@
 import random
 
+from ..utils.utils import DescribedMutation
+from ..utils.bitsets import get_random_bit_mask
+
 
 def get_flip_mutation_function():
     """
@@ -66,3 +69,119 @@ def get_gaussian_mutation_function(sigma):
     :returns: a sample from a gaussian distribution
     """
     return lambda value: random.gauss(value, sigma)
+
+
+def get_bitset_flip_mutation_function(size, flip_rate, should_describe_change=False):
+    """
+    Returns a function that flips each bit of a bitset independently with probability ``flip_rate``, using a single bitwise 'xor'; see :ref:`mutation-functions`
+
+    :Valid For:
+        ``"bitset"`` gene type
+
+    :param size: the number of bits in the gene
+    :type size: int
+
+    :param flip_rate: the probability that each bit is flipped
+    :type flip_rate: float
+
+    :param should_describe_change: whether the returned function should return a :class:`~holland.utils.utils.DescribedMutation` with change ``("flip", mask)``, where ``mask`` is the bitset of flipped bits; see :ref:`delta-evaluation`
+    :type should_describe_change: bool
+
+
+    :returns: a function that returns its input bitset with randomly chosen bits flipped
+
+
+    .. note:: ``"bitset"`` genes are mutated as a whole, so the gene's ``mutation_rate`` is the probability that this function is applied at all; use a ``mutation_rate`` of ``1`` to control mutation with ``flip_rate`` alone.
+
+    Dependencies:
+        * :func:`~holland.utils.bitsets.get_random_bit_mask`
+    """
+
+    def bitset_flip_mutation(value):
+        mask = get_random_bit_mask(size, probability=flip_rate)
+        if should_describe_change:
+            return DescribedMutation(value ^ mask, ("flip", mask))
+        return value ^ mask
+
+    return bitset_flip_mutation
+
+
+def get_swap_mutation_function(should_describe_change=False):
+    """
+    Returns a function that swaps the values at two random positions of a list; see :ref:`mutation-functions`
+
+    :Valid For:
+        ``"permutation"`` gene type and list-type genes (with ``"mutation_level": "gene"``)
+
+    :param should_describe_change: whether the returned function should return a :class:`~holland.utils.utils.DescribedMutation` with change ``("swap", i, j)``, where ``i`` and ``j`` are the positions of the swapped values; see :ref:`delta-evaluation`
+    :type should_describe_change: bool
+
+
+    :returns: a function that returns a copy of its input list with two values swapped
+    """
+
+    def swap_mutation(value):
+        mutated = list(value)
+        if len(mutated) < 2:
+            return mutated
+        i, j = random.sample(range(len(mutated)), 2)
+        mutated[i], mutated[j] = mutated[j], mutated[i]
+        if should_describe_change:
+            return DescribedMutation(mutated, ("swap", i, j))
+        return mutated
+
+    return swap_mutation
+
+
+def get_insertion_mutation_function(should_describe_change=False):
+    """
+    Returns a function that moves the value at a random position of a list to another random position; see :ref:`mutation-functions`
+
+    :Valid For:
+        ``"permutation"`` gene type and list-type genes (with ``"mutation_level": "gene"``)
+
+    :param should_describe_change: whether the returned function should return a :class:`~holland.utils.utils.DescribedMutation` with change ``("insertion", i, j)``, where the value at position ``i`` was moved to position ``j``; see :ref:`delta-evaluation`
+    :type should_describe_change: bool
+
+
+    :returns: a function that returns a copy of its input list with one value moved
+    """
+
+    def insertion_mutation(value):
+        mutated = list(value)
+        if len(mutated) < 2:
+            return mutated
+        i, j = random.sample(range(len(mutated)), 2)
+        mutated.insert(j, mutated.pop(i))
+        if should_describe_change:
+            return DescribedMutation(mutated, ("insertion", i, j))
+        return mutated
+
+    return insertion_mutation
+
+
+def get_inversion_mutation_function(should_describe_change=False):
+    """
+    Returns a function that reverses the order of the values in a random slice of a list (e.g. a 2-opt move for a tour); see :ref:`mutation-functions`
+
+    :Valid For:
+        ``"permutation"`` gene type and list-type genes (with ``"mutation_level": "gene"``)
+
+    :param should_describe_change: whether the returned function should return a :class:`~holland.utils.utils.DescribedMutation` with change ``("inversion", start, end)``, where the slice ``[start:end]`` was reversed; see :ref:`delta-evaluation`
+    :type should_describe_change: bool
+
+
+    :returns: a function that returns a copy of its input list with one slice reversed
+    """
+
+    def inversion_mutation(value):
+        mutated = list(value)
+        if len(mutated) < 2:
+            return mutated
+        start, end = sorted(random.sample(range(len(mutated) + 1), 2))
+        mutated[start:end] = mutated[start:end][::-1]
+        if should_describe_change:
+            return DescribedMutation(mutated, ("inversion", start, end))
+        return mutated
+
+    return inversion_mutation
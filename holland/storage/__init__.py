@@ -2,3 +2,4 @@ from .storage_manager import *
 from .fitness import *
 from .genomes_and_fitnesses import *
 from .utils import *
+from .hall_of_fame import *
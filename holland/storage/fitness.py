@@ -41,8 +41,20 @@ def format_fitness_statistics(generation_num, fitness_scores):
     :type fitness_scores: list
 
 
-    :returns: a dictionary of statistics for the fitness scores
+    :returns: a dictionary of statistics for the fitness scores; if the fitness scores are tuples of objective values (see :ref:`multi-objective`), each statistic is a list with its value for each objective
     """
+    if fitness_scores and type(fitness_scores[0]) in [list, tuple]:
+        objective_statistics = [
+            format_fitness_statistics(generation_num, list(objective_scores))
+            for objective_scores in zip(*fitness_scores)
+        ]
+        return {
+            "generation": generation_num,
+            **{
+                key: [statistic[key] for statistic in objective_statistics]
+                for key in ["max", "min", "median", "mean", "stdev"]
+            },
+        }
     return {
         "generation": generation_num,
         "max": max(fitness_scores),
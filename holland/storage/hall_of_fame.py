@@ -0,0 +1,87 @@
+import heapq
+import itertools
+
+from ..utils import hash_genome
+
+
+class HallOfFame:
+    """
+    Handles an archive of the most fit unique genomes seen over all generations
+
+    :param size: the maximum number of genomes in the archive
+    :type size: int
+
+    :param ascending: whether more fit genomes have higher fitness scores (as for :class:`~holland.evolution.Evaluator`)
+    :type ascending: bool
+
+    :param hash_function: a function returning a hash of a genome, so that equal genomes have equal hashes (by default :func:`~holland.utils.utils.hash_genome`)
+    :type hash_function: func
+
+
+    :raises ValueError: if ``size < 1``
+
+    .. note:: The archive is a heap with its least fit genome at the root, together with a dictionary from genome hashes to archived genomes. A genome that is not more fit than the root of a full archive is rejected with a single comparison, and only genomes that would enter the archive are hashed, so updating the archive with ``n`` genomes takes ``O(n + m log k)`` time, where ``m`` is the number of genomes entering an archive of size ``k``. A genome only enters the archive if it is more fit than the least fit archived genome, so of equally fit genomes the one seen first is kept.
+    """
+
+    def __init__(self, size, ascending=True, hash_function=hash_genome):
+        if size < 1:
+            raise ValueError("Hall of fame size must be at least 1")
+
+        self.size = size
+        self.ascending = ascending
+        self.hash_function = hash_function
+        self._heap = []
+        self._archived_ids = set()
+        self._archived_hashes = {}
+        self._counter = itertools.count()
+
+    def __len__(self):
+        return len(self._heap)
+
+    def update(self, fitness_results):
+        """
+        Adds the genomes of a round of evaluation that are more fit than the least fit archived genome and not already archived, evicting the least fit archived genomes to keep the archive within ``size``
+
+        :param fitness_results: a (not necessarily sorted) list of tuples containing a fitness score in the first position and a genome in the second
+        :type fitness_results: list
+
+
+        :returns: the number of genomes added to the archive
+        """
+        heap = self._heap
+        n_added = 0
+        for fitness, genome in fitness_results:
+            key = fitness if self.ascending else -fitness
+            if len(heap) >= self.size and key <= heap[0][0]:
+                continue
+            if id(genome) in self._archived_ids:
+                continue
+            genome_hash = self.hash_function(genome)
+            equal_genomes = self._archived_hashes.setdefault(genome_hash, [])
+            if any(archived == genome for archived in equal_genomes):
+                continue
+
+            entry = (key, next(self._counter), fitness, genome, genome_hash)
+            if len(heap) < self.size:
+                heapq.heappush(heap, entry)
+            else:
+                self._forget(heapq.heapreplace(heap, entry))
+            self._archived_ids.add(id(genome))
+            equal_genomes.append(genome)
+            n_added += 1
+        return n_added
+
+    def _forget(self, entry):
+        genome, genome_hash = entry[3], entry[4]
+        self._archived_ids.discard(id(genome))
+        equal_genomes = self._archived_hashes[genome_hash]
+        equal_genomes.remove(genome)
+        if not equal_genomes:
+            del self._archived_hashes[genome_hash]
+
+    @property
+    def fitness_results(self):
+        """
+        The archived genomes as a list of tuples of the form ``(score, genome)``, sorted by fitness (the most fit genome last, as returned by :func:`~holland.evolution.Evaluator.evaluate_fitness`)
+        """
+        return [(entry[2], entry[3]) for entry in sorted(self._heap)]
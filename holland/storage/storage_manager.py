@@ -1,5 +1,8 @@
 from .fitness import record_fitness
 from .genomes_and_fitnesses import record_genomes_and_fitnesses
+from .hall_of_fame import HallOfFame
+from .utils import record
+from ..utils import hash_genome
 
 
 class StorageManager:
@@ -11,9 +14,28 @@ class StorageManager:
 
     :param genome_storage_options: options for storing genomes and their fitness scores; see :ref:`genome-storage-options`
     :type genome_storage_options: dict
+
+    :param hall_of_fame_options: options for keeping and storing an archive of the most fit genomes of all generations; see :ref:`hall-of-fame-options`
+    :type hall_of_fame_options: dict
+
+    :param ascending: whether more fit genomes have higher fitness scores (used by the hall of fame)
+    :type ascending: bool
+
+    :param hash_function: a function returning a hash of a genome (used by the hall of fame to tell equal genomes apart)
+    :type hash_function: func
+
+
+    :raises ValueError: if ``hall_of_fame_options["size"] < 1``
     """
 
-    def __init__(self, fitness_storage_options={}, genome_storage_options={}):
+    def __init__(
+        self,
+        fitness_storage_options={},
+        genome_storage_options={},
+        hall_of_fame_options={},
+        ascending=True,
+        hash_function=hash_genome,
+    ):
         self.fitness_storage_options = fitness_storage_options
         self.should_record_fitness = fitness_storage_options.get("should_record_fitness")
         self.fitness_format = fitness_storage_options.get("format")
@@ -28,6 +50,15 @@ class StorageManager:
             "should_record_on_interrupt"
         )
 
+        self.hall_of_fame_options = hall_of_fame_options
+        self.should_record_hall_of_fame = hall_of_fame_options.get("should_record_hall_of_fame")
+        self.hall_of_fame = None
+        if "size" in hall_of_fame_options:
+            self.hall_of_fame = HallOfFame(
+                hall_of_fame_options["size"], ascending=ascending, hash_function=hash_function
+            )
+        self._last_generation_num = None
+
     def update_storage(self, generation_num, fitness_results):
         """
         Updates storage of fitness scores and genomes (with fitness scores) when called; Decisions for whether to record or not are handled by dependencies
@@ -45,13 +76,33 @@ class StorageManager:
         Dependencies:
             * :func:`~holland.storage.StorageManager.update_fitness_storage`
             * :func:`~holland.storage.StorageManager.update_genome_storage`
+            * :func:`~holland.storage.StorageManager.update_hall_of_fame`
         """
         self.update_fitness_storage(generation_num, fitness_results)
         self.update_genome_storage(generation_num, fitness_results)
+        self.update_hall_of_fame(fitness_results)
+        self._last_generation_num = generation_num
+
+    def update_hall_of_fame(self, fitness_results):
+        """
+        Updates the hall of fame (if ``hall_of_fame_options`` has a ``size``) with the genomes of ``fitness_results``, without storing anything else; used to archive individuals as soon as they are evaluated when they may be replaced before the next call to :func:`~holland.storage.StorageManager.update_storage`
+
+        :param fitness_results: a (not necessarily sorted) list of tuples containing a fitness score in the first position and a genome in the second
+        :type fitness_results: list
+
+
+        :returns: ``None``
+
+
+        Dependencies:
+            * :func:`~holland.storage.HallOfFame.update`
+        """
+        if self.hall_of_fame is not None:
+            self.hall_of_fame.update(fitness_results)
 
     def react_to_interruption(self, generation_num, fitness_results):
         """
-        Updates storage of genomes (with fitness scores) in the event of an interruption during execution if ``genome_storage_options["should_record_on_interrupt"]`` is set to ``True``
+        Updates storage of genomes (with fitness scores) in the event of an interruption during execution if ``genome_storage_options["should_record_on_interrupt"]`` is set to ``True``, and records the hall of fame if ``hall_of_fame_options["should_record_hall_of_fame"]`` is set to ``True``
 
         :param generation_num: the generation number of the population that generated the ``fitness_results``
         :type generation_num: int
@@ -65,11 +116,31 @@ class StorageManager:
 
         Dependencies:
             * :func:`~holland.storage.genomes_and_fitnesses.record_genomes_and_fitnesses`
+            * :func:`~holland.storage.StorageManager.record_hall_of_fame`
         """
         if self.should_record_genomes_on_interrupt:
             record_genomes_and_fitnesses(
                 generation_num, fitness_results, **self.genome_storage_options
             )
+        self.record_hall_of_fame()
+
+    def record_hall_of_fame(self):
+        """
+        Records the genomes of the hall of fame (with fitness scores) to a file if ``hall_of_fame_options["should_record_hall_of_fame"]`` is set to ``True``, in the form ``{"generation": generation_num, "results": fitness_results}`` where ``generation_num`` is the last generation stored
+
+
+        :returns: ``None``
+
+
+        Dependencies:
+            * :func:`~holland.storage.utils.record`
+        """
+        if self.hall_of_fame is not None and self.should_record_hall_of_fame:
+            data = {
+                "generation": self._last_generation_num,
+                "results": self.hall_of_fame.fitness_results,
+            }
+            record(data, **{"format": "json", **self.hall_of_fame_options})
 
     def update_fitness_storage(self, generation_num, fitness_results):
         """
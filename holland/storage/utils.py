@@ -9,7 +9,7 @@ def record(data, **storage_options):
     :param data: the data to write to the file
     :type data: list/dict
 
-    :param storage_options: options for writing the data to a file, specifically ``format`` (options: ``'json'``, ``'csv'``), ``file_name``, and ``path`` are relevant; see :ref:`fitness-storage-options` and :ref:`genome-storage-options`
+    :param storage_options: options for writing the data to a file, specifically ``format`` (options: ``'json'``, ``'csv'``), ``file_name``, and ``path`` are relevant; see :ref:`fitness-storage-options`, :ref:`genome-storage-options`, and :ref:`hall-of-fame-options`
     :type storage_options: dict
 
 
@@ -34,7 +34,7 @@ def record_to_csv(data, **storage_options):
     :param data: the data to write to the file (with column names as keys)
     :type data: dict
 
-    :param storage_options: options for writing the data to a file, specifically ``file_name`` and ``path`` are relevant; see :ref:`fitness-storage-options` and :ref:`genome-storage-options`
+    :param storage_options: options for writing the data to a file, specifically ``file_name`` and ``path`` are relevant; see :ref:`fitness-storage-options`, :ref:`genome-storage-options`, and :ref:`hall-of-fame-options`
     :type storage_options: dict
 
 
@@ -73,7 +73,7 @@ def record_to_json(data, **storage_options):
     :param data: the data to write to the file (must be valid JSON format)
     :type data: list/dict
 
-    :param storage_options: options for writing the data to a file, specifically ``file_name`` and ``path`` are relevant; see :ref:`fitness-storage-options` and :ref:`genome-storage-options`
+    :param storage_options: options for writing the data to a file, specifically ``file_name`` and ``path`` are relevant; see :ref:`fitness-storage-options`, :ref:`genome-storage-options`, and :ref:`hall-of-fame-options`
     :type storage_options: dict
 
 
@@ -1 +1,6 @@
 from .utils import *
+from .parallel import *
+from .bitsets import *
+from .niching import *
+from .grids import *
+from .pareto import *
@@ -0,0 +1,108 @@
+import math
+import random
+
+
+def pack_bits(values):
+    """
+    Packs a list of booleans into a bitset (an ``int`` whose bit ``i`` is ``values[i]``); the storage format of ``"bitset"`` genes
+
+    :param values: the booleans to pack
+    :type values: list
+
+
+    :returns: a non-negative ``int``
+    """
+    return int.from_bytes(_to_bytes(values), "little")
+
+
+def unpack_bits(bitset, size):
+    """
+    Unpacks a bitset into a list of booleans
+
+    :param bitset: the bitset to unpack
+    :type bitset: int
+
+    :param size: the number of bits in the bitset
+    :type size: int
+
+
+    :returns: a list of ``size`` booleans where element ``i`` is bit ``i`` of ``bitset``
+    """
+    return [(bitset >> i) & 1 == 1 for i in range(size)]
+
+
+def count_bits(bitset):
+    """
+    Counts the bits that are set in a bitset (popcount); e.g. the fitness of a ``"bitset"`` gene for OneMax
+
+    :param bitset: the bitset to count
+    :type bitset: int
+
+
+    :returns: the number of bits set to 1
+    """
+    return _count_bits(bitset)
+
+
+def get_bit_mask(start, end):
+    """
+    Returns a bitset with the bits in positions ``start`` (inclusive) through ``end`` (exclusive) set
+
+    :param start: the first position to set
+    :type start: int
+
+    :param end: the position after the last position to set
+    :type end: int
+
+
+    :returns: a non-negative ``int``
+    """
+    return ((1 << end) - 1) ^ ((1 << start) - 1)
+
+
+def get_random_bit_mask(size, probability=0.5):
+    """
+    Returns a random bitset where each of the ``size`` bits is set independently with the given ``probability``
+
+    :param size: the number of bits
+    :type size: int
+
+    :param probability: the probability with which each bit is set
+    :type probability: float
+
+
+    :returns: a non-negative ``int``
+
+
+    .. note:: For ``probability == 0.5`` a single call to ``random.getrandbits`` is used; otherwise set positions are found by drawing geometrically distributed gaps, so the cost scales with the number of bits set rather than with ``size``.
+    """
+    if size <= 0 or probability <= 0:
+        return 0
+    if probability >= 1:
+        return (1 << size) - 1
+    if probability == 0.5:
+        return random.getrandbits(size)
+
+    positions = bytearray(math.ceil(size / 8))
+    log_complement = math.log(1 - probability)
+    position = -1
+    while True:
+        position += 1 + int(math.log(1 - random.random()) / log_complement)
+        if position >= size:
+            break
+        positions[position >> 3] |= 1 << (position & 7)
+    return int.from_bytes(positions, "little")
+
+
+def _to_bytes(values):
+    packed = bytearray(math.ceil(len(values) / 8))
+    for i, value in enumerate(values):
+        if value:
+            packed[i >> 3] |= 1 << (i & 7)
+    return packed
+
+
+if hasattr(int, "bit_count"):
+    _count_bits = int.bit_count
+else:
+    _count_bits = lambda bitset: bin(bitset).count("1")
@@ -0,0 +1,76 @@
+import math
+
+
+def get_grid_shape(n_cells):
+    """
+    Returns the shape of the grid with ``n_cells`` cells that is as close to square as possible
+
+    :param n_cells: the number of cells
+    :type n_cells: int
+
+
+    :returns: a tuple ``(n_rows, n_columns)`` with ``n_rows <= n_columns`` and ``n_rows * n_columns == n_cells``
+
+
+    :raises ValueError: if ``n_cells < 1``
+    """
+    if n_cells < 1:
+        raise ValueError("Number of grid cells must be at least 1")
+
+    max_n_rows = int(math.sqrt(n_cells))
+    # the floating point square root of a large number can be off by one either way
+    while max_n_rows * max_n_rows > n_cells:
+        max_n_rows -= 1
+    while (max_n_rows + 1) * (max_n_rows + 1) <= n_cells:
+        max_n_rows += 1
+    n_rows = max(r for r in range(1, max_n_rows + 1) if n_cells % r == 0)
+    return (n_rows, n_cells // n_rows)
+
+
+def get_grid_neighborhoods(grid_shape, neighborhood="von_neumann", radius=1):
+    """
+    Determines the neighborhood of each cell of a toroidal (wrapping) grid whose cells are numbered in row-major order
+
+    :param grid_shape: the number of rows and columns of the grid
+    :type grid_shape: tuple
+
+    :param neighborhood: which cells are neighbors (options: ``"von_neumann"``, ``"moore"``); ``"von_neumann"`` cells are within ``radius`` steps up, down, left, and right (a diamond), ``"moore"`` cells are within ``radius`` steps diagonally as well (a square)
+    :type neighborhood: str
+
+    :param radius: the size of the neighborhood
+    :type radius: int
+
+
+    :returns: a list with, for each cell, a tuple of the indices of the cells in its neighborhood, starting with the cell itself; cells that wrap onto each other on small grids are listed once
+
+
+    :raises ValueError: if ``neighborhood`` is not one of ``"von_neumann"``, ``"moore"``
+    :raises ValueError: if ``radius < 1``
+    :raises ValueError: if the grid has fewer than one row or column
+    """
+    if neighborhood not in ["von_neumann", "moore"]:
+        raise ValueError("Neighborhood must be either 'von_neumann' or 'moore'")
+    if radius < 1:
+        raise ValueError("Neighborhood radius must be at least 1")
+    n_rows, n_columns = grid_shape
+    if n_rows < 1 or n_columns < 1:
+        raise ValueError("Grid must have at least one row and one column")
+
+    # the offsets are the same for every cell, so they are computed once and wrapped per cell
+    offsets = [(0, 0)] + [
+        (d_row, d_column)
+        for d_row in range(-radius, radius + 1)
+        for d_column in range(-radius, radius + 1)
+        if (d_row, d_column) != (0, 0)
+        and (neighborhood == "moore" or abs(d_row) + abs(d_column) <= radius)
+    ]
+
+    neighborhoods = []
+    for row in range(n_rows):
+        for column in range(n_columns):
+            cells = [
+                ((row + d_row) % n_rows) * n_columns + (column + d_column) % n_columns
+                for d_row, d_column in offsets
+            ]
+            neighborhoods.append(tuple(dict.fromkeys(cells)))
+    return neighborhoods
@@ -0,0 +1,142 @@
+import math
+import itertools
+import collections
+
+from .bitsets import count_bits
+
+
+_MAX_GRID_DIMENSIONS = 8
+
+
+def compute_niche_counts(points, radius, alpha=1, metric="euclidean"):
+    """
+    Computes the niche count of each point for fitness sharing: the sum, over all points (including the point itself), of the sharing function ``1 - (distance / radius) ** alpha`` for points closer than ``radius`` (and ``0`` otherwise)
+
+    :param points: the points; tuples of numbers for the ``"euclidean"`` metric, or bitsets (non-negative ``int``) for the ``"hamming"`` metric
+    :type points: list
+
+    :param radius: the sharing radius (``sigma_share``)
+    :type radius: int/float
+
+    :param alpha: the exponent of the sharing function
+    :type alpha: int/float
+
+    :param metric: the distance between points (options: ``"euclidean"``, ``"hamming"``)
+    :type metric: str
+
+
+    :returns: a list of niche counts (each at least ``1``), in the order of ``points``
+
+
+    :raises ValueError: if ``radius <= 0``
+    :raises ValueError: if ``metric`` is not one of ``"euclidean"``, ``"hamming"``
+
+
+    .. note:: Rather than computing the distance between every pair of points, points are placed in a spatial index and distances are only computed between candidates that can be closer than ``radius``, so the cost grows with the number of close pairs rather than with the square of the number of points. For the ``"euclidean"`` metric the index is a grid of cells of width ``radius`` over the (at most eight) coordinates with the widest spread, of which only the occupied cells are stored; two points within ``radius`` of each other are in the same or adjacent cells. For the ``"hamming"`` metric the bits are split into ``r + 1`` bands, where ``r`` is the largest distance within ``radius``; two points within ``r`` bits of each other must be equal in at least one band, so points are bucketed by the value of each band. Identical points are counted once, with their multiplicity.
+    """
+    if radius <= 0:
+        raise ValueError("Niching radius must be positive")
+    if metric not in ["euclidean", "hamming"]:
+        raise ValueError("Niching metric must be either 'euclidean' or 'hamming'")
+
+    multiplicities = collections.Counter(points)
+    unique_points = list(multiplicities)
+    weights = [multiplicities[point] for point in unique_points]
+    # identical points share fully with each other
+    unique_counts = [float(weight) for weight in weights]
+
+    if metric == "euclidean":
+        candidate_pairs = _get_grid_candidate_pairs(unique_points, radius)
+        get_distance = _get_euclidean_distance
+    else:
+        candidate_pairs = _get_band_candidate_pairs(unique_points, radius)
+        get_distance = lambda a, b: count_bits(a ^ b)
+
+    for i, j in candidate_pairs:
+        distance = get_distance(unique_points[i], unique_points[j])
+        if distance < radius:
+            sharing = 1 - (distance / radius) ** alpha
+            unique_counts[i] += sharing * weights[j]
+            unique_counts[j] += sharing * weights[i]
+
+    niche_counts = dict(zip(unique_points, unique_counts))
+    return [niche_counts[point] for point in points]
+
+
+def _get_euclidean_distance(a, b):
+    return math.sqrt(sum((a_k - b_k) ** 2 for a_k, b_k in zip(a, b)))
+
+
+def _get_grid_candidate_pairs(points, radius):
+    n_dimensions = len(points[0]) if points else 0
+    spreads = [
+        max(point[k] for point in points) - min(point[k] for point in points)
+        for k in range(n_dimensions)
+    ]
+    dimensions = sorted(range(n_dimensions), key=lambda k: spreads[k], reverse=True)
+    dimensions = dimensions[:_MAX_GRID_DIMENSIONS]
+
+    cells = collections.defaultdict(list)
+    for i, point in enumerate(points):
+        cells[tuple(math.floor(point[k] / radius) for k in dimensions)].append(i)
+
+    # cells are also stored in a trie (one level per dimension) so that only occupied adjacent
+    # cells are visited, rather than all 3 ** len(dimensions) of them
+    trie = {}
+    for cell in cells:
+        node = trie
+        for c in cell[:-1]:
+            node = node.setdefault(c, {})
+        if cell:
+            node[cell[-1]] = cell
+
+    for cell, indices in cells.items():
+        yield from itertools.combinations(indices, 2)
+        if not cell:
+            continue
+        for neighbor in _find_adjacent_cells(trie, cell, 0):
+            # each pair of cells is visited once, from the lesser cell
+            if neighbor > cell:
+                yield from itertools.product(indices, cells[neighbor])
+
+
+def _find_adjacent_cells(node, cell, level):
+    for c in (cell[level] - 1, cell[level], cell[level] + 1):
+        child = node.get(c)
+        if child is None:
+            continue
+        if level == len(cell) - 1:
+            yield child
+        else:
+            yield from _find_adjacent_cells(child, cell, level + 1)
+
+
+def _get_band_candidate_pairs(points, radius):
+    max_distance = math.ceil(radius) - 1
+    n_bits = max((point.bit_length() for point in points), default=0)
+    if max_distance < 1:
+        # only identical points are within radius
+        return
+    if max_distance >= n_bits:
+        yield from itertools.combinations(range(len(points)), 2)
+        return
+
+    n_bands = max_distance + 1
+    band_sizes = [n_bits // n_bands + (1 if k < n_bits % n_bands else 0) for k in range(n_bands)]
+    band_starts = [0] + list(itertools.accumulate(band_sizes))[:-1]
+    band_values = [
+        tuple((point >> start) & ((1 << size) - 1) for start, size in zip(band_starts, band_sizes))
+        for point in points
+    ]
+
+    buckets = collections.defaultdict(list)
+    for i, values in enumerate(band_values):
+        for band, value in enumerate(values):
+            buckets[(band, value)].append(i)
+
+    for (band, value), indices in buckets.items():
+        for i, j in itertools.combinations(indices, 2):
+            # a pair that is equal in several bands is only visited in the first of them
+            values_i, values_j = band_values[i], band_values[j]
+            if all(values_i[b] != values_j[b] for b in range(band)):
+                yield i, j
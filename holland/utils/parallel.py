@@ -0,0 +1,64 @@
+import multiprocessing
+
+
+def create_process_pool(n_workers, initializer=None, initargs=()):
+    """
+    Creates a pool of worker processes, preferring the ``"fork"`` start method where it is available
+
+    Forked workers inherit ``initializer`` and ``initargs`` without pickling them, so genome parameters, selection strategies, and fitness functions defined as lambdas can be shared with the workers. On platforms without ``"fork"`` the default start method is used and ``initargs`` must be picklable.
+
+    :param n_workers: the number of worker processes
+    :type n_workers: int
+
+    :param initializer: a function called once in each worker process when it starts
+    :type initializer: func
+
+    :param initargs: positional arguments passed to ``initializer``
+    :type initargs: tuple
+
+
+    :returns: a ``multiprocessing.pool.Pool``
+
+
+    :raises ValueError: if ``n_workers < 1``
+    """
+    if n_workers < 1:
+        raise ValueError("Number of worker processes must be at least 1")
+
+    context = get_process_context()
+    return context.Pool(processes=n_workers, initializer=initializer, initargs=initargs)
+
+
+def get_process_context():
+    """
+    Returns a multiprocessing context that uses the ``"fork"`` start method where it is available, and the default start method otherwise
+
+
+    :returns: a ``multiprocessing`` context
+    """
+    if "fork" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("fork")
+    return multiprocessing.get_context()
+
+
+def split_into_chunks(n_items, chunk_size):
+    """
+    Splits ``n_items`` items into consecutive chunks of at most ``chunk_size`` items
+
+    :param n_items: the number of items to split
+    :type n_items: int
+
+    :param chunk_size: the maximum number of items in a chunk
+    :type chunk_size: int
+
+
+    :returns: a list of chunk sizes that sum to ``n_items``
+
+
+    :raises ValueError: if ``chunk_size < 1``
+    """
+    if chunk_size < 1:
+        raise ValueError("Chunk size must be at least 1")
+
+    n_full_chunks, remainder = divmod(n_items, chunk_size)
+    return [chunk_size] * n_full_chunks + ([remainder] if remainder > 0 else [])
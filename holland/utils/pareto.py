@@ -0,0 +1,145 @@
+import math
+import operator
+
+
+def dominates(a, b, should_maximize=True):
+    """
+    Determines whether objective vector ``a`` Pareto-dominates objective vector ``b``: ``a`` is at least as good as ``b`` in every objective and better in at least one
+
+    :param a: the objective values of the first solution
+    :type a: tuple
+
+    :param b: the objective values of the second solution
+    :type b: tuple
+
+    :param should_maximize: whether larger objective values are better
+    :type should_maximize: bool
+
+
+    :returns: ``True`` if ``a`` dominates ``b``, ``False`` otherwise
+    """
+    if not should_maximize:
+        a, b = b, a
+    return a != b and all(value_a >= value_b for value_a, value_b in zip(a, b))
+
+
+def sort_non_dominated(objectives, should_maximize=True):
+    """
+    Sorts solutions into non-dominated fronts: the first front holds the solutions no other solution dominates, the second those only the first front dominates, and so on
+
+    :param objectives: the objective values (a tuple of numbers) of each solution
+    :type objectives: list
+
+    :param should_maximize: whether larger objective values are better
+    :type should_maximize: bool
+
+
+    :returns: a list of fronts, best first, each a list of indices into ``objectives``
+
+
+    .. note:: Solutions are sorted lexicographically first, so that a solution can only be dominated by solutions before it, and each is then placed in the first front none of whose members dominates it (efficient non-dominated sort). If a member of a front dominates a solution, so does a member of every earlier front, so the front is found by binary search over the fronts. For two objectives the members of a front, in the order they were added, are increasingly good in the second objective, so only the last member of a front needs to be compared, and sorting takes ``O(n log n)`` time; otherwise the members of a front are compared from the last added to the first.
+    """
+    if not objectives:
+        return []
+    n_objectives = len(objectives[0])
+    order = sorted(range(len(objectives)), key=objectives.__getitem__, reverse=should_maximize)
+
+    if n_objectives == 2:
+        sign = 1 if should_maximize else -1
+
+        def is_dominated_by_front(front, i):
+            last = objectives[front[-1]]
+            return last != objectives[i] and sign * last[1] >= sign * objectives[i][1]
+
+    else:
+        ge = operator.ge if should_maximize else operator.le
+
+        def is_dominated_by_front(front, i):
+            solution = objectives[i]
+            for j in reversed(front):
+                member = objectives[j]
+                if member != solution and all(map(ge, member, solution)):
+                    return True
+            return False
+
+    fronts = []
+    for i in order:
+        low, high = 0, len(fronts)
+        while low < high:
+            middle = (low + high) // 2
+            if is_dominated_by_front(fronts[middle], i):
+                low = middle + 1
+            else:
+                high = middle
+        if low == len(fronts):
+            fronts.append([i])
+        else:
+            fronts[low].append(i)
+    return fronts
+
+
+def compute_crowding_distances(objectives):
+    """
+    Computes the crowding distance of each solution of a front: the sum, over the objectives, of the distance between the two neighbors of the solution in that objective, normalized by the range of the objective
+
+    :param objectives: the objective values (a tuple of numbers) of each solution of the front
+    :type objectives: list
+
+
+    :returns: a list of crowding distances in the order of ``objectives``; the solutions with the smallest and largest value of any objective have an infinite crowding distance
+    """
+    n_solutions = len(objectives)
+    if n_solutions < 3:
+        return [math.inf] * n_solutions
+
+    distances = [0.0] * n_solutions
+    for values in zip(*objectives):
+        order = sorted(range(n_solutions), key=values.__getitem__)
+        sorted_values = [values[i] for i in order]
+        value_range = sorted_values[-1] - sorted_values[0]
+        distances[order[0]] = distances[order[-1]] = math.inf
+        if value_range == 0:
+            continue
+        # the gap between the neighbors of each interior solution, in one pass over shifted lists
+        gaps = map(operator.sub, sorted_values[2:], sorted_values[:-2])
+        for i, gap in zip(order[1:-1], gaps):
+            distances[i] += gap / value_range
+    return distances
+
+
+def select_non_dominated(objectives, n_selected, should_maximize=True):
+    """
+    Selects the ``n_selected`` best solutions by non-dominated rank and, within the last front that fits only in part, by crowding distance (NSGA-II survivor selection)
+
+    :param objectives: the objective values (a tuple of numbers) of each solution
+    :type objectives: list
+
+    :param n_selected: the number of solutions to select
+    :type n_selected: int
+
+    :param should_maximize: whether larger objective values are better
+    :type should_maximize: bool
+
+
+    :returns: a tuple ``(indices, ranks, crowding_distances)`` of lists with, for each selected solution, its index into ``objectives``, the index of its front, and its crowding distance within its front
+
+
+    Dependencies:
+        * :func:`~holland.utils.pareto.sort_non_dominated`
+        * :func:`~holland.utils.pareto.compute_crowding_distances`
+    """
+    indices, ranks, crowding_distances = [], [], []
+    for rank, front in enumerate(sort_non_dominated(objectives, should_maximize)):
+        n_remaining = n_selected - len(indices)
+        if n_remaining <= 0:
+            break
+        front_distances = compute_crowding_distances([objectives[i] for i in front])
+        members = list(zip(front, front_distances))
+        if len(members) > n_remaining:
+            members.sort(key=lambda member: member[1], reverse=True)
+            members = members[:n_remaining]
+        for i, distance in members:
+            indices.append(i)
+            ranks.append(rank)
+            crowding_distances.append(distance)
+    return indices, ranks, crowding_distances
@@ -1,6 +1,12 @@
 import re
 import math
+import heapq
+import bisect
 import random
+import operator
+import functools
+import itertools
+import collections
 
 
 def bound_value(value, minimum=-math.inf, maximum=math.inf, to_int=False):
@@ -33,7 +39,42 @@ def bound_value(value, minimum=-math.inf, maximum=math.inf, to_int=False):
     return min(max(value, minimum), maximum)
 
 
-def select_from(values, top=0, mid=0, bottom=0, random=0):
+def bound_values(values, minimum=-math.inf, maximum=math.inf, to_int=False):
+    """
+    Bounds each of a list of values between a minimum and maximum; equivalent to calling :func:`~holland.utils.utils.bound_value` on each value, but the bounds are resolved once for the whole list
+
+    :param values: the values to bound
+    :type values: list
+
+    :param minimum: the lower bound
+    :type minimum: int/float
+
+    :param maximum: the upper bound
+    :type maximum: int/float
+
+    :param to_int: whether or not to cast the results to ints
+    :type to_int: bool
+
+
+    :returns: a list of the bounded values
+    """
+    if minimum is None:  # in case None is passed in
+        minimum = -math.inf
+    if maximum is None:
+        maximum = math.inf
+    if to_int:
+        if isinstance(minimum, float) and minimum != -math.inf:
+            minimum = math.ceil(minimum)
+        return [
+            int(minimum if value < minimum else maximum if value > maximum else value)
+            for value in values
+        ]
+    return [
+        minimum if value < minimum else maximum if value > maximum else value for value in values
+    ]
+
+
+def select_from(values, top=0, mid=0, bottom=0, random=0, rng=None):
     """
     Selects elements from a (sorted) list without replacement
 
@@ -52,6 +93,9 @@ def select_from(values, top=0, mid=0, bottom=0, random=0):
     :param random: number of elements to select randomly from the list
     :type random: int
 
+    :param rng: the source of randomness (a ``random.Random`` instance); the ``random`` module is used if not specified
+    :type rng: random.Random
+
 
     :returns: a list of selected elements
     """
@@ -71,12 +115,12 @@ def select_from(values, top=0, mid=0, bottom=0, random=0):
     selected += values[:bottom]
 
     remaining_values = values[bottom:middle_start_index] + values[middle_start_index + mid : -top]
-    selected += select_random(remaining_values, n=random)
+    selected += select_random(remaining_values, n=random, rng=rng)
 
     return selected
 
 
-def select_random(choices, probabilities=None, n=1, should_replace=False):
+def select_random(choices, probabilities=None, n=1, should_replace=False, rng=None):
     """
     Selects random elements from a list
 
@@ -92,6 +136,9 @@ def select_random(choices, probabilities=None, n=1, should_replace=False):
     :param should_replace: specifies if selection should be done with replacement or not
     :type should_replace: bool
 
+    :param rng: the source of randomness (a ``random.Random`` instance); the ``random`` module is used if not specified
+    :type rng: random.Random
+
 
     :returns: a list of length ``n`` of elements selected randomly from ``choices``
 
@@ -100,96 +147,314 @@ def select_random(choices, probabilities=None, n=1, should_replace=False):
     :raises ValueError: if any element of ``probabilities`` is negative
     :raises ValueError: if ``sum(probabilities) > 1``
     :raises ValueError: if ``should_replace`` is ``False`` but ``n > len(choices)``
+
+
+    Dependencies:
+        * :func:`~holland.utils.utils.select_random_indices`
     """
-    num_choices = len(choices)
+    indices = select_random_indices(
+        len(choices), probabilities=probabilities, n=n, should_replace=should_replace, rng=rng
+    )
+    return [choices[i] for i in indices]
+
+
+def select_random_indices(n_choices, probabilities=None, n=1, should_replace=False, rng=None):
+    """
+    Selects random indices into a list of ``n_choices`` elements; the index-returning counterpart of :func:`~holland.utils.utils.select_random`, which avoids building copies of the choices
+
+    :param n_choices: number of elements to select from
+    :type n_choices: int
+
+    :param probabilities: list of probabilities for selecting each index; if not specified, uniform probability is used
+    :type probabilities: list
+
+    :param n: number of indices to select
+    :type n: int
+
+    :param should_replace: specifies if selection should be done with replacement or not
+    :type should_replace: bool
+
+    :param rng: the source of randomness (a ``random.Random`` instance); the ``random`` module is used if not specified
+    :type rng: random.Random
+
+
+    :returns: a list of length ``n`` of indices in ``range(n_choices)``, in the order they were selected
 
-    if not should_replace and n > num_choices:
+
+    :raises ValueError: if ``probabilities`` is given but ``len(probabilities) != n_choices``
+    :raises ValueError: if any element of ``probabilities`` is negative
+    :raises ValueError: if ``sum(probabilities) > 1``
+    :raises ValueError: if ``should_replace`` is ``False`` but ``n > n_choices``
+
+
+    .. note:: All strategies run in time linear in ``n_choices`` (or better): uniform selection without replacement uses :func:`random.sample` (partial Fisher-Yates or set rejection depending on ``n``), weighted selection with replacement bisects the cumulative weights, and weighted selection without replacement keeps the ``n`` largest Efraimidis-Spirakis keys in a heap.
+    """
+    if not should_replace and n > n_choices:
         raise ValueError(
             "Number of elements to select cannot exceed number of choices without replacement"
         )
+    if rng is None:
+        rng = random
 
     if not probabilities:
         if should_replace:
             # uniform random with replacement
-            return [choices[int(random.random() * num_choices)] for _ in range(n)]
-        else:
-            # uniform random with no replacement
-            result = [None] * n
-            selected = set()
-
-            for i in range(n):
-                j = int(random.random() * num_choices)
-                while j in selected:
-                    j = int(random.random() * num_choices)
-                selected.add(j)
-                result[i] = choices[j]
-            return result
+            return [int(rng.random() * n_choices) for _ in range(n)]
+        # uniform random with no replacement
+        return rng.sample(range(n_choices), n)
+
+    if len(probabilities) != n_choices:
+        raise ValueError("Number of probabilities must match number of choices")
+    if any(p < 0 for p in probabilities):
+        raise ValueError("Probabilities cannot be negative")
+    if not math.isclose(sum(probabilities), 1, rel_tol=1e-9):
+        raise ValueError("Probabilities must sum to 1")
+
+    if should_replace:
+        # weighted random with replacement
+        cumulative_weights = list(itertools.accumulate(probabilities))
+        total = cumulative_weights[-1]
+        # floating point error can push a draw past the last element with non-zero probability
+        last_index = max(i for i, p in enumerate(probabilities) if p > 0)
+        return [
+            min(bisect.bisect_right(cumulative_weights, rng.random() * total), last_index)
+            for _ in range(n)
+        ]
+
+    # weighted random with no replacement
+    # Efraimidis-Spirakis: the indices with the n largest keys log(u) / p form a weighted sample
+    keyed_indices = (
+        (math.log(1 - rng.random()) / p, i) for i, p in enumerate(probabilities) if p > 0
+    )
+    indices = [i for key, i in heapq.nlargest(n, keyed_indices)]
+    if len(indices) < n:
+        # only indices with zero probability remain
+        zero_indices = [i for i, p in enumerate(probabilities) if p == 0]
+        indices += rng.sample(zero_indices, n - len(indices))
+    return indices
+
+
+def select_stochastic_universal(choices, probabilities=None, n=1, rng=None):
+    """
+    Selects random elements from a list with replacement using stochastic universal sampling (a single random offset and ``n`` evenly spaced pointers over the cumulative probabilities)
+
+    :param choices: list of elements to select from
+    :type choices: list
+
+    :param probabilities: list of probabilities for selecting each element in ``choices``; if not specified, uniform probability is used
+    :type probabilities: list
+
+    :param n: number of elements to select from ``choices``
+    :type n: int
+
+    :param rng: the source of randomness (a ``random.Random`` instance); the ``random`` module is used if not specified
+    :type rng: random.Random
+
+
+    :returns: a list of length ``n`` of elements selected from ``choices``, in the same order as they appear in ``choices``
+
+
+    :raises ValueError: if ``n < 0``
+    :raises ValueError: if ``n > 0`` but ``choices`` is empty
+    :raises ValueError: if ``probabilities`` is given but ``len(probabilities) != len(choices)``
+    :raises ValueError: if any element of ``probabilities`` is negative
+    :raises ValueError: if ``sum(probabilities) != 1``
+
+
+    .. note:: Each element is selected either ``floor(n * p)`` or ``ceil(n * p)`` times, where ``p`` is its probability, so the spread of the selection is minimal compared to ``n`` independent calls to :func:`~holland.utils.utils.select_random`.
+    """
+    num_choices = len(choices)
+
+    if n < 0:
+        raise ValueError("Number of elements to select cannot be negative")
+    if n == 0:
+        return []
+    if num_choices == 0:
+        raise ValueError("Cannot select elements from an empty list of choices")
+
+    if not probabilities:
+        probabilities = [1 / num_choices] * num_choices
     else:
         if len(probabilities) != num_choices:
             raise ValueError("Number of probabilities must match number of choices")
         if any(p < 0 for p in probabilities):
             raise ValueError("Probabilities cannot be negative")
-        if round(sum(probabilities), 15) != 1:
+        if not math.isclose(sum(probabilities), 1, rel_tol=1e-9):
             raise ValueError("Probabilities must sum to 1")
 
-        if should_replace:
-            # weighted random with replacement
-            cumulative_weights = _accumulate(probabilities)
-            total = cumulative_weights[-1]
-
-            if n > 4:
-                # it's worth building this dictionary
-                bisect_mapping = _get_bisect_mapping(cumulative_weights)
-                return [choices[bisect_mapping[int(random.random() * total)]] for _ in range(n)]
-            else:
-                return [
-                    choices[_bisect(cumulative_weights, int(random.random() * total))]
-                    for _ in range(n)
-                ]
-        else:
-            # weighted random with no replacement
-            current_probs = probabilities[:]
-            cumulative_weights = None
-            total = None
-            indices = [None] * n
-            chosen_index = None
-            for i in range(n):
-                cumulative_weights = _accumulate(current_probs)
-                total = cumulative_weights[-1]
-                chosen_index = _bisect(cumulative_weights, random.random() * total)
-                indices[i] = chosen_index
-                current_probs = current_probs[:chosen_index] + current_probs[chosen_index + 1 :]
-
-            return [choices[j] for j in indices]
-
-
-# just like itertools.accumulate(arr) but without having to import itertools...
-def _accumulate(prob_dist):
-    s = 0
-    cumulative = [None] * len(prob_dist)
-    for i in range(len(prob_dist)):
-        s += prob_dist[i]
-        cumulative[i] = s
-    return cumulative
-
-
-# used for bisect
-# defines what bisect would return for bisect(arr, int(x))
-# useful when bisect would normally be called repeatedly
-def _get_bisect_mapping(arr):
-    mapping = {}
-    for i, a in enumerate(arr):
-        mapping[a] = i + 1
-    return mapping
-
-
-# acts like bisect
-# returns first index i to insert x into sorted array arr
-# return -1 if no index exists
-def _bisect(arr, x):
-    for i in range(len(arr)):
-        if arr[i] > x:
-            return i
+    if rng is None:
+        rng = random
+
+    step = 1 / n
+    start = rng.random() * step
+
+    selected = [None] * n
+    cumulative_weight = 0
+    last_choice = None
+    i = 0
+    for choice, probability in zip(choices, probabilities):
+        if probability == 0:
+            continue
+        cumulative_weight += probability
+        last_choice = choice
+        while i < n and start + i * step < cumulative_weight:
+            selected[i] = choice
+            i += 1
+    # floating point error can leave the last pointers just beyond the final cumulative weight
+    while i < n:
+        selected[i] = last_choice
+        i += 1
+
+    return selected
+
+
+def hash_genome(genome):
+    """
+    Computes a hash of a genome from the values of its genes, so that equal genomes have equal hashes even though genomes (and list-type genes) are not hashable themselves
+
+    The hash is Zobrist-style: it is the XOR of a key for each gene (:func:`~holland.utils.utils.hash_gene`), and the key of a list-type gene is the XOR of a key for each of its positions, so the hash can be updated for a change to a few positions without rehashing the whole genome (:func:`~holland.utils.utils.update_genome_hash`)
+
+    :param genome: the genome to hash
+    :type genome: dict
+
+
+    :returns: an ``int``
+
+
+    :raises TypeError: if a gene contains a value that is neither hashable nor a list
+
+    Dependencies:
+        * :func:`~holland.utils.utils.hash_gene`
+    """
+    genome_hash = 0
+    for gene_name, gene in genome.items():
+        genome_hash ^= hash_gene(gene_name, gene)
+    return genome_hash
+
+
+def hash_gene(gene_name, gene):
+    """
+    Computes the key of a single gene within the hash of a genome (see :func:`~holland.utils.utils.hash_genome`)
+
+    :param gene_name: the name of the gene
+    :type gene_name: str
+
+    :param gene: the gene to hash
+    :type gene: a valid gene type
+
+
+    :returns: an ``int``; for list-type genes, the XOR of the keys of ``(gene_name, index, value)`` for each position
+    """
+    if isinstance(gene, list):
+        values = map(_to_hashable, gene) if gene and isinstance(gene[0], list) else gene
+        position_keys = map(hash, zip(itertools.repeat(gene_name), itertools.count(), values))
+        return functools.reduce(operator.xor, position_keys, 0)
+    return hash((gene_name, _to_hashable(gene)))
+
+
+def update_genome_hash(genome_hash, gene_name, gene, new_gene, positions=None):
+    """
+    Updates the hash of a genome (see :func:`~holland.utils.utils.hash_genome`) for the replacement of one of its genes, at a cost proportional to the number of changed ``positions`` rather than to the length of the gene
+
+    :param genome_hash: the hash of the genome before the replacement
+    :type genome_hash: int
+
+    :param gene_name: the name of the replaced gene
+    :type gene_name: str
+
+    :param gene: the gene before the replacement
+    :type gene: a valid gene type
+
+    :param new_gene: the gene after the replacement
+    :type new_gene: a valid gene type
+
+    :param positions: the indices at which the values of a list-type gene differ (e.g. returned by :func:`~holland.utils.utils.get_changed_positions`); if not specified, the whole gene is rehashed
+    :type positions: list
+
+
+    :returns: the hash of the genome after the replacement
+    """
+    if positions is None:
+        return genome_hash ^ hash_gene(gene_name, gene) ^ hash_gene(gene_name, new_gene)
+    for values in (gene, new_gene):
+        changed_values = map(values.__getitem__, positions)
+        if values and isinstance(values[0], list):
+            changed_values = map(_to_hashable, changed_values)
+        position_keys = map(hash, zip(itertools.repeat(gene_name), positions, changed_values))
+        genome_hash = functools.reduce(operator.xor, position_keys, genome_hash)
+    return genome_hash
+
+
+def get_changed_positions(gene, new_gene):
+    """
+    Finds the positions of a list-type gene that hold a different value object after the gene was replaced
+
+    :param gene: the gene before the replacement
+    :type gene: list
+
+    :param new_gene: the gene after the replacement
+    :type new_gene: list
+
+
+    :returns: a list of indices, or ``None`` if either gene is not a list or their lengths differ
+
+
+    .. note:: Values are compared by identity, which runs at C speed; since crossover and mutation never modify values in place and pass unchanged values on as the same objects, every position that is not returned holds an equal value. Positions holding equal values in different objects may be returned, which is harmless for :func:`~holland.utils.utils.update_genome_hash`.
+    """
+    if not isinstance(gene, list) or not isinstance(new_gene, list) or len(gene) != len(new_gene):
+        return None
+    return list(itertools.compress(itertools.count(), map(operator.is_not, gene, new_gene)))
+
+
+def derive_genome_hash(genome, parent_genome, parent_hash, changed_positions={}):
+    """
+    Derives the hash of a genome (see :func:`~holland.utils.utils.hash_genome`) from the hash of a parent, updating it only for the genes and positions that differ from the parent
+
+    :param genome: the genome to hash
+    :type genome: dict
+
+    :param parent_genome: the parent of the genome (e.g. the first parent it was crossed from)
+    :type parent_genome: dict
+
+    :param parent_hash: the hash of ``parent_genome``
+    :type parent_hash: int
+
+    :param changed_positions: a dictionary mapping the names of list-type genes to the indices at which they differ from the parent, if already known (e.g. from the changes described by mutation functions); the changed positions of other genes are found by :func:`~holland.utils.utils.get_changed_positions`
+    :type changed_positions: dict
+
+
+    :returns: the hash of ``genome``, equal to ``hash_genome(genome)``
+
+
+    .. note:: Genes that the parent does not have (e.g. the strategy parameters of self-adaptive genes, which genomes only get once they are first mutated) are hashed in full and added to the hash.
+
+    Dependencies:
+        * :func:`~holland.utils.utils.hash_gene`
+        * :func:`~holland.utils.utils.get_changed_positions`
+        * :func:`~holland.utils.utils.update_genome_hash`
+    """
+    genome_hash = parent_hash
+    for gene_name, gene in genome.items():
+        if gene_name not in parent_genome:
+            genome_hash ^= hash_gene(gene_name, gene)
+            continue
+        parent_gene = parent_genome[gene_name]
+        if gene is parent_gene:
+            continue
+        positions = changed_positions.get(gene_name)
+        if positions is None:
+            positions = get_changed_positions(parent_gene, gene)
+        # each changed position costs two keys, so past half the gene rehashing it is cheaper
+        if positions is not None and 2 * len(positions) > len(gene):
+            positions = None
+        genome_hash = update_genome_hash(genome_hash, gene_name, parent_gene, gene, positions)
+    return genome_hash
+
+
+def _to_hashable(value):
+    if isinstance(value, list):
+        return tuple(_to_hashable(element) for element in value)
+    return value
 
 
 def is_numeric_type(gene_params):
@@ -219,3 +484,73 @@ def is_list_type(gene_params):
     :returns: a boolean indicating whether the gene is of a list type or not
     """
     return re.match(r"\[.+?\]", gene_params["type"])
+
+
+def is_permutation_type(gene_params):
+    """
+    Determines if a gene is of the ``"permutation"`` type or not
+
+    :param gene_params: a dictionary of parameters for a single gene; see :ref:`genome-params`
+    :type gene_params: dict
+
+    :returns: a boolean indicating whether the gene is a permutation or not
+    """
+    return gene_params["type"] == "permutation"
+
+
+def get_permutation_values(gene_params):
+    """
+    Returns the values permuted by a ``"permutation"`` gene: ``gene_params["values"]`` if given, otherwise ``range(gene_params["size"])``
+
+    :param gene_params: a dictionary of parameters for a single ``"permutation"`` gene; see :ref:`genome-params`
+    :type gene_params: dict
+
+    :returns: a list of values
+    """
+    if "values" in gene_params:
+        return list(gene_params["values"])
+    return list(range(gene_params["size"]))
+
+
+def get_strategy_gene_name(gene_name):
+    """
+    Returns the key under which a genome stores the strategy parameters (mutation step sizes or mutation rate) of a self-adaptive gene; see :ref:`self-adaptation`
+
+    :param gene_name: the name of the self-adaptive gene
+    :type gene_name: str
+
+    :returns: ``gene_name + "_strategy"``
+    """
+    return f"{gene_name}_strategy"
+
+
+def get_initial_strategy(gene_params):
+    """
+    Returns the initial strategy parameters of a self-adaptive gene; see :ref:`self-adaptation`
+
+    :param gene_params: a dictionary of parameters for a single gene, including ``self_adaptation``; see :ref:`genome-params`
+    :type gene_params: dict
+
+    :returns: for numeric genes, the ``initial_step_size`` (a list with one step size per value for list-type genes); for other genes, the ``initial_mutation_rate``
+    """
+    self_adaptation = gene_params["self_adaptation"]
+    if not is_numeric_type(gene_params):
+        return self_adaptation.get("initial_mutation_rate", gene_params.get("mutation_rate", 0.1))
+    initial_step_size = self_adaptation.get("initial_step_size", 1)
+    if is_list_type(gene_params):
+        return [initial_step_size] * gene_params["size"]
+    return initial_step_size
+
+
+class DescribedMutation(collections.namedtuple("DescribedMutation", ["value", "change"])):
+    """
+    The return value of a mutation function that describes the change it made, so that the fitness of the offspring can be computed from the fitness of its parent with a ``delta_fitness_function`` instead of in full; see :ref:`delta-evaluation`
+
+    :param value: the mutated value or gene
+    :type value: a valid gene type
+
+    :param change: a description of the change (e.g. ``("swap", i, j)``), passed on to the ``delta_fitness_function``
+    :type change: any
+    """
+
+    __slots__ = ()
@@ -1,3 +1,4 @@
+import random
 import unittest
 from unittest.mock import patch, call, Mock
 
@@ -5,6 +6,8 @@ from holland.evolution.breeding import *
 from holland.evolution.selection import Selector
 from holland.evolution.crossover import Crosser
 from holland.evolution.mutation import Mutator
+from holland.library import get_linear_weighting_function
+from holland.utils import get_grid_neighborhoods, get_changed_positions, DescribedMutation
 
 
 class PopulationGeneratorInitTest(unittest.TestCase):
@@ -30,6 +33,48 @@ class PopulationGeneratorInitTest(unittest.TestCase):
         """__init__ does not make the comparison n_random + n_elite > population_size if population_size is None (would throw a TypeError)"""
         PopulationGenerator({}, {}, generation_params={"n_random": 100, "n_elite": 100})
 
+    def test_asserts_n_breeding_workers_and_breeding_chunk_size_are_at_least_one(self):
+        """__init__ raises a ValueError if n_breeding_workers or breeding_chunk_size is less than 1"""
+        with self.assertRaises(ValueError):
+            PopulationGenerator({}, {}, generation_params={"n_breeding_workers": 0})
+
+        with self.assertRaises(ValueError):
+            PopulationGenerator({}, {}, generation_params={"breeding_chunk_size": 0})
+
+    def test_asserts_strategy_parameters_do_not_clash_with_genes(self):
+        """__init__ raises a ValueError if a self-adaptive gene would store its strategy parameters under the name of another gene"""
+        with self.assertRaises(ValueError):
+            PopulationGenerator(
+                {"x": {"type": "float", "self_adaptation": {}}, "x_strategy": {"type": "float"}},
+                {},
+            )
+
+        PopulationGenerator({"x": {"type": "float"}, "x_strategy": {"type": "float"}}, {})
+
+    def test_asserts_population_size_schedule_is_valid(self):
+        """__init__ raises a ValueError if a population size schedule has an invalid type, a final_population_size less than 1 or n_random + n_elite, or (unless adaptive) no n_generations"""
+        invalid_schedules = [
+            {"type": "cosine", "final_population_size": 10, "n_generations": 5},
+            {"type": "linear", "n_generations": 5},
+            {"type": "linear", "final_population_size": 0, "n_generations": 5},
+            {"type": "linear", "final_population_size": 2, "n_generations": 5},
+            {"type": "exponential", "final_population_size": 10},
+        ]
+        for schedule in invalid_schedules:
+            with self.assertRaises(ValueError):
+                PopulationGenerator(
+                    {},
+                    {},
+                    generation_params={
+                        "population_size": 20,
+                        "n_elite": 3,
+                        "population_size_schedule": schedule,
+                    },
+                )
+
+        adaptive_schedule = {"type": "adaptive", "final_population_size": 1}
+        PopulationGenerator({}, {}, generation_params={"population_size_schedule": adaptive_schedule})
+
 
 class GenerateNextGenerationTest(unittest.TestCase):
     def setUp(self):
@@ -146,6 +191,95 @@ class GenerateNextGenerationTest(unittest.TestCase):
         self.assertListEqual(sorted(next_generation), sorted(expected_next_generation))
 
 
+class PopulationSizeScheduleTest(unittest.TestCase):
+    def setUp(self):
+        self.fitness_results = [(i, {"a": [i]}) for i in range(4)]
+
+    def get_sizes(self, schedule, n_generations, population_size=50):
+        population_generator = PopulationGenerator(
+            {},
+            {},
+            generation_params={
+                "population_size": population_size,
+                "population_size_schedule": schedule,
+            },
+        )
+        return [
+            population_generator.get_scheduled_population_size(self.fitness_results)
+            for _ in range(n_generations)
+        ]
+
+    def test_linear_schedule_changes_size_by_a_constant_difference(self):
+        """get_scheduled_population_size moves the size from population_size to final_population_size by a constant difference over n_generations with a linear schedule, and then keeps it there"""
+        schedule = {"type": "linear", "final_population_size": 10, "n_generations": 4}
+
+        self.assertListEqual(self.get_sizes(schedule, 5), [40, 30, 20, 10, 10])
+
+    def test_exponential_schedule_changes_size_by_a_constant_factor(self):
+        """get_scheduled_population_size moves the size from population_size to final_population_size by a constant factor over n_generations with an exponential schedule, and then keeps it there"""
+        schedule = {"type": "exponential", "final_population_size": 4, "n_generations": 4}
+
+        self.assertListEqual(self.get_sizes(schedule, 5, population_size=64), [32, 16, 8, 4, 4])
+
+    def test_adaptive_schedule_scales_size_with_relative_diversity(self):
+        """get_scheduled_population_size scales the size between final_population_size and population_size by the diversity relative to the first generation (at most 1) with an adaptive schedule"""
+        diversity_function = Mock(side_effect=[4, 2, 0, 8])
+        schedule = {
+            "type": "adaptive",
+            "final_population_size": 10,
+            "diversity_function": diversity_function,
+        }
+
+        self.assertListEqual(self.get_sizes(schedule, 4), [50, 30, 10, 50])
+        diversity_function.assert_called_with([genome for _, genome in self.fitness_results])
+
+    def test_adaptive_schedule_measures_distinct_genomes_by_default(self):
+        """get_scheduled_population_size measures diversity as the fraction of distinct genomes if no diversity_function is given"""
+        population_generator = PopulationGenerator(
+            {},
+            {},
+            generation_params={
+                "population_size": 50,
+                "population_size_schedule": {"type": "adaptive", "final_population_size": 10},
+            },
+        )
+        converged_results = [(i, {"a": [i // 2]}) for i in range(4)]
+
+        population_generator.get_scheduled_population_size(self.fitness_results)
+
+        self.assertEqual(population_generator.get_scheduled_population_size(converged_results), 30)
+
+    @patch.object(PopulationGenerator, "breed_next_generation")
+    @patch.object(PopulationGenerator, "generate_random_genomes")
+    def test_generate_next_generation_breeds_the_scheduled_size(
+        self, mock_generate_random, mock_breed
+    ):
+        """generate_next_generation breeds the scheduled population size, less random and elite genomes"""
+        population_generator = PopulationGenerator(
+            {},
+            {},
+            generation_params={
+                "population_size": 50,
+                "n_random": 2,
+                "n_elite": 3,
+                "population_size_schedule": {
+                    "type": "linear",
+                    "final_population_size": 10,
+                    "n_generations": 4,
+                },
+            },
+        )
+
+        population_generator.generate_next_generation(self.fitness_results)
+        population_generator.generate_next_generation(self.fitness_results)
+
+        self.assertListEqual(
+            mock_breed.call_args_list,
+            [call(self.fitness_results, 35), call(self.fitness_results, 25)],
+        )
+        self.assertEqual(population_generator.population_size, 30)
+
+
 class BreedNextGenerationTest(unittest.TestCase):
     def setUp(self):
         self.fitness_scores = (100, 90, 85, 50, 45, 44, 30, 10, 9, 8, 7)
@@ -178,15 +312,19 @@ class BreedNextGenerationTest(unittest.TestCase):
     @patch("holland.evolution.breeding.Crosser")
     @patch("holland.evolution.breeding.Mutator")
     def test_creates_Selector_instance_correctly(self, MockMutator, MockCrosser, MockSelector):
-        """breed_next_generation creates an instance of the Selector class and passes the selection_strategy to the constructor"""
+        """breed_next_generation creates an instance of the Selector class and passes the selection_strategy, rng, and genome_params to the constructor"""
         population_generator = PopulationGenerator(self.genome_params, self.selection_strategy)
 
         population_generator.breed_next_generation(self.fitness_results, self.n_genomes)
 
-        MockSelector.assert_called_with(self.selection_strategy)
+        MockSelector.assert_called_with(
+            self.selection_strategy,
+            rng=population_generator.rng,
+            genome_params=self.genome_params,
+        )
 
-    @patch.object(Selector, "select_breeding_pool")
-    @patch.object(Selector, "select_parents")
+    @patch.object(Selector, "select_breeding_pool", return_value=[(100, "a"), (90, "b")])
+    @patch("holland.evolution.selection.select_random")
     @patch("holland.evolution.breeding.Crosser")
     @patch("holland.evolution.breeding.Mutator")
     def test_calls_select_breeding_pool_correctly(
@@ -200,26 +338,40 @@ class BreedNextGenerationTest(unittest.TestCase):
         mock_select_pool.assert_called_with(self.fitness_results)
 
     @patch.object(Selector, "select_breeding_pool", return_value=[(100, "a"), (90, "b")])
-    @patch.object(Selector, "select_parents")
+    @patch("holland.evolution.selection.select_random")
     @patch("holland.evolution.breeding.Crosser")
     @patch("holland.evolution.breeding.Mutator")
     def test_calls_select_parents_correctly_with_given_number(
         self, MockMutator, MockCrosser, mock_select_parents, mock_select_pool
     ):
-        """breed_next_generation calls select_parents with the breeding_pool"""
+        """breed_next_generation selects parents from the genomes of the breeding_pool once for each genome to breed"""
         population_generator = PopulationGenerator(self.genome_params, self.selection_strategy)
 
         population_generator.breed_next_generation(self.fitness_results, self.n_genomes)
 
         expected_number_of_calls = self.n_genomes
-        expected_calls = [
-            call(mock_select_pool.return_value) for _ in range(expected_number_of_calls)
-        ]
-        mock_select_parents.assert_has_calls(expected_calls)
         self.assertEqual(mock_select_parents.call_count, expected_number_of_calls)
+        for args, kwargs in mock_select_parents.call_args_list:
+            self.assertEqual(tuple(args[0]), ("a", "b"))
+
+    @patch.object(Selector, "select_breeding_pool", return_value=[(100, "a"), (90, "b")])
+    @patch.object(Selector, "select_parent_groups", return_value=[])
+    @patch("holland.evolution.breeding.Crosser")
+    @patch("holland.evolution.breeding.Mutator")
+    def test_calls_select_parent_groups_with_breeding_pool_and_number(
+        self, MockMutator, MockCrosser, mock_select_parent_groups, mock_select_pool
+    ):
+        """breed_next_generation selects one group of parents for each genome to breed from the breeding_pool"""
+        population_generator = PopulationGenerator(self.genome_params, self.selection_strategy)
+
+        population_generator.breed_next_generation(self.fitness_results, self.n_genomes)
+
+        mock_select_parent_groups.assert_called_once_with(
+            mock_select_pool.return_value, self.n_genomes
+        )
 
     @patch.object(Selector, "select_breeding_pool", return_value=[(100, "a"), (90, "b")])
-    @patch.object(Selector, "select_parents", return_value=["a", "b"])
+    @patch("holland.evolution.selection.select_random", return_value=["a", "b"])
     @patch("holland.evolution.breeding.Crosser")
     @patch("holland.evolution.breeding.Mutator")
     def test_creates_Crosser_instance_correctly(
@@ -233,7 +385,7 @@ class BreedNextGenerationTest(unittest.TestCase):
         MockCrosser.assert_called_with(self.genome_params)
 
     @patch.object(Selector, "select_breeding_pool", return_value=[(100, "a"), (90, "b")])
-    @patch.object(Selector, "select_parents", return_value=["a", "b"])
+    @patch("holland.evolution.selection.select_random", return_value=["a", "b"])
     @patch.object(Crosser, "cross_genomes")
     @patch("holland.evolution.breeding.Mutator")
     def test_calls_cross_genomes_correctly(
@@ -248,7 +400,7 @@ class BreedNextGenerationTest(unittest.TestCase):
         mock_cross.assert_has_calls(expected_calls)
 
     @patch.object(Selector, "select_breeding_pool", return_value=[(100, "a"), (90, "b")])
-    @patch.object(Selector, "select_parents")
+    @patch("holland.evolution.selection.select_random")
     @patch("holland.evolution.breeding.Crosser")
     @patch("holland.evolution.breeding.Mutator")
     def test_creates_Mutator_instance_correctly(
@@ -262,7 +414,7 @@ class BreedNextGenerationTest(unittest.TestCase):
         MockMutator.assert_called_once_with(self.genome_params)
 
     @patch.object(Selector, "select_breeding_pool", return_value=[(100, "a"), (90, "b")])
-    @patch.object(Selector, "select_parents", return_value=["a", "b"])
+    @patch("holland.evolution.selection.select_random", return_value=["a", "b"])
     @patch.object(Crosser, "cross_genomes", return_value="a")
     @patch.object(Mutator, "mutate_genome")
     def test_calls_Mutator_mutate_genome_on_offspring(
@@ -277,7 +429,7 @@ class BreedNextGenerationTest(unittest.TestCase):
         mock_mutate.assert_has_calls(expected_calls)
 
     @patch.object(Selector, "select_breeding_pool", return_value=[(100, "a"), (90, "b")])
-    @patch.object(Selector, "select_parents", return_value=["a", "b"])
+    @patch("holland.evolution.selection.select_random", return_value=["a", "b"])
     @patch.object(Crosser, "cross_genomes", return_value="a")
     @patch.object(Mutator, "mutate_genome")
     def test_returns_the_bred_population(
@@ -295,6 +447,289 @@ class BreedNextGenerationTest(unittest.TestCase):
         expected_next_generation = mutated_genomes
         self.assertListEqual(next_generation, expected_next_generation)
 
+    @patch.object(Selector, "select_breeding_pool")
+    @patch.object(Selector, "select_parent_groups")
+    @patch.object(Crosser, "cross_genomes", side_effect=lambda parents: dict(parents[0]))
+    @patch.object(Mutator, "mutate_genome_with_changes")
+    def test_records_lineage_of_offspring_bred_from_a_single_parent(
+        self, mock_mutate_with_changes, mock_cross, mock_select_parent_groups, mock_select_pool
+    ):
+        """breed_next_generation records the parent fitness, parent genome, and changes of offspring whose parents are all the same genome and whose mutations are described, if should_track_lineage is True"""
+        parent, other_parent = {"a": [1, 2]}, {"a": [2, 1]}
+        mock_select_pool.return_value = [(100, parent), (90, other_parent)]
+        mock_select_parent_groups.return_value = [
+            [parent, parent],
+            [parent, other_parent],
+            [other_parent, other_parent],
+        ]
+        described, undescribed = {"a": [2, 1]}, {"a": [1, 1]}
+        mock_mutate_with_changes.side_effect = [
+            (described, {"a": ("swap", 0, 1)}),
+            (undescribed, None),
+        ]
+        population_generator = PopulationGenerator(
+            self.genome_params, self.selection_strategy, should_track_lineage=True
+        )
+
+        with patch.object(Mutator, "mutate_genome", side_effect=lambda genome: genome):
+            next_generation = population_generator.breed_next_generation(
+                self.fitness_results, 3
+            )
+
+        self.assertEqual(next_generation[0], described)
+        self.assertEqual(next_generation[2], undescribed)
+        self.assertDictEqual(
+            population_generator.lineage, {id(described): (100, parent, {"a": ("swap", 0, 1)})}
+        )
+
+    def test_does_not_record_lineage_by_default(self):
+        """breed_next_generation does not record lineage if should_track_lineage is False"""
+        genome_params = {"a": {"type": "int", "mutation_function": Mock(), "mutation_rate": 0}}
+        selection_strategy = {"parents": {"n_parents": 1}}
+        population_generator = PopulationGenerator(genome_params, selection_strategy)
+
+        population_generator.breed_next_generation([(1, {"a": 1}), (2, {"a": 2})], 5)
+
+        self.assertDictEqual(population_generator.lineage, {})
+
+
+class BreedInParallelTest(unittest.TestCase):
+    def setUp(self):
+        self.genome_params = {
+            "gene1": {
+                "type": "[int]",
+                "size": 5,
+                "min": 0,
+                "max": 100,
+                "crossover_function": lambda parent_genes: [
+                    random.choice(values) for values in zip(*parent_genes)
+                ],
+                "mutation_function": lambda value: value + random.randint(-5, 5),
+                "mutation_rate": 0.5,
+            }
+        }
+        self.selection_strategy = {"pool": {"top": 4}, "parents": {"n_parents": 2}}
+        self.fitness_results = [(i, {"gene1": [i] * 5}) for i in range(10)]
+
+    @patch.object(PopulationGenerator, "breed_in_parallel")
+    def test_breed_next_generation_breeds_in_parallel_if_n_breeding_workers_greater_than_one(
+        self, mock_breed_in_parallel
+    ):
+        """breed_next_generation passes the breeding pool to breed_in_parallel if n_breeding_workers is greater than 1"""
+        population_generator = PopulationGenerator(
+            self.genome_params, self.selection_strategy, {"n_breeding_workers": 2}
+        )
+
+        with patch.object(Selector, "select_breeding_pool") as mock_select_pool:
+            next_generation = population_generator.breed_next_generation(self.fitness_results, 10)
+
+        mock_breed_in_parallel.assert_called_once_with(mock_select_pool.return_value, 10)
+        self.assertEqual(next_generation, mock_breed_in_parallel.return_value)
+
+    def test_returns_the_requested_number_of_genomes(self):
+        """breed_in_parallel returns n_genomes bred genomes"""
+        population_generator = PopulationGenerator(
+            self.genome_params,
+            self.selection_strategy,
+            {"n_breeding_workers": 2, "breeding_chunk_size": 3},
+        )
+
+        try:
+            bred_genomes = population_generator.breed_in_parallel(self.fitness_results, 10)
+        finally:
+            population_generator.close()
+
+        self.assertEqual(len(bred_genomes), 10)
+        for genome in bred_genomes:
+            self.assertEqual(len(genome["gene1"]), 5)
+            self.assertTrue(all(0 <= value <= 100 for value in genome["gene1"]))
+
+    def test_results_are_reproducible_with_the_same_seed(self):
+        """breed_in_parallel returns the same offspring in the same order when the random module is seeded the same way"""
+        population_generator = PopulationGenerator(
+            self.genome_params,
+            self.selection_strategy,
+            {"n_breeding_workers": 3, "breeding_chunk_size": 2},
+        )
+
+        try:
+            random.seed(7)
+            first_genomes = population_generator.breed_in_parallel(self.fitness_results, 11)
+            random.seed(7)
+            second_genomes = population_generator.breed_in_parallel(self.fitness_results, 11)
+        finally:
+            population_generator.close()
+
+        self.assertListEqual(first_genomes, second_genomes)
+
+    def test_results_match_serial_breeding_with_the_same_rng(self):
+        """breed_in_parallel returns the same offspring as serial breeding with an equally seeded rng, whatever the number of workers and chunk size"""
+        all_genomes = []
+        for generation_params in [
+            {},
+            {"n_breeding_workers": 2},
+            {"n_breeding_workers": 3, "breeding_chunk_size": 4},
+        ]:
+            population_generator = PopulationGenerator(
+                self.genome_params,
+                self.selection_strategy,
+                generation_params,
+                rng=random.Random(13),
+            )
+            try:
+                all_genomes.append(
+                    population_generator.breed_next_generation(self.fitness_results, 11)
+                )
+            finally:
+                population_generator.close()
+
+        self.assertListEqual(all_genomes[0], all_genomes[1])
+        self.assertListEqual(all_genomes[0], all_genomes[2])
+
+    def test_serial_breeding_with_rng_restores_the_random_module(self):
+        """breed_next_generation leaves the state of the random module unchanged if given an rng, as breeding in parallel would"""
+        population_generator = PopulationGenerator(
+            self.genome_params, self.selection_strategy, rng=random.Random(13)
+        )
+        random_state = random.getstate()
+
+        population_generator.breed_next_generation(self.fitness_results, 11)
+
+        self.assertEqual(random.getstate(), random_state)
+
+    def test_close_shuts_down_breeding_workers(self):
+        """close terminates the breeding workers and allows new workers to be started later"""
+        population_generator = PopulationGenerator(
+            self.genome_params, self.selection_strategy, {"n_breeding_workers": 2}
+        )
+        population_generator.breed_in_parallel(self.fitness_results, 4)
+
+        population_generator.close()
+
+        self.assertIsNone(population_generator._breeding_workers)
+
+
+class BreedCellsTest(unittest.TestCase):
+    def setUp(self):
+        self.genome_params = {
+            "gene1": {
+                "type": "[int]",
+                "size": 5,
+                "min": 0,
+                "max": 100,
+                "crossover_function": lambda parent_genes: [
+                    random.choice(values) for values in zip(*parent_genes)
+                ],
+                "mutation_function": lambda value: value + random.randint(-5, 5),
+                "mutation_rate": 0.5,
+            }
+        }
+        self.selection_strategy = {"parents": {"n_parents": 2}}
+        self.grid = [(i, {"gene1": [i] * 5}) for i in range(12)]
+        self.neighborhoods = get_grid_neighborhoods((3, 4))
+
+    @patch.object(Selector, "select_local_parent_groups")
+    def test_breeds_one_offspring_per_cell_from_its_local_parents(self, mock_select):
+        """breed_cells crosses and mutates the parents selected in the neighborhood of each cell, in the order of the cells"""
+        mock_select.return_value = [[genome, genome] for fitness, genome in self.grid]
+        genome_params = {**self.genome_params, "gene1": {**self.genome_params["gene1"]}}
+        genome_params["gene1"]["mutation_rate"] = 0
+        population_generator = PopulationGenerator(genome_params, self.selection_strategy)
+
+        offspring = population_generator.breed_cells(self.grid, self.neighborhoods, 4)
+
+        mock_select.assert_called_once_with(self.grid, self.neighborhoods)
+        self.assertListEqual(offspring, [genome for fitness, genome in self.grid])
+
+    def test_results_match_serial_breeding_when_rows_are_bred_in_parallel(self):
+        """breed_cells returns the same offspring with an equally seeded rng whether the rows of the grid are bred serially or split across workers"""
+        all_offspring = []
+        for generation_params in [
+            {},
+            {"n_breeding_workers": 2},
+            {"n_breeding_workers": 2, "breeding_chunk_size": 5},
+        ]:
+            population_generator = PopulationGenerator(
+                self.genome_params,
+                self.selection_strategy,
+                generation_params,
+                rng=random.Random(13),
+            )
+            try:
+                all_offspring.append(
+                    population_generator.breed_cells(self.grid, self.neighborhoods, 4)
+                )
+            finally:
+                population_generator.close()
+
+        self.assertEqual(len(all_offspring[0]), 12)
+        self.assertListEqual(all_offspring[0], all_offspring[1])
+        self.assertListEqual(all_offspring[0], all_offspring[2])
+
+    @patch.object(PopulationGenerator, "_breed_parent_groups_in_parallel")
+    def test_partitions_the_grid_into_blocks_of_whole_rows(self, mock_breed_in_parallel):
+        """breed_cells rounds the chunk size sent to breeding workers up to a whole number of rows"""
+        population_generator = PopulationGenerator(
+            self.genome_params,
+            self.selection_strategy,
+            {"n_breeding_workers": 2, "breeding_chunk_size": 5},
+        )
+
+        population_generator.breed_cells(self.grid, self.neighborhoods, 4)
+
+        self.assertEqual(mock_breed_in_parallel.call_args[0][1], 8)
+
+
+class BreedByCrowdedTournamentTest(unittest.TestCase):
+    def setUp(self):
+        self.genome_params = {
+            "gene1": {
+                "type": "float",
+                "crossover_function": lambda parent_genes: parent_genes[0],
+                "mutation_function": lambda value: value + random.random(),
+                "mutation_rate": 0.5,
+            }
+        }
+        self.fitness_results = [((i, -i), {"gene1": float(i)}) for i in range(6)]
+        self.ranks = [0] * 6
+        self.crowding_distances = [1.0] * 6
+
+    @patch.object(Selector, "select_crowded_tournament_parent_groups")
+    def test_breeds_from_tournament_parents(self, mock_select):
+        """breed_by_crowded_tournament crosses and mutates the parents selected by crowded tournaments"""
+        genome = self.fitness_results[2][1]
+        mock_select.return_value = [[genome, genome]] * 3
+        genome_params = {"gene1": {**self.genome_params["gene1"], "mutation_rate": 0}}
+        population_generator = PopulationGenerator(genome_params, {})
+
+        offspring = population_generator.breed_by_crowded_tournament(
+            self.fitness_results, self.ranks, self.crowding_distances, 3
+        )
+
+        mock_select.assert_called_once_with(
+            self.fitness_results, self.ranks, self.crowding_distances, 3
+        )
+        self.assertListEqual(offspring, [genome] * 3)
+
+    def test_results_match_serial_breeding_when_bred_in_parallel(self):
+        """breed_by_crowded_tournament returns the same offspring with an equally seeded rng whether breeding is serial or parallel"""
+        all_offspring = []
+        for generation_params in [{}, {"n_breeding_workers": 2}]:
+            population_generator = PopulationGenerator(
+                self.genome_params, {}, generation_params, rng=random.Random(5)
+            )
+            try:
+                all_offspring.append(
+                    population_generator.breed_by_crowded_tournament(
+                        self.fitness_results, self.ranks, self.crowding_distances, 8
+                    )
+                )
+            finally:
+                population_generator.close()
+
+        self.assertEqual(len(all_offspring[0]), 8)
+        self.assertListEqual(all_offspring[0], all_offspring[1])
+
 
 class GenerateRandomGenomesTest(unittest.TestCase):
     def setUp(self):
@@ -467,3 +902,350 @@ class GenerateRandomGenomesTest(unittest.TestCase):
         # list-types
         self.assertTrue(all(isinstance(x, int) for x in random_genomes[0]["gene3"]))
         self.assertTrue(all(isinstance(x, int) for x in random_genomes[0]["gene3"]))
+
+    def test_generates_random_permutations_if_no_initial_distribution(self):
+        """generate_random_genomes generates a random ordering of values (or of range(size)) for permutation genes without an initial_distribution"""
+        genome_params = {
+            "gene1": {"type": "permutation", "values": ["a", "b", "c", "d"]},
+            "gene2": {"type": "permutation", "size": 6},
+        }
+        population_generator = PopulationGenerator(genome_params, {})
+
+        random_genomes = population_generator.generate_random_genomes(10)
+
+        for genome in random_genomes:
+            self.assertListEqual(sorted(genome["gene1"]), ["a", "b", "c", "d"])
+            self.assertListEqual(sorted(genome["gene2"]), list(range(6)))
+
+    def test_uses_initial_distribution_for_permutation_genes_if_given(self):
+        """generate_random_genomes uses the initial_distribution of permutation genes if one is given"""
+        genome_params = {
+            "gene1": {"type": "permutation", "size": 3, "initial_distribution": lambda: [2, 1, 0]}
+        }
+        population_generator = PopulationGenerator(genome_params, {})
+
+        random_genomes = population_generator.generate_random_genomes(2)
+
+        self.assertListEqual(random_genomes, [{"gene1": [2, 1, 0]}, {"gene1": [2, 1, 0]}])
+
+    def test_generates_the_same_genomes_with_the_same_rng(self):
+        """generate_random_genomes generates the same genomes from equally seeded rngs and restores the state of the random module"""
+        genome_params = {
+            "gene1": {"type": "[float]", "size": 4, "initial_distribution": random.random},
+            "gene2": {"type": "permutation", "size": 5},
+        }
+        random_state = random.getstate()
+
+        all_genomes = [
+            PopulationGenerator(genome_params, {}, rng=random.Random(2)).generate_random_genomes(6)
+            for _ in range(2)
+        ]
+
+        self.assertListEqual(all_genomes[0], all_genomes[1])
+        self.assertEqual(random.getstate(), random_state)
+
+    def test_generates_genes_with_batch_initial_distribution_in_a_single_call(self):
+        """generate_random_genomes calls each gene's batch_initial_distribution once for all genomes, instead of initial_distribution, and bounds the results"""
+        number = 4
+        genome_params = {
+            "gene1": {
+                "type": "[int]",
+                "size": 3,
+                "min": 0,
+                "max": 8,
+                "initial_distribution": Mock(),
+                "batch_initial_distribution": Mock(side_effect=lambda n: [v - 2 for v in range(n)]),
+            },
+            "gene2": {"type": "bool", "batch_initial_distribution": Mock(return_value=[True] * 4)},
+        }
+        population_generator = PopulationGenerator(genome_params, {})
+
+        random_genomes = population_generator.generate_random_genomes(number)
+
+        genome_params["gene1"]["batch_initial_distribution"].assert_called_once_with(12)
+        genome_params["gene1"]["initial_distribution"].assert_not_called()
+        genome_params["gene2"]["batch_initial_distribution"].assert_called_once_with(4)
+        self.assertListEqual(
+            random_genomes,
+            [
+                {"gene1": [0, 0, 0], "gene2": True},
+                {"gene1": [1, 2, 3], "gene2": True},
+                {"gene1": [4, 5, 6], "gene2": True},
+                {"gene1": [7, 8, 8], "gene2": True},
+            ],
+        )
+
+    def test_asserts_batch_initial_distribution_returns_one_value_per_value_requested(self):
+        """generate_gene_batch raises a ValueError if batch_initial_distribution returns the wrong number of values"""
+        gene_params = {"type": "[float]", "size": 3, "batch_initial_distribution": lambda n: [0.5]}
+        population_generator = PopulationGenerator({"gene1": gene_params}, {})
+
+        with self.assertRaises(ValueError):
+            population_generator.generate_gene_batch(gene_params, 2)
+
+    def test_gives_genomes_the_initial_strategy_of_self_adaptive_genes(self):
+        """generate_random_genomes adds the initial strategy parameters of each self-adaptive gene to every genome, sharing one object between genomes"""
+        genome_params = {
+            "gene1": {
+                "type": "[float]",
+                "size": 3,
+                "initial_distribution": Mock(return_value=0.5),
+                "self_adaptation": {"initial_step_size": 0.2},
+            },
+            "gene2": {"type": "float", "initial_distribution": Mock(return_value=1.5)},
+        }
+        population_generator = PopulationGenerator(genome_params, {})
+
+        genomes = population_generator.generate_random_genomes(3)
+
+        for genome in genomes:
+            self.assertDictEqual(
+                genome, {"gene1": [0.5] * 3, "gene2": 1.5, "gene1_strategy": [0.2] * 3}
+            )
+        self.assertIs(genomes[0]["gene1_strategy"], genomes[1]["gene1_strategy"])
+
+
+class SpeciationTest(unittest.TestCase):
+    def setUp(self):
+        self.genome_params = {
+            "gene1": {
+                "type": "float",
+                "initial_distribution": random.random,
+                "crossover_function": lambda genes: sum(genes) / len(genes),
+                "mutation_function": lambda value: value,
+                "mutation_rate": 0,
+            }
+        }
+        self.selection_strategy = {"pool": {"top": 4}, "parents": {"n_parents": 2}}
+        self.compatibility_function = Mock(side_effect=lambda a, b: abs(a["gene1"] - b["gene1"]))
+        self.generation_params = {
+            "speciation": {"compatibility_function": self.compatibility_function, "threshold": 1}
+        }
+        genomes = [{"gene1": value} for value in [0.0, 10.0, 0.5, 10.5, 0.2, 10.2, 0.1, 10.1]]
+        self.fitness_results = [(i, genome) for i, genome in enumerate(genomes)]
+
+    def test_asserts_speciation_parameters_are_valid(self):
+        """__init__ raises a ValueError if speciation has no compatibility_function or a threshold that is not positive"""
+        with self.assertRaises(ValueError):
+            PopulationGenerator({}, {}, {"speciation": {"threshold": 1}})
+        with self.assertRaises(ValueError):
+            PopulationGenerator({}, {}, {"speciation": {"compatibility_function": Mock()}})
+        with self.assertRaises(ValueError):
+            PopulationGenerator(
+                {}, {}, {"speciation": {"compatibility_function": Mock(), "threshold": 0}}
+            )
+
+    def test_assigns_genomes_to_species_by_compatibility(self):
+        """assign_species groups genomes closer than the threshold to a species' representative and records species sizes"""
+        population_generator = PopulationGenerator(
+            self.genome_params, self.selection_strategy, self.generation_params
+        )
+
+        species = population_generator.assign_species(self.fitness_results)
+
+        self.assertEqual(len(species), 2)
+        for results in species.values():
+            values = [genome["gene1"] for fitness, genome in results]
+            self.assertTrue(max(values) - min(values) < 1)
+            self.assertListEqual(results, sorted(results, key=lambda result: result[0]))
+        self.assertDictEqual(population_generator.species_sizes, {0: 4, 1: 4})
+
+    def test_reuses_representatives_across_generations(self):
+        """assign_species keeps species ids and compares genomes only with species representatives, of which the most fit member of each species is kept"""
+        population_generator = PopulationGenerator(
+            self.genome_params, self.selection_strategy, self.generation_params
+        )
+        population_generator.assign_species(self.fitness_results)
+        self.compatibility_function.reset_mock()
+
+        species = population_generator.assign_species(self.fitness_results)
+
+        self.assertSetEqual(set(species), {0, 1})
+        self.assertLessEqual(self.compatibility_function.call_count, 2 * len(self.fitness_results))
+        self.assertDictEqual(
+            population_generator.species_representatives,
+            {0: self.fitness_results[6][1], 1: self.fitness_results[7][1]},
+        )
+
+    def test_drops_species_without_members(self):
+        """assign_species drops species to which no genome is assigned"""
+        population_generator = PopulationGenerator(
+            self.genome_params, self.selection_strategy, self.generation_params
+        )
+        population_generator.assign_species(self.fitness_results)
+
+        species = population_generator.assign_species(self.fitness_results[1::2])
+
+        self.assertSetEqual(set(species), {1})
+        self.assertDictEqual(population_generator.species_sizes, {1: 4})
+
+    def test_breeds_within_species(self):
+        """breed_species breeds the requested number of genomes, each from parents of a single species"""
+        population_generator = PopulationGenerator(
+            self.genome_params, self.selection_strategy, self.generation_params
+        )
+
+        bred_genomes = population_generator.breed_species(self.fitness_results, 10)
+
+        self.assertEqual(len(bred_genomes), 10)
+        values = [genome["gene1"] for genome in bred_genomes]
+        self.assertTrue(all(value < 1 or value >= 10 for value in values))
+        self.assertEqual(sum(value < 1 for value in values), 5)
+
+    def test_breeds_species_smaller_than_number_of_parents(self):
+        """breed_species breeds offspring from a species with a single member"""
+        population_generator = PopulationGenerator(
+            self.genome_params, self.selection_strategy, self.generation_params
+        )
+        fitness_results = [(1, {"gene1": 0.0}), (1, {"gene1": 10.0})]
+
+        bred_genomes = population_generator.breed_species(fitness_results, 4)
+
+        self.assertListEqual(
+            sorted(genome["gene1"] for genome in bred_genomes), [0.0, 0.0, 10.0, 10.0]
+        )
+
+    def test_breeds_single_member_species_with_negative_fitness(self):
+        """breed_species breeds offspring from species with a single member whose weighted fitness is negative, which would otherwise have a total selection weight of zero"""
+        selection_strategy = {
+            **self.selection_strategy,
+            "parents": {"weighting_function": get_linear_weighting_function(), "n_parents": 2},
+        }
+        population_generator = PopulationGenerator(
+            self.genome_params, selection_strategy, self.generation_params
+        )
+        fitness_results = [(-5, {"gene1": 0.0}), (-3, {"gene1": 10.0})]
+
+        bred_genomes = population_generator.breed_species(fitness_results, 4)
+
+        self.assertEqual(len(bred_genomes), 4)
+        self.assertTrue(all(genome["gene1"] in [0.0, 10.0] for genome in bred_genomes))
+
+    @patch.object(PopulationGenerator, "breed_species", return_value=[])
+    @patch.object(PopulationGenerator, "breed_next_generation")
+    def test_generate_next_generation_breeds_species_if_speciation_is_given(
+        self, mock_breed_next_generation, mock_breed_species
+    ):
+        """generate_next_generation breeds with breed_species instead of breed_next_generation if speciation is given"""
+        population_generator = PopulationGenerator(
+            self.genome_params, self.selection_strategy, self.generation_params
+        )
+
+        population_generator.generate_next_generation(self.fitness_results)
+
+        mock_breed_species.assert_called_once_with(self.fitness_results, 8)
+        mock_breed_next_generation.assert_not_called()
+
+
+class GenomeHashTest(unittest.TestCase):
+    def setUp(self):
+        self.genome_params = {
+            "gene1": {
+                "type": "[int]",
+                "size": 20,
+                "min": 0,
+                "max": 9,
+                "initial_distribution": lambda: random.randint(0, 9),
+                "crossover_function": lambda genes: genes[0][:10] + genes[1][10:],
+                "mutation_function": lambda value: value + 1,
+                "mutation_rate": 0.1,
+            },
+            "gene2": {
+                "type": "float",
+                "initial_distribution": random.random,
+                "crossover_function": lambda genes: genes[1],
+                "mutation_function": lambda value: value / 2,
+                "mutation_rate": 0.5,
+            },
+        }
+        self.selection_strategy = {"pool": {"top": 4}}
+
+    def test_derived_hashes_of_bred_genomes_are_correct(self):
+        """get_genome_hash returns hash_genome of each genome over several generations if should_hash_genomes is True"""
+        population_generator = PopulationGenerator(
+            self.genome_params, self.selection_strategy, should_hash_genomes=True
+        )
+        genomes = population_generator.generate_random_genomes(8)
+
+        for _ in range(5):
+            fitness_results = [(i, genome) for i, genome in enumerate(genomes)]
+            genomes = population_generator.generate_next_generation(fitness_results)
+
+            for genome in genomes:
+                self.assertEqual(population_generator.get_genome_hash(genome), hash_genome(genome))
+
+    @patch("holland.evolution.breeding.hash_genome", side_effect=hash_genome)
+    def test_does_not_hash_bred_genomes_in_full(self, mock_hash_genome):
+        """breed_next_generation derives the hashes of bred genomes from their parents instead of hashing them in full if should_hash_genomes is True"""
+        population_generator = PopulationGenerator(
+            self.genome_params, self.selection_strategy, should_hash_genomes=True
+        )
+        parents = population_generator.generate_random_genomes(4)
+        fitness_results = [(i, genome) for i, genome in enumerate(parents)]
+
+        bred_genomes = population_generator.breed_next_generation(fitness_results, 10)
+        for genome in bred_genomes:
+            population_generator.get_genome_hash(genome)
+
+        self.assertLessEqual(mock_hash_genome.call_count, len(parents))
+
+    @patch("holland.utils.utils.get_changed_positions", side_effect=get_changed_positions)
+    def test_takes_changed_positions_from_described_mutations(self, mock_get_changed_positions):
+        """breed_next_generation derives the hashes of genomes bred from a single parent from the changes described by mutation functions, without comparing list-type genes with the parent"""
+        self.genome_params["gene1"]["mutation_function"] = lambda value: DescribedMutation(
+            value + 1, 1
+        )
+        self.genome_params["gene2"]["mutation_function"] = lambda value: DescribedMutation(
+            value / 2, -value / 2
+        )
+        self.genome_params["gene1"]["max"] = 100
+        selection_strategy = {"pool": {"top": 4}, "parents": {"n_parents": 1}}
+        population_generator = PopulationGenerator(
+            self.genome_params, selection_strategy, should_hash_genomes=True
+        )
+        parents = population_generator.generate_random_genomes(4)
+        fitness_results = [(i, genome) for i, genome in enumerate(parents)]
+
+        bred_genomes = population_generator.breed_next_generation(fitness_results, 10)
+
+        for genome in bred_genomes:
+            self.assertEqual(population_generator.get_genome_hash(genome), hash_genome(genome))
+        for (gene, new_gene), _ in mock_get_changed_positions.call_args_list:
+            self.assertNotIsInstance(gene, list)
+
+    def test_derives_hashes_of_genomes_bred_from_parents_without_strategy_parameters(self):
+        """get_genome_hash returns hash_genome of genomes bred from parents that do not have the strategy parameters of their self-adaptive genes yet"""
+        self.genome_params["gene2"]["self_adaptation"] = {}
+        population_generator = PopulationGenerator(
+            self.genome_params, self.selection_strategy, should_hash_genomes=True
+        )
+        parents = [{"gene1": [i] * 20, "gene2": float(i)} for i in range(4)]
+        fitness_results = [(i, genome) for i, genome in enumerate(parents)]
+
+        bred_genomes = population_generator.breed_next_generation(fitness_results, 10)
+
+        for genome in bred_genomes:
+            self.assertEqual(population_generator.get_genome_hash(genome), hash_genome(genome))
+
+    def test_does_not_remember_hashes_if_should_remember_is_False(self):
+        """get_genome_hash computes the hash of a genome it has not derived without remembering it if should_remember is False"""
+        population_generator = PopulationGenerator(self.genome_params, self.selection_strategy)
+        genome = population_generator.generate_random_genomes(1)[0]
+
+        genome_hash = population_generator.get_genome_hash(genome, should_remember=False)
+
+        self.assertEqual(genome_hash, hash_genome(genome))
+        self.assertDictEqual(population_generator._genome_hashes, {})
+
+    def test_forgets_hashes_of_genomes_that_leave_the_population(self):
+        """breed_next_generation forgets the hashes of genomes that are not in fitness_results"""
+        population_generator = PopulationGenerator(self.genome_params, {"pool": {"top": 2}})
+        genomes = population_generator.generate_random_genomes(4)
+        for genome in genomes:
+            population_generator.get_genome_hash(genome)
+
+        population_generator.breed_next_generation([(0, genomes[0]), (1, genomes[1])], 0)
+
+        self.assertSetEqual(
+            set(population_generator._genome_hashes), {id(genomes[0]), id(genomes[1])}
+        )
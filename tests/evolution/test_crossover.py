@@ -69,3 +69,40 @@ class CrosserCrossGenomesTest(unittest.TestCase):
         crosser = Crosser(genome_params)
 
         crosser.cross_genomes(self.genomes)
+
+    def test_shares_gene_without_crossover_if_all_parents_share_the_gene(self):
+        """cross_genomes does not call the crossover_function and reuses the gene if all parents share the same gene object"""
+        shared_gene = [1, 2, 3, 4]
+        genomes = [
+            {"gene1": shared_gene, "gene2": [True, False]},
+            {"gene1": shared_gene, "gene2": [False, True]},
+        ]
+        genome_params = {
+            "gene1": {"crossover_function": Mock()},
+            "gene2": {"crossover_function": Mock()},
+        }
+        crosser = Crosser(genome_params)
+
+        crossed = crosser.cross_genomes(genomes)
+
+        genome_params["gene1"]["crossover_function"].assert_not_called()
+        self.assertIs(crossed["gene1"], shared_gene)
+        genome_params["gene2"]["crossover_function"].assert_called_once()
+
+    def test_averages_strategy_parameters_of_self_adaptive_genes(self):
+        """cross_genomes recombines the strategy parameters of self-adaptive genes by averaging those of the parents that have them"""
+        genome_params = {
+            "gene1": {"crossover_function": Mock(return_value=[1, 6, 3, 8]), "self_adaptation": {}},
+            "gene2": {"crossover_function": Mock(return_value=[True, True])},
+        }
+        genomes = [
+            {**self.genomes[0], "gene1_strategy": [1.0, 2.0, 3.0, 4.0]},
+            {**self.genomes[1], "gene1_strategy": [3.0, 2.0, 1.0, 0.0]},
+            {"gene1": [0, 0, 0, 0], "gene2": [True, True]},
+        ]
+        crosser = Crosser(genome_params)
+
+        crossed = crosser.cross_genomes(genomes)
+
+        self.assertListEqual(crossed["gene1_strategy"], [2.0, 2.0, 2.0, 2.0])
+        self.assertListEqual(crossed["gene1"], [1, 6, 3, 8])
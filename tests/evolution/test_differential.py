@@ -0,0 +1,114 @@
+import random
+import unittest
+from unittest.mock import patch
+
+from holland.evolution.differential import *
+
+
+class DifferentialBreederInitTest(unittest.TestCase):
+    def test_asserts_genes_strategy_and_rates_are_valid(self):
+        """DifferentialBreeder raises a ValueError if a gene is not a float gene, the strategy is not a valid option, the differential_weight is not positive, or the crossover_rate is not between 0 and 1"""
+        genome_params = {"gene1": {"type": "[float]", "size": 3}}
+
+        with self.assertRaises(ValueError):
+            DifferentialBreeder({"gene1": {"type": "[int]", "size": 3}})
+
+        with self.assertRaises(ValueError):
+            DifferentialBreeder(genome_params, {"strategy": "rand/2/exp"})
+
+        with self.assertRaises(ValueError):
+            DifferentialBreeder(genome_params, {"differential_weight": 0})
+
+        with self.assertRaises(ValueError):
+            DifferentialBreeder(genome_params, {"crossover_rate": 1.5})
+
+
+class DifferentialBreederVectorsTest(unittest.TestCase):
+    def setUp(self):
+        self.genome_params = {
+            "gene1": {"type": "[float]", "size": 3, "min": 0, "max": 1},
+            "gene2": {"type": "float"},
+        }
+        self.genomes = [{"gene1": [0.1, 0.2, 0.3], "gene2": 4.0}, {"gene1": [0.5] * 3, "gene2": -1.0}]
+
+    def test_flattens_genomes_into_vectors(self):
+        """to_vectors concatenates the values of the genes of each genome in the order of genome_params"""
+        breeder = DifferentialBreeder(self.genome_params)
+
+        vectors = breeder.to_vectors(self.genomes)
+
+        self.assertListEqual(vectors, [[0.1, 0.2, 0.3, 4.0], [0.5, 0.5, 0.5, -1.0]])
+
+    def test_builds_genomes_from_vectors(self):
+        """to_genomes is the inverse of to_vectors"""
+        breeder = DifferentialBreeder(self.genome_params)
+
+        genomes = breeder.to_genomes(breeder.to_vectors(self.genomes))
+
+        self.assertListEqual(genomes, self.genomes)
+
+
+class DifferentialBreederBreedTrialVectorsTest(unittest.TestCase):
+    def setUp(self):
+        self.genome_params = {"gene1": {"type": "[float]", "size": 2, "min": -10, "max": 10}}
+        self.vectors = [[0.0, 0.0], [1.0, 1.0], [2.0, 4.0], [3.0, 9.0], [9.0, 9.0]]
+
+    def test_asserts_population_is_large_enough_for_the_strategy(self):
+        """breed_trial_vectors raises a ValueError if there are too few vectors to draw distinct random vectors other than the target"""
+        breeder = DifferentialBreeder(self.genome_params)
+
+        with self.assertRaises(ValueError):
+            breeder.breed_trial_vectors(self.vectors[:3], 0)
+
+        breeder = DifferentialBreeder(self.genome_params, {"strategy": "best/1/bin"})
+        breeder.breed_trial_vectors(self.vectors[:3], 0)
+
+    def test_builds_mutant_vectors_for_each_strategy(self):
+        """breed_trial_vectors builds x_r1 + F * (x_r2 - x_r3) for rand/1/bin, x_best + F * (x_r1 - x_r2) for best/1/bin, and x_i + F * (x_best - x_i) + F * (x_r1 - x_r2) for current-to-best/1/bin"""
+        expected_trials = {
+            "rand/1/bin": [1.0 + 0.5 * (2.0 - 3.0), 1.0 + 0.5 * (4.0 - 9.0)],
+            "best/1/bin": [9.0 + 0.5 * (1.0 - 2.0), 9.0 + 0.5 * (1.0 - 4.0)],
+            "current-to-best/1/bin": [0.0 + 4.5 + 0.5 * (1.0 - 2.0), 0.0 + 4.5 + 0.5 * (1.0 - 4.0)],
+        }
+        for strategy, expected_trial in expected_trials.items():
+            breeder = DifferentialBreeder(
+                self.genome_params, {"strategy": strategy, "crossover_rate": 1}
+            )
+            with patch.object(breeder.rng, "sample", return_value=[0, 1, 2]):
+                trial_vectors = breeder.breed_trial_vectors(self.vectors, 4)
+
+            self.assertListEqual(trial_vectors[0], expected_trial)
+
+    def test_never_uses_the_target_as_a_random_vector(self):
+        """breed_trial_vectors draws the random vectors of each target from the other vectors"""
+        breeder = DifferentialBreeder(self.genome_params, {"crossover_rate": 1})
+
+        with patch.object(breeder.rng, "sample", return_value=[0, 1, 2]):
+            trial_vectors = breeder.breed_trial_vectors(self.vectors, 4)
+
+        # for the target at index 1, indices 0, 1, 2 of the other vectors are 0, 2, 3
+        self.assertListEqual(trial_vectors[1], [0.0 + 0.5 * (2.0 - 3.0), 0.0 + 0.5 * (4.0 - 9.0)])
+
+    def test_keeps_at_least_one_mutant_value_and_bounds_values(self):
+        """breed_trial_vectors takes each value from the target if crossover_rate is 0, except for one value from the bounded mutant vector"""
+        breeder = DifferentialBreeder(
+            self.genome_params, {"strategy": "best/1/bin", "differential_weight": 10, "crossover_rate": 0}
+        )
+
+        trial_vectors = breeder.breed_trial_vectors(self.vectors, 4)
+
+        for trial, target in zip(trial_vectors, self.vectors):
+            n_changed = sum(value != target_value for value, target_value in zip(trial, target))
+            self.assertLessEqual(n_changed, 1)
+            self.assertTrue(all(-10 <= value <= 10 for value in trial))
+
+    def test_draws_from_the_given_rng(self):
+        """breed_trial_vectors returns the same trial vectors for equally seeded rngs"""
+        trial_vectors = [
+            DifferentialBreeder(self.genome_params, rng=random.Random(3)).breed_trial_vectors(
+                self.vectors, 4
+            )
+            for _ in range(2)
+        ]
+
+        self.assertListEqual(trial_vectors[0], trial_vectors[1])
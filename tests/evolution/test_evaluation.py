@@ -1,7 +1,8 @@
 import unittest
-from unittest.mock import Mock, call
+from unittest.mock import Mock, call, patch
 
 from holland.evolution.evaluation import *
+from holland.evolution.evaluation import _initialize_evaluation_worker, _evaluate_genome_in_worker
 
 
 class EvaluatorEvaluateFitnessTest(unittest.TestCase):
@@ -80,3 +81,194 @@ class EvaluatorEvaluateFitnessTest(unittest.TestCase):
 
         expected_results = sorted(list(zip(scores, gene_pool)), key=lambda x: x[0], reverse=True)
         self.assertListEqual(results, expected_results)
+
+
+    def test_keeps_the_order_of_gene_pool_if_not_sorting(self):
+        """evaluate_fitness returns results in the order of gene_pool if should_sort is False"""
+        scores = [30, 10, 60, 20]
+        fitness_function = Mock(side_effect=scores)
+        gene_pool = ["a", "b", "c", "d"]
+        evaluator = Evaluator(fitness_function)
+
+        results = evaluator.evaluate_fitness(gene_pool, should_sort=False)
+
+        self.assertListEqual(results, list(zip(scores, gene_pool)))
+
+
+class EvaluatorDeltaEvaluationTest(unittest.TestCase):
+    def test_uses_delta_fitness_function_for_genomes_in_lineage(self):
+        """evaluate_fitness applies delta_fitness_function to the parent fitness, parent genome, and changes of genomes in lineage and fitness_function to the rest"""
+        fitness_function = Mock(return_value=1)
+        delta_fitness_function = Mock(return_value=5)
+        parent, child, other = {"gene": [0, 1]}, {"gene": [1, 0]}, {"gene": [0, 1]}
+        changes = {"gene": ("swap", 0, 1)}
+        evaluator = Evaluator(fitness_function, delta_fitness_function=delta_fitness_function)
+
+        results = evaluator.evaluate_fitness(
+            [child, other], lineage={id(child): (3, parent, changes)}
+        )
+
+        delta_fitness_function.assert_called_once_with(3, parent, changes)
+        fitness_function.assert_called_once_with(other)
+        self.assertEqual(results, [(1, other), (5, child)])
+
+    def test_reuses_parent_fitness_if_there_are_no_changes(self):
+        """evaluate_fitness reuses the parent's fitness for a genome in lineage without changes"""
+        delta_fitness_function = Mock()
+        parent, child = {"gene": 1}, {"gene": 1}
+        evaluator = Evaluator(Mock(), delta_fitness_function=delta_fitness_function)
+
+        results = evaluator.evaluate_fitness([child], lineage={id(child): (3, parent, {})})
+
+        delta_fitness_function.assert_not_called()
+        self.assertEqual(results, [(3, child)])
+
+    def test_ignores_lineage_without_delta_fitness_function(self):
+        """evaluate_fitness applies fitness_function to every genome if no delta_fitness_function is given"""
+        fitness_function = Mock(return_value=1)
+        parent, child = {"gene": 1}, {"gene": 2}
+        evaluator = Evaluator(fitness_function)
+
+        evaluator.evaluate_fitness([child], lineage={id(child): (3, parent, {"gene": "up"})})
+
+        fitness_function.assert_called_once_with(child)
+
+
+class EvaluatorEvaluateGenomeTest(unittest.TestCase):
+    def test_returns_tuple_of_score_and_genome(self):
+        """evaluate_genome pairs the genome with the score returned by fitness_function"""
+        evaluator = Evaluator(Mock(return_value=10))
+
+        result = evaluator.evaluate_genome("a")
+
+        self.assertEqual(result, (10, "a"))
+
+    def test_returns_result_of_fitness_function_if_it_returns_a_genome(self):
+        """evaluate_genome returns the score and genome returned by fitness_function if fitness_function returns a tuple/list"""
+        evaluator = Evaluator(Mock(return_value=(10, "b")))
+
+        result = evaluator.evaluate_genome("a")
+
+        self.assertEqual(result, (10, "b"))
+
+
+class EvaluatorLocalSearchTest(unittest.TestCase):
+    def setUp(self):
+        self.fitness_function = Mock(side_effect=lambda genome: genome["gene1"])
+
+        def local_search(genome, fitness, evaluate, is_better):
+            while True:
+                candidate = {"gene1": genome["gene1"] + 1}
+                candidate_fitness = evaluate(candidate)
+                if candidate_fitness is None or not is_better(candidate_fitness, fitness):
+                    return fitness, genome
+                genome, fitness = candidate, candidate_fitness
+
+        self.local_search = local_search
+
+    def test_asserts_local_search_params_are_valid(self):
+        """Evaluator raises a ValueError if the local search rate is not between 0 and 1 or max_evaluations < 1"""
+        with self.assertRaises(ValueError):
+            Evaluator(self.fitness_function, local_search_params={"rate": 1.5})
+
+        with self.assertRaises(ValueError):
+            Evaluator(self.fitness_function, local_search_params={"max_evaluations": 0})
+
+    def test_searches_locally_with_a_budget(self):
+        """evaluate_genome refines genomes with the local search function, which can call the fitness function at most max_evaluations times"""
+        evaluator = Evaluator(
+            self.fitness_function,
+            local_search_params={"function": self.local_search, "rate": 1, "max_evaluations": 4},
+        )
+
+        result = evaluator.evaluate_genome({"gene1": 0})
+
+        self.assertEqual(result, (4, {"gene1": 4}))
+        self.assertEqual(self.fitness_function.call_count, 1 + 4)
+
+    def test_compares_fitness_in_the_direction_of_evaluation(self):
+        """search_locally passes an is_better function that prefers lower fitness scores if ascending is False"""
+        evaluator = Evaluator(
+            self.fitness_function,
+            ascending=False,
+            local_search_params={"function": self.local_search, "rate": 1},
+        )
+
+        result = evaluator.evaluate_genome({"gene1": 0})
+
+        self.assertEqual(result, (0, {"gene1": 0}))
+
+    def test_searches_a_rate_fraction_of_genomes(self):
+        """evaluate_genome refines each genome with probability rate"""
+        local_search = Mock(return_value=(10, {"gene1": 10}))
+        evaluator = Evaluator(
+            self.fitness_function, local_search_params={"function": local_search, "rate": 0.5}
+        )
+
+        with patch("holland.evolution.evaluation.random.random", side_effect=[0.7, 0.2]):
+            results = [evaluator.evaluate_genome({"gene1": i}) for i in range(2)]
+
+        self.assertListEqual(results, [(0, {"gene1": 0}), (10, {"gene1": 10})])
+        local_search.assert_called_once()
+
+    def test_keeps_genome_if_not_lamarckian(self):
+        """search_locally returns the fitness found by the local search with the original genome if is_lamarckian is False"""
+        evaluator = Evaluator(
+            self.fitness_function,
+            local_search_params={
+                "function": self.local_search,
+                "max_evaluations": 3,
+                "is_lamarckian": False,
+            },
+        )
+
+        result = evaluator.search_locally(0, {"gene1": 0})
+
+        self.assertEqual(result, (3, {"gene1": 0}))
+
+    def test_evaluates_candidates_with_lamarckian_fitness_function(self):
+        """search_locally passes only the fitness score to the local search if the fitness function returns a tuple"""
+        fitness_function = Mock(side_effect=lambda genome: (genome["gene1"], genome))
+        evaluator = Evaluator(
+            fitness_function,
+            local_search_params={"function": self.local_search, "max_evaluations": 2},
+        )
+
+        result = evaluator.search_locally(0, {"gene1": 0})
+
+        self.assertEqual(result, (2, {"gene1": 2}))
+
+
+class EvaluatorMultiObjectiveTest(unittest.TestCase):
+    def test_returns_objective_values_as_fitness(self):
+        """evaluate_genome returns the tuple of objective values returned by the fitness function as the score if is_multi_objective is True"""
+        evaluator = Evaluator(Mock(return_value=[1, 2, 3]), is_multi_objective=True)
+
+        self.assertEqual(evaluator.evaluate_genome("a"), ((1, 2, 3), "a"))
+
+    def test_returns_genome_returned_with_objective_values(self):
+        """evaluate_genome returns the objective values and genome returned by the fitness function if its first element is a tuple/list"""
+        evaluator = Evaluator(Mock(return_value=([1, 2], "b")), is_multi_objective=True)
+
+        self.assertEqual(evaluator.evaluate_genome("a"), ((1, 2), "b"))
+
+    def test_asserts_local_search_is_not_given(self):
+        """Evaluator raises a ValueError if a local search function is given and is_multi_objective is True"""
+        with self.assertRaises(ValueError):
+            Evaluator(Mock(), local_search_params={"function": Mock()}, is_multi_objective=True)
+
+
+class EvaluationWorkerTest(unittest.TestCase):
+    def test_evaluates_genomes_with_the_given_evaluator(self):
+        """_evaluate_genome_in_worker evaluates genomes with the evaluator given to _initialize_evaluation_worker, including its local search"""
+        evaluator = Evaluator(
+            lambda genome: genome["gene1"],
+            local_search_params={
+                "function": lambda genome, fitness, evaluate, is_better: (fitness + 1, genome),
+                "rate": 1,
+            },
+        )
+
+        _initialize_evaluation_worker(evaluator)
+
+        self.assertEqual(_evaluate_genome_in_worker({"gene1": 1}), (2, {"gene1": 1}))
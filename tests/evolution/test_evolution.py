@@ -1,10 +1,13 @@
+import random
 import logging
 import unittest
-from unittest.mock import patch, call
+from unittest.mock import patch, call, Mock, ANY
 
 from holland.evolution.evolution import *
 from holland.evolution.breeding import PopulationGenerator
+from holland.library.local_search_functions import get_coordinate_descent_local_search
 from holland.storage.storage_manager import StorageManager
+from holland.evolution.restarts import RestartStrategy
 
 
 class EvolverEvolveTest(unittest.TestCase):
@@ -82,8 +85,52 @@ class EvolverEvolveTest(unittest.TestCase):
         )
 
         MockPopulationGenerator.assert_called_with(
-            self.genome_params, self.selection_strategy, generation_params=self.generation_params
+            self.genome_params,
+            self.selection_strategy,
+            generation_params=self.generation_params,
+            should_track_lineage=False,
+            rng=None,
+            should_hash_genomes=False,
+        )
+
+    @patch("holland.evolution.evolution.PopulationGenerator")
+    @patch("holland.evolution.evolution.Evaluator")
+    def test_hashes_genomes_while_breeding_if_genomes_are_hashed(
+        self, MockEvaluator, MockPopulationGenerator
+    ):
+        """evolve creates a PopulationGenerator with should_hash_genomes True if a hall of fame is kept or an adaptive population size schedule has no diversity_function, unless generation_params["should_hash_genomes"] is given"""
+        evolver = Evolver(self.fitness_function, self.genome_params, self.selection_strategy)
+        schedule = {"type": "adaptive", "final_population_size": 50}
+        hall_of_fame_options = {"hall_of_fame": {"size": 5}}
+
+        with patch("holland.evolution.evolution.StorageManager"):
+            evolver.evolve(
+                storage_options=hall_of_fame_options, logging_options=self.logging_options
+            )
+        self.assertTrue(MockPopulationGenerator.call_args[1]["should_hash_genomes"])
+
+        evolver.evolve(
+            generation_params={**self.generation_params, "population_size_schedule": schedule},
+            logging_options=self.logging_options,
+        )
+        self.assertTrue(MockPopulationGenerator.call_args[1]["should_hash_genomes"])
+
+        evolver.evolve(
+            generation_params={
+                **self.generation_params,
+                "population_size_schedule": {**schedule, "diversity_function": len},
+            },
+            logging_options=self.logging_options,
         )
+        self.assertFalse(MockPopulationGenerator.call_args[1]["should_hash_genomes"])
+
+        with patch("holland.evolution.evolution.StorageManager"):
+            evolver.evolve(
+                generation_params={"should_hash_genomes": False},
+                storage_options=hall_of_fame_options,
+                logging_options=self.logging_options,
+            )
+        self.assertFalse(MockPopulationGenerator.call_args[1]["should_hash_genomes"])
 
     @patch.object(PopulationGenerator, "generate_random_genomes")
     @patch("holland.evolution.evolution.Evaluator")
@@ -137,7 +184,13 @@ class EvolverEvolveTest(unittest.TestCase):
 
         evolver.evolve(logging_options=self.logging_options)
 
-        MockEvaluator.assert_called_with(self.fitness_function, ascending=True)
+        MockEvaluator.assert_called_with(
+            self.fitness_function,
+            ascending=True,
+            delta_fitness_function=None,
+            local_search_params={},
+            is_multi_objective=False,
+        )
 
     @patch.object(PopulationGenerator, "generate_random_genomes")
     @patch("holland.evolution.evolution.Evaluator")
@@ -155,7 +208,45 @@ class EvolverEvolveTest(unittest.TestCase):
 
         evolver.evolve(logging_options=self.logging_options)
 
-        MockEvaluator.assert_called_with(self.fitness_function, ascending=False)
+        MockEvaluator.assert_called_with(
+            self.fitness_function,
+            ascending=False,
+            delta_fitness_function=None,
+            local_search_params={},
+            is_multi_objective=False,
+        )
+
+    @patch("holland.evolution.evolution.PopulationGenerator")
+    @patch("holland.evolution.evolution.Evaluator")
+    def test_enables_delta_evaluation_if_given_delta_fitness_function(
+        self, MockEvaluator, MockPopulationGenerator
+    ):
+        """evolve passes the delta_fitness_function to the Evaluator and has the PopulationGenerator track lineage if a delta_fitness_function is given"""
+        delta_fitness_function = Mock()
+        evolver = Evolver(
+            self.fitness_function,
+            self.genome_params,
+            self.selection_strategy,
+            delta_fitness_function=delta_fitness_function,
+        )
+
+        evolver.evolve(logging_options=self.logging_options)
+
+        MockEvaluator.assert_called_with(
+            self.fitness_function,
+            ascending=True,
+            delta_fitness_function=delta_fitness_function,
+            local_search_params={},
+            is_multi_objective=False,
+        )
+        MockPopulationGenerator.assert_called_with(
+            self.genome_params,
+            self.selection_strategy,
+            generation_params={},
+            should_track_lineage=True,
+            rng=None,
+            should_hash_genomes=False,
+        )
 
     @patch.object(PopulationGenerator, "generate_random_genomes")
     @patch.object(Evaluator, "evaluate_fitness")
@@ -192,7 +283,7 @@ class EvolverEvolveTest(unittest.TestCase):
             logging_options=self.logging_options,
         )
 
-        expected_evaluate_fitness_calls = [call(pop) for pop in all_populations]
+        expected_evaluate_fitness_calls = [call(pop, lineage={}) for pop in all_populations]
         expected_generate_next_gen_calls = [
             call(res)
             for res in results[:-1]
@@ -285,6 +376,9 @@ class EvolverEvolveTest(unittest.TestCase):
         MockStorageManager.assert_called_with(
             fitness_storage_options=fitness_storage_options,
             genome_storage_options=genome_storage_options,
+            hall_of_fame_options={},
+            ascending=True,
+            hash_function=ANY,
         )
 
     @patch.object(PopulationGenerator, "generate_random_genomes")
@@ -387,3 +481,828 @@ class EvolverEvolveTest(unittest.TestCase):
 
         expected_final_results = results[-1]
         self.assertListEqual(final_results, expected_final_results)
+
+
+def get_float_genome_params(**gene_params):
+    return {
+        "gene1": {
+            "type": "float",
+            "min": -5,
+            "max": 5,
+            "initial_distribution": lambda: random.uniform(-5, 5),
+            "crossover_function": lambda parent_genes: random.choice(parent_genes),
+            "mutation_function": lambda value: value + random.gauss(0, 1),
+            "mutation_rate": 0.5,
+            **gene_params,
+        }
+    }
+
+
+class EvolverModeTestCase(unittest.TestCase):
+    def setUp(self):
+        self.fitness_function = Mock(side_effect=lambda genome: sum(genome["gene1"]))
+        self.genome_params = {
+            "gene1": {
+                "type": "[int]",
+                "size": 5,
+                "min": 0,
+                "max": 10,
+                "initial_distribution": lambda: random.randint(0, 10),
+                "crossover_function": lambda parent_genes: parent_genes[0],
+                "mutation_function": lambda value: value + random.choice([-1, 1]),
+                "mutation_rate": 0.2,
+            }
+        }
+        self.selection_strategy = {"pool": {"top": 5}, "parents": {"n_parents": 2}}
+        self.logging_options = {"level": logging.CRITICAL}
+
+
+class EvolverSeedTest(EvolverModeTestCase):
+    def setUp(self):
+        super().setUp()
+        self.fitness_function = lambda genome: sum(genome["gene1"]) + random.random()
+        self.genome_params["gene1"]["crossover_function"] = lambda parent_genes: random.choice(
+            parent_genes
+        )
+        self.selection_strategy["pool"]["random"] = 2
+
+    def evolve(self, seed, **generation_params):
+        evolver = Evolver(self.fitness_function, self.genome_params, self.selection_strategy)
+        return evolver.evolve(
+            generation_params={"population_size": 10, **generation_params},
+            stop_conditions={"n_generations": 5},
+            logging_options=self.logging_options,
+            seed=seed,
+        )
+
+    def test_runs_with_the_same_seed_are_identical(self):
+        """evolve returns the same results for runs with the same seed, in both generational and steady_state modes"""
+        self.assertListEqual(self.evolve(3), self.evolve(3))
+        self.assertListEqual(
+            self.evolve(3, mode="steady_state", replacement="random"),
+            self.evolve(3, mode="steady_state", replacement="random"),
+        )
+
+    def test_accepts_a_random_instance_as_seed(self):
+        """evolve accepts a random.Random instance as the seed"""
+        self.assertListEqual(self.evolve(random.Random(3)), self.evolve(random.Random(3)))
+
+    def test_parallel_breeding_gives_the_same_results_as_serial_breeding(self):
+        """evolve returns the same results with a seed whether or not breeding is done in parallel"""
+        self.assertListEqual(self.evolve(3), self.evolve(3, n_breeding_workers=2))
+
+    def test_restores_the_random_module(self):
+        """evolve restores the state of the random module at the end of a seeded run"""
+        random_state = random.getstate()
+
+        self.evolve(3)
+
+        self.assertEqual(random.getstate(), random_state)
+
+    @patch.object(PopulationGenerator, "close", autospec=True)
+    def test_restores_the_random_module_if_setup_fails(self, mock_close):
+        """evolve restores the state of the random module and closes the population generator if creating the storage manager or the initial population raises an error in a seeded run"""
+        random_state = random.getstate()
+
+        with patch("holland.evolution.evolution.StorageManager", side_effect=ValueError):
+            with self.assertRaises(ValueError):
+                self.evolve(3)
+        self.assertEqual(random.getstate(), random_state)
+
+        with patch.object(PopulationGenerator, "generate_random_genomes", side_effect=ValueError):
+            with self.assertRaises(ValueError):
+                self.evolve(3)
+        self.assertEqual(random.getstate(), random_state)
+        mock_close.assert_called_once()
+
+
+class EvolverSteadyStateTest(EvolverModeTestCase):
+    def setUp(self):
+        super().setUp()
+        self.generation_params = {
+            "population_size": 10,
+            "mode": "steady_state",
+            "n_offspring_per_step": 2,
+        }
+
+    def test_asserts_mode_n_offspring_per_step_and_replacement_are_valid(self):
+        """evolve raises a ValueError if generation_params["mode"] or generation_params["replacement"] is not a valid option or generation_params["n_offspring_per_step"] is less than 1"""
+        evolver = Evolver(self.fitness_function, self.genome_params, self.selection_strategy)
+
+        with self.assertRaises(ValueError):
+            evolver.evolve(generation_params={"mode": "something else"})
+
+        with self.assertRaises(ValueError):
+            evolver.evolve(generation_params={"mode": "steady_state", "n_offspring_per_step": 0})
+
+        with self.assertRaises(ValueError):
+            evolver.evolve(generation_params={"mode": "steady_state", "replacement": "oldest"})
+
+    def test_asserts_speciation_is_generational(self):
+        """evolve raises a ValueError if generation_params["speciation"] is given in "steady_state" mode"""
+        evolver = Evolver(self.fitness_function, self.genome_params, self.selection_strategy)
+        speciation = {"compatibility_function": lambda a, b: 0, "threshold": 1}
+
+        with self.assertRaises(ValueError):
+            evolver.evolve(generation_params={**self.generation_params, "speciation": speciation})
+
+    def test_evaluates_n_offspring_per_step_in_each_step(self):
+        """evolve in steady_state mode evaluates the initial population once and then n_offspring_per_step offspring in each step, with enough steps per generation to breed population_size offspring"""
+        n_generations = 3
+        evolver = Evolver(self.fitness_function, self.genome_params, self.selection_strategy)
+
+        evolver.evolve(
+            generation_params=self.generation_params,
+            stop_conditions={"n_generations": n_generations},
+            logging_options=self.logging_options,
+        )
+
+        population_size = self.generation_params["population_size"]
+        expected_n_evaluations = population_size + (n_generations - 1) * population_size
+        self.assertEqual(self.fitness_function.call_count, expected_n_evaluations)
+
+    @patch.object(PopulationGenerator, "generate_next_generation")
+    def test_does_not_generate_whole_generations(self, mock_generate_next_gen):
+        """evolve in steady_state mode breeds offspring without generating whole new generations"""
+        evolver = Evolver(self.fitness_function, self.genome_params, self.selection_strategy)
+
+        evolver.evolve(
+            generation_params=self.generation_params,
+            stop_conditions={"n_generations": 3},
+            logging_options=self.logging_options,
+        )
+
+        mock_generate_next_gen.assert_not_called()
+
+    def test_returns_sorted_population_of_constant_size_that_never_gets_worse(self):
+        """evolve in steady_state mode with 'worst' replacement returns a sorted population of population_size individuals whose best fitness is at least the best initial fitness"""
+        initial_population = [{"gene1": [i % 10] * 5} for i in range(10)]
+        evolver = Evolver(self.fitness_function, self.genome_params, self.selection_strategy)
+
+        fitness_results = evolver.evolve(
+            generation_params=self.generation_params,
+            initial_population=initial_population,
+            stop_conditions={"n_generations": 5},
+            logging_options=self.logging_options,
+        )
+
+        fitness_scores = [fitness for fitness, genome in fitness_results]
+        self.assertEqual(len(fitness_results), self.generation_params["population_size"])
+        self.assertListEqual(fitness_scores, sorted(fitness_scores))
+        self.assertGreaterEqual(fitness_scores[-1], 45)
+
+    @patch("random.random", return_value=0.99)
+    def test_keeps_transient_best_genome_in_hall_of_fame(self, mock_random):
+        """evolve in steady_state mode adds each offspring to the hall of fame when it is evaluated, so a best genome replaced before the end of the generation is kept"""
+        best_genome, worse_genome = {"gene1": [10] * 5}, {"gene1": [1] * 5}
+        evolver = Evolver(self.fitness_function, self.genome_params, self.selection_strategy)
+
+        with patch.object(
+            PopulationGenerator,
+            "breed_next_generation",
+            side_effect=[[best_genome], [worse_genome]],
+        ):
+            fitness_results, hall_of_fame = evolver.evolve(
+                generation_params={
+                    "population_size": 2,
+                    "mode": "steady_state",
+                    "replacement": "random",
+                },
+                initial_population=[{"gene1": [0] * 5}, {"gene1": [0] * 5}],
+                stop_conditions={"n_generations": 2},
+                storage_options={"hall_of_fame": {"size": 1}},
+                logging_options=self.logging_options,
+            )
+
+        self.assertListEqual([fitness for fitness, genome in fitness_results], [0, 5])
+        self.assertListEqual(hall_of_fame, [(50, best_genome)])
+
+
+class EvolverAsynchronousTest(EvolverModeTestCase):
+    def setUp(self):
+        super().setUp()
+        self.generation_params = {
+            "population_size": 10,
+            "mode": "asynchronous",
+            "n_evaluation_workers": 2,
+        }
+
+    def test_asserts_n_evaluation_workers_is_at_least_one(self):
+        """evolve raises a ValueError if generation_params["n_evaluation_workers"] is less than 1"""
+        evolver = Evolver(self.fitness_function, self.genome_params, self.selection_strategy)
+
+        with self.assertRaises(ValueError):
+            evolver.evolve(generation_params={"mode": "asynchronous", "n_evaluation_workers": 0})
+
+    @patch("holland.evolution.evolution.os.cpu_count", return_value=None)
+    def test_uses_one_evaluation_worker_if_the_cpu_count_is_unknown(self, mock_cpu_count):
+        """evolve in asynchronous mode evaluates genomes in a single worker if generation_params["n_evaluation_workers"] is not given and the number of CPUs cannot be determined"""
+        evolver = Evolver(self.fitness_function, self.genome_params, self.selection_strategy)
+
+        with patch(
+            "holland.evolution.evolution.create_process_pool", wraps=create_process_pool
+        ) as mock_create_pool:
+            fitness_results = evolver.evolve(
+                generation_params={"population_size": 10, "mode": "asynchronous"},
+                stop_conditions={"n_generations": 1},
+                logging_options=self.logging_options,
+            )
+
+        self.assertEqual(mock_create_pool.call_args[0][0], 1)
+        self.assertEqual(len(fitness_results), 10)
+
+    def test_ignores_n_evaluation_workers_in_other_modes(self):
+        """evolve does not validate generation_params["n_evaluation_workers"] outside of asynchronous mode"""
+        evolver = Evolver(self.fitness_function, self.genome_params, self.selection_strategy)
+
+        fitness_results = evolver.evolve(
+            generation_params={"population_size": 10, "n_evaluation_workers": 0},
+            stop_conditions={"n_generations": 1},
+            logging_options=self.logging_options,
+        )
+
+        self.assertEqual(len(fitness_results), 10)
+
+    @patch.object(
+        PopulationGenerator,
+        "generate_random_genomes",
+        autospec=True,
+        side_effect=PopulationGenerator.generate_random_genomes,
+    )
+    def test_evaluates_no_more_than_the_initial_population_until_it_is_full(
+        self, mock_generate_random
+    ):
+        """evolve in asynchronous mode does not dispatch genomes other than the initial population while its evaluations are pending, even if workers are idle"""
+        evolver = Evolver(self.fitness_function, self.genome_params, self.selection_strategy)
+
+        with patch.object(
+            PopulationGenerator,
+            "breed_next_generation",
+            autospec=True,
+            side_effect=PopulationGenerator.breed_next_generation,
+        ) as mock_breed:
+            evolver.evolve(
+                generation_params={**self.generation_params, "n_evaluation_workers": 4},
+                stop_conditions={"n_generations": 1},
+                logging_options=self.logging_options,
+            )
+
+        mock_generate_random.assert_called_once()
+        self.assertEqual(mock_generate_random.call_args[0][1], 10)
+        mock_breed.assert_not_called()
+
+    @patch.object(StorageManager, "update_storage")
+    def test_returns_sorted_population_of_constant_size_after_each_generation(
+        self, mock_update_storage
+    ):
+        """evolve in asynchronous mode records a sorted population of population_size individuals once per generation and returns the final population"""
+        n_generations = 4
+        evolver = Evolver(self.fitness_function, self.genome_params, self.selection_strategy)
+
+        fitness_results = evolver.evolve(
+            generation_params=self.generation_params,
+            stop_conditions={"n_generations": n_generations},
+            logging_options=self.logging_options,
+        )
+
+        fitness_scores = [fitness for fitness, genome in fitness_results]
+        self.assertEqual(len(fitness_results), self.generation_params["population_size"])
+        self.assertListEqual(fitness_scores, sorted(fitness_scores))
+        self.assertEqual(mock_update_storage.call_count, n_generations)
+        self.assertListEqual(
+            [c[0][0] for c in mock_update_storage.call_args_list], list(range(n_generations))
+        )
+
+    def test_stops_on_reaching_target_fitness(self):
+        """evolve in asynchronous mode stops as soon as the best fitness is equal to the target fitness"""
+        initial_population = [{"gene1": [10] * 5}] + [{"gene1": [0] * 5} for _ in range(9)]
+        evolver = Evolver(self.fitness_function, self.genome_params, self.selection_strategy)
+
+        fitness_results = evolver.evolve(
+            generation_params=self.generation_params,
+            initial_population=initial_population,
+            stop_conditions={"n_generations": 1000, "target_fitness": 50},
+            logging_options=self.logging_options,
+        )
+
+        self.assertEqual(fitness_results[-1][0], 50)
+
+    @patch.object(StorageManager, "react_to_interruption")
+    def test_reraises_errors_from_workers_and_reacts_to_interruption(self, mock_react):
+        """evolve in asynchronous mode re-raises exceptions raised by the fitness function in a worker after calling StorageManager.react_to_interruption"""
+
+        def fitness_function(genome):
+            raise RuntimeError("evaluation failed")
+
+        evolver = Evolver(fitness_function, self.genome_params, self.selection_strategy)
+
+        with self.assertRaises(RuntimeError):
+            evolver.evolve(
+                generation_params=self.generation_params, logging_options=self.logging_options
+            )
+
+        mock_react.assert_called_once()
+
+    def test_searches_locally_in_the_workers(self):
+        """evolve in asynchronous mode refines genomes with the local search in the worker processes"""
+        evolver = Evolver(self.fitness_function, self.genome_params, self.selection_strategy)
+        local_search_params = {
+            "function": get_coordinate_descent_local_search("gene1", 8, minimum=0, maximum=10),
+            "rate": 1,
+        }
+
+        fitness_results = evolver.evolve(
+            generation_params={**self.generation_params, "local_search": local_search_params},
+            stop_conditions={"n_generations": 1},
+            logging_options=self.logging_options,
+        )
+
+        self.assertTrue(all(fitness == 50 for fitness, genome in fitness_results))
+
+
+class EvolverCellularTest(EvolverModeTestCase):
+    def setUp(self):
+        super().setUp()
+        self.generation_params = {"population_size": 12, "mode": "cellular"}
+
+    def test_asserts_cell_replacement_grid_shape_and_neighborhood_are_valid(self):
+        """evolve raises a ValueError if generation_params["cell_replacement"] or generation_params["neighborhood"] is not a valid option or generation_params["grid_shape"] does not have one cell per individual"""
+        evolver = Evolver(self.fitness_function, self.genome_params, self.selection_strategy)
+
+        with self.assertRaises(ValueError):
+            evolver.evolve(generation_params={**self.generation_params, "cell_replacement": "x"})
+
+        with self.assertRaises(ValueError):
+            evolver.evolve(generation_params={**self.generation_params, "grid_shape": (3, 5)})
+
+        with self.assertRaises(ValueError):
+            evolver.evolve(generation_params={**self.generation_params, "neighborhood": "hex"})
+
+    def test_evaluates_every_cell_in_each_generation(self):
+        """evolve in cellular mode evaluates the initial population and then one offspring per cell in each generation"""
+        n_generations = 3
+        evolver = Evolver(self.fitness_function, self.genome_params, self.selection_strategy)
+
+        evolver.evolve(
+            generation_params=self.generation_params,
+            stop_conditions={"n_generations": n_generations},
+            logging_options=self.logging_options,
+        )
+
+        self.assertEqual(
+            self.fitness_function.call_count,
+            n_generations * self.generation_params["population_size"],
+        )
+
+    @patch.object(PopulationGenerator, "breed_cells")
+    def test_breeds_cells_from_grid_neighborhoods(self, mock_breed_cells):
+        """evolve in cellular mode breeds each generation with PopulationGenerator.breed_cells from the unsorted grid, the neighborhoods of the grid, and its number of columns"""
+        initial_population = [{"gene1": [i % 10] * 5} for i in range(12)]
+        mock_breed_cells.return_value = initial_population
+        evolver = Evolver(self.fitness_function, self.genome_params, self.selection_strategy)
+
+        evolver.evolve(
+            generation_params={**self.generation_params, "grid_shape": (2, 6)},
+            initial_population=initial_population,
+            stop_conditions={"n_generations": 2},
+            logging_options=self.logging_options,
+        )
+
+        grid, neighborhoods, n_columns = mock_breed_cells.call_args[0]
+        self.assertListEqual([genome for fitness, genome in grid], initial_population)
+        self.assertListEqual(neighborhoods, get_grid_neighborhoods((2, 6)))
+        self.assertEqual(n_columns, 6)
+
+    def test_cells_only_improve_with_if_better_replacement(self):
+        """evolve in cellular mode with 'if_better' replacement keeps the individual of a cell unless its offspring is more fit"""
+        initial_population = [{"gene1": [10] * 5}] + [{"gene1": [0] * 5} for _ in range(11)]
+        evolver = Evolver(self.fitness_function, self.genome_params, self.selection_strategy)
+
+        fitness_results = evolver.evolve(
+            generation_params=self.generation_params,
+            initial_population=initial_population,
+            stop_conditions={"n_generations": 5},
+            logging_options=self.logging_options,
+        )
+
+        fitness_scores = [fitness for fitness, genome in fitness_results]
+        self.assertEqual(len(fitness_results), self.generation_params["population_size"])
+        self.assertListEqual(fitness_scores, sorted(fitness_scores))
+        self.assertEqual(fitness_scores[-1], 50)
+        self.assertGreaterEqual(fitness_scores[0], 0)
+
+    def test_parallel_breeding_gives_the_same_results_as_serial_breeding(self):
+        """evolve in cellular mode with a seed gives the same results whether rows of the grid are bred in the main process or in breeding workers"""
+        evolver = Evolver(self.fitness_function, self.genome_params, self.selection_strategy)
+
+        results = [
+            evolver.evolve(
+                generation_params={**self.generation_params, "n_breeding_workers": n_workers},
+                stop_conditions={"n_generations": 4},
+                logging_options=self.logging_options,
+                seed=5,
+            )
+            for n_workers in (1, 2)
+        ]
+
+        self.assertListEqual(results[0], results[1])
+
+
+class EvolverDifferentialEvolutionTest(EvolverModeTestCase):
+    def setUp(self):
+        super().setUp()
+        self.fitness_function = Mock(
+            side_effect=lambda genome: sum(value ** 2 for value in genome["gene1"])
+        )
+        self.genome_params = get_float_genome_params(type="[float]", size=3)
+        self.generation_params = {"population_size": 10, "mode": "differential_evolution"}
+
+    def test_asserts_genes_and_strategy_are_valid(self):
+        """evolve raises a ValueError in differential_evolution mode if a gene is not a float gene or the strategy is not valid"""
+        evolver = Evolver(self.fitness_function, {"gene1": {"type": "int"}}, {})
+
+        with self.assertRaises(ValueError):
+            evolver.evolve(
+                generation_params=self.generation_params, initial_population=[{"gene1": 1}] * 10
+            )
+
+        evolver = Evolver(self.fitness_function, self.genome_params, {})
+        with self.assertRaises(ValueError):
+            evolver.evolve(
+                generation_params={
+                    **self.generation_params,
+                    "differential_evolution": {"strategy": "unknown"},
+                }
+            )
+
+    def test_evaluates_one_trial_per_genome_in_each_generation(self):
+        """evolve in differential_evolution mode evaluates the initial population and then one trial genome per genome in each generation"""
+        n_generations = 4
+        evolver = Evolver(self.fitness_function, self.genome_params, {})
+
+        evolver.evolve(
+            generation_params=self.generation_params,
+            stop_conditions={"n_generations": n_generations},
+            logging_options=self.logging_options,
+        )
+
+        self.assertEqual(self.fitness_function.call_count, n_generations * 10)
+
+    def test_best_fitness_never_gets_worse(self):
+        """evolve in differential_evolution mode only replaces genomes by trials that are at least as fit, so the best fitness never gets worse, and returns a sorted population"""
+        evolver = Evolver(
+            self.fitness_function, self.genome_params, {}, should_maximize_fitness=False
+        )
+
+        with patch.object(StorageManager, "update_storage") as mock_update_storage:
+            fitness_results = evolver.evolve(
+                generation_params=self.generation_params,
+                stop_conditions={"n_generations": 20},
+                logging_options=self.logging_options,
+                seed=0,
+            )
+
+        best_fitnesses = [c[0][1][-1][0] for c in mock_update_storage.call_args_list]
+        self.assertListEqual(best_fitnesses, sorted(best_fitnesses, reverse=True))
+        fitness_scores = [fitness for fitness, genome in fitness_results]
+        self.assertListEqual(fitness_scores, sorted(fitness_scores, reverse=True))
+        self.assertEqual(len(fitness_results), 10)
+
+
+class EvolverEvolutionStrategyTest(EvolverModeTestCase):
+    def setUp(self):
+        super().setUp()
+        self.fitness_function = Mock(
+            side_effect=lambda genome: sum(value ** 2 for value in genome["gene1"])
+        )
+        self.genome_params = get_float_genome_params(type="[float]", size=3)
+        self.generation_params = {"population_size": 8, "mode": "evolution_strategy"}
+
+    def test_asserts_genes_and_strategy_are_valid(self):
+        """evolve raises a ValueError in evolution_strategy mode if a gene is not a float gene or the strategy is not valid"""
+        evolver = Evolver(self.fitness_function, {"gene1": {"type": "int"}}, {})
+
+        with self.assertRaises(ValueError):
+            evolver.evolve(
+                generation_params=self.generation_params, initial_population=[{"gene1": 1}] * 8
+            )
+
+        evolver = Evolver(self.fitness_function, self.genome_params, {})
+        with self.assertRaises(ValueError):
+            evolver.evolve(
+                generation_params={
+                    **self.generation_params,
+                    "evolution_strategy": {"n_parents": 9},
+                }
+            )
+
+    def test_evaluates_population_size_offspring_in_each_generation(self):
+        """evolve in evolution_strategy mode evaluates the initial population and then population_size offspring in each generation"""
+        n_generations = 4
+        evolver = Evolver(self.fitness_function, self.genome_params, {})
+
+        evolver.evolve(
+            generation_params=self.generation_params,
+            stop_conditions={"n_generations": n_generations},
+            logging_options=self.logging_options,
+        )
+
+        self.assertEqual(self.fitness_function.call_count, n_generations * 8)
+
+    def test_comma_selection_reports_offspring_only(self):
+        """evolve in evolution_strategy mode with comma selection reports and returns the sorted offspring of each generation"""
+        evolver = Evolver(
+            self.fitness_function, self.genome_params, {}, should_maximize_fitness=False
+        )
+
+        fitness_results = evolver.evolve(
+            generation_params={
+                **self.generation_params,
+                "evolution_strategy": {"selection": "comma", "n_parents": 2},
+            },
+            stop_conditions={"n_generations": 5},
+            logging_options=self.logging_options,
+            seed=0,
+        )
+
+        fitness_scores = [fitness for fitness, genome in fitness_results]
+        self.assertListEqual(fitness_scores, sorted(fitness_scores, reverse=True))
+        self.assertEqual(len(fitness_results), 8)
+
+    def test_plus_selection_never_loses_the_best_genome(self):
+        """evolve in evolution_strategy mode with plus selection selects parents from the parents and offspring, so the best fitness never gets worse"""
+        evolver = Evolver(
+            self.fitness_function, self.genome_params, {}, should_maximize_fitness=False
+        )
+
+        with patch.object(StorageManager, "update_storage") as mock_update_storage:
+            fitness_results = evolver.evolve(
+                generation_params={
+                    **self.generation_params,
+                    "evolution_strategy": {
+                        "selection": "plus",
+                        "n_parents": 2,
+                        "step_size_adaptation": "one_fifth",
+                    },
+                },
+                stop_conditions={"n_generations": 20},
+                logging_options=self.logging_options,
+                seed=0,
+            )
+
+        best_fitnesses = [c[0][1][-1][0] for c in mock_update_storage.call_args_list]
+        self.assertListEqual(best_fitnesses, sorted(best_fitnesses, reverse=True))
+        self.assertEqual(len(fitness_results), 2 + 8)
+
+    def test_converges_on_a_sphere(self):
+        """evolve in evolution_strategy mode adapts the step size so that the best genome approaches the optimum of a sphere function"""
+        evolver = Evolver(
+            self.fitness_function, self.genome_params, {}, should_maximize_fitness=False
+        )
+
+        fitness_results = evolver.evolve(
+            generation_params=self.generation_params,
+            stop_conditions={"n_generations": 100},
+            logging_options=self.logging_options,
+            seed=1,
+        )
+
+        self.assertLess(fitness_results[-1][0], 1e-6)
+
+
+class EvolverNSGA2Test(EvolverModeTestCase):
+    def setUp(self):
+        super().setUp()
+        self.fitness_function = Mock(
+            side_effect=lambda genome: (genome["gene1"] ** 2, (genome["gene1"] - 2) ** 2)
+        )
+        self.genome_params = get_float_genome_params(
+            crossover_function=lambda parent_genes: sum(parent_genes) / len(parent_genes),
+            mutation_function=lambda value: value + random.gauss(0, 0.5),
+            mutation_rate=1,
+        )
+        self.generation_params = {"population_size": 20, "mode": "nsga2"}
+
+    def test_evaluates_population_size_offspring_in_each_generation(self):
+        """evolve in nsga2 mode evaluates the initial population and then population_size offspring in each generation"""
+        n_generations = 3
+        evolver = Evolver(self.fitness_function, self.genome_params, {})
+
+        fitness_results = evolver.evolve(
+            generation_params=self.generation_params,
+            stop_conditions={"n_generations": n_generations},
+            logging_options=self.logging_options,
+        )
+
+        self.assertEqual(self.fitness_function.call_count, n_generations * 20)
+        self.assertEqual(len(fitness_results), 20)
+        self.assertTrue(all(isinstance(fitness, tuple) for fitness, genome in fitness_results))
+
+    def test_converges_to_the_pareto_front(self):
+        """evolve in nsga2 mode returns a population whose genomes approach the Pareto front (0 <= gene1 <= 2) and spread along it, ordered with the first front last"""
+        evolver = Evolver(
+            self.fitness_function, self.genome_params, {}, should_maximize_fitness=False
+        )
+
+        with patch.object(StorageManager, "update_storage") as mock_update_storage:
+            fitness_results = evolver.evolve(
+                generation_params=self.generation_params,
+                stop_conditions={"n_generations": 30},
+                logging_options=self.logging_options,
+                seed=0,
+            )
+
+        genes = [genome["gene1"] for fitness, genome in fitness_results]
+        self.assertTrue(all(-0.1 <= gene <= 2.1 for gene in genes))
+        self.assertLess(min(genes), 0.5)
+        self.assertGreater(max(genes), 1.5)
+        self.assertIs(mock_update_storage.call_args[0][1], fitness_results)
+
+    def test_asserts_local_search_is_not_given(self):
+        """evolve raises a ValueError in nsga2 mode if a local search is given"""
+        evolver = Evolver(self.fitness_function, self.genome_params, {})
+
+        with self.assertRaises(ValueError):
+            evolver.evolve(
+                generation_params={**self.generation_params, "local_search": {"function": Mock()}}
+            )
+
+    def test_asserts_hall_of_fame_is_not_given(self):
+        """evolve raises a ValueError in nsga2 mode if a hall of fame is given"""
+        evolver = Evolver(self.fitness_function, self.genome_params, {})
+
+        with self.assertRaises(ValueError):
+            evolver.evolve(
+                generation_params=self.generation_params,
+                storage_options={"hall_of_fame": {"size": 5}},
+            )
+
+
+class EvolverHallOfFameTest(EvolverModeTestCase):
+    def setUp(self):
+        super().setUp()
+        self.genome_params["gene1"].update(
+            size=3,
+            crossover_function=lambda parent_genes: random.choice(parent_genes),
+            mutation_function=lambda value: random.randint(0, 10),
+            mutation_rate=0.5,
+        )
+        self.selection_strategy["pool"]["random"] = 2
+
+    def test_returns_the_most_fit_unique_genomes_of_all_generations(self):
+        """evolve returns the hall of fame after the fitness results if a hall of fame size is given, holding the most fit unique genomes of all generations sorted with the most fit last"""
+        evolver = Evolver(self.fitness_function, self.genome_params, self.selection_strategy)
+        update_storage = StorageManager.update_storage
+
+        with patch.object(StorageManager, "update_storage", autospec=True) as mock_update:
+            mock_update.side_effect = update_storage
+            fitness_results, hall_of_fame = evolver.evolve(
+                generation_params={"population_size": 10},
+                stop_conditions={"n_generations": 10},
+                storage_options={"hall_of_fame": {"size": 5}},
+                logging_options=self.logging_options,
+                seed=0,
+            )
+
+        all_results = [result for args in mock_update.call_args_list for result in args[0][2]]
+        unique_scores = {}
+        for fitness, genome in all_results:
+            unique_scores[tuple(genome["gene1"])] = fitness
+        self.assertEqual(len(fitness_results), 10)
+        self.assertEqual(len(hall_of_fame), 5)
+        self.assertEqual(len({tuple(genome["gene1"]) for _, genome in hall_of_fame}), 5)
+        self.assertListEqual(
+            [fitness for fitness, genome in hall_of_fame], sorted(unique_scores.values())[-5:]
+        )
+
+    @patch.object(PopulationGenerator, "close", autospec=True)
+    def test_hall_of_fame_does_not_remember_genome_hashes(self, mock_close):
+        """evolve gives the hall of fame a hash function that does not remember the hashes of the genomes it archives in the population generator, which would otherwise only forget them when breeding"""
+        evolver = Evolver(self.fitness_function, self.genome_params, self.selection_strategy)
+        n_remembered_hashes = []
+        mock_close.side_effect = lambda population_generator: n_remembered_hashes.append(
+            len(population_generator._genome_hashes)
+        )
+
+        evolver.evolve(
+            generation_params={"population_size": 10},
+            stop_conditions={"n_generations": 1},
+            storage_options={"hall_of_fame": {"size": 5}},
+            logging_options=self.logging_options,
+        )
+
+        self.assertListEqual(n_remembered_hashes, [0])
+
+    def test_returns_hall_of_fame_after_fitness_history(self):
+        """evolve returns the fitness results, fitness history, and hall of fame if fitness is stored in memory and a hall of fame size is given"""
+        evolver = Evolver(self.fitness_function, self.genome_params, self.selection_strategy)
+
+        fitness_results, fitness_history, hall_of_fame = evolver.evolve(
+            generation_params={"population_size": 10},
+            stop_conditions={"n_generations": 3},
+            storage_options={
+                "fitness": {"should_record_fitness": True, "format": "memory"},
+                "hall_of_fame": {"size": 2},
+            },
+            logging_options=self.logging_options,
+        )
+
+        self.assertEqual(len(fitness_history), 3)
+        self.assertEqual(len(hall_of_fame), 2)
+        self.assertGreaterEqual(hall_of_fame[-1][0], fitness_results[-1][0])
+
+
+class EvolverRestartTest(EvolverModeTestCase):
+    def setUp(self):
+        super().setUp()
+        self.fitness_function = Mock(return_value=1)
+        self.genome_params = get_float_genome_params()
+        self.selection_strategy["pool"]["top"] = 4
+
+    def test_asserts_mode_and_grid_shape_are_valid(self):
+        """evolve raises a ValueError if a restart is given in asynchronous or nsga2 mode, if the restart is invalid, or if an 'ipop' restart is given with a grid shape"""
+        evolver = Evolver(self.fitness_function, self.genome_params, self.selection_strategy)
+
+        invalid_generation_params = [
+            {"mode": "asynchronous", "restart": {}},
+            {"mode": "nsga2", "restart": {}},
+            {"restart": {"policy": "random"}},
+            {"mode": "cellular", "grid_shape": (2, 5), "restart": {"policy": "ipop"}},
+        ]
+        for generation_params in invalid_generation_params:
+            with self.assertRaises(ValueError):
+                evolver.evolve(
+                    generation_params={"population_size": 10, **generation_params},
+                    logging_options=self.logging_options,
+                )
+
+    def test_restarts_after_stagnation_window_and_numbers_generations_on(self):
+        """evolve restarts from a new population once the best fitness has not improved for stagnation_window generations, numbering generations on across restarts"""
+        evolver = Evolver(self.fitness_function, self.genome_params, self.selection_strategy)
+
+        with patch.object(StorageManager, "update_storage") as mock_update_storage, patch.object(
+            RestartStrategy, "restart", autospec=True, side_effect=RestartStrategy.restart
+        ) as mock_restart:
+            evolver.evolve(
+                generation_params={"population_size": 10, "restart": {"stagnation_window": 3}},
+                stop_conditions={"n_generations": 10},
+                logging_options=self.logging_options,
+            )
+
+        generation_nums = [args[0][0] for args in mock_update_storage.call_args_list]
+        self.assertListEqual(generation_nums, list(range(10)))
+        self.assertEqual(mock_restart.call_count, 2)
+
+    def test_ipop_restarts_double_the_population_size(self):
+        """evolve with 'ipop' restarts doubles the population size on each restart, in every mode that supports restarts"""
+        for mode in ["generational", "steady_state", "cellular"]:
+            evolver = Evolver(self.fitness_function, self.genome_params, self.selection_strategy)
+
+            fitness_results = evolver.evolve(
+                generation_params={
+                    "population_size": 10,
+                    "mode": mode,
+                    "restart": {"policy": "ipop", "stagnation_window": 2, "max_restarts": 2},
+                },
+                stop_conditions={"n_generations": 10},
+                logging_options=self.logging_options,
+            )
+
+            self.assertEqual(len(fitness_results), 40)
+
+
+class EvolverPopulationSizeScheduleTest(EvolverModeTestCase):
+    def setUp(self):
+        super().setUp()
+        self.fitness_function = Mock(side_effect=lambda genome: genome["gene1"])
+        self.genome_params = get_float_genome_params()
+        self.selection_strategy["pool"]["top"] = 4
+        self.schedule = {"type": "linear", "final_population_size": 10, "n_generations": 3}
+
+    def test_asserts_mode_is_generational_and_restart_is_not_given(self):
+        """evolve raises a ValueError if a population size schedule is given in a mode other than generational, or with a restart"""
+        evolver = Evolver(self.fitness_function, self.genome_params, self.selection_strategy)
+
+        invalid_generation_params = [
+            {"mode": "steady_state", "population_size_schedule": self.schedule},
+            {"restart": {}, "population_size_schedule": self.schedule},
+        ]
+        for generation_params in invalid_generation_params:
+            with self.assertRaises(ValueError):
+                evolver.evolve(
+                    generation_params={"population_size": 40, **generation_params},
+                    logging_options=self.logging_options,
+                )
+
+    def test_evaluates_the_scheduled_population_sizes(self):
+        """evolve evaluates generations of the scheduled sizes, starting at population_size"""
+        evolver = Evolver(self.fitness_function, self.genome_params, self.selection_strategy)
+
+        fitness_results = evolver.evolve(
+            generation_params={"population_size": 40, "population_size_schedule": self.schedule},
+            stop_conditions={"n_generations": 5},
+            logging_options=self.logging_options,
+        )
+
+        self.assertEqual(self.fitness_function.call_count, 40 + 30 + 20 + 10 + 10)
+        self.assertEqual(len(fitness_results), 10)
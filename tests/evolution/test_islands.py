@@ -0,0 +1,178 @@
+import random
+import logging
+import unittest
+
+from holland.evolution.evolution import Evolver
+from holland.evolution.islands import *
+
+
+def count_ones(genome):
+    return sum(genome["gene1"])
+
+
+def fail(genome):
+    raise ZeroDivisionError("fitness function failed")
+
+
+class GetMigrationTopologyTest(unittest.TestCase):
+    def test_ring_sends_to_the_next_island(self):
+        """get_migration_topology connects each island to the next in a ring"""
+        self.assertListEqual(get_migration_topology(4, "ring"), [[1], [2], [3], [0]])
+        self.assertListEqual(get_migration_topology(1, "ring"), [[]])
+
+    def test_fully_connected_sends_to_every_other_island(self):
+        """get_migration_topology connects each island to every other island if fully connected"""
+        self.assertListEqual(
+            get_migration_topology(3, "fully_connected"), [[1, 2], [0, 2], [0, 1]]
+        )
+
+    def test_grid_sends_to_adjacent_islands_on_a_torus(self):
+        """get_migration_topology connects each island to the islands above, below, left, and right of it on a toroidal grid"""
+        destinations = get_migration_topology(9, "grid")
+
+        self.assertListEqual(destinations[0], [1, 2, 3, 6])
+        self.assertListEqual(destinations[4], [1, 3, 5, 7])
+
+    def test_grid_uses_given_shape(self):
+        """get_migration_topology uses grid_shape and raises a ValueError if it does not have one cell per island"""
+        self.assertListEqual(get_migration_topology(4, "grid", (1, 4))[0], [1, 3])
+
+        with self.assertRaises(ValueError):
+            get_migration_topology(4, "grid", (3, 3))
+
+    def test_asserts_topology_is_valid(self):
+        """get_migration_topology raises a ValueError if topology is not 'ring', 'grid', or 'fully_connected'"""
+        with self.assertRaises(ValueError):
+            get_migration_topology(4, "star")
+
+
+class IslandModelTest(unittest.TestCase):
+    def setUp(self):
+        genome_params = {
+            "gene1": {
+                "type": "[bool]",
+                "size": 20,
+                "initial_distribution": lambda: random.random() < 0.5,
+                "crossover_function": lambda genes: genes[0][:10] + genes[1][10:],
+                "mutation_function": lambda value: not value,
+                "mutation_rate": 0.05,
+            }
+        }
+        selection_strategy = {"pool": {"top": 5}, "parents": {"weighting_function": lambda x: x}}
+        self.evolver = Evolver(count_ones, genome_params, selection_strategy)
+        self.failing_evolver = Evolver(fail, genome_params, selection_strategy)
+        self.generation_params = {"population_size": 10, "n_elite": 1}
+        self.stop_conditions = {"n_generations": 6}
+        self.logging_options = {"level": logging.CRITICAL}
+
+    def test_asserts_parameters_are_valid(self):
+        """__init__ raises a ValueError if n_islands, interval, or n_migrants is invalid"""
+        with self.assertRaises(ValueError):
+            IslandModel(self.evolver, 0)
+        with self.assertRaises(ValueError):
+            IslandModel(self.evolver, 2, {"interval": 0})
+        with self.assertRaises(ValueError):
+            IslandModel(self.evolver, 2, {"n_migrants": -1})
+
+    def test_asserts_islands_receive_fewer_migrants_than_population_size(self):
+        """evolve raises a ValueError if an island could receive as many migrants as its population size"""
+        island_model = IslandModel(self.evolver, 6, {"topology": "fully_connected", "n_migrants": 2})
+
+        with self.assertRaises(ValueError):
+            island_model.evolve(self.generation_params, logging_options=self.logging_options)
+
+    def test_asserts_mode_is_generational(self):
+        """evolve raises a ValueError if generation_params["mode"] is not "generational\""""
+        island_model = IslandModel(self.evolver, 2)
+
+        with self.assertRaises(ValueError):
+            island_model.evolve(
+                {**self.generation_params, "mode": "steady_state"},
+                logging_options=self.logging_options,
+            )
+
+    def test_asserts_restart_is_not_given(self):
+        """evolve raises a ValueError if generation_params["restart"] is given"""
+        island_model = IslandModel(self.evolver, 2)
+
+        with self.assertRaises(ValueError):
+            island_model.evolve(
+                {**self.generation_params, "restart": {"stagnation_window": 5}},
+                logging_options=self.logging_options,
+            )
+
+    def test_asserts_population_size_schedule_is_not_given(self):
+        """evolve raises a ValueError if generation_params["population_size_schedule"] is given"""
+        island_model = IslandModel(self.evolver, 2)
+        schedule = {"type": "linear", "final_population_size": 2, "n_generations": 5}
+
+        with self.assertRaises(ValueError):
+            island_model.evolve(
+                {**self.generation_params, "population_size_schedule": schedule},
+                logging_options=self.logging_options,
+            )
+
+    def test_route_migrants_follows_topology(self):
+        """route_migrants sends the emigrants of each island to each of its destinations"""
+        island_model = IslandModel(self.evolver, 3, {"topology": "ring"})
+
+        immigrants = island_model.route_migrants([["a"], ["b"], ["c"]])
+
+        self.assertListEqual(immigrants, [["c"], ["a"], ["b"]])
+
+    def test_returns_results_of_all_islands_and_statistics(self):
+        """evolve returns the sorted fitness results of every island and fitness statistics for each generation of each island"""
+        island_model = IslandModel(self.evolver, 3, {"interval": 2, "n_migrants": 2})
+
+        fitness_results, island_statistics = island_model.evolve(
+            self.generation_params,
+            self.stop_conditions,
+            logging_options=self.logging_options,
+            seed=0,
+        )
+
+        self.assertEqual(len(fitness_results), 30)
+        fitness_scores = [fitness for fitness, genome in fitness_results]
+        self.assertListEqual(fitness_scores, sorted(fitness_scores))
+        self.assertEqual(len(island_statistics), 3)
+        for statistics in island_statistics:
+            self.assertListEqual([s["generation"] for s in statistics], list(range(6)))
+
+    def test_is_reproducible_with_seed(self):
+        """evolve returns the same results for the same seed"""
+        island_model = IslandModel(self.evolver, 2, {"topology": "fully_connected", "interval": 2})
+
+        results = [
+            island_model.evolve(
+                self.generation_params,
+                self.stop_conditions,
+                logging_options=self.logging_options,
+                seed=1,
+            )
+            for _ in range(2)
+        ]
+
+        self.assertEqual(results[0], results[1])
+
+    def test_stops_all_islands_at_target_fitness(self):
+        """evolve stops every island at the first migration at which any island has reached target_fitness"""
+        island_model = IslandModel(self.evolver, 2, {"interval": 1})
+
+        fitness_results, island_statistics = island_model.evolve(
+            self.generation_params,
+            {"n_generations": 50, "target_fitness": 20},
+            logging_options=self.logging_options,
+            seed=2,
+        )
+
+        n_generations = len(island_statistics[0])
+        self.assertEqual(len(island_statistics[1]), n_generations)
+        self.assertTrue(n_generations == 50 or fitness_results[-1][0] == 20)
+        self.assertTrue(all(s["max"] < 20 for s in island_statistics[0][:-1]))
+
+    def test_reraises_errors_from_islands(self):
+        """evolve raises the errors raised in island processes"""
+        island_model = IslandModel(self.failing_evolver, 2)
+
+        with self.assertRaises(ZeroDivisionError):
+            island_model.evolve(self.generation_params, logging_options=self.logging_options)
@@ -1,7 +1,9 @@
+import math
 import unittest
 from unittest.mock import patch, Mock, call
 
 from holland.evolution.mutation import *
+from holland.utils import DescribedMutation
 
 
 class MutatorMutateGenomeTest(unittest.TestCase):
@@ -45,6 +47,75 @@ class MutatorMutateGenomeTest(unittest.TestCase):
         self.assertDictEqual(mutated_genome, expected_mutated_genome)
 
 
+    @patch.object(Mutator, "mutate_gene", side_effect=lambda gene, gene_params: gene)
+    def test_returns_the_given_genome_if_no_gene_is_mutated(self, mock_mutate_gene):
+        """mutate_genome returns the given genome (not a copy) if none of its genes are mutated"""
+        mutated_genome = self.mutator.mutate_genome(self.genome)
+
+        self.assertIs(mutated_genome, self.genome)
+
+    @patch.object(Mutator, "mutate_gene")
+    def test_shares_unmutated_genes_with_the_given_genome(self, mock_mutate_gene):
+        """mutate_genome returns a new genome that shares the genes that were not mutated with the given genome"""
+        mutated_gene1 = [11, 22, 33, 44, 55]
+        mock_mutate_gene.side_effect = [mutated_gene1, self.genome["gene2"], self.genome["gene3"]]
+
+        mutated_genome = self.mutator.mutate_genome(self.genome)
+
+        self.assertIsNot(mutated_genome, self.genome)
+        self.assertIs(mutated_genome["gene1"], mutated_gene1)
+        self.assertIs(mutated_genome["gene2"], self.genome["gene2"])
+        self.assertIs(mutated_genome["gene3"], self.genome["gene3"])
+        self.assertEqual(self.genome["gene1"], [1, 2, 3, 4, 5])
+
+
+class MutatorMutateGenomeWithChangesTest(unittest.TestCase):
+    def setUp(self):
+        self.genome = {"gene1": [0, 1, 2], "gene2": 5, "gene3": True}
+        self.genome_params = {
+            "gene1": {"type": "permutation"},
+            "gene2": {"type": "int"},
+            "gene3": {"type": "bool"},
+        }
+        self.mutator = Mutator(self.genome_params)
+
+    @patch.object(Mutator, "mutate_gene")
+    def test_returns_mutated_genome_and_described_changes(self, mock_mutate_gene):
+        """mutate_genome_with_changes unwraps described mutations and returns the mutated genome with a dictionary of changes for the mutated genes"""
+        mock_mutate_gene.side_effect = [
+            DescribedMutation([1, 0, 2], ("swap", 0, 1)),
+            self.genome["gene2"],
+            DescribedMutation(False, "flip"),
+        ]
+
+        mutated_genome, changes = self.mutator.mutate_genome_with_changes(self.genome)
+
+        self.assertDictEqual(mutated_genome, {"gene1": [1, 0, 2], "gene2": 5, "gene3": False})
+        self.assertDictEqual(changes, {"gene1": ("swap", 0, 1), "gene3": "flip"})
+
+    @patch.object(Mutator, "mutate_gene")
+    def test_returns_None_for_changes_if_any_mutation_is_not_described(self, mock_mutate_gene):
+        """mutate_genome_with_changes returns None for the changes if any gene is mutated without a description"""
+        mock_mutate_gene.side_effect = [
+            DescribedMutation([1, 0, 2], ("swap", 0, 1)),
+            6,
+            self.genome["gene3"],
+        ]
+
+        mutated_genome, changes = self.mutator.mutate_genome_with_changes(self.genome)
+
+        self.assertDictEqual(mutated_genome, {"gene1": [1, 0, 2], "gene2": 6, "gene3": True})
+        self.assertIsNone(changes)
+
+    @patch.object(Mutator, "mutate_gene", side_effect=lambda gene, gene_params: gene)
+    def test_returns_the_given_genome_and_no_changes_if_no_gene_is_mutated(self, mock_mutate_gene):
+        """mutate_genome_with_changes returns the given genome and an empty dictionary of changes if no gene is mutated"""
+        mutated_genome, changes = self.mutator.mutate_genome_with_changes(self.genome)
+
+        self.assertIs(mutated_genome, self.genome)
+        self.assertDictEqual(changes, {})
+
+
 class MutatorMutateGeneTest(unittest.TestCase):
     def setUp(self):
         self.gene_params = {"mutation_function": Mock(), "mutation_rate": 0.01}
@@ -161,6 +232,156 @@ class MutatorMutateGeneTest(unittest.TestCase):
         self.assertListEqual(mutated_gene, expected_mutated_gene)
 
 
+    @patch.object(Mutator, "probabilistically_apply_mutation", side_effect=lambda v, gp: v)
+    def test_returns_the_given_gene_if_no_value_is_mutated(self, mock_apply_mutation):
+        """mutate_gene returns the given gene (not a copy) if none of its values are mutated"""
+        gene = [1.5, 2.5, 3.5]
+        gene_params = {**self.gene_params, "type": "[float]"}
+        mutator = Mutator({})
+
+        mutated_gene = mutator.mutate_gene(gene, gene_params)
+
+        self.assertIs(mutated_gene, gene)
+
+    @patch.object(Mutator, "probabilistically_apply_mutation")
+    def test_does_not_modify_the_given_gene(self, mock_apply_mutation):
+        """mutate_gene builds a new gene rather than modifying the given gene if a value is mutated"""
+        gene = [1.5, 2.5, 3.5]
+        mock_apply_mutation.side_effect = [gene[0], 10.5, gene[2]]
+        gene_params = {**self.gene_params, "type": "[float]"}
+        mutator = Mutator({})
+
+        mutated_gene = mutator.mutate_gene(gene, gene_params)
+
+        self.assertListEqual(mutated_gene, [1.5, 10.5, 3.5])
+        self.assertListEqual(gene, [1.5, 2.5, 3.5])
+
+    @patch.object(Mutator, "probabilistically_apply_mutation")
+    def test_describes_changes_by_index_if_every_mutated_value_is_described(
+        self, mock_apply_mutation
+    ):
+        """mutate_gene returns a DescribedMutation with a dictionary mapping index to change if every mutated value of a list-type gene is described"""
+        gene = [1.5, 2.5, 3.5]
+        mock_apply_mutation.side_effect = [
+            DescribedMutation(0.5, "down"),
+            gene[1],
+            DescribedMutation(4.5, "up"),
+        ]
+        gene_params = {**self.gene_params, "type": "[float]"}
+        mutator = Mutator({})
+
+        mutated_gene = mutator.mutate_gene(gene, gene_params)
+
+        self.assertEqual(mutated_gene, DescribedMutation([0.5, 2.5, 4.5], {0: "down", 2: "up"}))
+
+    @patch.object(Mutator, "probabilistically_apply_mutation")
+    def test_does_not_describe_changes_if_any_mutated_value_is_not_described(
+        self, mock_apply_mutation
+    ):
+        """mutate_gene returns a plain list if any mutated value of a list-type gene is not described"""
+        gene = [1.5, 2.5, 3.5]
+        mock_apply_mutation.side_effect = [DescribedMutation(0.5, "down"), 3, gene[2]]
+        gene_params = {**self.gene_params, "type": "[float]"}
+        mutator = Mutator({})
+
+        mutated_gene = mutator.mutate_gene(gene, gene_params)
+
+        self.assertNotIsInstance(mutated_gene, DescribedMutation)
+        self.assertListEqual(mutated_gene, [0.5, 3, 3.5])
+
+
+class MutatorSelfAdaptationTest(unittest.TestCase):
+    def setUp(self):
+        self.gene_params = {
+            "type": "[float]",
+            "size": 4,
+            "min": -1,
+            "max": 1,
+            "self_adaptation": {"min_step_size": 0.01},
+        }
+
+    def test_mutates_self_adaptive_genes_with_their_strategy(self):
+        """mutate_genome_with_changes mutates a self-adaptive gene together with its strategy parameters and does not describe the changes"""
+        genome = {"gene1": [0.0] * 4, "gene1_strategy": [0.5] * 4}
+        mutator = Mutator({"gene1": self.gene_params})
+
+        with patch.object(
+            Mutator, "mutate_self_adaptive_gene", return_value=([0.1] * 4, [0.4] * 4)
+        ) as mock_mutate:
+            mutated_genome, changes = mutator.mutate_genome_with_changes(genome)
+
+        mock_mutate.assert_called_once_with(genome["gene1"], genome["gene1_strategy"], self.gene_params)
+        self.assertDictEqual(mutated_genome, {"gene1": [0.1] * 4, "gene1_strategy": [0.4] * 4})
+        self.assertIsNone(changes)
+        self.assertListEqual(genome["gene1"], [0.0] * 4)
+
+    def test_uses_the_initial_strategy_if_genome_has_none(self):
+        """mutate_genome_with_changes mutates a self-adaptive gene of a genome without strategy parameters with the initial strategy parameters"""
+        gene_params = {**self.gene_params, "self_adaptation": {"initial_step_size": 0.3}}
+        mutator = Mutator({"gene1": gene_params})
+
+        with patch.object(
+            Mutator, "mutate_self_adaptive_gene", return_value=([0.1] * 4, [0.4] * 4)
+        ) as mock_mutate:
+            mutator.mutate_genome_with_changes({"gene1": [0.0] * 4})
+
+        self.assertListEqual(mock_mutate.call_args[0][1], [0.3] * 4)
+
+    def test_mutates_step_sizes_log_normally_and_values_with_them(self):
+        """mutate_self_adaptive_gene multiplies each step size by the exponential of a gaussian sample, bounds it below by min_step_size, and moves each value by a gaussian sample scaled by its new step size"""
+        mutator = Mutator({})
+        samples = [0.0, 1.0, -1.0, 0.0, -100.0, 1.0, 1.0, 1.0, 1.0]
+
+        with patch("random.gauss", side_effect=lambda mu, sigma: samples.pop(0)):
+            values, step_sizes = mutator.mutate_self_adaptive_gene(
+                [0.0, 0.0, 0.0, 0.95], [0.5] * 4, self.gene_params
+            )
+
+        learning_rate = 1 / math.sqrt(2 * math.sqrt(4))
+        expected_step_sizes = [
+            0.5 * math.exp(learning_rate),
+            0.5 * math.exp(-learning_rate),
+            0.5,
+            0.01,
+        ]
+        for step_size, expected_step_size in zip(step_sizes, expected_step_sizes):
+            self.assertAlmostEqual(step_size, expected_step_size)
+        for value, expected_value in zip(values, expected_step_sizes[:3] + [0.96]):
+            self.assertAlmostEqual(value, expected_value)
+
+    def test_bounds_mutated_values(self):
+        """mutate_self_adaptive_gene bounds mutated values to the minimum and maximum of the gene and rounds them for int genes"""
+        gene_params = {"type": "int", "min": 0, "max": 10, "self_adaptation": {}}
+        mutator = Mutator({})
+
+        with patch("random.gauss", return_value=3.0):
+            value, step_size = mutator.mutate_self_adaptive_gene(9, 1.0, gene_params)
+
+        self.assertEqual(value, 10)
+        self.assertIsInstance(value, int)
+        self.assertGreater(step_size, 1.0)
+
+    def test_adapts_mutation_rate_of_non_numeric_genes(self):
+        """mutate_self_adaptive_gene mutates the mutation rate of a non-numeric gene by the logistic-normal rule and mutates the gene with the new rate"""
+        gene_params = {
+            "type": "[bool]",
+            "size": 3,
+            "mutation_function": lambda value: not value,
+            "mutation_rate": 0.1,
+            "self_adaptation": {"learning_rate": 1},
+        }
+        mutator = Mutator({})
+
+        with patch("random.gauss", return_value=math.log(3)), patch.object(
+            Mutator, "mutate_gene", return_value=[True] * 3
+        ) as mock_mutate_gene:
+            gene, mutation_rate = mutator.mutate_self_adaptive_gene([False] * 3, 0.25, gene_params)
+
+        self.assertAlmostEqual(mutation_rate, 0.5)
+        self.assertListEqual(gene, [True] * 3)
+        self.assertAlmostEqual(mock_mutate_gene.call_args[0][1]["mutation_rate"], 0.5)
+
+
 class MutatorProbabilisticallyMutateValueTest(unittest.TestCase):
     def test_calls_mutation_function_according_to_mutation_rate(self):
         """probabilistically_apply_mutation calls the mutation_function according to the given mutation_rate"""
@@ -367,3 +588,34 @@ class MutatorProbabilisticallyMutateValueTest(unittest.TestCase):
             output = mutator.probabilistically_apply_mutation(value, gene_params)
 
             self.assertTrue(isinstance(output, int))
+
+    @patch("random.random", return_value=0.01)
+    def test_returns_described_mutation_if_mutation_function_describes_change(self, mock_random):
+        """probabilistically_apply_mutation returns a DescribedMutation of the bounded value if the mutation function returns a DescribedMutation that bounding does not change"""
+        gene_params = {
+            "mutation_function": Mock(return_value=DescribedMutation(3, ("add", 2))),
+            "mutation_rate": 0.1,
+            "type": "int",
+            "max": 10,
+        }
+        mutator = Mutator({})
+
+        output = mutator.probabilistically_apply_mutation(1, gene_params)
+
+        self.assertEqual(output, DescribedMutation(3, ("add", 2)))
+
+    @patch("random.random", return_value=0.01)
+    def test_drops_description_if_bounding_changes_the_value(self, mock_random):
+        """probabilistically_apply_mutation returns only the bounded value if bounding changes the value of a DescribedMutation"""
+        gene_params = {
+            "mutation_function": Mock(return_value=DescribedMutation(12, ("add", 11))),
+            "mutation_rate": 0.1,
+            "type": "int",
+            "max": 10,
+        }
+        mutator = Mutator({})
+
+        output = mutator.probabilistically_apply_mutation(1, gene_params)
+
+        self.assertNotIsInstance(output, DescribedMutation)
+        self.assertEqual(output, 10)
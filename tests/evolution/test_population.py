@@ -0,0 +1,88 @@
+import random
+import unittest
+from unittest.mock import patch
+
+from holland.evolution.population import *
+
+
+class SortedPopulationInsertTest(unittest.TestCase):
+    def test_inserts_in_ascending_order_if_ascending(self):
+        """insert places individuals so that fitness_results stays in ascending order of fitness if ascending is True"""
+        population = SortedPopulation([(1, "a"), (5, "b"), (9, "c")], ascending=True)
+
+        population.insert(6, "d")
+        population.insert(0, "e")
+        population.insert(10, "f")
+
+        expected_results = [(0, "e"), (1, "a"), (5, "b"), (6, "d"), (9, "c"), (10, "f")]
+        self.assertListEqual(population.fitness_results, expected_results)
+
+    def test_inserts_in_descending_order_if_not_ascending(self):
+        """insert places individuals so that fitness_results stays in descending order of fitness if ascending is False"""
+        population = SortedPopulation([(9, "c"), (5, "b"), (1, "a")], ascending=False)
+
+        population.insert(6, "d")
+        population.insert(0, "e")
+
+        expected_results = [(9, "c"), (6, "d"), (5, "b"), (1, "a"), (0, "e")]
+        self.assertListEqual(population.fitness_results, expected_results)
+
+    def test_does_not_modify_given_fitness_results(self):
+        """SortedPopulation copies the given fitness_results instead of modifying them"""
+        fitness_results = [(1, "a"), (5, "b")]
+        population = SortedPopulation(fitness_results)
+
+        population.insert(3, "c")
+
+        self.assertListEqual(fitness_results, [(1, "a"), (5, "b")])
+
+
+class SortedPopulationReplaceTest(unittest.TestCase):
+    def setUp(self):
+        self.fitness_results = [(1, "a"), (5, "b"), (9, "c"), (12, "d")]
+
+    def test_removes_the_worst_individual_if_policy_is_worst(self):
+        """replace removes the least fit individual after inserting the new one if policy is 'worst'"""
+        population = SortedPopulation(self.fitness_results)
+
+        removed = population.replace(6, "e", policy="worst")
+
+        self.assertEqual(removed, (1, "a"))
+        self.assertListEqual(population.fitness_results, [(5, "b"), (6, "e"), (9, "c"), (12, "d")])
+
+    def test_discards_new_individual_if_it_is_the_worst(self):
+        """replace discards the new individual if it is less fit than the whole population and policy is 'worst'"""
+        population = SortedPopulation(self.fitness_results)
+
+        removed = population.replace(0, "e", policy="worst")
+
+        self.assertEqual(removed, (0, "e"))
+        self.assertListEqual(population.fitness_results, self.fitness_results)
+
+    @patch("random.random", return_value=0.99)
+    def test_does_not_remove_protected_individuals_if_policy_is_random(self, mock_random):
+        """replace does not remove any of the n_protected most fit individuals if policy is 'random'"""
+        population = SortedPopulation(self.fitness_results)
+
+        removed = population.replace(0, "e", policy="random", n_protected=2)
+
+        self.assertEqual(removed, (5, "b"))
+        self.assertEqual(len(population), len(self.fitness_results))
+        self.assertIn((0, "e"), population.fitness_results)
+
+    def test_asserts_policy_is_valid(self):
+        """replace raises a ValueError if the policy is not 'worst' or 'random'"""
+        population = SortedPopulation(self.fitness_results)
+
+        with self.assertRaises(ValueError):
+            population.replace(6, "e", policy="something else")
+
+    def test_random_policy_draws_from_the_given_rng(self):
+        """replace with the 'random' policy removes the individual chosen by the given rng"""
+        fitness_results = [(i, str(i)) for i in range(10)]
+        removed = []
+        for _ in range(2):
+            population = SortedPopulation(fitness_results, rng=random.Random(5))
+            removed.append([population.replace(5.5, "new", policy="random") for _ in range(3)])
+
+        self.assertListEqual(removed[0], removed[1])
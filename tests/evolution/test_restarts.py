@@ -0,0 +1,112 @@
+import unittest
+from unittest.mock import Mock
+
+from holland.evolution.restarts import *
+
+
+class RestartStrategyInitTest(unittest.TestCase):
+    def test_asserts_params_are_valid(self):
+        """RestartStrategy raises a ValueError if the policy, stagnation window, minimum improvement, population size factor, or immigrant fraction is not valid"""
+        invalid_params = [
+            {"policy": "random"},
+            {"stagnation_window": 0},
+            {"min_improvement": -1},
+            {"population_size_factor": 1},
+            {"immigrant_fraction": 0},
+            {"immigrant_fraction": 1.5},
+        ]
+        for params in invalid_params:
+            with self.assertRaises(ValueError):
+                RestartStrategy(params)
+
+
+class RestartStrategyUpdateTest(unittest.TestCase):
+    def test_is_stagnant_after_stagnation_window_generations_without_improvement(self):
+        """update returns True once the best fitness has not improved for stagnation_window generations"""
+        restart_strategy = RestartStrategy({"stagnation_window": 2})
+
+        is_stagnant = [
+            restart_strategy.update(n, fitness) for n, fitness in enumerate([1, 2, 2, 1, 3, 3, 3])
+        ]
+
+        self.assertListEqual(is_stagnant, [False, False, False, True, False, False, True])
+        self.assertEqual(restart_strategy.last_generation_num, 6)
+
+    def test_counts_only_improvements_greater_than_min_improvement(self):
+        """update does not count an improvement of at most min_improvement, and a decrease counts as an improvement if not ascending"""
+        restart_strategy = RestartStrategy({"stagnation_window": 2, "min_improvement": 0.5})
+        descending_strategy = RestartStrategy({"stagnation_window": 2}, ascending=False)
+
+        is_stagnant = [
+            restart_strategy.update(n, fitness) for n, fitness in enumerate([1, 1.5, 1.4])
+        ]
+        is_descending_stagnant = [
+            descending_strategy.update(n, fitness) for n, fitness in enumerate([3, 2, 1, 2])
+        ]
+
+        self.assertListEqual(is_stagnant, [False, False, True])
+        self.assertListEqual(is_descending_stagnant, [False, False, False, False])
+
+    def test_is_not_stagnant_after_max_restarts(self):
+        """update returns False once max_restarts restarts have been made"""
+        restart_strategy = RestartStrategy({"stagnation_window": 1, "max_restarts": 0})
+
+        is_stagnant = [restart_strategy.update(n, 1) for n in range(3)]
+
+        self.assertListEqual(is_stagnant, [False, False, False])
+
+
+class RestartStrategyRestartTest(unittest.TestCase):
+    def setUp(self):
+        self.fitness_results = [(i, f"genome{i}") for i in range(6)]
+        self.population_generator = Mock()
+        self.population_generator.generate_random_genomes.side_effect = lambda n: ["random"] * n
+
+    def test_reinitialize_keeps_the_most_fit_genome_without_a_hall_of_fame(self):
+        """restart with 'reinitialize' keeps the most fit genome and generates the rest of the population randomly"""
+        restart_strategy = RestartStrategy({"policy": "reinitialize"})
+
+        population = restart_strategy.restart(self.fitness_results, self.population_generator)
+
+        self.assertListEqual(population, ["genome5"] + ["random"] * 5)
+        self.assertEqual(self.population_generator.population_size, 6)
+        self.assertEqual(restart_strategy.n_restarts, 1)
+
+    def test_reinitialize_keeps_the_hall_of_fame(self):
+        """restart with 'reinitialize' keeps the genomes of the hall of fame if one is given"""
+        restart_strategy = RestartStrategy({"policy": "reinitialize"})
+        hall_of_fame = [(8, "best2"), (9, "best1")]
+
+        population = restart_strategy.restart(
+            self.fitness_results, self.population_generator, hall_of_fame=hall_of_fame
+        )
+
+        self.assertListEqual(population, ["best2", "best1"] + ["random"] * 4)
+
+    def test_ipop_multiplies_the_population_size(self):
+        """restart with 'ipop' multiplies the population size by population_size_factor"""
+        restart_strategy = RestartStrategy({"policy": "ipop", "population_size_factor": 1.5})
+
+        population = restart_strategy.restart(self.fitness_results, self.population_generator)
+
+        self.assertListEqual(population, ["genome5"] + ["random"] * 8)
+        self.assertEqual(self.population_generator.population_size, 9)
+
+    def test_immigrants_replaces_the_least_fit_genomes(self):
+        """restart with 'immigrants' replaces the immigrant_fraction least fit genomes with random genomes"""
+        restart_strategy = RestartStrategy({"policy": "immigrants", "immigrant_fraction": 0.5})
+
+        population = restart_strategy.restart(self.fitness_results, self.population_generator)
+
+        self.assertListEqual(population, ["genome3", "genome4", "genome5"] + ["random"] * 3)
+
+    def test_resets_stagnation(self):
+        """restart resets stagnation tracking, so the next run is compared with its own best fitness"""
+        restart_strategy = RestartStrategy({"stagnation_window": 1})
+        restart_strategy.update(0, 10)
+        restart_strategy.update(1, 10)
+
+        restart_strategy.restart(self.fitness_results, self.population_generator)
+
+        self.assertFalse(restart_strategy.is_stagnant)
+        self.assertFalse(restart_strategy.update(2, 1))
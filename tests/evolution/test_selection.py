@@ -1,5 +1,6 @@
+import random
 import unittest
-from unittest.mock import patch
+from unittest.mock import patch, call
 
 from holland.evolution.selection import *
 
@@ -24,6 +25,62 @@ class SelectorInitTest(unittest.TestCase):
         with self.assertRaises(ValueError):
             Selector({"parents": {"n_parents": -1}})
 
+    def test_asserts_sampling_is_valid(self):
+        """__init__ throws a ValueError if the given sampling is not 'independent' or 'stochastic_universal'"""
+        with self.assertRaises(ValueError):
+            Selector({"parents": {"sampling": "something else"}})
+
+        Selector({"parents": {"sampling": "independent"}})
+        Selector({"parents": {"sampling": "stochastic_universal"}})
+
+    def test_asserts_niching_parameters_are_valid(self):
+        """__init__ throws a ValueError if the niching radius is not positive or the niching metric is not 'euclidean' or 'hamming'"""
+        with self.assertRaises(ValueError):
+            Selector({"niching": {"radius": 0}})
+        with self.assertRaises(ValueError):
+            Selector({"niching": {"radius": 1, "metric": "something else"}})
+
+        Selector({"niching": {"radius": 1, "metric": "hamming"}})
+
+    def test_asserts_niching_genes_suit_the_metric(self):
+        """__init__ throws a ValueError if genome_params is given and a niching gene is not of a type suited to the niching metric, or no gene is"""
+        genome_params = {"x": {"type": "float"}, "b": {"type": "[bool]"}, "s": {"type": "str"}}
+        with self.assertRaises(ValueError):
+            Selector({"niching": {"radius": 1, "genes": ["s"]}}, genome_params=genome_params)
+        with self.assertRaises(ValueError):
+            Selector({"niching": {"radius": 1, "genes": ["b"]}}, genome_params=genome_params)
+        with self.assertRaises(ValueError):
+            Selector(
+                {"niching": {"radius": 1, "metric": "hamming", "genes": ["x"]}},
+                genome_params=genome_params,
+            )
+        with self.assertRaises(ValueError):
+            Selector({"niching": {"radius": 1}}, genome_params={"s": {"type": "str"}})
+
+        Selector({"niching": {"radius": 1, "genes": ["x"]}}, genome_params=genome_params)
+        Selector(
+            {"niching": {"radius": 1, "metric": "hamming", "genes": ["b"]}},
+            genome_params=genome_params,
+        )
+
+    def test_defaults_niching_genes_to_genes_suited_to_the_metric(self):
+        """__init__ sets the niching genes to the genes of genome_params of a type suited to the niching metric if they are not given"""
+        genome_params = {
+            "x": {"type": "float"},
+            "y": {"type": "[int]"},
+            "b": {"type": "bool"},
+            "c": {"type": "bitset"},
+            "s": {"type": "str"},
+        }
+
+        euclidean_selector = Selector({"niching": {"radius": 1}}, genome_params=genome_params)
+        hamming_selector = Selector(
+            {"niching": {"radius": 1, "metric": "hamming"}}, genome_params=genome_params
+        )
+
+        self.assertListEqual(euclidean_selector.niching_genes, ["x", "y"])
+        self.assertListEqual(hamming_selector.niching_genes, ["b", "c"])
+
 
 class SelectorSelectBreedingPoolTest(unittest.TestCase):
     def setUp(self):
@@ -49,7 +106,7 @@ class SelectorSelectBreedingPoolTest(unittest.TestCase):
         selector.select_breeding_pool(self.fitness_results)
 
         mock_select_from.assert_called_once_with(
-            self.fitness_results, top=top, mid=mid, bottom=bottom, random=random
+            self.fitness_results, top=top, mid=mid, bottom=bottom, random=random, rng=selector.rng
         )
 
     @patch("holland.evolution.selection.select_from", return_value=[(1, "a"), (2, "b")])
@@ -88,7 +145,7 @@ class SelectorSelectParentsTest(unittest.TestCase):
             weighted_score / weighted_total for weighted_score in weighted_scores
         ]
         mock_select_from.assert_called_with(
-            self.genomes, probabilities=expected_probabilities, n=n_parents
+            self.genomes, probabilities=expected_probabilities, n=n_parents, rng=selector.rng
         )
 
     @patch("holland.evolution.selection.select_random")
@@ -105,6 +162,14 @@ class SelectorSelectParentsTest(unittest.TestCase):
         actual_probabilities = mock_select_from.call_args[1]["probabilities"]
         self.assertTrue(all(p >= 0 for p in actual_probabilities))
 
+    def test_selection_probabilities_are_uniform_if_weighted_scores_sum_to_zero(self):
+        """compute_selection_probabilities returns equal probabilities instead of dividing by zero if all weighted scores are equal and negative (so they shift to zero) or are all zero"""
+        selector = Selector({"parents": {"weighting_function": lambda x: x}})
+
+        self.assertListEqual(selector.compute_selection_probabilities([-4]), [1])
+        self.assertListEqual(selector.compute_selection_probabilities([-4, -4]), [0.5, 0.5])
+        self.assertListEqual(selector.compute_selection_probabilities([0, 0]), [0.5, 0.5])
+
     @patch("holland.evolution.selection.select_random", return_value=["a", "b", "c"])
     def test_returns_selected_parents(self, mock_select_from):
         """select_parents returns the genomes it selects"""
@@ -113,3 +178,214 @@ class SelectorSelectParentsTest(unittest.TestCase):
 
         expected_parents = mock_select_from.return_value
         self.assertListEqual(parents, expected_parents)
+
+
+class SelectorNichingTest(unittest.TestCase):
+    def setUp(self):
+        self.genomes = [{"x": 0.0, "y": [0.0]}, {"x": 0.1, "y": [0.0]}, {"x": 5.0, "y": [5.0]}]
+        self.fitness_results = [(1, genome) for genome in self.genomes]
+
+    @patch("holland.evolution.selection.select_random")
+    def test_divides_selection_probabilities_by_niche_counts(self, mock_select_random):
+        """select_parents divides the selection probability of each genome by its niche count if a niching radius is given"""
+        selector = Selector({"niching": {"radius": 1}})
+
+        selector.select_parents(self.fitness_results)
+
+        probabilities = mock_select_random.call_args[1]["probabilities"]
+        self.assertAlmostEqual(probabilities[0], probabilities[1])
+        self.assertAlmostEqual(sum(probabilities), 1)
+        self.assertAlmostEqual(probabilities[2] / probabilities[0], 1.9)
+
+    def test_computes_euclidean_niche_counts_over_given_genes(self):
+        """compute_niche_counts uses the values of the niching genes as coordinates"""
+        selector = Selector({"niching": {"radius": 1, "genes": ["y"]}})
+
+        niche_counts = selector.compute_niche_counts(self.genomes)
+
+        self.assertListEqual(niche_counts, [2, 2, 1])
+
+    @patch("holland.evolution.selection.compute_niche_counts", return_value=[1, 1])
+    def test_concatenates_bits_for_hamming_metric(self, mock_compute_niche_counts):
+        """compute_niche_counts concatenates the bits of bool, [bool], and bitset genes for the 'hamming' metric"""
+        genomes = [
+            {"a": True, "b": [False, True], "c": 0b101},
+            {"a": False, "b": [True, True], "c": 0b1},
+        ]
+        selector = Selector({"niching": {"radius": 2, "metric": "hamming"}})
+
+        selector.compute_niche_counts(genomes)
+
+        points = mock_compute_niche_counts.call_args[0][0]
+        self.assertListEqual(points, [0b110101, 0b011001])
+
+    def test_skips_genes_unsuited_to_the_metric_without_genome_params(self):
+        """compute_niche_counts only uses the genes whose values suit the niching metric if neither the niching genes nor genome_params are given"""
+        genomes = [{"name": "a", **genome} for genome in self.genomes]
+        selector = Selector({"niching": {"radius": 1}})
+
+        niche_counts = selector.compute_niche_counts(genomes)
+
+        self.assertAlmostEqual(niche_counts[0], 1.9)
+        self.assertAlmostEqual(niche_counts[2], 1)
+
+
+class SelectorSelectParentGroupsTest(unittest.TestCase):
+    def setUp(self):
+        self.fitness_scores = (10, 15, 5, 8)
+        self.genomes = ("a", "b", "c", "d")
+        self.fitness_results = list(zip(self.fitness_scores, self.genomes))
+        self.selection_strategy = {
+            "parents": {"weighting_function": lambda x: x * x, "n_parents": 3}
+        }
+
+    @patch.object(Selector, "compute_selection_probabilities", return_value=[0.25] * 4)
+    @patch("holland.evolution.selection.select_random", return_value=["a", "b", "c"])
+    def test_selects_parents_for_each_group_if_sampling_is_independent(
+        self, mock_select_random, mock_compute_probabilities
+    ):
+        """select_parent_groups computes selection probabilities once and then draws parents independently with select_random once for each group, if sampling is 'independent'"""
+        n_groups = 5
+        selector = Selector(self.selection_strategy)
+
+        parent_groups = selector.select_parent_groups(self.fitness_results, n_groups)
+
+        mock_compute_probabilities.assert_called_once_with(self.fitness_scores)
+        self.assertEqual(mock_select_random.call_count, n_groups)
+        for args, kwargs in mock_select_random.call_args_list:
+            self.assertEqual(tuple(args[0]), self.genomes)
+            self.assertEqual(kwargs["probabilities"], [0.25] * 4)
+            self.assertEqual(kwargs["n"], 3)
+        self.assertListEqual(parent_groups, [["a", "b", "c"]] * n_groups)
+
+    @patch.object(Selector, "select_parents")
+    @patch("holland.evolution.selection.select_stochastic_universal")
+    def test_samples_all_parents_at_once_if_sampling_is_stochastic_universal(
+        self, mock_select_sus, mock_select_parents
+    ):
+        """select_parent_groups selects all parents with a single call to select_stochastic_universal if sampling is 'stochastic_universal'"""
+        n_groups = 5
+        n_parents = self.selection_strategy["parents"]["n_parents"]
+        mock_select_sus.return_value = list("abcdabcdabcdabc")
+        selection_strategy = {
+            "parents": {**self.selection_strategy["parents"], "sampling": "stochastic_universal"}
+        }
+        selector = Selector(selection_strategy)
+
+        selector.select_parent_groups(self.fitness_results, n_groups)
+
+        weighted_scores = [x * x for x in self.fitness_scores]
+        expected_probabilities = [ws / sum(weighted_scores) for ws in weighted_scores]
+        mock_select_sus.assert_called_once_with(
+            self.genomes,
+            probabilities=expected_probabilities,
+            n=n_groups * n_parents,
+            rng=selector.rng,
+        )
+        mock_select_parents.assert_not_called()
+
+    def test_returns_groups_of_n_parents_if_sampling_is_stochastic_universal(self):
+        """select_parent_groups returns n_groups groups of n_parents genomes if sampling is 'stochastic_universal'"""
+        n_groups = 7
+        n_parents = self.selection_strategy["parents"]["n_parents"]
+        selection_strategy = {
+            "parents": {**self.selection_strategy["parents"], "sampling": "stochastic_universal"}
+        }
+        selector = Selector(selection_strategy)
+
+        parent_groups = selector.select_parent_groups(self.fitness_results, n_groups)
+
+        self.assertEqual(len(parent_groups), n_groups)
+        for parents in parent_groups:
+            self.assertEqual(len(parents), n_parents)
+            self.assertTrue(all(parent in self.genomes for parent in parents))
+
+    @patch.object(Selector, "compute_selection_probabilities", return_value=[0.25] * 4)
+    def test_computes_selection_probabilities_once_if_sampling_is_independent(
+        self, mock_compute_probabilities
+    ):
+        """select_parent_groups computes the selection probabilities once for all groups if sampling is 'independent'"""
+        selector = Selector(self.selection_strategy)
+
+        parent_groups = selector.select_parent_groups(self.fitness_results, 5)
+
+        mock_compute_probabilities.assert_called_once_with(self.fitness_scores)
+        self.assertEqual(len(parent_groups), 5)
+
+    def test_returns_empty_list_if_n_groups_is_zero(self):
+        """select_parent_groups returns an empty list if n_groups is 0"""
+        selector = Selector({"parents": {"sampling": "stochastic_universal"}})
+
+        self.assertListEqual(selector.select_parent_groups(self.fitness_results, 0), [])
+
+
+class SelectorSelectLocalParentGroupsTest(unittest.TestCase):
+    def test_selects_parents_only_from_each_neighborhood(self):
+        """select_local_parent_groups returns n_parents genomes for each neighborhood, all from that neighborhood"""
+        fitness_results = [(i, chr(97 + i)) for i in range(10)]
+        neighborhoods = [(i, (i + 1) % 10, (i - 1) % 10) for i in range(10)]
+        selector = Selector({"parents": {"n_parents": 3}}, rng=random.Random(0))
+
+        parent_groups = selector.select_local_parent_groups(fitness_results, neighborhoods)
+
+        self.assertEqual(len(parent_groups), 10)
+        for parents, neighborhood in zip(parent_groups, neighborhoods):
+            self.assertEqual(len(parents), 3)
+            self.assertTrue(set(parents) <= {fitness_results[i][1] for i in neighborhood})
+
+    def test_weights_neighbors_by_fitness(self):
+        """select_local_parent_groups never selects a neighbor whose weighted fitness is zero unless the whole neighborhood is"""
+        fitness_results = [(0, "a"), (1, "b"), (0, "c"), (0, "d")]
+        neighborhoods = [(0, 1), (2, 3)]
+        selector = Selector({"parents": {"weighting_function": lambda x: x}})
+
+        parent_groups = selector.select_local_parent_groups(fitness_results, neighborhoods)
+
+        self.assertListEqual(parent_groups[0], ["b", "b"])
+        self.assertTrue(set(parent_groups[1]) <= {"c", "d"})
+
+
+class SelectorSelectCrowdedTournamentParentGroupsTest(unittest.TestCase):
+    def test_prefers_better_front_then_larger_crowding_distance(self):
+        """select_crowded_tournament_parent_groups selects the genome in the better front of each pair, or the one with the larger crowding distance within a front"""
+        fitness_results = [((0, 0), "a"), ((1, 1), "b"), ((2, 0), "c")]
+        ranks = [1, 0, 0]
+        crowding_distances = [1, 1, 2]
+        selector = Selector({"parents": {"n_parents": 2}})
+
+        # the pairs drawn are (a, b) and (b, c)
+        with patch.object(selector.rng, "random", side_effect=[0, 0.4, 0.4, 0.9]):
+            parent_groups = selector.select_crowded_tournament_parent_groups(
+                fitness_results, ranks, crowding_distances, 1
+            )
+
+        self.assertListEqual(parent_groups, [["b", "c"]])
+
+    def test_returns_n_groups_of_n_parents(self):
+        """select_crowded_tournament_parent_groups returns n_groups lists of n_parents genomes"""
+        fitness_results = [((i, -i), i) for i in range(5)]
+        selector = Selector({"parents": {"n_parents": 3}}, rng=random.Random(0))
+
+        parent_groups = selector.select_crowded_tournament_parent_groups(
+            fitness_results, [0] * 5, [1] * 5, 4
+        )
+
+        self.assertEqual(len(parent_groups), 4)
+        self.assertTrue(all(len(parents) == 3 for parents in parent_groups))
+
+
+class SelectorRandomStreamTest(unittest.TestCase):
+    def test_draws_from_the_given_rng(self):
+        """Selector draws the breeding pool and parents from the given rng, so selectors with equally seeded rngs make the same selections"""
+        fitness_results = [(i, chr(97 + i)) for i in range(10)]
+        selection_strategy = {
+            "pool": {"top": 2, "random": 4},
+            "parents": {"weighting_function": lambda x: x + 1, "sampling": "stochastic_universal"},
+        }
+        selections = []
+        for _ in range(2):
+            selector = Selector(selection_strategy, rng=random.Random(3))
+            breeding_pool = selector.select_breeding_pool(fitness_results)
+            selections.append((breeding_pool, selector.select_parent_groups(breeding_pool, 5)))
+
+        self.assertEqual(selections[0], selections[1])
@@ -0,0 +1,129 @@
+import random
+import unittest
+from unittest.mock import patch
+
+from holland.evolution.strategies import *
+
+
+class EvolutionStrategyInitTest(unittest.TestCase):
+    def test_asserts_genes_and_params_are_valid(self):
+        """EvolutionStrategy raises a ValueError if a gene is not a float gene, n_parents is not between 1 and n_offspring, or the selection, recombination, step size adaptation, or initial step size is not valid"""
+        genome_params = {"gene1": {"type": "[float]", "size": 3}}
+
+        with self.assertRaises(ValueError):
+            EvolutionStrategy({"gene1": {"type": "[int]", "size": 3}}, 4)
+
+        invalid_params = [
+            {"n_parents": 0},
+            {"n_parents": 5},
+            {"selection": "star"},
+            {"recombination": "discrete"},
+            {"step_size_adaptation": "cma"},
+            {"initial_step_size": 0},
+        ]
+        for params in invalid_params:
+            with self.assertRaises(ValueError):
+                EvolutionStrategy(genome_params, 4, params)
+
+    def test_defaults_n_parents_to_a_quarter_of_the_offspring(self):
+        """EvolutionStrategy uses n_offspring // 4 parents (at least 1) if n_parents is not given"""
+        genome_params = {"gene1": {"type": "float"}}
+
+        self.assertEqual(EvolutionStrategy(genome_params, 20).n_parents, 5)
+        self.assertEqual(EvolutionStrategy(genome_params, 2).n_parents, 1)
+
+
+class EvolutionStrategyBreedOffspringVectorsTest(unittest.TestCase):
+    def setUp(self):
+        self.genome_params = {"gene1": {"type": "[float]", "size": 2, "min": -10, "max": 10}}
+        self.parent_vectors = [[0.0, 2.0], [4.0, 6.0]]
+
+    def test_perturbs_the_mean_parent_with_intermediate_recombination(self):
+        """breed_offspring_vectors adds step_size times a standard normal vector to the mean of the parents"""
+        strategy = EvolutionStrategy(
+            self.genome_params, 3, {"n_parents": 2, "initial_step_size": 2}
+        )
+
+        with patch.object(strategy.rng, "gauss", return_value=0.5):
+            offspring_vectors = strategy.breed_offspring_vectors(self.parent_vectors)
+
+        self.assertListEqual(offspring_vectors, [[3.0, 5.0]] * 3)
+
+    def test_perturbs_a_random_parent_without_recombination(self):
+        """breed_offspring_vectors adds step_size times a standard normal vector to a random parent if recombination is none"""
+        strategy = EvolutionStrategy(
+            self.genome_params, 2, {"n_parents": 2, "recombination": "none"}
+        )
+
+        with patch.object(strategy.rng, "gauss", return_value=1.0), patch.object(
+            strategy.rng, "random", side_effect=[0.9, 0.1]
+        ):
+            offspring_vectors = strategy.breed_offspring_vectors(self.parent_vectors)
+
+        self.assertListEqual(offspring_vectors, [[5.0, 7.0], [1.0, 3.0]])
+
+    def test_bounds_values(self):
+        """breed_offspring_vectors bounds each value to the min and max of its gene"""
+        strategy = EvolutionStrategy(self.genome_params, 10, {"initial_step_size": 100})
+
+        offspring_vectors = strategy.breed_offspring_vectors(self.parent_vectors)
+
+        self.assertTrue(all(-10 <= value <= 10 for vector in offspring_vectors for value in vector))
+
+    def test_draws_from_the_given_rng(self):
+        """breed_offspring_vectors returns the same offspring for equally seeded rngs"""
+        offspring_vectors = [
+            EvolutionStrategy(self.genome_params, 4, rng=random.Random(3)).breed_offspring_vectors(
+                self.parent_vectors
+            )
+            for _ in range(2)
+        ]
+
+        self.assertListEqual(offspring_vectors[0], offspring_vectors[1])
+
+
+class EvolutionStrategyAdaptStepSizeTest(unittest.TestCase):
+    def setUp(self):
+        self.genome_params = {"gene1": {"type": "[float]", "size": 4}}
+        self.parent_vectors = [[0.0] * 4]
+
+    def test_one_fifth_rule(self):
+        """adapt_step_size with one_fifth increases the step size if more than a fifth of the offspring are successful, decreases it if fewer are, and keeps it at exactly a fifth"""
+        for success_rate, comparison in [(0.5, "assertGreater"), (0.0, "assertLess")]:
+            strategy = EvolutionStrategy(
+                self.genome_params, 4, {"step_size_adaptation": "one_fifth"}
+            )
+            step_size = strategy.adapt_step_size(
+                self.parent_vectors, self.parent_vectors, success_rate
+            )
+            getattr(self, comparison)(step_size, 1)
+
+        strategy = EvolutionStrategy(self.genome_params, 4, {"step_size_adaptation": "one_fifth"})
+        self.assertAlmostEqual(
+            strategy.adapt_step_size(self.parent_vectors, self.parent_vectors, 0.2), 1
+        )
+
+    def test_cumulative_step_size_adaptation(self):
+        """adapt_step_size with csa increases the step size while the mean parent keeps moving in one direction and decreases it while the mean parent does not move"""
+        strategy = EvolutionStrategy(self.genome_params, 4, {"n_parents": 1})
+        vectors = [[[float(i)] * 4] for i in range(6)]
+        for previous_vectors, next_vectors in zip(vectors, vectors[1:]):
+            strategy.adapt_step_size(previous_vectors, next_vectors, 0)
+        self.assertGreater(strategy.step_size, 1)
+
+        strategy = EvolutionStrategy(self.genome_params, 4, {"n_parents": 1})
+        for _ in range(5):
+            strategy.adapt_step_size(self.parent_vectors, self.parent_vectors, 0)
+        self.assertLess(strategy.step_size, 1)
+
+    def test_keeps_step_size_above_minimum(self):
+        """adapt_step_size never decreases the step size below min_step_size"""
+        strategy = EvolutionStrategy(
+            self.genome_params,
+            4,
+            {"step_size_adaptation": "one_fifth", "initial_step_size": 1e-3, "min_step_size": 1e-3},
+        )
+
+        strategy.adapt_step_size(self.parent_vectors, self.parent_vectors, 0)
+
+        self.assertEqual(strategy.step_size, 1e-3)
@@ -0,0 +1,31 @@
+import math
+import unittest
+
+from holland.evolution.vectors import *
+
+
+class GenomeVectorizerTest(unittest.TestCase):
+    def setUp(self):
+        self.genome_params = {
+            "gene1": {"type": "[float]", "size": 2, "min": 0, "max": 1},
+            "gene2": {"type": "float", "max": 3},
+        }
+
+    def test_asserts_genes_are_float_genes(self):
+        """GenomeVectorizer raises a ValueError if a gene is not of type float or [float]"""
+        with self.assertRaises(ValueError):
+            GenomeVectorizer({**self.genome_params, "gene3": {"type": "bool"}})
+
+    def test_collects_bounds_of_each_value(self):
+        """GenomeVectorizer repeats the min and max of list genes for each value and uses infinite bounds for missing ones"""
+        vectorizer = GenomeVectorizer(self.genome_params)
+
+        self.assertListEqual(vectorizer.lower_bounds, [0, 0, -math.inf])
+        self.assertListEqual(vectorizer.upper_bounds, [1, 1, 3])
+
+    def test_bounds_vectors(self):
+        """bound_vector clips each value to the bounds of its gene"""
+        vectorizer = GenomeVectorizer(self.genome_params)
+
+        self.assertListEqual(vectorizer.bound_vector([-1, 0.5, 4]), [0, 0.5, 3])
+        self.assertListEqual(vectorizer.bound_vector([2, 1, -100]), [1, 1, -100])
@@ -1,3 +1,4 @@
+import random
 import unittest
 from unittest.mock import patch, call
 
@@ -140,6 +141,14 @@ class GetAndCrossoverFunctionTest(unittest.TestCase):
         expected_output = [True, False, False]
         self.assertListEqual(output, expected_output)
 
+    def test_returned_function_works_as_expected_with_bitset_genes(self):
+        """get_and_crossover_function returns a function that returns the bitwise 'and' of bitset parent genes"""
+        and_crossover = get_and_crossover_function()
+
+        output = and_crossover([0b1100, 0b1010, 0b1110])
+
+        self.assertEqual(output, 0b1000)
+
 
 class GetOrCrossoverFunctionTest(unittest.TestCase):
     def test_returned_function_works_as_expected_with_value_type_genes(self):
@@ -162,3 +171,111 @@ class GetOrCrossoverFunctionTest(unittest.TestCase):
 
         expected_output = [True, True, False]
         self.assertListEqual(output, expected_output)
+
+    def test_returned_function_works_as_expected_with_bitset_genes(self):
+        """get_or_crossover_function returns a function that returns the bitwise 'or' of bitset parent genes"""
+        or_crossover = get_or_crossover_function()
+
+        output = or_crossover([0b1100, 0b1010, 0b0000])
+
+        self.assertEqual(output, 0b1110)
+
+
+class GetBitsetUniformCrossoverFunctionTest(unittest.TestCase):
+    def test_takes_each_bit_from_one_of_the_parents(self):
+        """get_bitset_uniform_crossover_function returns a function whose output bits each come from one of the parents"""
+        size = 64
+        bitset_uniform_crossover = get_bitset_uniform_crossover_function(size)
+        parent_genes = [(1 << size) - 1, 0, 0]
+
+        for _ in range(20):
+            output = bitset_uniform_crossover(parent_genes)
+            self.assertEqual(output >> size, 0)
+
+        self.assertEqual(bitset_uniform_crossover([0b1010, 0b1010]), 0b1010)
+
+    def test_takes_bits_from_each_parent_with_equal_probability(self):
+        """get_bitset_uniform_crossover_function returns a function that takes about 1/n of the bits from each of n parents"""
+        size = 30000
+        bitset_uniform_crossover = get_bitset_uniform_crossover_function(size)
+        parent_genes = [(1 << size) - 1, 0, 0]
+
+        n_set = bin(bitset_uniform_crossover(parent_genes)).count("1")
+
+        self.assertGreater(n_set, 0.9 * size / 3)
+        self.assertLess(n_set, 1.1 * size / 3)
+
+
+class GetBitsetPointCrossoverFunctionTest(unittest.TestCase):
+    def test_asserts_number_of_crossover_points_is_nonnegative(self):
+        """get_bitset_point_crossover_function raises a ValueError if n_crossover_points is negative"""
+        with self.assertRaises(ValueError):
+            get_bitset_point_crossover_function(8, n_crossover_points=-1)
+
+    @patch("holland.library.crossover_functions.select_random", return_value=[2, 5])
+    def test_returned_function_switches_parents_at_crossover_points(self, mock_select_random):
+        """get_bitset_point_crossover_function returns a function that takes bits from each parent in turn between crossover points"""
+        bitset_point_crossover = get_bitset_point_crossover_function(8, n_crossover_points=2)
+        parent_genes = [0b11111111, 0b00000000]
+
+        output = bitset_point_crossover(parent_genes)
+
+        mock_select_random.assert_called_with(range(1, 8), n=2)
+        self.assertEqual(output, 0b11100011)
+
+
+class PermutationCrossoverFunctionsTest(unittest.TestCase):
+    def setUp(self):
+        self.crossover_functions = [
+            get_order_crossover_function(),
+            get_partially_mapped_crossover_function(),
+            get_cycle_crossover_function(),
+        ]
+
+    def test_returned_functions_return_permutations_of_the_parent_values(self):
+        """get_order_crossover_function, get_partially_mapped_crossover_function, and get_cycle_crossover_function return functions whose outputs are permutations of the parents' values"""
+        values = list("abcdefghij")
+
+        for crossover in self.crossover_functions:
+            for _ in range(100):
+                parent_genes = [random.sample(values, len(values)) for _ in range(2)]
+                output = crossover(parent_genes)
+                self.assertListEqual(sorted(output), values)
+
+    def test_returned_functions_handle_a_single_parent(self):
+        """permutation crossover functions return a copy of the parent gene if given a single parent"""
+        parent_gene = [3, 1, 2, 0]
+
+        for crossover in self.crossover_functions:
+            output = crossover([parent_gene])
+            self.assertListEqual(output, parent_gene)
+            self.assertIsNot(output, parent_gene)
+
+    @patch("random.sample", return_value=[6, 3])
+    def test_order_crossover_fills_from_second_parent_after_slice(self, mock_sample):
+        """get_order_crossover_function returns a function that copies a slice from the first parent and fills the rest with the second parent's order, starting after the slice"""
+        order_crossover = get_order_crossover_function()
+        parent_genes = [[1, 2, 3, 4, 5, 6, 7, 8, 9], [9, 3, 7, 8, 2, 6, 5, 1, 4]]
+
+        output = order_crossover(parent_genes)
+
+        self.assertListEqual(output, [7, 8, 2, 4, 5, 6, 1, 9, 3])
+
+    @patch("random.sample", return_value=[3, 7])
+    def test_partially_mapped_crossover_places_displaced_values_by_mapping(self, mock_sample):
+        """get_partially_mapped_crossover_function returns a function that copies a slice from the first parent and places displaced values of the second parent by following the mapping between slices"""
+        partially_mapped_crossover = get_partially_mapped_crossover_function()
+        parent_genes = [[8, 4, 7, 3, 6, 2, 5, 1, 9, 0], [0, 1, 2, 3, 4, 5, 6, 7, 8, 9]]
+
+        output = partially_mapped_crossover(parent_genes)
+
+        self.assertListEqual(output, [0, 1, 4, 3, 6, 2, 5, 7, 8, 9])
+
+    def test_cycle_crossover_keeps_every_value_in_a_parent_position(self):
+        """get_cycle_crossover_function returns a function whose output has every value in the position it holds in one of the parents"""
+        cycle_crossover = get_cycle_crossover_function()
+        parent_genes = [[1, 2, 3, 4, 5, 6, 7, 8], [8, 5, 2, 1, 3, 6, 4, 7]]
+
+        output = cycle_crossover(parent_genes)
+
+        self.assertListEqual(output, [1, 5, 2, 4, 3, 6, 7, 8])
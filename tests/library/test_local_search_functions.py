@@ -0,0 +1,107 @@
+import operator
+import unittest
+
+from holland.library.local_search_functions import (
+    get_hill_climbing_local_search,
+    get_coordinate_descent_local_search,
+    get_two_opt_local_search,
+)
+
+
+def get_budgeted_evaluate(fitness_function, max_evaluations):
+    evaluations = []
+
+    def evaluate(candidate):
+        if len(evaluations) >= max_evaluations:
+            return None
+        evaluations.append(candidate)
+        return fitness_function(candidate)
+
+    return evaluate, evaluations
+
+
+class GetHillClimbingLocalSearchTest(unittest.TestCase):
+    def test_keeps_improving_mutations_until_budget_is_used(self):
+        """get_hill_climbing_local_search returns a function that keeps each mutation that improves fitness and stops once evaluate returns None"""
+        local_search = get_hill_climbing_local_search("gene1", lambda value: value + 1)
+        evaluate, evaluations = get_budgeted_evaluate(lambda genome: genome["gene1"], 5)
+        genome = {"gene1": 0, "gene2": "a"}
+
+        fitness, searched_genome = local_search(genome, 0, evaluate, operator.gt)
+
+        self.assertEqual(fitness, 5)
+        self.assertDictEqual(searched_genome, {"gene1": 5, "gene2": "a"})
+        self.assertDictEqual(genome, {"gene1": 0, "gene2": "a"})
+        self.assertEqual(len(evaluations), 5)
+
+    def test_stops_after_max_failures(self):
+        """get_hill_climbing_local_search returns a function that stops after max_failures consecutive mutations that do not improve fitness"""
+        local_search = get_hill_climbing_local_search(
+            "gene1", lambda value: value + 1, max_failures=3
+        )
+        evaluate, evaluations = get_budgeted_evaluate(lambda genome: genome["gene1"], 100)
+
+        fitness, searched_genome = local_search({"gene1": 0}, 0, evaluate, operator.lt)
+
+        self.assertEqual(fitness, 0)
+        self.assertDictEqual(searched_genome, {"gene1": 0})
+        self.assertEqual(len(evaluations), 3)
+
+
+class GetCoordinateDescentLocalSearchTest(unittest.TestCase):
+    def test_moves_each_value_towards_the_optimum(self):
+        """get_coordinate_descent_local_search returns a function that moves the values of a list gene to the optimum of a separable function"""
+        local_search = get_coordinate_descent_local_search("gene1", 1.0, min_step_size=1e-3)
+        fitness_function = lambda genome: (
+            (genome["gene1"][0] - 2) ** 2 + (genome["gene1"][1] + 1) ** 2
+        )
+        evaluate, evaluations = get_budgeted_evaluate(fitness_function, 1000)
+        genome = {"gene1": [0.0, 0.0]}
+
+        fitness, searched_genome = local_search(
+            genome, fitness_function(genome), evaluate, operator.lt
+        )
+
+        self.assertAlmostEqual(searched_genome["gene1"][0], 2)
+        self.assertAlmostEqual(searched_genome["gene1"][1], -1)
+        self.assertEqual(fitness, fitness_function(searched_genome))
+        self.assertListEqual(genome["gene1"], [0.0, 0.0])
+
+    def test_searches_scalar_genes_within_bounds(self):
+        """get_coordinate_descent_local_search returns a function that searches a scalar gene and bounds moved values to minimum and maximum"""
+        local_search = get_coordinate_descent_local_search("gene1", 4, minimum=0, maximum=10)
+        evaluate, evaluations = get_budgeted_evaluate(lambda genome: genome["gene1"], 1000)
+
+        fitness, searched_genome = local_search({"gene1": 5}, 5, evaluate, operator.gt)
+
+        self.assertDictEqual(searched_genome, {"gene1": 10})
+        self.assertTrue(all(0 <= candidate["gene1"] <= 10 for candidate in evaluations))
+
+    def test_stops_once_budget_is_used(self):
+        """get_coordinate_descent_local_search returns a function that returns the most fit genome found so far once evaluate returns None"""
+        local_search = get_coordinate_descent_local_search("gene1", 1.0)
+        evaluate, evaluations = get_budgeted_evaluate(lambda genome: -genome["gene1"], 3)
+
+        fitness, searched_genome = local_search({"gene1": 0.0}, 0.0, evaluate, operator.gt)
+
+        self.assertEqual(len(evaluations), 3)
+        self.assertEqual(fitness, -searched_genome["gene1"])
+
+
+class GetTwoOptLocalSearchTest(unittest.TestCase):
+    def test_untangles_a_tour(self):
+        """get_two_opt_local_search returns a function that reverses slices of a tour until no reversal improves fitness"""
+        local_search = get_two_opt_local_search("tour")
+        # the length of a tour of points on a line is shortest when the points are in order
+        tour_length = lambda genome: sum(
+            abs(a - b) for a, b in zip(genome["tour"], genome["tour"][1:] + genome["tour"][:1])
+        )
+        evaluate, evaluations = get_budgeted_evaluate(tour_length, 1000)
+        genome = {"tour": [0, 3, 1, 4, 2, 5]}
+
+        fitness, searched_genome = local_search(genome, tour_length(genome), evaluate, operator.lt)
+
+        self.assertEqual(fitness, 10)
+        self.assertEqual(tour_length(searched_genome), 10)
+        self.assertListEqual(sorted(searched_genome["tour"]), list(range(6)))
+        self.assertListEqual(genome["tour"], [0, 3, 1, 4, 2, 5])
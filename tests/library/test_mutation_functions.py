@@ -1,11 +1,17 @@
 import unittest
 from unittest.mock import patch
 
+from holland.utils import DescribedMutation
+
 from holland.library.mutation_functions import (
     get_flip_mutation_function,
     get_boundary_mutation_function,
     get_uniform_mutation_function,
     get_gaussian_mutation_function,
+    get_bitset_flip_mutation_function,
+    get_swap_mutation_function,
+    get_insertion_mutation_function,
+    get_inversion_mutation_function,
 )
 
 
@@ -73,3 +79,77 @@ class GetGaussianMutationFunctionTest(unittest.TestCase):
         expected_output = mock_gauss.return_value
         self.assertEqual(output, expected_output)
         mock_gauss.assert_called_with(value, sigma)
+
+
+class GetBitsetFlipMutationFunctionTest(unittest.TestCase):
+    def test_returned_function_flips_all_or_no_bits(self):
+        """get_bitset_flip_mutation_function returns a function that flips every bit if flip_rate is 1 and no bits if flip_rate is 0"""
+        value = 0b10110
+
+        self.assertEqual(get_bitset_flip_mutation_function(5, 1)(value), 0b01001)
+        self.assertEqual(get_bitset_flip_mutation_function(5, 0)(value), value)
+
+    def test_returned_function_flips_bits_according_to_flip_rate(self):
+        """get_bitset_flip_mutation_function returns a function that flips about size * flip_rate bits"""
+        size = 100000
+        flip_rate = 0.02
+        bitset_flip_mutate = get_bitset_flip_mutation_function(size, flip_rate)
+
+        n_flipped = bin(bitset_flip_mutate(0)).count("1")
+
+        self.assertGreater(n_flipped, 0.8 * size * flip_rate)
+        self.assertLess(n_flipped, 1.2 * size * flip_rate)
+
+
+class PermutationMutationFunctionsTest(unittest.TestCase):
+    def setUp(self):
+        self.value = [0, 1, 2, 3, 4, 5]
+
+    @patch("random.sample", return_value=[1, 4])
+    def test_swap_mutation_swaps_two_values(self, mock_sample):
+        """get_swap_mutation_function returns a function that swaps the values at two random positions"""
+        output = get_swap_mutation_function()(self.value)
+
+        self.assertListEqual(output, [0, 4, 2, 3, 1, 5])
+
+    @patch("random.sample", return_value=[1, 4])
+    def test_insertion_mutation_moves_a_value(self, mock_sample):
+        """get_insertion_mutation_function returns a function that moves the value at one random position to another"""
+        output = get_insertion_mutation_function()(self.value)
+
+        self.assertListEqual(output, [0, 2, 3, 4, 1, 5])
+
+    @patch("random.sample", return_value=[4, 1])
+    def test_inversion_mutation_reverses_a_slice(self, mock_sample):
+        """get_inversion_mutation_function returns a function that reverses a random slice"""
+        output = get_inversion_mutation_function()(self.value)
+
+        self.assertListEqual(output, [0, 3, 2, 1, 4, 5])
+
+    def test_returned_functions_do_not_modify_the_given_gene(self):
+        """permutation mutation functions return a new list and leave the given gene unchanged"""
+        for get_mutation_function in [
+            get_swap_mutation_function,
+            get_insertion_mutation_function,
+            get_inversion_mutation_function,
+        ]:
+            output = get_mutation_function()(self.value)
+
+            self.assertListEqual(self.value, [0, 1, 2, 3, 4, 5])
+            self.assertListEqual(sorted(output), self.value)
+
+    @patch("random.sample", return_value=[4, 1])
+    def test_returned_functions_describe_their_changes_if_requested(self, mock_sample):
+        """permutation mutation functions return a DescribedMutation of the mutated gene and the move made if should_describe_change is True"""
+        self.assertEqual(
+            get_swap_mutation_function(should_describe_change=True)(self.value),
+            DescribedMutation([0, 4, 2, 3, 1, 5], ("swap", 4, 1)),
+        )
+        self.assertEqual(
+            get_insertion_mutation_function(should_describe_change=True)(self.value),
+            DescribedMutation([0, 4, 1, 2, 3, 5], ("insertion", 4, 1)),
+        )
+        self.assertEqual(
+            get_inversion_mutation_function(should_describe_change=True)(self.value),
+            DescribedMutation([0, 3, 2, 1, 4, 5], ("inversion", 1, 4)),
+        )
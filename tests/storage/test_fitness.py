@@ -52,3 +52,16 @@ class FormatFitnessStatisticsTest(unittest.TestCase):
         }
 
         self.assertDictEqual(data, expected_data)
+
+    def test_formats_stats_of_each_objective(self):
+        """format_fitness_statistics returns a list with the value of each statistic for each objective if the fitness scores are tuples"""
+        fitness_scores = [(1, 6), (2, 5), (3, 7)]
+
+        data = format_fitness_statistics(0, fitness_scores)
+
+        self.assertEqual(data["generation"], 0)
+        self.assertListEqual(data["max"], [3, 7])
+        self.assertListEqual(data["min"], [1, 5])
+        self.assertListEqual(data["median"], [2, 6])
+        self.assertListEqual(data["mean"], [2, 6])
+        self.assertListEqual(data["stdev"], [1, 1])
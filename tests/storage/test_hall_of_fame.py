@@ -0,0 +1,71 @@
+import unittest
+
+from holland.storage.hall_of_fame import *
+
+
+class HallOfFameTest(unittest.TestCase):
+    def test_raises_error_if_size_is_less_than_one(self):
+        """HallOfFame raises a ValueError if size is less than 1"""
+        with self.assertRaises(ValueError):
+            HallOfFame(0)
+
+    def test_keeps_the_most_fit_genomes_over_all_updates(self):
+        """update keeps the size most fit genomes seen over all updates, sorted with the most fit last"""
+        hall_of_fame = HallOfFame(3)
+
+        hall_of_fame.update([(i, {"a": i}) for i in [5, 1, 7]])
+        hall_of_fame.update([(i, {"a": i}) for i in [2, 9, 6]])
+
+        self.assertEqual(hall_of_fame.fitness_results, [(6, {"a": 6}), (7, {"a": 7}), (9, {"a": 9})])
+        self.assertEqual(len(hall_of_fame), 3)
+
+    def test_keeps_the_least_fitness_scores_if_not_ascending(self):
+        """update keeps the genomes with the least fitness scores, sorted with the least last, if ascending is False"""
+        hall_of_fame = HallOfFame(2, ascending=False)
+
+        hall_of_fame.update([(i, {"a": i}) for i in [5, 1, 7, 3]])
+
+        self.assertEqual(hall_of_fame.fitness_results, [(3, {"a": 3}), (1, {"a": 1})])
+
+    def test_skips_genomes_equal_to_archived_genomes(self):
+        """update does not add a genome that is equal to an archived genome, and returns the number of genomes added"""
+        hall_of_fame = HallOfFame(3)
+        genome = {"a": [1, 2]}
+
+        n_added = hall_of_fame.update([(1, genome), (1, genome), (1, {"a": [1, 2]}), (2, {"a": [3]})])
+
+        self.assertEqual(n_added, 2)
+        self.assertEqual(hall_of_fame.fitness_results, [(1, {"a": [1, 2]}), (2, {"a": [3]})])
+
+    def test_adds_a_genome_equal_to_an_evicted_genome(self):
+        """update adds a genome equal to a genome that was evicted from the archive"""
+        hall_of_fame = HallOfFame(1)
+
+        hall_of_fame.update([(1, {"a": 1})])
+        hall_of_fame.update([(2, {"a": 2})])
+        n_added = hall_of_fame.update([(3, {"a": 1})])
+
+        self.assertEqual(n_added, 1)
+        self.assertEqual(hall_of_fame.fitness_results, [(3, {"a": 1})])
+
+    def test_keeps_genomes_with_equal_hashes(self):
+        """update keeps genomes that are not equal even if their hashes are equal"""
+        hall_of_fame = HallOfFame(3, hash_function=lambda genome: 0)
+
+        hall_of_fame.update([(1, {"a": 1}), (2, {"a": 2}), (3, {"a": 1})])
+
+        self.assertEqual(hall_of_fame.fitness_results, [(1, {"a": 1}), (2, {"a": 2})])
+
+    def test_does_not_hash_genomes_that_cannot_enter(self):
+        """update does not hash genomes that are not more fit than the least fit genome of a full archive"""
+        hashed = []
+
+        def hash_function(genome):
+            hashed.append(genome["a"])
+            return genome["a"]
+
+        hall_of_fame = HallOfFame(2, hash_function=hash_function)
+
+        hall_of_fame.update([(5, {"a": 5}), (6, {"a": 6}), (4, {"a": 4}), (5, {"a": 0})])
+
+        self.assertEqual(hashed, [5, 6])
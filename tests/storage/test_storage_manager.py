@@ -20,13 +20,48 @@ class StorageManagerUpdateStorageTest(unittest.TestCase):
         mock_update_fitness.assert_called_with(generation_num, fitness_results)
         mock_update_genomes.assert_called_with(generation_num, fitness_results)
 
+    def test_updates_hall_of_fame_if_size_is_given(self):
+        """update_storage updates the hall of fame with the fitness results if hall_of_fame_options has a size"""
+        fitness_results = [(100, {"x": "a"}), (150, {"x": "b"}), (20, {"x": "c"})]
+        storage_manager = StorageManager(hall_of_fame_options={"size": 2})
+
+        storage_manager.update_storage(1, fitness_results)
+
+        self.assertEqual(storage_manager.hall_of_fame.fitness_results, [(100, {"x": "a"}), (150, {"x": "b"})])
+
+    @patch.object(StorageManager, "update_genome_storage")
+    @patch.object(StorageManager, "update_fitness_storage")
+    def test_update_hall_of_fame_only_updates_hall_of_fame(
+        self, mock_update_fitness, mock_update_genomes
+    ):
+        """update_hall_of_fame adds the fitness results to the hall of fame without storing fitness scores or genomes, and does nothing if there is no hall of fame"""
+        storage_manager = StorageManager(hall_of_fame_options={"size": 2})
+
+        storage_manager.update_hall_of_fame([(100, {"x": "a"}), (20, {"x": "c"})])
+        storage_manager.update_hall_of_fame([(150, {"x": "b"})])
+
+        self.assertEqual(
+            storage_manager.hall_of_fame.fitness_results, [(100, {"x": "a"}), (150, {"x": "b"})]
+        )
+        StorageManager().update_hall_of_fame([(100, {"x": "a"})])
+        mock_update_fitness.assert_not_called()
+        mock_update_genomes.assert_not_called()
+
+    def test_does_not_keep_hall_of_fame_if_no_size_is_given(self):
+        """StorageManager has no hall of fame if hall_of_fame_options has no size"""
+        storage_manager = StorageManager()
+
+        storage_manager.update_storage(1, [(100, {"x": "a"})])
+
+        self.assertIsNone(storage_manager.hall_of_fame)
+
 
 class StorageManagerReactToInterruptionTest(unittest.TestCase):
     @patch("holland.storage.storage_manager.record_genomes_and_fitnesses")
     def test_calls_record_genomes_if_should(self, mock_record):
         """react_to_interruption calls record_genomes_and_fitnesses with the generation_num, fitness_results, and genome_storage_options if should_record_on_interrupt is True"""
         generation_num = 58
-        fitness_results = [(100, "a"), (150, "b"), (20, "c")]
+        fitness_results = [(100, {"x": "a"}), (150, {"x": "b"}), (20, {"x": "c"})]
         genome_storage_options = {
             "file_name": "test.json",
             "path": "test/test",
@@ -43,7 +78,7 @@ class StorageManagerReactToInterruptionTest(unittest.TestCase):
     def test_does_not_call_record_genomes_if_should_not(self, mock_record):
         """react_to_interruption does not call record_genomes_and_fitnesses if should not"""
         generation_num = 58
-        fitness_results = [(100, "a"), (150, "b"), (20, "c")]
+        fitness_results = [(100, {"x": "a"}), (150, {"x": "b"}), (20, {"x": "c"})]
         genome_storage_options = {
             "file_name": "test.json",
             "path": "test/test",
@@ -57,6 +92,49 @@ class StorageManagerReactToInterruptionTest(unittest.TestCase):
         mock_record.assert_not_called()
 
 
+class StorageManagerRecordHallOfFameTest(unittest.TestCase):
+    @patch("holland.storage.storage_manager.record")
+    def test_records_hall_of_fame_if_should(self, mock_record):
+        """record_hall_of_fame calls record with the last generation number, the hall of fame fitness results, and hall_of_fame_options if should_record_hall_of_fame is True"""
+        hall_of_fame_options = {
+            "size": 2,
+            "should_record_hall_of_fame": True,
+            "file_name": "hall_of_fame.json",
+            "path": "test/test",
+        }
+        storage_manager = StorageManager(hall_of_fame_options=hall_of_fame_options)
+        storage_manager.update_storage(4, [(100, {"x": "a"}), (150, {"x": "b"}), (20, {"x": "c"})])
+
+        storage_manager.record_hall_of_fame()
+
+        mock_record.assert_called_with(
+            {"generation": 4, "results": [(100, {"x": "a"}), (150, {"x": "b"})]},
+            format="json",
+            **hall_of_fame_options,
+        )
+
+    @patch("holland.storage.storage_manager.record")
+    def test_does_not_record_hall_of_fame_if_should_not(self, mock_record):
+        """record_hall_of_fame does not call record if should_record_hall_of_fame is not True"""
+        storage_manager = StorageManager(hall_of_fame_options={"size": 2})
+        storage_manager.update_storage(4, [(100, {"x": "a"})])
+
+        storage_manager.record_hall_of_fame()
+
+        mock_record.assert_not_called()
+
+    @patch("holland.storage.storage_manager.record")
+    def test_react_to_interruption_records_hall_of_fame(self, mock_record):
+        """react_to_interruption records the hall of fame if should_record_hall_of_fame is True"""
+        hall_of_fame_options = {"size": 2, "should_record_hall_of_fame": True}
+        storage_manager = StorageManager(hall_of_fame_options=hall_of_fame_options)
+        storage_manager.update_storage(4, [(100, {"x": "a"})])
+
+        storage_manager.react_to_interruption(5, [(10, {"x": "b"})])
+
+        mock_record.assert_called_once()
+
+
 class StorageManagerUpdateFitnessStorageTest(unittest.TestCase):
     @patch("holland.storage.storage_manager.record_fitness")
     def test_calls_record_fitness_with_correct_args_if_should(self, mock_record):
@@ -0,0 +1,64 @@
+import unittest
+from unittest.mock import patch
+
+from holland.utils.bitsets import *
+
+
+class PackBitsTest(unittest.TestCase):
+    def test_packs_values_with_first_value_as_lowest_bit(self):
+        """pack_bits returns an int whose bit i is the value at index i"""
+        self.assertEqual(pack_bits([True, False, True, True]), 0b1101)
+        self.assertEqual(pack_bits([False] * 20), 0)
+        self.assertEqual(pack_bits([]), 0)
+
+    def test_is_inverse_of_unpack_bits(self):
+        """unpack_bits returns the values given to pack_bits"""
+        values = [i % 3 == 0 for i in range(1000)]
+
+        self.assertListEqual(unpack_bits(pack_bits(values), len(values)), values)
+
+
+class UnpackBitsTest(unittest.TestCase):
+    def test_unpacks_bits_into_booleans(self):
+        """unpack_bits returns a list of size booleans where element i is bit i"""
+        self.assertListEqual(unpack_bits(0b1101, 6), [True, False, True, True, False, False])
+
+
+class CountBitsTest(unittest.TestCase):
+    def test_counts_set_bits(self):
+        """count_bits returns the number of bits set to 1"""
+        self.assertEqual(count_bits(0), 0)
+        self.assertEqual(count_bits(0b1101), 3)
+        self.assertEqual(count_bits((1 << 100000) - 1), 100000)
+
+
+class GetBitMaskTest(unittest.TestCase):
+    def test_sets_bits_from_start_to_end(self):
+        """get_bit_mask sets the bits in positions start (inclusive) through end (exclusive)"""
+        self.assertEqual(get_bit_mask(0, 3), 0b111)
+        self.assertEqual(get_bit_mask(2, 5), 0b11100)
+        self.assertEqual(get_bit_mask(4, 4), 0)
+
+
+class GetRandomBitMaskTest(unittest.TestCase):
+    def test_returns_no_bits_or_all_bits_for_probability_zero_or_one(self):
+        """get_random_bit_mask sets no bits if probability is 0 and all size bits if probability is 1"""
+        self.assertEqual(get_random_bit_mask(50, probability=0), 0)
+        self.assertEqual(get_random_bit_mask(50, probability=1), (1 << 50) - 1)
+
+    def test_does_not_set_bits_beyond_size(self):
+        """get_random_bit_mask only sets bits in the first size positions"""
+        for probability in [0.01, 0.5, 0.9]:
+            for _ in range(50):
+                mask = get_random_bit_mask(37, probability=probability)
+                self.assertEqual(mask >> 37, 0)
+
+    def test_sets_bits_according_to_probability(self):
+        """get_random_bit_mask sets about size * probability bits"""
+        size = 100000
+        probability = 0.01
+
+        n_set = count_bits(get_random_bit_mask(size, probability=probability))
+
+        self.assertGreater(n_set, 0.8 * size * probability)
+        self.assertLess(n_set, 1.2 * size * probability)
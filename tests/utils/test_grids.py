@@ -0,0 +1,52 @@
+import unittest
+
+from holland.utils.grids import *
+
+
+class GetGridShapeTest(unittest.TestCase):
+    def test_asserts_n_cells_is_at_least_one(self):
+        """get_grid_shape raises a ValueError if n_cells is less than 1"""
+        with self.assertRaises(ValueError):
+            get_grid_shape(0)
+
+    def test_returns_the_most_square_shape(self):
+        """get_grid_shape returns the shape with n_cells cells whose number of rows and columns are closest"""
+        self.assertEqual(get_grid_shape(12), (3, 4))
+        self.assertEqual(get_grid_shape(16), (4, 4))
+        self.assertEqual(get_grid_shape(7), (1, 7))
+
+
+class GetGridNeighborhoodsTest(unittest.TestCase):
+    def test_asserts_neighborhood_radius_and_shape_are_valid(self):
+        """get_grid_neighborhoods raises a ValueError if neighborhood is not a valid option, radius is less than 1, or the grid is empty"""
+        with self.assertRaises(ValueError):
+            get_grid_neighborhoods((3, 3), neighborhood="hexagonal")
+
+        with self.assertRaises(ValueError):
+            get_grid_neighborhoods((3, 3), radius=0)
+
+        with self.assertRaises(ValueError):
+            get_grid_neighborhoods((0, 3))
+
+    def test_returns_von_neumann_neighborhoods_on_a_torus(self):
+        """get_grid_neighborhoods returns each cell followed by the cells above, below, left, and right of it, wrapping around the edges"""
+        neighborhoods = get_grid_neighborhoods((3, 4))
+
+        self.assertEqual(len(neighborhoods), 12)
+        self.assertEqual(neighborhoods[0][0], 0)
+        self.assertSetEqual(set(neighborhoods[0]), {0, 8, 4, 3, 1})
+        self.assertSetEqual(set(neighborhoods[6]), {6, 2, 10, 5, 7})
+
+    def test_returns_moore_neighborhoods_with_diagonals(self):
+        """get_grid_neighborhoods returns the square of cells within radius of each cell for the 'moore' neighborhood"""
+        neighborhoods = get_grid_neighborhoods((5, 5), neighborhood="moore")
+
+        self.assertSetEqual(set(neighborhoods[12]), {6, 7, 8, 11, 12, 13, 16, 17, 18})
+        self.assertEqual(len(get_grid_neighborhoods((5, 5), "moore", radius=2)[0]), 25)
+        self.assertEqual(len(get_grid_neighborhoods((5, 5), "von_neumann", radius=2)[0]), 13)
+
+    def test_lists_wrapped_cells_once_on_small_grids(self):
+        """get_grid_neighborhoods lists each cell at most once in a neighborhood, even where the grid wraps onto itself"""
+        neighborhoods = get_grid_neighborhoods((1, 2))
+
+        self.assertEqual(neighborhoods, [(0, 1), (1, 0)])
@@ -0,0 +1,88 @@
+import math
+import random
+import unittest
+
+from holland.utils.niching import *
+from holland.utils.bitsets import count_bits
+
+
+def compute_niche_counts_by_all_pairs(points, radius, alpha, get_distance):
+    return [
+        sum(
+            1 - (get_distance(point, other) / radius) ** alpha
+            for other in points
+            if get_distance(point, other) < radius
+        )
+        for point in points
+    ]
+
+
+class ComputeNicheCountsTest(unittest.TestCase):
+    def test_euclidean_niche_counts(self):
+        """compute_niche_counts returns the sum of the sharing function over all points for the 'euclidean' metric"""
+        points = [(0.0, 0.0), (0.3, 0.4), (2.0, 0.0), (2.0, 0.5)]
+
+        niche_counts = compute_niche_counts(points, 1, alpha=1)
+
+        expected_niche_counts = [1.5, 1.5, 1.5, 1.5]
+        for niche_count, expected_niche_count in zip(niche_counts, expected_niche_counts):
+            self.assertAlmostEqual(niche_count, expected_niche_count)
+
+    def test_hamming_niche_counts(self):
+        """compute_niche_counts returns the sum of the sharing function over all points for the 'hamming' metric"""
+        points = [0b0000, 0b0001, 0b1111]
+
+        niche_counts = compute_niche_counts(points, 2, alpha=1, metric="hamming")
+
+        self.assertListEqual(niche_counts, [1.5, 1.5, 1])
+
+    def test_matches_niche_counts_from_all_pairs(self):
+        """compute_niche_counts returns the same niche counts as computing the distance between every pair of points"""
+        random.seed(0)
+        for _ in range(20):
+            n_dimensions = random.randint(1, 10)
+            points = [
+                tuple(round(random.random(), 1) for _ in range(n_dimensions)) for _ in range(100)
+            ]
+            radius = random.choice([0.05, 0.2, 0.5, 2])
+            alpha = random.choice([1, 2])
+
+            niche_counts = compute_niche_counts(points, radius, alpha=alpha)
+
+            expected_niche_counts = compute_niche_counts_by_all_pairs(
+                points, radius, alpha, math.dist
+            )
+            for niche_count, expected_niche_count in zip(niche_counts, expected_niche_counts):
+                self.assertAlmostEqual(niche_count, expected_niche_count)
+
+    def test_matches_hamming_niche_counts_from_all_pairs(self):
+        """compute_niche_counts returns the same niche counts as computing the Hamming distance between every pair of points"""
+        random.seed(0)
+        for _ in range(20):
+            n_bits = random.randint(1, 40)
+            points = [random.getrandbits(n_bits) for _ in range(100)]
+            radius = random.choice([0.5, 1, 2, 3.5, 7, 50])
+
+            niche_counts = compute_niche_counts(points, radius, metric="hamming")
+
+            expected_niche_counts = compute_niche_counts_by_all_pairs(
+                points, radius, 1, lambda a, b: count_bits(a ^ b)
+            )
+            for niche_count, expected_niche_count in zip(niche_counts, expected_niche_counts):
+                self.assertAlmostEqual(niche_count, expected_niche_count)
+
+    def test_counts_identical_points(self):
+        """compute_niche_counts counts each copy of identical points"""
+        niche_counts = compute_niche_counts([(1.0,), (1.0,), (1.0,), (5.0,)], 1)
+
+        self.assertListEqual(niche_counts, [3, 3, 3, 1])
+
+    def test_asserts_radius_is_positive(self):
+        """compute_niche_counts raises a ValueError if radius is not positive"""
+        with self.assertRaises(ValueError):
+            compute_niche_counts([(1.0,)], 0)
+
+    def test_asserts_metric_is_valid(self):
+        """compute_niche_counts raises a ValueError if metric is not 'euclidean' or 'hamming'"""
+        with self.assertRaises(ValueError):
+            compute_niche_counts([(1.0,)], 1, metric="manhattan")
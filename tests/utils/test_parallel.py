@@ -0,0 +1,50 @@
+import unittest
+import multiprocessing
+
+from holland.utils.parallel import *
+
+
+def _square(x):
+    return x * x
+
+
+class CreateProcessPoolTest(unittest.TestCase):
+    def test_asserts_n_workers_is_at_least_one(self):
+        """create_process_pool raises a ValueError if n_workers is less than 1"""
+        with self.assertRaises(ValueError):
+            create_process_pool(0)
+
+    def test_passes_unpicklable_initargs_to_workers(self):
+        """create_process_pool creates a working pool even if initargs cannot be pickled (e.g. lambdas)"""
+        pool = create_process_pool(2, initializer=lambda f: f(), initargs=(lambda: None,))
+        try:
+            results = pool.map(_square, range(5))
+        finally:
+            pool.close()
+            pool.join()
+
+        self.assertListEqual(results, [0, 1, 4, 9, 16])
+
+
+class GetProcessContextTest(unittest.TestCase):
+    def test_uses_fork_if_available(self):
+        """get_process_context returns the 'fork' context where the platform supports it"""
+        context = get_process_context()
+
+        if "fork" in multiprocessing.get_all_start_methods():
+            self.assertEqual(context.get_start_method(), "fork")
+        else:
+            self.assertIsNotNone(context.get_start_method())
+
+
+class SplitIntoChunksTest(unittest.TestCase):
+    def test_asserts_chunk_size_is_at_least_one(self):
+        """split_into_chunks raises a ValueError if chunk_size is less than 1"""
+        with self.assertRaises(ValueError):
+            split_into_chunks(10, 0)
+
+    def test_returns_chunk_sizes_summing_to_n_items(self):
+        """split_into_chunks returns full chunks followed by a smaller remainder chunk if needed"""
+        self.assertListEqual(split_into_chunks(10, 3), [3, 3, 3, 1])
+        self.assertListEqual(split_into_chunks(9, 3), [3, 3, 3])
+        self.assertListEqual(split_into_chunks(0, 3), [])
@@ -0,0 +1,98 @@
+import math
+import random
+import unittest
+
+from holland.utils.pareto import *
+
+
+def sort_non_dominated_naively(objectives, should_maximize):
+    remaining = set(range(len(objectives)))
+    fronts = []
+    while remaining:
+        front = {
+            i
+            for i in remaining
+            if not any(dominates(objectives[j], objectives[i], should_maximize) for j in remaining)
+        }
+        fronts.append(front)
+        remaining -= front
+    return fronts
+
+
+class DominatesTest(unittest.TestCase):
+    def test_requires_at_least_as_good_in_all_and_better_in_one(self):
+        """dominates returns True only if a is at least as good as b in every objective and not equal to b"""
+        self.assertTrue(dominates((2, 3), (2, 1)))
+        self.assertFalse(dominates((2, 3), (2, 3)))
+        self.assertFalse(dominates((2, 3), (3, 1)))
+
+    def test_prefers_smaller_values_if_minimizing(self):
+        """dominates compares smaller values as better if should_maximize is False"""
+        self.assertTrue(dominates((2, 1), (2, 3), should_maximize=False))
+        self.assertFalse(dominates((2, 3), (2, 1), should_maximize=False))
+
+
+class SortNonDominatedTest(unittest.TestCase):
+    def test_sorts_solutions_into_fronts(self):
+        """sort_non_dominated returns the indices of each front, best front first"""
+        objectives = [(1, 1), (3, 0), (0, 3), (2, 2), (1, 2), (0, 0)]
+
+        fronts = sort_non_dominated(objectives)
+
+        self.assertListEqual([set(front) for front in fronts], [{1, 2, 3}, {4}, {0}, {5}])
+
+    def test_keeps_equal_solutions_in_the_same_front(self):
+        """sort_non_dominated places identical objective vectors in the same front"""
+        fronts = sort_non_dominated([(1, 2, 3), (1, 2, 3), (0, 2, 3)])
+
+        self.assertListEqual([set(front) for front in fronts], [{0, 1}, {2}])
+
+    def test_matches_pairwise_comparison(self):
+        """sort_non_dominated returns the same fronts as comparing every pair of solutions, for two and more objectives and both directions"""
+        rng = random.Random(0)
+        for n_objectives in [2, 3, 4]:
+            for should_maximize in [True, False]:
+                objectives = [
+                    tuple(rng.randint(0, 4) for _ in range(n_objectives)) for _ in range(40)
+                ]
+
+                fronts = sort_non_dominated(objectives, should_maximize)
+
+                self.assertListEqual(
+                    [set(front) for front in fronts],
+                    sort_non_dominated_naively(objectives, should_maximize),
+                )
+
+    def test_returns_no_fronts_for_no_solutions(self):
+        """sort_non_dominated returns an empty list if there are no solutions"""
+        self.assertListEqual(sort_non_dominated([]), [])
+
+
+class ComputeCrowdingDistancesTest(unittest.TestCase):
+    def test_sums_normalized_neighbor_gaps(self):
+        """compute_crowding_distances sums the normalized gap between the neighbors of each solution along each objective and gives boundary solutions an infinite distance"""
+        objectives = [(0, 4), (1, 2), (4, 0), (3, 1)]
+
+        distances = compute_crowding_distances(objectives)
+
+        self.assertEqual(distances[0], math.inf)
+        self.assertEqual(distances[2], math.inf)
+        self.assertAlmostEqual(distances[1], 3 / 4 + 3 / 4)
+        self.assertAlmostEqual(distances[3], 3 / 4 + 2 / 4)
+
+    def test_small_fronts_are_infinitely_far_apart(self):
+        """compute_crowding_distances returns infinite distances for fronts of fewer than three solutions"""
+        self.assertListEqual(compute_crowding_distances([(0, 1), (1, 0)]), [math.inf] * 2)
+
+
+class SelectNonDominatedTest(unittest.TestCase):
+    def test_fills_by_front_then_by_crowding_distance(self):
+        """select_non_dominated selects whole fronts while they fit and the least crowded solutions of the last front that fits in part"""
+        objectives = [(4, 4), (0, 3), (1, 2), (1.1, 1.9), (3, 0)]
+
+        indices, ranks, crowding_distances = select_non_dominated(objectives, 3)
+
+        self.assertEqual(indices[0], 0)
+        self.assertSetEqual(set(indices[1:]), {1, 4})
+        self.assertListEqual(ranks, [0, 1, 1])
+        self.assertListEqual(crowding_distances[1:], [math.inf, math.inf])
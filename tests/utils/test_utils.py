@@ -121,6 +121,28 @@ class BoundValueTest(unittest.TestCase):
             self.assertEqual(output, expected_output)
 
 
+class BoundValuesTest(unittest.TestCase):
+    def test_returns_the_same_values_as_bound_value(self):
+        """bound_values returns the result of calling bound_value on each value"""
+        values = [-12.5, -3, 0, 0.25, 4.75, 9, 10.5, 30]
+
+        for minimum, maximum, to_int in [
+            (0, 10, False),
+            (0.5, 9.5, True),
+            (None, None, False),
+            (None, 5, True),
+            (-3.2, None, True),
+        ]:
+            expected_values = [
+                bound_value(value, minimum=minimum, maximum=maximum, to_int=to_int)
+                for value in values
+            ]
+            self.assertListEqual(
+                bound_values(values, minimum=minimum, maximum=maximum, to_int=to_int),
+                expected_values,
+            )
+
+
 class SelectFromTest(unittest.TestCase):
     def setUp(self):
         self.values = [7, 8, 9, 10, 30, 44, 45, 50, 85, 90, 100]
@@ -276,6 +298,262 @@ class SelectRandomTest(unittest.TestCase):
         self.assertTrue(isinstance(selected[0], tuple))
 
 
+    def test_selects_elements_according_to_respective_probabilities_with_replacement(self):
+        """select_random never selects elements with zero probability when selecting with replacement"""
+        choices = list(range(10))
+        probabilities = [0, 0, 0.5, 0, 0, 0, 0.5, 0, 0, 0]
+
+        selected = select_random(choices, probabilities=probabilities, n=100, should_replace=True)
+
+        self.assertTrue(all(s in [2, 6] for s in selected))
+
+    def test_no_duplicates_if_should_not_replace_and_weighted(self):
+        """select_random returns a list that contains no duplicates if should_replace is False and probabilities are given"""
+        choices = list(range(10))
+        probabilities = [0.1] * 10
+
+        for _ in range(100):
+            selected = select_random(choices, probabilities=probabilities, n=5)
+            self.assertEqual(len(selected), len(set(selected)))
+
+    def test_selects_all_choices_if_n_is_len_choices_and_should_not_replace(self):
+        """select_random returns every element of choices if n is the number of choices and should_replace is False"""
+        choices = list(range(8))
+        probabilities = [0.25] * 4 + [0] * 4
+
+        self.assertListEqual(sorted(select_random(choices, n=len(choices))), choices)
+        self.assertListEqual(
+            sorted(select_random(choices, probabilities=probabilities, n=len(choices))), choices
+        )
+
+    def test_selects_positive_probability_elements_before_zero_probability_elements(self):
+        """select_random only selects elements with zero probability once all other elements have been selected when should_replace is False"""
+        choices = list(range(10))
+        probabilities = [0.25, 0, 0.25, 0, 0.25, 0, 0.25, 0, 0, 0]
+
+        selected = select_random(choices, probabilities=probabilities, n=6)
+
+        self.assertListEqual(sorted(selected[:4]), [0, 2, 4, 6])
+
+    def test_favors_elements_with_higher_probabilities_when_should_not_replace(self):
+        """select_random selects elements with higher probability first more often when should_replace is False"""
+        choices = ["a", "b"]
+        probabilities = [0.9, 0.1]
+
+        first_selections = [
+            select_random(choices, probabilities=probabilities, n=2)[0] for _ in range(1000)
+        ]
+
+        self.assertGreater(first_selections.count("a"), first_selections.count("b"))
+
+
+class SelectRandomIndicesTest(unittest.TestCase):
+    def test_asserts_n_leq_n_choices_if_should_not_replace(self):
+        """select_random_indices throws a ValueError if should_replace is False but n > n_choices"""
+        with self.assertRaises(ValueError):
+            select_random_indices(3, n=4, should_replace=False)
+
+    def test_returns_indices_in_range(self):
+        """select_random_indices returns n ints in range(n_choices) for every selection strategy"""
+        n_choices = 20
+        probabilities = [1 / n_choices] * n_choices
+
+        for weights in [None, probabilities]:
+            for should_replace in [True, False]:
+                selected = select_random_indices(
+                    n_choices, probabilities=weights, n=15, should_replace=should_replace
+                )
+                self.assertEqual(len(selected), 15)
+                self.assertTrue(all(isinstance(i, int) and 0 <= i < n_choices for i in selected))
+
+    def test_accepts_probabilities_with_rounding_error(self):
+        """select_random_indices accepts probabilities whose sum differs from 1 by floating point rounding error"""
+        probabilities = [0.1] * 9 + [0.1 + 1e-15]
+        self.assertNotEqual(round(sum(probabilities), 15), 1)
+
+        selected = select_random_indices(10, probabilities=probabilities, n=5)
+
+        self.assertEqual(len(selected), 5)
+
+    def test_handles_large_numbers_of_choices(self):
+        """select_random_indices selects many indices without replacement from a large number of choices"""
+        n_choices = 10 ** 6
+        n = 10 ** 5
+
+        selected = select_random_indices(n_choices, n=n)
+
+        self.assertEqual(len(set(selected)), n)
+
+
+class SelectRandomStreamTest(unittest.TestCase):
+    def test_draws_from_the_given_rng_instead_of_the_random_module(self):
+        """select_random, select_random_indices, select_stochastic_universal, and select_from draw from the given rng, leaving the random module untouched"""
+        choices = list(range(20))
+        probabilities = [0.05] * 20
+        random_state = random.getstate()
+
+        selections = []
+        for _ in range(2):
+            rng = random.Random(11)
+            selections.append(
+                (
+                    select_random(choices, n=5, rng=rng),
+                    select_random(choices, probabilities=probabilities, n=5, rng=rng),
+                    select_random_indices(20, probabilities=probabilities, n=5, rng=rng),
+                    select_random_indices(20, n=5, should_replace=True, rng=rng),
+                    select_stochastic_universal(choices, probabilities=probabilities, n=5, rng=rng),
+                    select_from(choices, top=2, random=3, rng=rng),
+                )
+            )
+
+        self.assertEqual(selections[0], selections[1])
+        self.assertEqual(random.getstate(), random_state)
+
+
+class SelectStochasticUniversalTest(unittest.TestCase):
+    def test_asserts_n_is_nonnegative(self):
+        """select_stochastic_universal throws a ValueError if n is negative"""
+        with self.assertRaises(ValueError):
+            select_stochastic_universal([1, 2, 3], n=-1)
+
+    def test_asserts_choices_and_probabilities_match(self):
+        """select_stochastic_universal throws a ValueError if probabilities is given but len(probabilites) != len(choices)"""
+        with self.assertRaises(ValueError):
+            select_stochastic_universal([1, 2, 3], probabilities=[0.5, 0.5])
+
+    def test_asserts_probabilities_are_nonnegative_and_normalized(self):
+        """select_stochastic_universal throws a ValueError if any probability is negative or the probabilities do not sum to 1"""
+        with self.assertRaises(ValueError):
+            select_stochastic_universal([1, 2, 3], probabilities=[0.75, 0.75, -0.5])
+
+        with self.assertRaises(ValueError):
+            select_stochastic_universal([1, 2, 3], probabilities=[0.1, 0.1, 0.1])
+
+    def test_returns_a_list_of_length_n(self):
+        """select_stochastic_universal returns a list of size n, including n greater than the number of choices"""
+        choices = list(range(10))
+
+        for n in range(25):
+            selected = select_stochastic_universal(choices, n=n)
+            self.assertEqual(len(selected), n)
+
+    def test_selects_each_element_floor_or_ceil_of_its_expected_count(self):
+        """select_stochastic_universal selects each element either floor(n * p) or ceil(n * p) times"""
+        choices = ["a", "b", "c", "d"]
+        probabilities = [0.1, 0.2, 0.3, 0.4]
+        n = 25
+
+        for _ in range(100):  # 100 times because the offset is random
+            selected = select_stochastic_universal(choices, probabilities=probabilities, n=n)
+            for choice, probability in zip(choices, probabilities):
+                count = selected.count(choice)
+                self.assertGreaterEqual(count, math.floor(n * probability))
+                self.assertLessEqual(count, math.ceil(n * probability))
+
+    def test_never_selects_elements_with_zero_probability(self):
+        """select_stochastic_universal does not select elements whose probability is 0"""
+        choices = list(range(10))
+        probabilities = [0, 0.5, 0, 0, 0.5, 0, 0, 0, 0, 0]
+
+        for _ in range(100):
+            selected = select_stochastic_universal(choices, probabilities=probabilities, n=7)
+            self.assertTrue(all(s in [1, 4] for s in selected))
+
+
+class HashGenomeTest(unittest.TestCase):
+    def test_equal_genomes_have_equal_hashes(self):
+        """hash_genome returns equal hashes for equal genomes, including list-type genes and nested lists"""
+        genome = {"a": [1, 2, 3], "b": 0.5, "c": [[1], [2]]}
+        equal_genome = {"c": [[1], [2]], "b": 0.5, "a": [1, 2, 3]}
+
+        self.assertEqual(hash_genome(genome), hash_genome(equal_genome))
+
+    def test_different_genomes_have_different_hashes(self):
+        """hash_genome returns different hashes for genomes that differ in a single value"""
+        self.assertNotEqual(hash_genome({"a": [1, 2, 3]}), hash_genome({"a": [1, 2, 4]}))
+
+
+class IncrementalHashTest(unittest.TestCase):
+    def setUp(self):
+        self.genome = {"a": [1, 2, 3, 4], "b": 0.5, "c": [[1], [2]]}
+
+    def test_hash_genome_combines_gene_hashes(self):
+        """hash_genome is the XOR of hash_gene of each gene"""
+        expected_hash = 0
+        for gene_name, gene in self.genome.items():
+            expected_hash ^= hash_gene(gene_name, gene)
+
+        self.assertEqual(hash_genome(self.genome), expected_hash)
+
+    def test_update_genome_hash_for_changed_positions(self):
+        """update_genome_hash returns the hash of the new genome given the changed positions of a list-type gene"""
+        new_genome = {**self.genome, "a": [1, 5, 3, 6], "c": [[1], [3]]}
+
+        genome_hash = update_genome_hash(
+            hash_genome(self.genome), "a", self.genome["a"], new_genome["a"], [1, 3]
+        )
+        genome_hash = update_genome_hash(
+            genome_hash, "c", self.genome["c"], new_genome["c"], [1]
+        )
+
+        self.assertEqual(genome_hash, hash_genome(new_genome))
+
+    def test_update_genome_hash_for_whole_gene(self):
+        """update_genome_hash rehashes the whole gene if positions is not specified"""
+        new_genome = {**self.genome, "b": 0.25}
+
+        genome_hash = update_genome_hash(hash_genome(self.genome), "b", 0.5, 0.25)
+
+        self.assertEqual(genome_hash, hash_genome(new_genome))
+
+    def test_get_changed_positions(self):
+        """get_changed_positions returns the indices at which the new gene holds a different value object"""
+        gene = [1.5, 2.5, 3.5, 4.5]
+        new_gene = [gene[0], 7.5, gene[2], 8.5]
+
+        self.assertListEqual(get_changed_positions(gene, new_gene), [1, 3])
+        self.assertIsNone(get_changed_positions(gene, gene[:3]))
+        self.assertIsNone(get_changed_positions(1.5, 2.5))
+
+    def test_derive_genome_hash_matches_hash_genome(self):
+        """derive_genome_hash returns the same hash as hash_genome for a genome bred from a parent"""
+        parent = {"a": list(range(100)), "b": 0.5, "c": [[1], [2]]}
+        genome = {"a": list(parent["a"]), "b": 0.75, "c": parent["c"]}
+        genome["a"][10], genome["a"][20] = genome["a"][20], genome["a"][10]
+        shuffled_genome = {**genome, "a": random.sample(parent["a"], 100)}
+
+        self.assertEqual(
+            derive_genome_hash(genome, parent, hash_genome(parent)), hash_genome(genome)
+        )
+        self.assertEqual(
+            derive_genome_hash(shuffled_genome, parent, hash_genome(parent)),
+            hash_genome(shuffled_genome),
+        )
+
+    def test_derive_genome_hash_adds_genes_missing_from_the_parent(self):
+        """derive_genome_hash adds the full hash of genes that the parent does not have"""
+        parent = {"a": [1.5, 2.5], "b": 0.5}
+        genome = {"a": parent["a"], "b": 0.75, "b_strategy": 0.1}
+
+        self.assertEqual(
+            derive_genome_hash(genome, parent, hash_genome(parent)), hash_genome(genome)
+        )
+
+    @patch("holland.utils.utils.get_changed_positions", return_value=None)
+    def test_derive_genome_hash_uses_given_changed_positions(self, mock_get_changed_positions):
+        """derive_genome_hash takes the changed positions of a gene from changed_positions instead of finding them if they are given"""
+        parent = {"a": list(range(100)), "b": 0.5}
+        genome = {"a": list(parent["a"]), "b": 0.75}
+        genome["a"][10] = 1000
+
+        genome_hash = derive_genome_hash(
+            genome, parent, hash_genome(parent), changed_positions={"a": [10]}
+        )
+
+        self.assertEqual(genome_hash, hash_genome(genome))
+        mock_get_changed_positions.assert_called_once_with(0.5, 0.75)
+
+
 class IsNumericTypeTest(unittest.TestCase):
     def test_returns_False_if_is_not_numeric_type(self):
         """is_numeric_type returns False if the type is not int or float"""
@@ -306,3 +584,42 @@ class IsListTypeTest(unittest.TestCase):
         self.assertTrue(is_list_type({"type": "[float]"}))
         self.assertTrue(is_list_type({"type": "[int]"}))
         self.assertTrue(is_list_type({"type": "[str]"}))
+
+
+
+class IsPermutationTypeTest(unittest.TestCase):
+    def test_returns_True_only_if_type_is_permutation(self):
+        """is_permutation_type returns True if the type is permutation and False otherwise"""
+        self.assertTrue(is_permutation_type({"type": "permutation"}))
+        self.assertFalse(is_permutation_type({"type": "[int]"}))
+        self.assertFalse(is_permutation_type({"type": "int"}))
+
+
+class GetPermutationValuesTest(unittest.TestCase):
+    def test_returns_values_if_given_otherwise_range_of_size(self):
+        """get_permutation_values returns a list of the gene's values if given, otherwise of range(size)"""
+        self.assertListEqual(get_permutation_values({"values": ("a", "b"), "size": 5}), ["a", "b"])
+        self.assertListEqual(get_permutation_values({"size": 3}), [0, 1, 2])
+
+
+class SelfAdaptationStrategyTest(unittest.TestCase):
+    def test_names_strategy_genes_after_their_gene(self):
+        """get_strategy_gene_name appends '_strategy' to the name of the gene"""
+        self.assertEqual(get_strategy_gene_name("gene1"), "gene1_strategy")
+
+    def test_returns_initial_step_sizes_for_numeric_genes(self):
+        """get_initial_strategy returns initial_step_size for each value of a numeric gene"""
+        self_adaptation = {"initial_step_size": 0.5}
+        list_params = {"type": "[float]", "size": 3, "self_adaptation": self_adaptation}
+        value_params = {"type": "int", "self_adaptation": {}}
+
+        self.assertListEqual(get_initial_strategy(list_params), [0.5] * 3)
+        self.assertEqual(get_initial_strategy(value_params), 1)
+
+    def test_returns_initial_mutation_rate_for_non_numeric_genes(self):
+        """get_initial_strategy returns initial_mutation_rate for a non-numeric gene, defaulting to its mutation_rate"""
+        gene_params = {"type": "[bool]", "size": 3, "mutation_rate": 0.2, "self_adaptation": {}}
+
+        self.assertEqual(get_initial_strategy(gene_params), 0.2)
+        gene_params["self_adaptation"]["initial_mutation_rate"] = 0.05
+        self.assertEqual(get_initial_strategy(gene_params), 0.05)